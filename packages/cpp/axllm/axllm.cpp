@@ -6856,7 +6856,9 @@ Value Core::provider_descriptor(Value profile) {
 
 Value Core::provider_resolve_descriptor(Value profile, Value options) {
   axir_coverage_mark("provider_resolve_descriptor");
-  Value descriptor = Core::provider_descriptor(profile);
+  Value shared_descriptor = Core::provider_descriptor(profile);
+  Value descriptor_seed = Value::object();
+  Value descriptor = Core::map_merge(shared_descriptor, descriptor_seed);
   Value provider_id = Core::provider_normalize_profile(profile);
   Value generic_base_snake = Core::get(options, Value("base_url"), Value());
   Value generic_base_camel = Core::get(options, Value("baseUrl"), generic_base_snake);
@@ -6967,7 +6969,9 @@ Value Core::provider_resolve_descriptor(Value profile, Value options) {
       Core::set(descriptor, Value("baseUrl"), base_url);
       Core::set(descriptor, Value("auth"), Value("bearer"));
       Core::map_delete(descriptor, Value("apiKeyQuery"));
-      Value operations = Core::get(descriptor, Value("operations"), Value());
+      Value shared_operations = Core::get(descriptor, Value("operations"), Value());
+      Value operations_seed = Value::object();
+      Value operations = Core::map_merge(shared_operations, operations_seed);
       Value resource_parent = Core::string_format(Value("projects/{}/locations/{}"), project, region);
       Value parent = Core::string_format(Value("/{}"), resource_parent);
       if (Core::truthy(is_gemini)) {
@@ -6984,11 +6988,26 @@ Value Core::provider_resolve_descriptor(Value profile, Value options) {
         Value chat_path = Core::string_format(Value("{}:generateContent"), model_prefix);
         Value stream_path = Core::string_format(Value("{}:streamGenerateContent?alt=sse"), model_prefix);
         Value embed_path = Core::string_format(Value("{}:predict"), embed_prefix);
-        Value chat = Core::get(operations, Value("chat"), Value());
-        Value stream_chat = Core::get(operations, Value("stream_chat"), Value());
-        Value embed = Core::get(operations, Value("embed"), Value());
-        Value transcribe = Core::get(operations, Value("transcribe"), Value());
-        Value speak = Core::get(operations, Value("speak"), Value());
+        Value shared_chat = Core::get(operations, Value("chat"), Value());
+        Value chat_seed = Value::object();
+        Value chat = Core::map_merge(shared_chat, chat_seed);
+        Core::set(operations, Value("chat"), chat);
+        Value shared_stream_chat = Core::get(operations, Value("stream_chat"), Value());
+        Value stream_chat_seed = Value::object();
+        Value stream_chat = Core::map_merge(shared_stream_chat, stream_chat_seed);
+        Core::set(operations, Value("stream_chat"), stream_chat);
+        Value shared_embed = Core::get(operations, Value("embed"), Value());
+        Value embed_seed = Value::object();
+        Value embed = Core::map_merge(shared_embed, embed_seed);
+        Core::set(operations, Value("embed"), embed);
+        Value shared_transcribe = Core::get(operations, Value("transcribe"), Value());
+        Value transcribe_seed = Value::object();
+        Value transcribe = Core::map_merge(shared_transcribe, transcribe_seed);
+        Core::set(operations, Value("transcribe"), transcribe);
+        Value shared_speak = Core::get(operations, Value("speak"), Value());
+        Value speak_seed = Value::object();
+        Value speak = Core::map_merge(shared_speak, speak_seed);
+        Core::set(operations, Value("speak"), speak);
         Core::set(chat, Value("path"), chat_path);
         Core::set(stream_chat, Value("path"), stream_path);
         Core::set(embed, Value("path"), embed_path);
@@ -7009,8 +7028,14 @@ Value Core::provider_resolve_descriptor(Value profile, Value options) {
         Value model_path = Core::string_replace(model_path_raw, Value("MODEL_TOKEN"), Value("{model}"));
         Value stream_model_path_raw = Core::string_format(Value("{}/publishers/anthropic/models/MODEL_TOKEN:streamRawPredict?alt=sse"), parent);
         Value stream_model_path = Core::string_replace(stream_model_path_raw, Value("MODEL_TOKEN"), Value("{model}"));
-        Value chat = Core::get(operations, Value("chat"), Value());
-        Value stream_chat = Core::get(operations, Value("stream_chat"), Value());
+        Value shared_chat = Core::get(operations, Value("chat"), Value());
+        Value chat_seed = Value::object();
+        Value chat = Core::map_merge(shared_chat, chat_seed);
+        Core::set(operations, Value("chat"), chat);
+        Value shared_stream_chat = Core::get(operations, Value("stream_chat"), Value());
+        Value stream_chat_seed = Value::object();
+        Value stream_chat = Core::map_merge(shared_stream_chat, stream_chat_seed);
+        Core::set(operations, Value("stream_chat"), stream_chat);
         Core::set(chat, Value("path"), model_path);
         Core::set(stream_chat, Value("path"), stream_model_path);
         Value headers = Value::object();
@@ -12875,34 +12900,45 @@ Value Core::_ace_dedupe_playbook(Value playbook) {
   Value empty_map = Value::object();
   Value sections = Core::get(playbook, Value("sections"), empty_map);
   Value section_names = Core::map_keys(sections);
+  Value deduped = Core::_ace_dedupe_playbook_sections(playbook, section_names);
+  return deduped;
+}
+
+Value Core::_ace_dedupe_playbook_sections(Value playbook, Value section_names) {
+  axir_coverage_mark("_ace_dedupe_playbook_sections");
+  Value empty_map = Value::object();
+  Value sections = Core::get(playbook, Value("sections"), empty_map);
   for (auto section_name : Core::iter(section_names)) {
     Value bullets = Core::get(sections, section_name, Value());
-    Value seen = Value::object();
-    Value unique = Value::array();
-    for (auto bullet : Core::iter(bullets)) {
-      Value content = Core::get(bullet, Value("content"), Value(""));
-      Value trimmed = Core::string_trim(content);
-      Value key = Core::string_lower(trimmed);
-      Value has_existing = Core::map_contains(seen, key);
-      if (Core::truthy(has_existing)) {
-        Value existing = Core::get(seen, key, Value());
-        Value existing_helpful = Core::get(existing, Value("helpfulCount"), Value(0));
-        Value bullet_helpful = Core::get(bullet, Value("helpfulCount"), Value(0));
-        Value merged_helpful = Core::add(existing_helpful, bullet_helpful);
-        Core::set(existing, Value("helpfulCount"), merged_helpful);
-        Value existing_harmful = Core::get(existing, Value("harmfulCount"), Value(0));
-        Value bullet_harmful = Core::get(bullet, Value("harmfulCount"), Value(0));
-        Value merged_harmful = Core::add(existing_harmful, bullet_harmful);
-        Core::set(existing, Value("harmfulCount"), merged_harmful);
-        Value bullet_updated_at = Core::get(bullet, Value("updatedAt"), Value(""));
-        Core::set(existing, Value("updatedAt"), bullet_updated_at);
-      }
-      if (!Core::truthy(has_existing)) {
-        Core::set(seen, key, bullet);
-        Core::append(unique, bullet);
-      }
-    }
-    Core::set(sections, section_name, unique);
+    Value has_bullets = Core::truthy_value(bullets);
+    if (Core::truthy(has_bullets)) {
+      Value seen = Value::object();
+      Value unique = Value::array();
+      for (auto bullet : Core::iter(bullets)) {
+        Value content = Core::get(bullet, Value("content"), Value(""));
+        Value trimmed = Core::string_trim(content);
+        Value key = Core::string_lower(trimmed);
+        Value has_existing = Core::map_contains(seen, key);
+        if (Core::truthy(has_existing)) {
+          Value existing = Core::get(seen, key, Value());
+          Value existing_helpful = Core::get(existing, Value("helpfulCount"), Value(0));
+          Value bullet_helpful = Core::get(bullet, Value("helpfulCount"), Value(0));
+          Value merged_helpful = Core::add(existing_helpful, bullet_helpful);
+          Core::set(existing, Value("helpfulCount"), merged_helpful);
+          Value existing_harmful = Core::get(existing, Value("harmfulCount"), Value(0));
+          Value bullet_harmful = Core::get(bullet, Value("harmfulCount"), Value(0));
+          Value merged_harmful = Core::add(existing_harmful, bullet_harmful);
+          Core::set(existing, Value("harmfulCount"), merged_harmful);
+          Value bullet_updated_at = Core::get(bullet, Value("updatedAt"), Value(""));
+          Core::set(existing, Value("updatedAt"), bullet_updated_at);
+        }
+        if (!Core::truthy(has_existing)) {
+          Core::set(seen, key, bullet);
+          Core::append(unique, bullet);
+        }
+      }
+      Core::set(sections, section_name, unique);
+    }
   }
   Core::set(playbook, Value("sections"), sections);
   Value recomputed = Core::_ace_recompute_playbook_stats(playbook);
@@ -12940,6 +12976,13 @@ Value Core::_function_call_mode_impl(Value mode) {
   return mode;
 }
 
+Value Core::_response_function_calls_impl(Value response) {
+  axir_coverage_mark("_response_function_calls_impl");
+  Value empty = Value::array();
+  Value calls = Core::get(response, Value("function_calls"), empty);
+  return calls;
+}
+
 Value Core::_ace_prune_section_for_addition(Value section, Value protected_ids) {
   axir_coverage_mark("_ace_prune_section_for_addition");
   Value candidate_index = Value(-1);
@@ -13021,13 +13064,6 @@ Value Core::_ace_prune_section_for_addition(Value section, Value protected_ids)
   return out;
 }
 
-Value Core::_response_function_calls_impl(Value response) {
-  axir_coverage_mark("_response_function_calls_impl");
-  Value empty = Value::array();
-  Value calls = Core::get(response, Value("function_calls"), empty);
-  return calls;
-}
-
 Value Core::_append_tool_call_messages_impl(Value messages, Value response, Value calls) {
   axir_coverage_mark("_append_tool_call_messages_impl");
   Value chat_calls = Value::array();
@@ -13080,6 +13116,21 @@ Value Core::_tool_result_message_impl(Value call, Value result) {
   return message;
 }
 
+Value Core::_tool_error_message_impl(Value call, Value error) {
+  axir_coverage_mark("_tool_error_message_impl");
+  Value id = Core::get(call, Value("id"), Value());
+  Value error_text = Core::exception_message(error);
+  Value payload = Value::object();
+  Core::set(payload, Value("error"), error_text);
+  Value payload_json = Core::json_stringify(payload);
+  Value message = Value::object();
+  Core::set(message, Value("role"), Value("function"));
+  Core::set(message, Value("function_id"), id);
+  Core::set(message, Value("result"), payload_json);
+  Core::set(message, Value("is_error"), Value(true));
+  return message;
+}
+
 Value Core::_ace_apply_curator_operations(Value playbook, Value operations, Value options, Value now) {
   axir_coverage_mark("_ace_apply_curator_operations");
   Value empty_map = Value::object();
@@ -13250,21 +13301,6 @@ Value Core::_ace_apply_curator_operations(Value playbook, Value operations, Valu
   return out;
 }
 
-Value Core::_tool_error_message_impl(Value call, Value error) {
-  axir_coverage_mark("_tool_error_message_impl");
-  Value id = Core::get(call, Value("id"), Value());
-  Value error_text = Core::exception_message(error);
-  Value payload = Value::object();
-  Core::set(payload, Value("error"), error_text);
-  Value payload_json = Core::json_stringify(payload);
-  Value message = Value::object();
-  Core::set(message, Value("role"), Value("function"));
-  Core::set(message, Value("function_id"), id);
-  Core::set(message, Value("result"), payload_json);
-  Core::set(message, Value("is_error"), Value(true));
-  return message;
-}
-
 Value Core::_append_validation_retry_messages_impl(Value messages, Value response, Value error) {
   axir_coverage_mark("_append_validation_retry_messages_impl");
   Value content = Core::get(response, Value("content"), Value(""));
@@ -527,15 +527,16 @@ struct Core {
   static Value _ace_update_bullet_feedback(Value playbook, Value bullet_id, Value tag, Value now);
   static Value _validate_exact_output_keys(Value fields, Value values, Value context);
   static Value _ace_dedupe_playbook(Value playbook);
+  static Value _ace_dedupe_playbook_sections(Value playbook, Value section_names);
   static Value _tool_spec_impl(Value fn);
   static Value _function_call_mode_impl(Value mode);
-  static Value _ace_prune_section_for_addition(Value section, Value protected_ids);
   static Value _response_function_calls_impl(Value response);
+  static Value _ace_prune_section_for_addition(Value section, Value protected_ids);
   static Value _append_tool_call_messages_impl(Value messages, Value response, Value calls);
   static Value _completion_call_to_chat_impl(Value call);
   static Value _tool_result_message_impl(Value call, Value result);
-  static Value _ace_apply_curator_operations(Value playbook, Value operations, Value options, Value now);
   static Value _tool_error_message_impl(Value call, Value error);
+  static Value _ace_apply_curator_operations(Value playbook, Value operations, Value options, Value now);
   static Value _append_validation_retry_messages_impl(Value messages, Value response, Value error);
   static Value _ace_is_noop_acknowledgment(Value content);
   static Value _ace_normalize_curator_operations(Value operations);
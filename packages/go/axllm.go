@@ -11477,11 +11477,14 @@ func provider_resolve_descriptor(args ...Value) (Value, error) {
 	var v_candidate Value
 	var v_chat Value
 	var v_chat_path Value
+	var v_chat_seed Value
 	var v_close_brace Value
 	var v_descriptor Value
+	var v_descriptor_seed Value
 	var v_embed Value
 	var v_embed_path Value
 	var v_embed_prefix Value
+	var v_embed_seed Value
 	var v_endpoint Value
 	var v_endpoint_base_url Value
 	var v_endpoint_config Value
@@ -11525,6 +11528,7 @@ func provider_resolve_descriptor(args ...Value) (Value, error) {
 	var v_normalizers Value
 	var v_open_brace Value
 	var v_operations Value
+	var v_operations_seed Value
 	var v_parent Value
 	var v_project Value
 	var v_project_present Value
@@ -11538,13 +11542,23 @@ func provider_resolve_descriptor(args ...Value) (Value, error) {
 	var v_resolve_endpoint Value
 	var v_resource_parent Value
 	var v_scheme Value
+	var v_shared_chat Value
+	var v_shared_descriptor Value
+	var v_shared_embed Value
+	var v_shared_operations Value
+	var v_shared_speak Value
+	var v_shared_stream_chat Value
+	var v_shared_transcribe Value
 	var v_speak Value
+	var v_speak_seed Value
 	var v_stream_chat Value
+	var v_stream_chat_seed Value
 	var v_stream_model_path Value
 	var v_stream_model_path_raw Value
 	var v_stream_path Value
 	var v_token Value
 	var v_transcribe Value
+	var v_transcribe_seed Value
 	var v_transport Value
 	var v_use_beta Value
 	var v_version Value
@@ -11566,11 +11580,14 @@ func provider_resolve_descriptor(args ...Value) (Value, error) {
 	_ = v_candidate
 	_ = v_chat
 	_ = v_chat_path
+	_ = v_chat_seed
 	_ = v_close_brace
 	_ = v_descriptor
+	_ = v_descriptor_seed
 	_ = v_embed
 	_ = v_embed_path
 	_ = v_embed_prefix
+	_ = v_embed_seed
 	_ = v_endpoint
 	_ = v_endpoint_base_url
 	_ = v_endpoint_config
@@ -11614,6 +11631,7 @@ func provider_resolve_descriptor(args ...Value) (Value, error) {
 	_ = v_normalizers
 	_ = v_open_brace
 	_ = v_operations
+	_ = v_operations_seed
 	_ = v_parent
 	_ = v_project
 	_ = v_project_present
@@ -11627,18 +11645,30 @@ func provider_resolve_descriptor(args ...Value) (Value, error) {
 	_ = v_resolve_endpoint
 	_ = v_resource_parent
 	_ = v_scheme
+	_ = v_shared_chat
+	_ = v_shared_descriptor
+	_ = v_shared_embed
+	_ = v_shared_operations
+	_ = v_shared_speak
+	_ = v_shared_stream_chat
+	_ = v_shared_transcribe
 	_ = v_speak
+	_ = v_speak_seed
 	_ = v_stream_chat
+	_ = v_stream_chat_seed
 	_ = v_stream_model_path
 	_ = v_stream_model_path_raw
 	_ = v_stream_path
 	_ = v_token
 	_ = v_transcribe
+	_ = v_transcribe_seed
 	_ = v_transport
 	_ = v_use_beta
 	_ = v_version
 	_ = v_vertex_provider
-	{ v, err := provider_descriptor(v_profile); if err != nil { return nil, err }; v_descriptor = v }
+	{ v, err := provider_descriptor(v_profile); if err != nil { return nil, err }; v_shared_descriptor = v }
+	v_descriptor_seed = Object()
+	v_descriptor = _core_map_merge(v_shared_descriptor, v_descriptor_seed)
 	{ v, err := provider_normalize_profile(v_profile); if err != nil { return nil, err }; v_provider_id = v }
 	v_generic_base_snake = coreGet(v_options, "base_url", nil)
 	v_generic_base_camel = coreGet(v_options, "baseUrl", v_generic_base_snake)
@@ -11763,7 +11793,9 @@ func provider_resolve_descriptor(args ...Value) (Value, error) {
 			if err := coreSet(v_descriptor, "baseUrl", v_base_url); err != nil { return nil, err }
 			if err := coreSet(v_descriptor, "auth", "bearer"); err != nil { return nil, err }
 			_core_map_delete(v_descriptor, "apiKeyQuery")
-			v_operations = coreGet(v_descriptor, "operations", nil)
+			v_shared_operations = coreGet(v_descriptor, "operations", nil)
+			v_operations_seed = Object()
+			v_operations = _core_map_merge(v_shared_operations, v_operations_seed)
 			v_resource_parent = _core_string_format("projects/{}/locations/{}", v_project, v_region)
 			v_parent = _core_string_format("/{}", v_resource_parent)
 			if coreTruthy(v_is_gemini) {
@@ -11782,11 +11814,26 @@ func provider_resolve_descriptor(args ...Value) (Value, error) {
 				v_chat_path = _core_string_format("{}:generateContent", v_model_prefix)
 				v_stream_path = _core_string_format("{}:streamGenerateContent?alt=sse", v_model_prefix)
 				v_embed_path = _core_string_format("{}:predict", v_embed_prefix)
-				v_chat = coreGet(v_operations, "chat", nil)
-				v_stream_chat = coreGet(v_operations, "stream_chat", nil)
-				v_embed = coreGet(v_operations, "embed", nil)
-				v_transcribe = coreGet(v_operations, "transcribe", nil)
-				v_speak = coreGet(v_operations, "speak", nil)
+				v_shared_chat = coreGet(v_operations, "chat", nil)
+				v_chat_seed = Object()
+				v_chat = _core_map_merge(v_shared_chat, v_chat_seed)
+				if err := coreSet(v_operations, "chat", v_chat); err != nil { return nil, err }
+				v_shared_stream_chat = coreGet(v_operations, "stream_chat", nil)
+				v_stream_chat_seed = Object()
+				v_stream_chat = _core_map_merge(v_shared_stream_chat, v_stream_chat_seed)
+				if err := coreSet(v_operations, "stream_chat", v_stream_chat); err != nil { return nil, err }
+				v_shared_embed = coreGet(v_operations, "embed", nil)
+				v_embed_seed = Object()
+				v_embed = _core_map_merge(v_shared_embed, v_embed_seed)
+				if err := coreSet(v_operations, "embed", v_embed); err != nil { return nil, err }
+				v_shared_transcribe = coreGet(v_operations, "transcribe", nil)
+				v_transcribe_seed = Object()
+				v_transcribe = _core_map_merge(v_shared_transcribe, v_transcribe_seed)
+				if err := coreSet(v_operations, "transcribe", v_transcribe); err != nil { return nil, err }
+				v_shared_speak = coreGet(v_operations, "speak", nil)
+				v_speak_seed = Object()
+				v_speak = _core_map_merge(v_shared_speak, v_speak_seed)
+				if err := coreSet(v_operations, "speak", v_speak); err != nil { return nil, err }
 				if err := coreSet(v_chat, "path", v_chat_path); err != nil { return nil, err }
 				if err := coreSet(v_stream_chat, "path", v_stream_path); err != nil { return nil, err }
 				if err := coreSet(v_embed, "path", v_embed_path); err != nil { return nil, err }
@@ -11808,8 +11855,14 @@ func provider_resolve_descriptor(args ...Value) (Value, error) {
 				v_model_path = _core_string_replace(v_model_path_raw, "MODEL_TOKEN", "{model}")
 				v_stream_model_path_raw = _core_string_format("{}/publishers/anthropic/models/MODEL_TOKEN:streamRawPredict?alt=sse", v_parent)
 				v_stream_model_path = _core_string_replace(v_stream_model_path_raw, "MODEL_TOKEN", "{model}")
-				v_chat = coreGet(v_operations, "chat", nil)
-				v_stream_chat = coreGet(v_operations, "stream_chat", nil)
+				v_shared_chat = coreGet(v_operations, "chat", nil)
+				v_chat_seed = Object()
+				v_chat = _core_map_merge(v_shared_chat, v_chat_seed)
+				if err := coreSet(v_operations, "chat", v_chat); err != nil { return nil, err }
+				v_shared_stream_chat = coreGet(v_operations, "stream_chat", nil)
+				v_stream_chat_seed = Object()
+				v_stream_chat = _core_map_merge(v_shared_stream_chat, v_stream_chat_seed)
+				if err := coreSet(v_operations, "stream_chat", v_stream_chat); err != nil { return nil, err }
 				if err := coreSet(v_chat, "path", v_model_path); err != nil { return nil, err }
 				if err := coreSet(v_stream_chat, "path", v_stream_model_path); err != nil { return nil, err }
 				v_headers = Object()
@@ -24119,6 +24172,27 @@ func _validate_exact_output_keys(args ...Value) (Value, error) {
 func _ace_dedupe_playbook(args ...Value) (Value, error) {
 	axirCoverageMark("_ace_dedupe_playbook")
 	var v_playbook Value
+	var v_deduped Value
+	var v_empty_map Value
+	var v_section_names Value
+	var v_sections Value
+	if len(args) > 0 { v_playbook = args[0] }
+	_ = v_playbook
+	_ = v_deduped
+	_ = v_empty_map
+	_ = v_section_names
+	_ = v_sections
+	v_empty_map = Object()
+	v_sections = coreGet(v_playbook, "sections", v_empty_map)
+	v_section_names = _core_map_keys(v_sections)
+	{ v, err := _ace_dedupe_playbook_sections(v_playbook, v_section_names); if err != nil { return nil, err }; v_deduped = v }
+	return v_deduped, nil
+}
+
+func _ace_dedupe_playbook_sections(args ...Value) (Value, error) {
+	axirCoverageMark("_ace_dedupe_playbook_sections")
+	var v_playbook Value
+	var v_section_names Value
 	var v_bullet Value
 	var v_bullet_harmful Value
 	var v_bullet_helpful Value
@@ -24129,19 +24203,21 @@ func _ace_dedupe_playbook(args ...Value) (Value, error) {
 	var v_existing Value
 	var v_existing_harmful Value
 	var v_existing_helpful Value
+	var v_has_bullets Value
 	var v_has_existing Value
 	var v_key Value
 	var v_merged_harmful Value
 	var v_merged_helpful Value
 	var v_recomputed Value
 	var v_section_name Value
-	var v_section_names Value
 	var v_sections Value
 	var v_seen Value
 	var v_trimmed Value
 	var v_unique Value
 	if len(args) > 0 { v_playbook = args[0] }
 	_ = v_playbook
+	if len(args) > 1 { v_section_names = args[1] }
+	_ = v_section_names
 	_ = v_bullet
 	_ = v_bullet_harmful
 	_ = v_bullet_helpful
@@ -24152,47 +24228,51 @@ func _ace_dedupe_playbook(args ...Value) (Value, error) {
 	_ = v_existing
 	_ = v_existing_harmful
 	_ = v_existing_helpful
+	_ = v_has_bullets
 	_ = v_has_existing
 	_ = v_key
 	_ = v_merged_harmful
 	_ = v_merged_helpful
 	_ = v_recomputed
 	_ = v_section_name
-	_ = v_section_names
 	_ = v_sections
 	_ = v_seen
 	_ = v_trimmed
 	_ = v_unique
 	v_empty_map = Object()
 	v_sections = coreGet(v_playbook, "sections", v_empty_map)
-	v_section_names = _core_map_keys(v_sections)
 	for _, v_section_name = range coreIter(v_section_names) {
 		v_bullets = coreGet(v_sections, v_section_name, nil)
-		v_seen = Object()
-		v_unique = MutableArray()
-		for _, v_bullet = range coreIter(v_bullets) {
-			v_content = coreGet(v_bullet, "content", "")
-			v_trimmed = coreStringTrim(v_content)
-			v_key = _core_string_lower(v_trimmed)
-			v_has_existing = _core_map_contains(v_seen, v_key)
-			if coreTruthy(v_has_existing) {
-				v_existing = coreGet(v_seen, v_key, nil)
-				v_existing_helpful = coreGet(v_existing, "helpfulCount", 0)
-				v_bullet_helpful = coreGet(v_bullet, "helpfulCount", 0)
-				v_merged_helpful = _core_add(v_existing_helpful, v_bullet_helpful)
-				if err := coreSet(v_existing, "helpfulCount", v_merged_helpful); err != nil { return nil, err }
-				v_existing_harmful = coreGet(v_existing, "harmfulCount", 0)
-				v_bullet_harmful = coreGet(v_bullet, "harmfulCount", 0)
-				v_merged_harmful = _core_add(v_existing_harmful, v_bullet_harmful)
-				if err := coreSet(v_existing, "harmfulCount", v_merged_harmful); err != nil { return nil, err }
-				v_bullet_updated_at = coreGet(v_bullet, "updatedAt", "")
-				if err := coreSet(v_existing, "updatedAt", v_bullet_updated_at); err != nil { return nil, err }
-			} else {
-				if err := coreSet(v_seen, v_key, v_bullet); err != nil { return nil, err }
-				v_unique = coreAppend(v_unique, v_bullet)
-			}
-		}
-		if err := coreSet(v_sections, v_section_name, v_unique); err != nil { return nil, err }
+		v_has_bullets = _core_truthy(v_bullets)
+		if coreTruthy(v_has_bullets) {
+			v_seen = Object()
+			v_unique = MutableArray()
+			for _, v_bullet = range coreIter(v_bullets) {
+				v_content = coreGet(v_bullet, "content", "")
+				v_trimmed = coreStringTrim(v_content)
+				v_key = _core_string_lower(v_trimmed)
+				v_has_existing = _core_map_contains(v_seen, v_key)
+				if coreTruthy(v_has_existing) {
+					v_existing = coreGet(v_seen, v_key, nil)
+					v_existing_helpful = coreGet(v_existing, "helpfulCount", 0)
+					v_bullet_helpful = coreGet(v_bullet, "helpfulCount", 0)
+					v_merged_helpful = _core_add(v_existing_helpful, v_bullet_helpful)
+					if err := coreSet(v_existing, "helpfulCount", v_merged_helpful); err != nil { return nil, err }
+					v_existing_harmful = coreGet(v_existing, "harmfulCount", 0)
+					v_bullet_harmful = coreGet(v_bullet, "harmfulCount", 0)
+					v_merged_harmful = _core_add(v_existing_harmful, v_bullet_harmful)
+					if err := coreSet(v_existing, "harmfulCount", v_merged_harmful); err != nil { return nil, err }
+					v_bullet_updated_at = coreGet(v_bullet, "updatedAt", "")
+					if err := coreSet(v_existing, "updatedAt", v_bullet_updated_at); err != nil { return nil, err }
+				} else {
+					if err := coreSet(v_seen, v_key, v_bullet); err != nil { return nil, err }
+					v_unique = coreAppend(v_unique, v_bullet)
+				}
+			}
+			if err := coreSet(v_sections, v_section_name, v_unique); err != nil { return nil, err }
+		} else {
+		// empty
+		}
 	}
 	if err := coreSet(v_playbook, "sections", v_sections); err != nil { return nil, err }
 	{ v, err := _ace_recompute_playbook_stats(v_playbook); if err != nil { return nil, err }; v_recomputed = v }
@@ -24260,6 +24340,20 @@ func _function_call_mode_impl(args ...Value) (Value, error) {
 	return v_mode, nil
 }
 
+func _response_function_calls_impl(args ...Value) (Value, error) {
+	axirCoverageMark("_response_function_calls_impl")
+	var v_response Value
+	var v_calls Value
+	var v_empty Value
+	if len(args) > 0 { v_response = args[0] }
+	_ = v_response
+	_ = v_calls
+	_ = v_empty
+	v_empty = MutableArray()
+	v_calls = coreGet(v_response, "function_calls", v_empty)
+	return v_calls, nil
+}
+
 func _ace_prune_section_for_addition(args ...Value) (Value, error) {
 	axirCoverageMark("_ace_prune_section_for_addition")
 	var v_section Value
@@ -24423,20 +24517,6 @@ func _ace_prune_section_for_addition(args ...Value) (Value, error) {
 	return v_out, nil
 }
 
-func _response_function_calls_impl(args ...Value) (Value, error) {
-	axirCoverageMark("_response_function_calls_impl")
-	var v_response Value
-	var v_calls Value
-	var v_empty Value
-	if len(args) > 0 { v_response = args[0] }
-	_ = v_response
-	_ = v_calls
-	_ = v_empty
-	v_empty = MutableArray()
-	v_calls = coreGet(v_response, "function_calls", v_empty)
-	return v_calls, nil
-}
-
 func _append_tool_call_messages_impl(args ...Value) (Value, error) {
 	axirCoverageMark("_append_tool_call_messages_impl")
 	var v_messages Value
@@ -24545,6 +24625,37 @@ func _tool_result_message_impl(args ...Value) (Value, error) {
 	return v_message, nil
 }
 
+func _tool_error_message_impl(args ...Value) (Value, error) {
+	axirCoverageMark("_tool_error_message_impl")
+	var v_call Value
+	var v_error Value
+	var v_error_text Value
+	var v_id Value
+	var v_message Value
+	var v_payload Value
+	var v_payload_json Value
+	if len(args) > 0 { v_call = args[0] }
+	_ = v_call
+	if len(args) > 1 { v_error = args[1] }
+	_ = v_error
+	_ = v_error_text
+	_ = v_id
+	_ = v_message
+	_ = v_payload
+	_ = v_payload_json
+	v_id = coreGet(v_call, "id", nil)
+	v_error_text = _core_exception_message(v_error)
+	v_payload = Object()
+	if err := coreSet(v_payload, "error", v_error_text); err != nil { return nil, err }
+	v_payload_json = _core_json_stringify(v_payload)
+	v_message = Object()
+	if err := coreSet(v_message, "role", "function"); err != nil { return nil, err }
+	if err := coreSet(v_message, "function_id", v_id); err != nil { return nil, err }
+	if err := coreSet(v_message, "result", v_payload_json); err != nil { return nil, err }
+	if err := coreSet(v_message, "is_error", true); err != nil { return nil, err }
+	return v_message, nil
+}
+
 func _ace_apply_curator_operations(args ...Value) (Value, error) {
 	axirCoverageMark("_ace_apply_curator_operations")
 	var v_playbook Value
@@ -24900,37 +25011,6 @@ func _ace_apply_curator_operations(args ...Value) (Value, error) {
 	return v_out, nil
 }
 
-func _tool_error_message_impl(args ...Value) (Value, error) {
-	axirCoverageMark("_tool_error_message_impl")
-	var v_call Value
-	var v_error Value
-	var v_error_text Value
-	var v_id Value
-	var v_message Value
-	var v_payload Value
-	var v_payload_json Value
-	if len(args) > 0 { v_call = args[0] }
-	_ = v_call
-	if len(args) > 1 { v_error = args[1] }
-	_ = v_error
-	_ = v_error_text
-	_ = v_id
-	_ = v_message
-	_ = v_payload
-	_ = v_payload_json
-	v_id = coreGet(v_call, "id", nil)
-	v_error_text = _core_exception_message(v_error)
-	v_payload = Object()
-	if err := coreSet(v_payload, "error", v_error_text); err != nil { return nil, err }
-	v_payload_json = _core_json_stringify(v_payload)
-	v_message = Object()
-	if err := coreSet(v_message, "role", "function"); err != nil { return nil, err }
-	if err := coreSet(v_message, "function_id", v_id); err != nil { return nil, err }
-	if err := coreSet(v_message, "result", v_payload_json); err != nil { return nil, err }
-	if err := coreSet(v_message, "is_error", true); err != nil { return nil, err }
-	return v_message, nil
-}
-
 func _append_validation_retry_messages_impl(args ...Value) (Value, error) {
 	axirCoverageMark("_append_validation_retry_messages_impl")
 	var v_messages Value
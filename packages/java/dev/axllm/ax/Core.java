@@ -5792,7 +5792,9 @@ final class Core {
 
   static Object provider_resolve_descriptor(Object profile, Object options) {
     axirCoverageMark("provider_resolve_descriptor");
-    Object descriptor = Core.provider_descriptor(profile);
+    Object shared_descriptor = Core.provider_descriptor(profile);
+    Object descriptor_seed = new java.util.LinkedHashMap<String, Object>();
+    Object descriptor = Core.mapMerge(shared_descriptor, descriptor_seed);
     Object provider_id = Core.provider_normalize_profile(profile);
     Object generic_base_snake = Core.get(options, "base_url", null);
     Object generic_base_camel = Core.get(options, "baseUrl", generic_base_snake);
@@ -5903,7 +5905,9 @@ final class Core {
         Core.set(descriptor, "baseUrl", base_url);
         Core.set(descriptor, "auth", "bearer");
         Core.mapDelete(descriptor, "apiKeyQuery");
-        Object operations = Core.get(descriptor, "operations", null);
+        Object shared_operations = Core.get(descriptor, "operations", null);
+        Object operations_seed = new java.util.LinkedHashMap<String, Object>();
+        Object operations = Core.mapMerge(shared_operations, operations_seed);
         Object resource_parent = Core.stringFormat("projects/{}/locations/{}", project, region);
         Object parent = Core.stringFormat("/{}", resource_parent);
         if (Core.truthy(is_gemini)) {
@@ -5920,11 +5924,26 @@ final class Core {
           Object chat_path = Core.stringFormat("{}:generateContent", model_prefix);
           Object stream_path = Core.stringFormat("{}:streamGenerateContent?alt=sse", model_prefix);
           Object embed_path = Core.stringFormat("{}:predict", embed_prefix);
-          Object chat = Core.get(operations, "chat", null);
-          Object stream_chat = Core.get(operations, "stream_chat", null);
-          Object embed = Core.get(operations, "embed", null);
-          Object transcribe = Core.get(operations, "transcribe", null);
-          Object speak = Core.get(operations, "speak", null);
+          Object shared_chat = Core.get(operations, "chat", null);
+          Object chat_seed = new java.util.LinkedHashMap<String, Object>();
+          Object chat = Core.mapMerge(shared_chat, chat_seed);
+          Core.set(operations, "chat", chat);
+          Object shared_stream_chat = Core.get(operations, "stream_chat", null);
+          Object stream_chat_seed = new java.util.LinkedHashMap<String, Object>();
+          Object stream_chat = Core.mapMerge(shared_stream_chat, stream_chat_seed);
+          Core.set(operations, "stream_chat", stream_chat);
+          Object shared_embed = Core.get(operations, "embed", null);
+          Object embed_seed = new java.util.LinkedHashMap<String, Object>();
+          Object embed = Core.mapMerge(shared_embed, embed_seed);
+          Core.set(operations, "embed", embed);
+          Object shared_transcribe = Core.get(operations, "transcribe", null);
+          Object transcribe_seed = new java.util.LinkedHashMap<String, Object>();
+          Object transcribe = Core.mapMerge(shared_transcribe, transcribe_seed);
+          Core.set(operations, "transcribe", transcribe);
+          Object shared_speak = Core.get(operations, "speak", null);
+          Object speak_seed = new java.util.LinkedHashMap<String, Object>();
+          Object speak = Core.mapMerge(shared_speak, speak_seed);
+          Core.set(operations, "speak", speak);
           Core.set(chat, "path", chat_path);
           Core.set(stream_chat, "path", stream_path);
           Core.set(embed, "path", embed_path);
@@ -5945,8 +5964,14 @@ final class Core {
           Object model_path = Core.stringReplace(model_path_raw, "MODEL_TOKEN", "{model}");
           Object stream_model_path_raw = Core.stringFormat("{}/publishers/anthropic/models/MODEL_TOKEN:streamRawPredict?alt=sse", parent);
           Object stream_model_path = Core.stringReplace(stream_model_path_raw, "MODEL_TOKEN", "{model}");
-          Object chat = Core.get(operations, "chat", null);
-          Object stream_chat = Core.get(operations, "stream_chat", null);
+          Object shared_chat = Core.get(operations, "chat", null);
+          Object chat_seed = new java.util.LinkedHashMap<String, Object>();
+          Object chat = Core.mapMerge(shared_chat, chat_seed);
+          Core.set(operations, "chat", chat);
+          Object shared_stream_chat = Core.get(operations, "stream_chat", null);
+          Object stream_chat_seed = new java.util.LinkedHashMap<String, Object>();
+          Object stream_chat = Core.mapMerge(shared_stream_chat, stream_chat_seed);
+          Core.set(operations, "stream_chat", stream_chat);
           Core.set(chat, "path", model_path);
           Core.set(stream_chat, "path", stream_model_path);
           Object headers = new java.util.LinkedHashMap<String, Object>();
@@ -11803,34 +11828,45 @@ final class Core {
     Object empty_map = new java.util.LinkedHashMap<String, Object>();
     Object sections = Core.get(playbook, "sections", empty_map);
     Object section_names = Core.mapKeys(sections);
+    Object deduped = Core._ace_dedupe_playbook_sections(playbook, section_names);
+    return deduped;
+  }
+
+  static Object _ace_dedupe_playbook_sections(Object playbook, Object section_names) {
+    axirCoverageMark("_ace_dedupe_playbook_sections");
+    Object empty_map = new java.util.LinkedHashMap<String, Object>();
+    Object sections = Core.get(playbook, "sections", empty_map);
     for (Object section_name : Core.iter(section_names)) {
       Object bullets = Core.get(sections, section_name, null);
-      Object seen = new java.util.LinkedHashMap<String, Object>();
-      Object unique = new java.util.ArrayList<Object>();
-      for (Object bullet : Core.iter(bullets)) {
-        Object content = Core.get(bullet, "content", "");
-        Object trimmed = Core.stringTrim(content);
-        Object key = Core.stringLower(trimmed);
-        Object has_existing = Core.mapContains(seen, key);
-        if (Core.truthy(has_existing)) {
-          Object existing = Core.get(seen, key, null);
-          Object existing_helpful = Core.get(existing, "helpfulCount", 0);
-          Object bullet_helpful = Core.get(bullet, "helpfulCount", 0);
-          Object merged_helpful = Core.add(existing_helpful, bullet_helpful);
-          Core.set(existing, "helpfulCount", merged_helpful);
-          Object existing_harmful = Core.get(existing, "harmfulCount", 0);
-          Object bullet_harmful = Core.get(bullet, "harmfulCount", 0);
-          Object merged_harmful = Core.add(existing_harmful, bullet_harmful);
-          Core.set(existing, "harmfulCount", merged_harmful);
-          Object bullet_updated_at = Core.get(bullet, "updatedAt", "");
-          Core.set(existing, "updatedAt", bullet_updated_at);
-        }
-        if (!Core.truthy(has_existing)) {
-          Core.set(seen, key, bullet);
-          Core.append(unique, bullet);
-        }
-      }
-      Core.set(sections, section_name, unique);
+      Object has_bullets = Core.truthyValue(bullets);
+      if (Core.truthy(has_bullets)) {
+        Object seen = new java.util.LinkedHashMap<String, Object>();
+        Object unique = new java.util.ArrayList<Object>();
+        for (Object bullet : Core.iter(bullets)) {
+          Object content = Core.get(bullet, "content", "");
+          Object trimmed = Core.stringTrim(content);
+          Object key = Core.stringLower(trimmed);
+          Object has_existing = Core.mapContains(seen, key);
+          if (Core.truthy(has_existing)) {
+            Object existing = Core.get(seen, key, null);
+            Object existing_helpful = Core.get(existing, "helpfulCount", 0);
+            Object bullet_helpful = Core.get(bullet, "helpfulCount", 0);
+            Object merged_helpful = Core.add(existing_helpful, bullet_helpful);
+            Core.set(existing, "helpfulCount", merged_helpful);
+            Object existing_harmful = Core.get(existing, "harmfulCount", 0);
+            Object bullet_harmful = Core.get(bullet, "harmfulCount", 0);
+            Object merged_harmful = Core.add(existing_harmful, bullet_harmful);
+            Core.set(existing, "harmfulCount", merged_harmful);
+            Object bullet_updated_at = Core.get(bullet, "updatedAt", "");
+            Core.set(existing, "updatedAt", bullet_updated_at);
+          }
+          if (!Core.truthy(has_existing)) {
+            Core.set(seen, key, bullet);
+            Core.append(unique, bullet);
+          }
+        }
+        Core.set(sections, section_name, unique);
+      }
     }
     Core.set(playbook, "sections", sections);
     Object recomputed = Core._ace_recompute_playbook_stats(playbook);
@@ -11868,6 +11904,13 @@ final class Core {
     return mode;
   }
 
+  static Object _response_function_calls_impl(Object response) {
+    axirCoverageMark("_response_function_calls_impl");
+    Object empty = new java.util.ArrayList<Object>();
+    Object calls = Core.get(response, "function_calls", empty);
+    return calls;
+  }
+
   static Object _ace_prune_section_for_addition(Object section, Object protected_ids) {
     axirCoverageMark("_ace_prune_section_for_addition");
     Object candidate_index = -1;
@@ -11949,13 +11992,6 @@ final class Core {
     return out;
   }
 
-  static Object _response_function_calls_impl(Object response) {
-    axirCoverageMark("_response_function_calls_impl");
-    Object empty = new java.util.ArrayList<Object>();
-    Object calls = Core.get(response, "function_calls", empty);
-    return calls;
-  }
-
   static Object _append_tool_call_messages_impl(Object messages, Object response, Object calls) {
     axirCoverageMark("_append_tool_call_messages_impl");
     Object chat_calls = new java.util.ArrayList<Object>();
@@ -12008,6 +12044,21 @@ final class Core {
     return message;
   }
 
+  static Object _tool_error_message_impl(Object call, Object error) {
+    axirCoverageMark("_tool_error_message_impl");
+    Object id = Core.get(call, "id", null);
+    Object error_text = Core.exceptionMessage(error);
+    Object payload = new java.util.LinkedHashMap<String, Object>();
+    Core.set(payload, "error", error_text);
+    Object payload_json = Core.jsonStringify(payload);
+    Object message = new java.util.LinkedHashMap<String, Object>();
+    Core.set(message, "role", "function");
+    Core.set(message, "function_id", id);
+    Core.set(message, "result", payload_json);
+    Core.set(message, "is_error", Boolean.TRUE);
+    return message;
+  }
+
   static Object _ace_apply_curator_operations(Object playbook, Object operations, Object options, Object now) {
     axirCoverageMark("_ace_apply_curator_operations");
     Object empty_map = new java.util.LinkedHashMap<String, Object>();
@@ -12178,21 +12229,6 @@ final class Core {
     return out;
   }
 
-  static Object _tool_error_message_impl(Object call, Object error) {
-    axirCoverageMark("_tool_error_message_impl");
-    Object id = Core.get(call, "id", null);
-    Object error_text = Core.exceptionMessage(error);
-    Object payload = new java.util.LinkedHashMap<String, Object>();
-    Core.set(payload, "error", error_text);
-    Object payload_json = Core.jsonStringify(payload);
-    Object message = new java.util.LinkedHashMap<String, Object>();
-    Core.set(message, "role", "function");
-    Core.set(message, "function_id", id);
-    Core.set(message, "result", payload_json);
-    Core.set(message, "is_error", Boolean.TRUE);
-    return message;
-  }
-
   static Object _append_validation_retry_messages_impl(Object messages, Object response, Object error) {
     axirCoverageMark("_append_validation_retry_messages_impl");
     Object content = Core.get(response, "content", "");
@@ -1,61 +1,270 @@
-from .signature import AxSignature, AxSignatureError, Field, FieldType, SignatureBuilder, f, s
-from .schema import AxValidationError
-from .tool import Tool, fn
-from .ai import (
-    AIClient,
-    AxAIRefusalError,
-    AxAIService,
-    AxAIServiceAuthenticationError,
-    AxAIServiceError,
-    AxAIServiceNetworkError,
-    AxAIServiceResponseError,
-    AxAIServiceStatusError,
-    AxAIServiceStreamTerminatedError,
-    AxAIServiceTimeoutError,
-    AxBaseAI,
-    AxBalancer,
-    AxBalancerAdaptiveStrategy,
-    AxBalancerCandidateScore,
-    AxBalancerFailureReason,
-    AxBalancerOptions,
-    AxBalancerRouteStats,
-    AxBalancerRoutingEvent,
-    AxBalancerStatsKey,
-    AxBalancerStatsObservation,
-    AxBalancerStatsStore,
-    AxInMemoryBalancerStatsStore,
-    AxUnsupportedCapabilityError,
-    AxUsageContext,
-    AxUsageEvent,
-    AxUsageObserver,
-    AnthropicClient,
-    GoogleGeminiClient,
-    MultiServiceRouter,
-    OpenAICompatibleClient,
-    OpenAIResponsesClient,
-    ProviderRouter,
-    ai,
-    create_balancer_route_stats,
-    get_supported_ai_models,
-    sample_balancer_route_health,
-    set_usage_observer,
-    update_balancer_route_stats,
-)
-from .gen import AxGen, AxMemory, ax
-from .agent import AxAgent, AxAgentClarificationError, AxBootstrapFewShot, AxCodeRuntime, AxCodeSession, AxGEPA, AxPlaybook, OptimizerEngine, OptimizerEvaluator, agent, optimize, playbook
-from .flow import AxFlow, AxProgram, flow
-from .mcp import AxEventCancellationToken, AxEventClock, AxEventCommand, AxEventContinuation, AxEventDeadLetter, AxEventEnvelope, AxEventInputBuilder, AxEventInputError, AxEventInputPlan, AxEventPath, AxEventPublishReceipt, AxEventRoute, AxEventRouteBuilder, AxEventRun, AxEventRuntime, AxEventSink, AxEventSource, AxEventStore, AxEventTarget, AxEventTargetBuilder, AxExecutionContext, AxInMemoryEventStore, AxManualEventClock, AxMCPClient, AxMCPContinuationState, AxMCPEventSource, AxMCPOAuthOptions, AxMCPScriptedTransport, AxMCPStdioTransport, AxMCPStreamableHTTPTransport, AxMCPTokenSet, AxMCPTransport, AxPushEventSource, AxSystemEventClock, AxUCPBinding, AxUCPClient, event_input, event_path, event_route, event_target
-from .prompt import AxPromptTemplate, TemplateError, render_template_content, validate_prompt_template_syntax
-from .runtime import ProcessCodeRuntime, ProcessCodeSession, RuntimeCapabilities, RuntimeEnvelope
-from .runtime_quickjs import AxQuickJsCodeRuntime, AxQuickJsCodeSession
+from __future__ import annotations
+
+import importlib
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .signature import AxSignature, AxSignatureError, Field, FieldType, SignatureBuilder, f, s
+    from .schema import AxValidationError
+    from .tool import Tool, fn
+    from .ai import (
+        AIClient,
+        AxAIRefusalError,
+        AxAIService,
+        AxAIServiceAuthenticationError,
+        AxAIServiceCircuitOpenError,
+        AxAIServiceError,
+        AxAIServiceNetworkError,
+        AxAIServiceRateLimitError,
+        AxAIServiceResponseError,
+        AxAIServiceStatusError,
+        AxAIServiceStreamTerminatedError,
+        AxAIServiceTimeoutError,
+        AxBaseAI,
+        AxBalancer,
+        AxBalancerAdaptiveStrategy,
+        AxBalancerCandidateScore,
+        AxBalancerFailureReason,
+        AxBalancerOptions,
+        AxBalancerRouteStats,
+        AxBalancerRoutingEvent,
+        AxBalancerStatsKey,
+        AxBalancerStatsObservation,
+        AxBalancerStatsStore,
+        AxCircuitBreaker,
+        AxCircuitBreakerRegistry,
+        AxFileRateLimitStore,
+        AxMediaBuffer,
+        AxInMemoryBalancerStatsStore,
+        AxInMemoryRateLimitStore,
+        AxRateLimitStore,
+        AxRateLimiter,
+        AxRetryBudget,
+        AxRetryPolicy,
+        AxUnsupportedCapabilityError,
+        AxUsageContext,
+        AxUsageEvent,
+        AxUsageObserver,
+        AnthropicClient,
+        GoogleGeminiClient,
+        MultiServiceRouter,
+        OpenAICompatibleClient,
+        OpenAIResponsesClient,
+        ProviderRouter,
+        ai,
+        create_balancer_route_stats,
+        get_supported_ai_models,
+        sample_balancer_route_health,
+        set_usage_observer,
+        update_balancer_route_stats,
+    )
+    from .gen import AxGen, AxInMemoryMemoryStore, AxJsonlTraceSink, AxMemory, AxMemoryStore, AxRunContext, AxSQLiteMemoryStore, AxTraceBuffer, AxTraceSink, ax
+    from .agent import AxAgent, AxAgentClarificationError, AxBootstrapFewShot, AxCodeRuntime, AxCodeSession, AxGEPA, AxPlaybook, OptimizerEngine, OptimizerEvaluator, agent, optimize, playbook
+    from .flow import AxFlow, AxProgram, flow
+    from .mcp import AxEventCancellationToken, AxEventClock, AxEventCommand, AxEventContinuation, AxEventDeadLetter, AxEventEnvelope, AxEventInputBuilder, AxEventInputError, AxEventInputPlan, AxEventPath, AxEventPublishReceipt, AxEventRoute, AxEventRouteBuilder, AxEventRun, AxEventRuntime, AxEventSink, AxEventSource, AxEventStore, AxEventTarget, AxEventTargetBuilder, AxExecutionContext, AxInMemoryEventStore, AxManualEventClock, AxMCPClient, AxMCPContinuationState, AxMCPEventSource, AxMCPOAuthOptions, AxMCPScriptedTransport, AxMCPStdioTransport, AxMCPStreamableHTTPTransport, AxMCPTokenSet, AxMCPTransport, AxPushEventSource, AxSystemEventClock, AxUCPBinding, AxUCPClient, event_input, event_path, event_route, event_target
+    from .prompt import AxPromptTemplate, TemplateError, render_template_content, validate_prompt_template_syntax
+    from .runtime import ProcessCodeRuntime, ProcessCodeSession, RuntimeCapabilities, RuntimeEnvelope
+    from .runtime_quickjs import AxQuickJsCodeRuntime, AxQuickJsCodeSession
+
+# Public names resolve lazily (PEP 562): `import axllm` loads no submodule, and
+# `axllm.ai` only pulls in the provider layer. Agent, flow, MCP/event runtime and
+# optimizer code load on first attribute access.
+_LAZY_EXPORTS: dict[str, tuple[str, ...]] = {
+    "signature": (
+        "AxSignature",
+        "AxSignatureError",
+        "Field",
+        "FieldType",
+        "SignatureBuilder",
+        "f",
+        "s",
+    ),
+    "schema": (
+        "AxValidationError",
+    ),
+    "tool": (
+        "Tool",
+        "fn",
+    ),
+    "ai": (
+        "AIClient",
+        "AxAIRefusalError",
+        "AxAIService",
+        "AxAIServiceAuthenticationError",
+        "AxAIServiceCircuitOpenError",
+        "AxAIServiceError",
+        "AxAIServiceNetworkError",
+        "AxAIServiceRateLimitError",
+        "AxAIServiceResponseError",
+        "AxAIServiceStatusError",
+        "AxAIServiceStreamTerminatedError",
+        "AxAIServiceTimeoutError",
+        "AxBaseAI",
+        "AxBalancer",
+        "AxBalancerAdaptiveStrategy",
+        "AxBalancerCandidateScore",
+        "AxBalancerFailureReason",
+        "AxBalancerOptions",
+        "AxBalancerRouteStats",
+        "AxBalancerRoutingEvent",
+        "AxBalancerStatsKey",
+        "AxBalancerStatsObservation",
+        "AxBalancerStatsStore",
+        "AxCircuitBreaker",
+        "AxCircuitBreakerRegistry",
+        "AxFileRateLimitStore",
+        "AxMediaBuffer",
+        "AxInMemoryBalancerStatsStore",
+        "AxInMemoryRateLimitStore",
+        "AxRateLimitStore",
+        "AxRateLimiter",
+        "AxRetryBudget",
+        "AxRetryPolicy",
+        "AxUnsupportedCapabilityError",
+        "AxUsageContext",
+        "AxUsageEvent",
+        "AxUsageObserver",
+        "AnthropicClient",
+        "GoogleGeminiClient",
+        "MultiServiceRouter",
+        "OpenAICompatibleClient",
+        "OpenAIResponsesClient",
+        "ProviderRouter",
+        "ai",
+        "create_balancer_route_stats",
+        "get_supported_ai_models",
+        "sample_balancer_route_health",
+        "set_usage_observer",
+        "update_balancer_route_stats",
+    ),
+    "gen": (
+        "AxGen",
+        "AxInMemoryMemoryStore",
+        "AxJsonlTraceSink",
+        "AxMemory",
+        "AxMemoryStore",
+        "AxRunContext",
+        "AxSQLiteMemoryStore",
+        "AxTraceBuffer",
+        "AxTraceSink",
+        "ax",
+    ),
+    "agent": (
+        "AxAgent",
+        "AxAgentClarificationError",
+        "AxBootstrapFewShot",
+        "AxCodeRuntime",
+        "AxCodeSession",
+        "AxGEPA",
+        "AxPlaybook",
+        "OptimizerEngine",
+        "OptimizerEvaluator",
+        "agent",
+        "optimize",
+        "playbook",
+    ),
+    "flow": (
+        "AxFlow",
+        "AxProgram",
+        "flow",
+    ),
+    "mcp": (
+        "AxEventCancellationToken",
+        "AxEventClock",
+        "AxEventCommand",
+        "AxEventContinuation",
+        "AxEventDeadLetter",
+        "AxEventEnvelope",
+        "AxEventInputBuilder",
+        "AxEventInputError",
+        "AxEventInputPlan",
+        "AxEventPath",
+        "AxEventPublishReceipt",
+        "AxEventRoute",
+        "AxEventRouteBuilder",
+        "AxEventRun",
+        "AxEventRuntime",
+        "AxEventSink",
+        "AxEventSource",
+        "AxEventStore",
+        "AxEventTarget",
+        "AxEventTargetBuilder",
+        "AxExecutionContext",
+        "AxInMemoryEventStore",
+        "AxManualEventClock",
+        "AxMCPClient",
+        "AxMCPContinuationState",
+        "AxMCPEventSource",
+        "AxMCPOAuthOptions",
+        "AxMCPScriptedTransport",
+        "AxMCPStdioTransport",
+        "AxMCPStreamableHTTPTransport",
+        "AxMCPTokenSet",
+        "AxMCPTransport",
+        "AxPushEventSource",
+        "AxSystemEventClock",
+        "AxUCPBinding",
+        "AxUCPClient",
+        "event_input",
+        "event_path",
+        "event_route",
+        "event_target",
+    ),
+    "prompt": (
+        "AxPromptTemplate",
+        "TemplateError",
+        "render_template_content",
+        "validate_prompt_template_syntax",
+    ),
+    "runtime": (
+        "ProcessCodeRuntime",
+        "ProcessCodeSession",
+        "RuntimeCapabilities",
+        "RuntimeEnvelope",
+    ),
+    "runtime_quickjs": (
+        "AxQuickJsCodeRuntime",
+        "AxQuickJsCodeSession",
+    ),
+}
+_EXPORT_MODULES = {name: module for module, names in _LAZY_EXPORTS.items() for name in names}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORT_MODULES))
+
+
+class _AxLazyPackage(ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing `axllm.ai` / `axllm.agent` / `axllm.flow` binds the submodule
+        # on the package; keep the same-named factory functions visible instead.
+        if isinstance(value, ModuleType) and name in _EXPORT_MODULES:
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _AxLazyPackage
 
 __all__ = [
     "AIClient",
     "AxAIRefusalError",
     "AxAIService",
     "AxAIServiceAuthenticationError",
+    "AxAIServiceCircuitOpenError",
     "AxAIServiceError",
     "AxAIServiceNetworkError",
+    "AxAIServiceRateLimitError",
     "AxAIServiceResponseError",
     "AxAIServiceStatusError",
     "AxAIServiceStreamTerminatedError",
@@ -71,7 +280,16 @@ __all__ = [
     "AxBalancerStatsKey",
     "AxBalancerStatsObservation",
     "AxBalancerStatsStore",
+    "AxCircuitBreaker",
+    "AxCircuitBreakerRegistry",
+    "AxFileRateLimitStore",
+    "AxMediaBuffer",
     "AxInMemoryBalancerStatsStore",
+    "AxInMemoryRateLimitStore",
+    "AxRateLimitStore",
+    "AxRateLimiter",
+    "AxRetryBudget",
+    "AxRetryPolicy",
     "AxGen",
     "AxFlow",
     "AxAgent",
@@ -84,6 +302,12 @@ __all__ = [
     "AxGEPA",
     "AxPlaybook",
     "AxMemory",
+    "AxMemoryStore",
+    "AxInMemoryMemoryStore",
+    "AxSQLiteMemoryStore",
+    "AxTraceBuffer",
+    "AxTraceSink",
+    "AxJsonlTraceSink",
     "AxExecutionContext",
     "AxEventClock",
     "AxEventCommand",
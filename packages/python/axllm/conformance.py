@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import copy
 import json
 import os
@@ -462,7 +463,39 @@ def run_fixture_path(path):
     return run_fixture(data, source=str(path))
 
 
+@contextlib.contextmanager
+def _portable_core():
+    """Route every Python host replacement back to its portable Core definition.
+
+    Each module lists the definitions it replaced in ``_CORE_PORTABLE``. Every
+    package global bound to a replacement, including names imported into other
+    modules, points at the portable definition until the block exits.
+    """
+    prefix = f"{__package__}."
+    modules = [module for name, module in list(sys.modules.items()) if name.startswith(prefix) and module is not None]
+    portable = {}
+    for module in modules:
+        for name, definition in (getattr(module, "_CORE_PORTABLE", None) or {}).items():
+            portable[id(getattr(module, name))] = definition
+    swapped = []
+    for module in modules:
+        for name, value in list(vars(module).items()):
+            definition = portable.get(id(value))
+            if definition is not None:
+                swapped.append((module, name, value))
+                setattr(module, name, definition)
+    try:
+        yield
+    finally:
+        for module, name, value in swapped:
+            setattr(module, name, value)
+
+
 def run_fixture(fixture: dict[str, Any], *, source: str | None = None):
+    if fixture.get("core_path") == "portable":
+        # Run the portable Core definitions that the Python host replacements shadow.
+        with _portable_core():
+            return run_fixture({key: value for key, value in fixture.items() if key != "core_path"}, source=source)
     name = fixture.get("name") or source or "<fixture>"
     kind = fixture.get("kind", "forward")
     try:
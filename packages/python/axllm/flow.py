@@ -4,11 +4,16 @@ import os
 from abc import ABC, abstractmethod
 import copy
 import json
+import threading
+import weakref
 from typing import Any, Callable
 
 from .ai import AIClient
 from .gen import (
     AxGen,
+    AxRunContext,
+    _core_program_begin_run,
+    _core_program_end_run,
     ax,
     _core_exception_message,
     _core_eq,
@@ -21,7 +26,6 @@ from .gen import (
     _core_get,
     _core_is_none,
     _core_json_stringify,
-    _core_map_merge,
     _core_object_call_method,
     _core_or,
     _core_runtime_error,
@@ -94,6 +98,167 @@ def _core_coverage_mark(name):
         handle.write(name + "\n")
 
 
+_FLOW_STATE_MISSING = object()
+_FLOW_STATE_DELETED = object()
+_FLOW_STATE_MAX_DEPTH = 32
+
+
+class _FlowState(dict):
+    """Copy-on-write flow state layered over a shared parent state.
+
+    The dict storage holds only this layer's writes; reads fall through the
+    parent chain. Each node therefore pays for its own outputs rather than a
+    copy of the whole state. Copies, pickles and ``dict(...)`` see a flat dict.
+    """
+
+    __slots__ = ("_parent", "_depth")
+
+    def __init__(self, parent=None):
+        super().__init__()
+        depth = parent._depth if isinstance(parent, _FlowState) else 0
+        if depth >= _FLOW_STATE_MAX_DEPTH:
+            parent = parent.flatten()
+            depth = 0
+        self._parent = parent
+        self._depth = depth + 1
+
+    def _lookup(self, key):
+        layer = self
+        while isinstance(layer, _FlowState):
+            value = dict.get(layer, key, _FLOW_STATE_MISSING)
+            if value is _FLOW_STATE_DELETED:
+                return _FLOW_STATE_MISSING
+            if value is not _FLOW_STATE_MISSING:
+                return value
+            layer = layer._parent
+        if layer is None:
+            return _FLOW_STATE_MISSING
+        return layer.get(key, _FLOW_STATE_MISSING)
+
+    def flatten(self):
+        layers = []
+        layer = self
+        while isinstance(layer, _FlowState):
+            layers.append(layer)
+            layer = layer._parent
+        out = dict(layer or {})
+        for layer in reversed(layers):
+            for key, value in dict.items(layer):
+                if value is _FLOW_STATE_DELETED:
+                    out.pop(key, None)
+                else:
+                    out[key] = value
+        return out
+
+    def __getitem__(self, key):
+        value = self._lookup(key)
+        if value is _FLOW_STATE_MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        value = self._lookup(key)
+        return default if value is _FLOW_STATE_MISSING else value
+
+    def __contains__(self, key):
+        return self._lookup(key) is not _FLOW_STATE_MISSING
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        dict.__setitem__(self, key, _FLOW_STATE_DELETED)
+
+    def pop(self, key, default=_FLOW_STATE_MISSING):
+        value = self._lookup(key)
+        if value is _FLOW_STATE_MISSING:
+            if default is _FLOW_STATE_MISSING:
+                raise KeyError(key)
+            return default
+        dict.__setitem__(self, key, _FLOW_STATE_DELETED)
+        return value
+
+    def popitem(self):
+        items = list(self.flatten().items())
+        if not items:
+            raise KeyError("popitem(): flow state is empty")
+        key, value = items[-1]
+        dict.__setitem__(self, key, _FLOW_STATE_DELETED)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        value = self._lookup(key)
+        if value is _FLOW_STATE_MISSING:
+            self[key] = default
+            return default
+        return value
+
+    def clear(self):
+        dict.clear(self)
+        self._parent = None
+        self._depth = 1
+
+    def __iter__(self):
+        return iter(self.flatten())
+
+    def __reversed__(self):
+        return reversed(self.flatten())
+
+    def __len__(self):
+        return len(self.flatten())
+
+    def keys(self):
+        return self.flatten().keys()
+
+    def values(self):
+        return self.flatten().values()
+
+    def items(self):
+        return self.flatten().items()
+
+    def copy(self):
+        return self.flatten()
+
+    def __copy__(self):
+        return self.flatten()
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self.flatten(), memo)
+
+    def __reduce__(self):
+        return (dict, (self.flatten(),))
+
+    def __eq__(self, other):
+        if isinstance(other, _FlowState):
+            other = other.flatten()
+        return self.flatten() == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __or__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        out = self.flatten()
+        out.update(other)
+        return out
+
+    def __ror__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        out = dict(other)
+        out.update(self.flatten())
+        return out
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __repr__(self):
+        return repr(self.flatten())
+
+
 class _FlowCallable:
     def __init__(self, fn: Callable[[dict[str, Any]], Any]):
         self.fn = fn
@@ -183,6 +348,8 @@ class AxProgram(ABC):
 
 class AxFlow(AxProgram):
     def __init__(self, options: dict[str, Any] | str | None = None, bindings: dict[str, Any] | None = None):
+        self._run_lock = threading.Lock()
+        self.last_run_context: AxRunContext | None = None
         if isinstance(options, str):
             normalized = _normalize_mermaid_bindings(bindings)
             self.options = dict(normalized.get("options") or {})
@@ -290,6 +457,9 @@ class AxFlow(AxProgram):
     def get_usage(self):
         return dict(self.state.get("usage") or {})
 
+    def get_run_context(self):
+        return self.last_run_context
+
     def get_optimizable_components(self):
         return _flow_get_optimizable_components(self.state)
 
@@ -344,13 +514,32 @@ class AxFlow(AxProgram):
         return self.optimize_with(engine, dataset or [], opts)
 
     def forward(self, client: AIClient, values: dict[str, Any], options: dict[str, Any] | None = None):
-        call_options = dict(options or {})
+        run, call_options = _core_program_begin_run(self, options)
         call_context = resolve_execution_context(call_options, self.execution_context)
         if call_context:
             call_options["executionContext"] = call_context
             call_options["mcp"] = call_context.mcp
             call_options["ucp"] = call_context.ucp
-        return _flow_forward(self.state, client, values or {}, call_options)
+        # _flow_forward resets traces/chat_log/usage on the state it is given;
+        # hand it a per-call copy and publish the result as the latest run.
+        state = dict(self.state)
+        try:
+            output = _flow_forward(state, client, values or {}, call_options)
+        except BaseException as exc:
+            self._publish_run(run, state, error=exc)
+            raise
+        self._publish_run(run, state, output)
+        return output
+
+    def _publish_run(self, run, state, output=None, error=None):
+        run.traces = list(state.get("traces") or [])
+        run.chat_log = list(state.get("chat_log") or [])
+        run.usage = dict(state.get("usage") or {})
+        with self._run_lock:
+            for key in ("traces", "chat_log", "usage"):
+                if key in state:
+                    self.state[key] = state[key]
+            _core_program_end_run(self, run, output, error)
 
     def streaming_forward(self, client: AIClient, values: dict[str, Any], options: dict[str, Any] | None = None):
         yield {"version": 1, "index": 0, "delta": self.forward(client, values or {}, options or {})}
@@ -481,6 +670,56 @@ def _core_map_delete(target, key):
     return target
 
 
+def _core_map_merge(left, right):
+    """Flow-state aware ``map.merge``.
+
+    Copying a flow state (``merge(state, {})``) opens a copy-on-write layer
+    instead of copying every key, and merging a state derived from ``left``'s
+    history (a parallel step's result) replays only the writes made since their
+    common ancestor. Any other merge is the plain dict merge.
+    """
+    if isinstance(left, _FlowState):
+        if isinstance(right, _FlowState):
+            rebased = _flow_state_rebase(left, right)
+            if rebased is not None:
+                return rebased
+        out = _FlowState(left)
+        if right:
+            out.update(right)
+        return out
+    merged = dict(left or {})
+    merged.update(right or {})
+    return merged
+
+
+def _flow_state_rebase(target, result):
+    ancestors = set()
+    layer = target
+    while isinstance(layer, _FlowState):
+        ancestors.add(id(layer))
+        layer = layer._parent
+    if layer is not None:
+        ancestors.add(id(layer))
+    layers = []
+    layer = result
+    while isinstance(layer, _FlowState) and id(layer) not in ancestors:
+        layers.append(layer)
+        layer = layer._parent
+    if layer is None or id(layer) not in ancestors:
+        return None
+    out = _FlowState(target)
+    for layer in reversed(layers):
+        for key, value in dict.items(layer):
+            dict.__setitem__(out, key, value)
+    return out
+
+
+def _core_map_flatten(state):
+    if isinstance(state, _FlowState):
+        return state.flatten()
+    return state
+
+
 def _core_string_slice(value, start, end=None):
     return str(value)[int(start):] if end is None else str(value)[int(start):int(end)]
 
@@ -517,6 +756,67 @@ def _core_program_apply_components(program, component_map):
     return {}
 
 
+_FLOW_STAGE_RUNS = threading.local()
+
+
+def _flow_stage_runs():
+    runs = getattr(_FLOW_STAGE_RUNS, "runs", None)
+    if runs is None:
+        runs = _FLOW_STAGE_RUNS.runs = weakref.WeakKeyDictionary()
+    return runs
+
+
+def _flow_stage_run(stage):
+    try:
+        return _flow_stage_runs().get(stage)
+    except TypeError:
+        return None
+
+
+def _core_flow_stage_forward(stage, client, values, options):
+    """Forward a flow node's program into a run context of its own.
+
+    The run is remembered per thread so the node's chat log, usage and traces
+    are read back from this call rather than from whichever call on the shared
+    program finished last.
+    """
+    run = AxRunContext()
+    try:
+        _flow_stage_runs()[stage] = run
+    except TypeError:
+        pass
+    opts = dict(options or {})
+    opts["runContext"] = run
+    return _flow_agent_stage_forward(stage, client, values, opts)
+
+
+def _core_flow_stage_chat_log(stage):
+    # The flow renames the entries it records, so hand it copies.
+    entries = _flow_agent_stage_chat_log(stage, _flow_stage_run(stage)) or []
+    return [dict(entry) if isinstance(entry, dict) else entry for entry in entries]
+
+
+def _core_flow_stage_usage(stage):
+    return _flow_agent_stage_usage(stage, _flow_stage_run(stage))
+
+
+def _core_flow_stage_traces(stage):
+    return _flow_agent_stage_traces(stage, _flow_stage_run(stage))
+
+
+def _core_flow_execute_steps(flow, client, state, options):
+    """Host replacement for Core's ``_flow_execute_steps``: run the steps over a
+    copy-on-write layer so each node only pays for its own writes."""
+    if not isinstance(state, _FlowState):
+        state = _FlowState(state)
+    return _core_flow_execute_steps_portable(flow, client, state, options)
+
+
+def _core_flow_project_returns(state, returns):
+    """Host replacement for Core's ``_flow_project_returns``; outputs are plain dicts."""
+    return _core_map_flatten(_core_flow_project_returns_portable(state, returns))
+
+
 # BEGIN AXIR CORE EMITTED FUNCTIONS
 def _flow_factory(options: Any) -> Any:
     _core_coverage_mark("_flow_factory")
@@ -2805,3 +3105,24 @@ def _flow_to_mermaid(flow: Any, options: Any) -> str:
     return rendered
 
 # END AXIR CORE EMITTED FUNCTIONS
+
+
+# Python host replacements for Core functions. The portable definitions above
+# stay the reference; rebinding the module globals routes emitted callers here.
+# _CORE_PORTABLE keeps each replaced definition so conformance can run it.
+_CORE_PORTABLE = {
+    "_flow_execute_steps": _flow_execute_steps,
+    "_flow_project_returns": _flow_project_returns,
+}
+_flow_agent_stage_forward = _core_agent_stage_forward
+_flow_agent_stage_chat_log = _core_agent_stage_chat_log
+_flow_agent_stage_usage = _core_agent_stage_usage
+_flow_agent_stage_traces = _core_agent_stage_traces
+_core_agent_stage_forward = _core_flow_stage_forward
+_core_agent_stage_chat_log = _core_flow_stage_chat_log
+_core_agent_stage_usage = _core_flow_stage_usage
+_core_agent_stage_traces = _core_flow_stage_traces
+_core_flow_execute_steps_portable = _flow_execute_steps
+_flow_execute_steps = _core_flow_execute_steps
+_core_flow_project_returns_portable = _flow_project_returns
+_flow_project_returns = _core_flow_project_returns
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Callable
 
-from .schema import to_json_schema, validate_fields
+from .schema import _fields_key, compile_fields_validator, to_json_schema
 
 
 @dataclass
@@ -16,11 +16,21 @@ class Tool:
     namespace: str | None = None
     args: list[Any] = field(default_factory=list)
 
+    _validators: dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def _validator(self, kind: str, fields: list[Any]):
+        key = _fields_key(fields)
+        entry = self._validators.get(kind)
+        if entry is None or entry[0] != key:
+            entry = (key, compile_fields_validator(fields))
+            self._validators[kind] = entry
+        return entry[1]
+
     def call(self, args: dict[str, Any]):
-        validate_fields(self.args, args, f"tool.{self.name}.args")
+        self._validator("args", self.args)(args, f"tool.{self.name}.args")
         result = self.handler(args)
         if self.returns and isinstance(result, dict):
-            validate_fields(self.returns, result, f"tool.{self.name}.return")
+            self._validator("returns", self.returns)(result, f"tool.{self.name}.return")
         return result
 
 
@@ -0,0 +1,72 @@
+"""Overlap generation, reflection and curation across examples.
+
+With pipelineWindow set, evolve runs the generator, metric, reflector and
+curator for up to that many examples on worker threads. Curator operations
+are still applied one example at a time, in example order, so the feedback
+history matches a strict run. Each example reflects against the playbook as
+rendered when it was scheduled.
+"""
+
+import json
+import re
+import threading
+import time
+
+from axllm import ax, playbook
+
+EXAMPLES = 16
+LATENCY = 0.02
+
+
+class SlowClient:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = 0
+
+    def complete(self, request):
+        time.sleep(LATENCY)
+        with self.lock:
+            self.calls += 1
+        match = re.search(r"q(\d+)", json.dumps(request))
+        index = int(match.group(1)) if match else 0
+        return {
+            "content": json.dumps(
+                {
+                    "answer": "ok",
+                    "reasoning": "Missed a constraint.",
+                    "errorIdentification": "A constraint was ignored.",
+                    "rootCauseAnalysis": "No rule covered it.",
+                    "correctApproach": "Check every constraint.",
+                    "keyInsight": "List constraints first.",
+                    "bulletTags": [],
+                    "operations": [{"type": "ADD", "section": f"Section {index % 3}", "content": f"Rule {index}: check constraint {index}."}],
+                }
+            )
+        }
+
+
+SEED = {
+    "version": 1,
+    "sections": {"Section 0": [{"id": "seed-1", "section": "Section 0", "content": "Read the question twice.", "helpfulCount": 0, "harmfulCount": 0}]},
+    "stats": {"bulletCount": 1, "helpfulCount": 0, "harmfulCount": 0, "tokenEstimate": 6},
+}
+
+
+def run(options):
+    client = SlowClient()
+    pb = playbook(ax("question:string -> answer:string"), {"studentAI": client, "maxEpochs": 1, "initialPlaybook": SEED})
+    started = time.perf_counter()
+    pb.evolve([{"question": f"q{index}"} for index in range(EXAMPLES)], lambda args: 0.5, options)
+    return pb.get_state(), client.calls, time.perf_counter() - started
+
+
+strict, strict_calls, strict_s = run({})
+piped, piped_calls, piped_s = run({"pipelineWindow": 4})
+
+assert strict_calls == piped_calls
+assert [entry["example"] for entry in piped["artifact"]["feedback"]] == [entry["example"] for entry in strict["artifact"]["feedback"]]
+assert sorted(bullet["content"] for section in piped["playbook"]["sections"].values() for bullet in section) == sorted(
+    bullet["content"] for section in strict["playbook"]["sections"].values() for bullet in section
+)
+assert piped_s < strict_s
+print(f"python-ace-pipelined-compile-ok (strict {strict_s * 1000:.0f} ms, window 4 {piped_s * 1000:.0f} ms)")
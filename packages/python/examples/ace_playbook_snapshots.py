@@ -0,0 +1,63 @@
+"""Grow a playbook over many examples, then read and edit its state.
+
+The playbook engine re-renders only after the playbook changes. Dedupe
+rescans only the sections a curator batch touched and then recomputes the
+playbook stats. get_state() returns an editable copy that load() accepts.
+"""
+
+import json
+import time
+
+from axllm import ax, playbook
+
+EXAMPLES = 120
+
+
+class ScriptedClient:
+    def __init__(self):
+        self.calls = 0
+
+    def complete(self, request):
+        self.calls += 1
+        rule = f"Rule {self.calls % 40}: check the {self.calls % 7}th constraint."
+        return {
+            "content": json.dumps(
+                {
+                    "answer": "ok",
+                    "reasoning": "Missed a constraint.",
+                    "errorIdentification": "A constraint was ignored.",
+                    "rootCauseAnalysis": "No rule covered it.",
+                    "correctApproach": "Check every constraint.",
+                    "keyInsight": "List constraints first.",
+                    "bulletTags": [],
+                    "operations": [{"type": "ADD", "section": f"Section {self.calls % 5}", "content": rule}],
+                }
+            )
+        }
+
+
+SEED = {
+    "version": 1,
+    "sections": {"Section 0": [{"id": "seed-1", "section": "Section 0", "content": "Read the question twice.", "helpfulCount": 0, "harmfulCount": 0}]},
+    "stats": {"bulletCount": 1, "helpfulCount": 0, "harmfulCount": 0, "tokenEstimate": 6},
+}
+
+client = ScriptedClient()
+pb = playbook(ax("question:string -> answer:string"), {"studentAI": client, "maxEpochs": 1, "maxSectionSize": 60, "initialPlaybook": SEED})
+started = time.perf_counter()
+pb.evolve([{"question": f"q{index}"} for index in range(EXAMPLES)], lambda args: 0.5)
+elapsed_ms = (time.perf_counter() - started) * 1000
+
+state = pb.get_state()
+bullets = [bullet for section in state["playbook"]["sections"].values() for bullet in section]
+contents = [bullet["content"].strip().lower() for bullet in bullets]
+assert len(contents) == len(set(contents)), "dedupe must leave one bullet per content"
+assert len(state["artifact"]["feedback"]) == EXAMPLES
+assert state["playbook"]["stats"]["bulletCount"] == len(bullets), "stats must follow dedupe"
+assert len(bullets) > 1 and pb.render().count("- [") == len(bullets)
+
+state["playbook"]["sections"]["Section 0"] = [{"id": "edited-1", "section": "Section 0", "content": "Edited rule.", "helpfulCount": 0, "harmfulCount": 0}]
+assert pb.render().count("- [") == len(bullets), "editing a snapshot must not touch the live playbook"
+pb.load(state)
+assert "Edited rule." in pb.render()
+print(f"python-ace-playbook-snapshots-ok ({EXAMPLES} examples, {len(bullets)} bullets, {elapsed_ms:.0f} ms)")
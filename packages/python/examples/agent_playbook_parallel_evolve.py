@@ -0,0 +1,91 @@
+"""Evaluate agent.playbook().evolve() tasks on a worker pool.
+
+concurrency runs independent task evaluations on threads. Metric calls are
+reserved in task order before each run starts, so maxMetricCalls is spent
+exactly as in a sequential evolve and records come back in task order. Progress
+events carry inFlight. The scripted runtime sleeps to stand in for agent
+latency.
+"""
+
+import json
+import time
+
+from axllm import AxCodeRuntime, AxCodeSession, RuntimeEnvelope, agent
+
+TASKS = 24
+RUNS_PER_TASK = 2
+MAX_METRIC_CALLS = 31
+CONCURRENCY = 8
+
+
+class ScriptedClient:
+    def complete(self, request):
+        return {
+            "content": json.dumps(
+                {
+                    "pythonCode": "final('Answer', {'answer': 'ok'})",
+                    "answer": "ok",
+                    "weaknessDescription": "The agent does not verify its final step.",
+                    "rootCause": "The final step is accepted without a check.",
+                    "proposedGuidance": "Verify the final step before completing the task.",
+                    "evidenceQuotes": ["final"],
+                    "configRecommendations": [],
+                }
+            )
+        }
+
+
+class SlowSession(AxCodeSession):
+    def execute(self, code, options=None):
+        time.sleep(0.01)
+        return RuntimeEnvelope.final({"answer": "ok"})
+
+    def snapshot_globals(self, options=None):
+        return {"version": 1, "bindings": {}, "globals": {}, "closed": False}
+
+    def patch_globals(self, snapshot, options=None):
+        return snapshot
+
+
+class Runtime(AxCodeRuntime):
+    language = "Python"
+
+    def create_session(self, globals, options=None):
+        return SlowSession()
+
+
+def metric(args):
+    return 1.0 if args["task"]["id"].endswith(("0", "5")) else 0.25
+
+
+def evolve(concurrency):
+    client = ScriptedClient()
+    ag = agent("question:string -> answer:string", {"name": "qa", "ai": client, "runtime": Runtime()})
+    pb = ag.playbook({"target": "responder", "studentAI": client})
+    dataset = {"train": [{"id": f"task-{index:02d}", "input": {"question": f"q{index}"}} for index in range(TASKS)]}
+    events = []
+    started = time.perf_counter()
+    result = pb.evolve(dataset, {
+        "metric": metric,
+        "runsPerTask": RUNS_PER_TASK,
+        "maxMetricCalls": MAX_METRIC_CALLS,
+        "maxProposals": 1,
+        "concurrency": concurrency,
+        "onProgress": events.append,
+    })
+    return result, events, time.perf_counter() - started
+
+
+sequential, sequential_events, sequential_s = evolve(1)
+parallel, parallel_events, parallel_s = evolve(CONCURRENCY)
+
+for result in (sequential, parallel):
+    assert result["metricCallsUsed"] == MAX_METRIC_CALLS, result["metricCallsUsed"]
+    # 31 calls cover 15 full tasks plus one run of the 16th.
+    assert [record["task"]["id"] for record in result["records"]] == [f"task-{index:02d}" for index in range(16)]
+assert parallel["baseline"] == sequential["baseline"], (parallel["baseline"], sequential["baseline"])
+assert [record["score"] for record in parallel["records"]] == [record["score"] for record in sequential["records"]]
+assert max(event["inFlight"] for event in sequential_events) == 0
+assert 1 < max(event["inFlight"] for event in parallel_events) <= CONCURRENCY
+print(f"sequential {sequential_s * 1000:.0f} ms, concurrency={CONCURRENCY} {parallel_s * 1000:.0f} ms")
+print("python-agent-playbook-parallel-evolve-ok")
@@ -0,0 +1,58 @@
+"""Share one AxGen, AxFlow and AxAgent across a thread pool without cross-talk.
+
+Each forward records into its own AxRunContext (pass {"runContext": ctx} to
+keep a handle on it). The scripted client echoes the question it was asked
+after a random delay, so calls interleave. The example checks that every
+context holds only the chat log, traces and output of its own call.
+"""
+
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from axllm import AxRunContext, agent, ax, flow
+
+WORKERS = 16
+CALLS = 400
+
+
+class EchoClient:
+    def complete(self, request):
+        prompt = json.dumps(request.get("chat_prompt"), default=str)
+        tag = prompt[prompt.index("q-") : prompt.index("q-") + 6]
+        time.sleep(random.random() / 1000)
+        # The agent's distiller reads completion; the other stages read answer.
+        content = {"answer": f"a-{tag}", "completion": {"type": "respond", "args": [tag]}}
+        return {"content": json.dumps(content), "usage": {"tag": tag}}
+
+
+client = EchoClient()
+qa = ax("question:string -> answer:string")
+graph = flow({"id": "shared.flow"}).execute("qa", qa).returns({"answer": "answer"})
+helper = agent("question:string -> answer:string", {"contextFields": []})
+
+
+def run_one(index):
+    tag = f"q-{index:04d}"
+    program = (qa, graph, helper)[index % 3]
+    ctx = AxRunContext()
+    out = program.forward(client, {"question": tag}, {"runContext": ctx})
+    assert out["answer"] == f"a-{tag}", (tag, out)
+    assert ctx.status == "ok" and ctx.output == out, (tag, ctx.status)
+    assert ctx.chat_log, tag
+    for entry in ctx.chat_log:
+        assert tag in json.dumps(entry.get("messages"), default=str), (tag, entry)
+    if program is qa:
+        assert [trace["input"] for trace in ctx.traces] == [{"question": tag}], ctx.traces
+    if program is graph:
+        assert [entry["name"] for entry in ctx.chat_log] == ["qa"], ctx.chat_log
+        assert ctx.usage["qa"] == [{"tag": tag}], ctx.usage
+    return tag
+
+
+with ThreadPoolExecutor(WORKERS) as pool:
+    done = list(pool.map(run_one, range(CALLS)))
+assert len(done) == CALLS
+assert qa.last_run_context is not None and graph.get_run_context() is not None
+print(f"python-concurrent-programs-ok ({CALLS} calls on {WORKERS} threads)")
@@ -0,0 +1,62 @@
+"""Run a wide flow over a large input state.
+
+Each node layers its outputs over the state it read instead of copying the
+whole state, so per-node cost tracks the node's own outputs. The example
+checks parallel fan-out/join results, that the caller's input is untouched,
+and that the un-projected output is a plain dict.
+"""
+
+import json
+import time
+
+from axllm import ax, flow
+
+STATE_KEYS = 20000
+NODES = 40
+
+
+class ScriptedClient:
+    def complete(self, request):
+        prompt = json.dumps(request.get("chat_prompt"), default=str)
+        if "briefText" in prompt:
+            return {"content": json.dumps({"briefText": "facts+angle"})}
+        if "factList" in prompt:
+            return {"content": json.dumps({"factList": "facts"})}
+        if "audienceAngle" in prompt:
+            return {"content": json.dumps({"audienceAngle": "angle"})}
+        return {"content": json.dumps({"noteText": "note"})}
+
+
+def fan_out_flow():
+    return (
+        flow({"id": "example.stateFanOut"})
+        .execute("research", ax("topicText:string -> factList:string"), {"reads": ["topicText"], "writes": ["researchResult", "factList"]})
+        .execute("audience", ax("topicText:string -> audienceAngle:string"), {"reads": ["topicText"], "writes": ["audienceResult", "audienceAngle"]})
+        .execute("join", ax("factList:string, audienceAngle:string -> briefText:string"), {"reads": ["factList", "audienceAngle"], "writes": ["joinResult", "briefText"]})
+    )
+
+
+def wide_flow():
+    graph = flow({"id": "example.stateWide"})
+    for index in range(NODES):
+        graph = graph.execute(f"note{index}", ax("topicText:string -> noteText:string"))
+    return graph.returns({"noteText": "noteText"})
+
+
+client = ScriptedClient()
+values = {f"k{index}": index for index in range(STATE_KEYS)}
+values["topicText"] = "Typed LLM workflows"
+snapshot = dict(values)
+
+out = fan_out_flow().forward(client, values)
+assert type(out) is dict, type(out)
+assert out["briefText"] == "facts+angle", out
+assert out["factList"] == "facts" and out["audienceAngle"] == "angle", out
+assert out["k19999"] == 19999 and len(out) == STATE_KEYS + 7, len(out)
+assert values == snapshot, "flow must not mutate the caller's state"
+
+graph = wide_flow()
+start = time.perf_counter()
+assert graph.forward(client, values) == {"noteText": "note"}
+elapsed_ms = (time.perf_counter() - start) * 1000
+print(f"python-flow-state-sharing-ok ({NODES} nodes over {STATE_KEYS} keys in {elapsed_ms:.1f} ms)")
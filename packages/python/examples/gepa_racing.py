@@ -0,0 +1,71 @@
+"""Race GEPA child candidates against their parent on shuffled minibatch slices.
+
+With racing on, a child proposal is scored on a growing slice of the
+minibatch. It is dropped once a paired sign test against the parent shows it
+can't clear minImprovementThreshold. The default "hoeffding" bound and the
+"bernstein" bound make no assumption about the score distribution, and both
+need more tasks before they drop a candidate. The reflection client
+here proposes mostly worse instructions. The example checks that racing makes
+the same accept/reject decisions while spending fewer metric calls, and it
+reports metricCallsSaved.
+"""
+
+import json
+import zlib
+
+from axllm import AxGEPA, OptimizerEvaluator
+
+PROPOSALS = ["Answer tersely.", "Ramble at length.", "Answer concisely with one fact.", "Ignore the question.", "Guess."]
+
+
+class ReflectionClient:
+    def __init__(self):
+        self.calls = 0
+
+    def chat(self, prompt, options=None):
+        text = PROPOSALS[self.calls % len(PROPOSALS)]
+        self.calls += 1
+        return {"results": [{"content": f"New Value: {text}"}]}
+
+
+def quality(instruction, example):
+    base = 0.85 if "concise" in instruction.lower() else 0.7 if "terse" in instruction.lower() else 0.2
+    jitter = (zlib.crc32(json.dumps([instruction, example]).encode()) % 100) / 1000
+    return min(1.0, base + jitter)
+
+
+class LocalEvaluator(OptimizerEvaluator):
+    def __init__(self):
+        self.calls = 0
+
+    def evaluate(self, candidate_map, options=None):
+        examples = ((options or {}).get("dataset") or {}).get("train") or []
+        instruction = candidate_map.get("qa::instruction", "")
+        rows = [{"input": example, "prediction": {}, "scores": {"quality": quality(instruction, example)}, "scalar": quality(instruction, example)} for example in examples]
+        self.calls += len(rows)
+        total = sum(row["scalar"] for row in rows)
+        return {"rows": rows, "avg": total / max(len(rows), 1), "sum": total, "count": len(rows)}
+
+
+def run(racing):
+    request = {
+        "programKind": "axgen",
+        "components": [{"id": "qa::instruction", "owner": "qa", "kind": "instruction", "current": "Answer clearly."}],
+        "dataset": {"train": [{"question": f"q{index}"} for index in range(40)], "validation": [{"question": f"v{index}"} for index in range(10)]},
+        "options": {"numTrials": 5, "minibatchSize": 40, "maxMetricCalls": 2000, "earlyStoppingTrials": 10, "seed": 7, "racing": racing},
+    }
+    evaluator = LocalEvaluator()
+    artifact = AxGEPA(ReflectionClient(), seed=7).optimize(request, evaluator)
+    return artifact, evaluator.calls
+
+
+exhaustive, exhaustive_calls = run(False)
+raced, raced_calls = run({"bound": "sign", "confidence": 0.95, "minBatch": 4})
+
+assert raced["componentMap"] == exhaustive["componentMap"], (raced["componentMap"], exhaustive["componentMap"])
+assert raced["metadata"]["candidatesExplored"] == exhaustive["metadata"]["candidatesExplored"]
+assert raced_calls == raced["metadata"]["totalMetricCalls"]
+assert raced_calls + raced["metadata"]["metricCallsSaved"] == exhaustive_calls, (raced_calls, raced["metadata"]["metricCallsSaved"], exhaustive_calls)
+assert raced_calls < exhaustive_calls
+print(json.dumps({"componentMap": raced["componentMap"], "metricCalls": {"exhaustive": exhaustive_calls, "raced": raced_calls, "saved": raced["metadata"]["metricCallsSaved"]}}, sort_keys=True))
+print("python-gepa-racing-ok")
@@ -0,0 +1,56 @@
+"""Startup check: import axllm; axllm.ai must leave the heavy modules unloaded.
+
+A fresh interpreter runs the import under python -X importtime. Both its
+sys.modules and the import trace must be free of the agent, flow, MCP, and
+generation modules, which load only on first use. For scale it also times an
+eager baseline that imports those modules up front and prints the slowest
+entries of the lazy trace. The timings are printed, not asserted, so a busy
+machine cannot fail the check. The interpreters inherit the caller's
+environment unchanged.
+"""
+
+import json
+import subprocess
+import sys
+import time
+
+HEAVY = ("axllm.agent", "axllm.flow", "axllm.mcp", "axllm.gen")
+LAZY = "import axllm; axllm.ai"
+EAGER = LAZY + "; " + "; ".join(f"import {module}" for module in HEAVY)
+RUNS = 5
+
+PROBE = """
+import json, sys
+{statement}
+print(json.dumps(sorted(m for m in sys.modules if m.startswith("axllm"))))
+"""
+
+
+def run(statement, *flags):
+    return subprocess.run(
+        [sys.executable, *flags, "-c", PROBE.format(statement=statement)], check=True, capture_output=True, text=True
+    )
+
+
+def best_ms(statement):
+    samples = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        run(statement)
+        samples.append((time.perf_counter() - started) * 1000)
+    return min(samples)
+
+
+traced = run(LAZY, "-X", "importtime")
+loaded = json.loads(traced.stdout)
+rows = [line.split("|") for line in traced.stderr.splitlines() if line.startswith("import time:") and "cumulative" not in line]
+imported = {row[2].strip() for row in rows}
+for heavy in HEAVY:
+    assert heavy not in loaded, f"{heavy} loaded eagerly"
+    assert heavy not in imported, f"{heavy} appears in the import trace"
+
+lazy_ms, eager_ms = best_ms(LAZY), best_ms(EAGER)
+print("loaded:", ", ".join(loaded))
+print(f"{LAZY}: best {lazy_ms:.1f} ms of {RUNS} interpreters; eager baseline {eager_ms:.1f} ms")
+for row in sorted(rows, key=lambda row: -int(row[1]))[:8]:
+    print(f"  {int(row[1]) / 1000:7.1f} ms  {row[2].rstrip()}")
@@ -0,0 +1,84 @@
+"""Wait for long-running MCP tasks without flooding the server.
+
+call_tool polls tasks/get for a task with exponential backoff. The first
+delay is taskPollInitialMs and it doubles up to taskPollMaxMs. A server
+pollIntervalMs lengthens the delay, and half of ttlMs caps it. While a
+listener is running, notifications/tasks/status wakes the wait at once.
+wait_for_tasks waits on several task ids together, and taskTimeoutMs bounds
+the whole wait.
+"""
+
+import threading
+import time
+
+from axllm import AxMCPClient, AxMCPScriptedTransport
+from axllm.mcp import AxMCPError
+
+
+class TaskServer(AxMCPScriptedTransport):
+    """A scripted modern server whose tasks finish after a set duration."""
+
+    def __init__(self, notify=False):
+        super().__init__()
+        self.notify = notify
+        self.tasks = {}
+        self.polls = 0
+
+    def task(self, task_id):
+        task = self.tasks[task_id]
+        done = time.monotonic() >= task["doneAt"]
+        out = {"taskId": task_id, "status": "completed" if done else "working", "createdAt": "2026-07-28T00:00:00Z", "lastUpdatedAt": "2026-07-28T00:00:01Z", "ttlMs": 60000}
+        if done:
+            out["result"] = {"resultType": "complete", "structuredContent": {"task": task_id}}
+        return out
+
+    def send(self, message):
+        method, params = message.get("method"), message.get("params") or {}
+        if method == "server/discover":
+            result = {"resultType": "complete", "supportedVersions": ["2026-07-28"], "capabilities": {"tools": {}, "extensions": {"io.modelcontextprotocol/tasks": {}}}, "ttlMs": 60000, "cacheScope": "private"}
+        elif method == "tools/list":
+            result = {"tools": [{"name": "slow", "inputSchema": {"type": "object"}}], "ttlMs": 60000, "cacheScope": "private"}
+        elif method == "tools/call":
+            task_id = f"task-{len(self.tasks) + 1}"
+            seconds = float(params["arguments"]["seconds"])
+            self.tasks[task_id] = {"doneAt": time.monotonic() + seconds}
+            if self.notify:
+                timer = threading.Timer(seconds, lambda: self.emit({"jsonrpc": "2.0", "method": "notifications/tasks/status", "params": self.task(task_id)}))
+                timer.daemon = True
+                timer.start()
+            result = {"resultType": "task", **self.task(task_id)}
+        elif method == "tasks/get":
+            self.polls += 1
+            result = self.task(params["taskId"])
+        else:
+            result = {}
+        return {"jsonrpc": "2.0", "id": message.get("id"), "result": result}
+
+
+polling = TaskServer()
+client = AxMCPClient(polling, {"era": "modern"})
+client.init()
+assert client.call_tool("slow", {"seconds": 0.5})["structuredContent"] == {"task": "task-1"}
+backoff_polls = polling.polls
+assert backoff_polls < 15, backoff_polls
+
+pushed = TaskServer(notify=True)
+listening = AxMCPClient(pushed, {"era": "modern", "taskPollMaxMs": 10000})
+listening.start_listening()
+started = time.perf_counter()
+assert listening.call_tool("slow", {"seconds": 0.5})["structuredContent"] == {"task": "task-1"}
+notified_s = time.perf_counter() - started
+assert notified_s < 1.0 and pushed.polls < 10, (notified_s, pushed.polls)
+
+ids = [client.request("tools/call", {"name": "slow", "arguments": {"seconds": seconds}})["taskId"] for seconds in (0.1, 0.3, 0.2)]
+results = client.wait_for_tasks(ids)
+assert sorted(results) == sorted(ids)
+
+late = client.request("tools/call", {"name": "slow", "arguments": {"seconds": 5}})["taskId"]
+try:
+    client.wait_for_tasks([late], timeout_ms=200)
+    raise AssertionError("expected the task wait to time out")
+except AxMCPError as error:
+    assert "did not finish within 200 ms" in str(error)
+
+print(f"python-mcp-task-waiting-ok ({backoff_polls} polls for a 0.5 s task)")
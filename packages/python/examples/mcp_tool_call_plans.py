@@ -0,0 +1,87 @@
+"""Call MCP tools through plans compiled once per catalog load.
+
+Each tools/list load compiles a call plan per tool. A plan holds the
+x-mcp-header bindings, a required/type argument check, and the exposed and
+namespace-qualified names. call_tool looks the plan up by name. When the
+server answers -32020 (header mismatch), only the tools/list page that held
+the tool is fetched again.
+"""
+
+import time
+
+from axllm import AxMCPClient, AxMCPScriptedTransport
+from axllm.mcp import AxMCPError
+
+TOOLS_PER_PAGE = 200
+
+
+def page_tools(page, header):
+    return [
+        {
+            "name": f"tool_{page}_{index}",
+            "inputSchema": {
+                "type": "object",
+                "properties": {"region": {"type": "string", "x-mcp-header": header}, "limit": {"type": "integer"}},
+                "required": ["region"],
+            },
+        }
+        for index in range(TOOLS_PER_PAGE)
+    ]
+
+
+class PagedServer(AxMCPScriptedTransport):
+    def __init__(self):
+        super().__init__()
+        self.headers = {"p0": "Region", "p1": "Region"}
+        self.mismatch = set()
+
+    def send_with_headers(self, message, headers=None):
+        self.request_headers.append(dict(headers or {}))
+        self.requests.append(message)
+        method, params = message.get("method"), message.get("params") or {}
+        if method == "server/discover":
+            result = {"resultType": "complete", "supportedVersions": ["2026-07-28"], "capabilities": {"tools": {}}, "ttlMs": 60000, "cacheScope": "private"}
+        elif method == "tools/list":
+            page = params.get("cursor") or "p0"
+            result = {"tools": page_tools(page, self.headers[page]), "ttlMs": 60000, "cacheScope": "private"}
+            if page == "p0":
+                result["nextCursor"] = "p1"
+        elif method == "tools/call":
+            if params["name"] in self.mismatch:
+                self.mismatch.discard(params["name"])
+                return {"jsonrpc": "2.0", "id": message.get("id"), "error": {"code": -32020, "message": "Header mismatch"}}
+            result = {"resultType": "complete", "structuredContent": {"headers": dict(headers or {})}}
+        else:
+            result = {}
+        return {"jsonrpc": "2.0", "id": message.get("id"), "result": result}
+
+
+server = PagedServer()
+client = AxMCPClient(server, {"era": "modern", "namespace": "warehouse", "validateToolArguments": True})
+client.init()
+assert len(client.tools) == 2 * TOOLS_PER_PAGE
+
+started = time.perf_counter()
+for _ in range(2000):
+    out = client.call_tool(f"tool_p1_{TOOLS_PER_PAGE - 1}", {"region": "west", "limit": 5})
+calls_ms = (time.perf_counter() - started) * 1000
+assert out["structuredContent"]["headers"] == {"Mcp-Param-Region": "west"}, out
+
+try:
+    client.call_tool("tool_p0_0", {"limit": "five"})
+    raise AssertionError("expected argument validation to fail")
+except AxMCPError as error:
+    assert "missing required arguments: region" in str(error)
+client.call_tool("tool_p0_0", {"region": "west", "limit": 5.0})
+
+server.headers["p1"] = "Zone"
+server.mismatch.add("tool_p1_3")
+before = len(server.requests)
+out = client.call_tool("tool_p1_3", {"region": "east"})
+lists = [request.get("params", {}).get("cursor") for request in server.requests[before:] if request["method"] == "tools/list"]
+assert lists == ["p1"], lists
+assert out["structuredContent"]["headers"] == {"Mcp-Param-Zone": "east"}, out
+assert [tool["name"] for tool in client.tools][:2] == ["tool_p0_0", "tool_p0_1"]
+assert len(client.tools) == 2 * TOOLS_PER_PAGE
+assert client.native_tools()[0].name == "tool_p0_0"
+print(f"python-mcp-tool-call-plans-ok (2000 calls in {calls_ms:.0f} ms)")
@@ -0,0 +1,70 @@
+"""Partition conversation memory by session and compact long sessions.
+
+AxMemory keeps each session_id separate, with per-session tag and index
+lookups. With max_items a session is compacted to compact_to items once it
+grows past the limit; summarize() receives the dropped turns and returns the
+item that replaces them. AxSQLiteMemoryStore keeps one row per item, so a
+fresh AxMemory over the same file picks the sessions up again.
+"""
+
+import os
+import tempfile
+
+from axllm import AxMemory, AxSQLiteMemoryStore
+
+
+def turn(text):
+    return [{"role": "user", "content": text}]
+
+
+def summarize(dropped):
+    return {"role": "summary", "content": f"{len(dropped)} earlier turns", "tags": ["summary"]}
+
+
+with tempfile.TemporaryDirectory() as directory:
+    path = os.path.join(directory, "memory.db")
+    store = AxSQLiteMemoryStore(path)
+    memory = AxMemory(store, max_items=6, compact_to=3, summarize=summarize)
+
+    # Sessions never see each other's turns.
+    memory.add_request(turn("hello from alice"), session_id="alice")
+    memory.add_response({"content": "hi alice"}, session_id="alice")
+    memory.add_request(turn("hello from bob"), session_id="bob")
+    assert [item["session_id"] for item in memory.history(session_id="alice")] == ["alice", "alice"]
+    assert len(memory.history(session_id="bob")) == 1
+    assert sorted(memory.sessions()) == ["alice", "bob"]
+
+    # Tags mark checkpoints that a session can rewind to.
+    memory.add_tag("greeted", session_id="alice")
+    memory.add_request(turn("a detour"), session_id="alice")
+    memory.rewind_to_tag("greeted", session_id="alice")
+    assert memory.get_last(session_id="alice")["response"] == {"content": "hi alice"}
+
+    # The seventh item triggers compaction: four turns fold into one summary.
+    for index in range(5):
+        memory.add_request(turn(f"question {index}"), session_id="alice")
+    history = memory.history(session_id="alice")
+    assert len(history) == 4, history
+    assert history[0] == {"role": "summary", "content": "4 earlier turns", "tags": ["summary"]}
+    assert [item["messages"][0]["content"] for item in history[1:]] == ["question 2", "question 3", "question 4"]
+
+    # summarize() must return items; anything else fails and leaves the session intact.
+    strict = AxMemory(max_items=2, compact_to=1, summarize=lambda dropped: "not an item")
+    strict.add_request(turn("one")).add_request(turn("two"))
+    try:
+        strict.add_request(turn("three"))
+        raise AssertionError("a string summary must be rejected")
+    except TypeError:
+        pass
+    assert len(strict.history()) == 2
+
+    # A new AxMemory over the same SQLite file sees the compacted sessions.
+    store.close()
+    reopened = AxMemory(AxSQLiteMemoryStore(path))
+    assert reopened.history(session_id="alice") == history
+    assert len(reopened.history(session_id="bob")) == 1
+    reopened.clear(session_id="bob")
+    assert reopened.sessions() == ["alice"]
+    reopened.store.close()
+
+print(f"python-memory-sessions-ok (alice={len(history)} items after compaction)")
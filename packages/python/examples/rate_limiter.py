@@ -0,0 +1,81 @@
+"""Throttle requests client-side with AxRateLimiter.
+
+One limiter holds requests-per-minute and tokens-per-minute buckets per quota
+key. acquire() debits a pre-send token estimate and settle() corrects it with
+the provider-reported usage. A blocking limiter sleeps until the buckets
+refill; a non-blocking one raises AxAIServiceRateLimitError carrying the wait
+as retry_after_ms. Clients that share a store share the same buckets. A scripted
+clock keeps the example instant and deterministic.
+"""
+
+from axllm import AxAIServiceRateLimitError, AxInMemoryRateLimitStore, AxRateLimiter
+from axllm.ai import ProviderOperationClient
+
+now = [0.0]
+slept = []
+
+
+def clock():
+    return now[0]
+
+
+def sleep(seconds):
+    slept.append(seconds)
+    now[0] += seconds
+
+
+# Two requests per minute: the third call waits 30 seconds for a refill.
+limiter = AxRateLimiter(rpm=2, clock=clock, sleep=sleep)
+for _ in range(3):
+    limiter.acquire("openai:gpt-4.1-mini")
+assert slept == [30.0], slept
+
+# Non-blocking callers get the wait back instead of sleeping.
+try:
+    limiter.acquire("openai:gpt-4.1-mini", blocking=False)
+    raise AssertionError("the request bucket is empty")
+except AxAIServiceRateLimitError as error:
+    assert error.status == 429 and error.retryable, error
+    assert error.retry_after_ms == 30_000, error.retry_after_ms
+
+# Other quota keys have their own buckets.
+assert limiter.try_acquire("anthropic:claude") is not None
+
+# Token budget: settle() refunds an overestimate so later calls are admitted.
+tokens = AxRateLimiter(tpm=1_000, clock=clock, sleep=sleep, blocking=False)
+reservation = tokens.acquire("batch", tokens=900)
+assert tokens.try_acquire("batch", tokens=500) is None, "900 of 1000 tokens are reserved"
+tokens.settle(reservation, 300)
+assert tokens.try_acquire("batch", tokens=500) is not None, "settling returned 600 tokens"
+
+# Clients sharing a store share one quota; rate_limit accepts a plain dict.
+RESPONSE = {
+    "id": "resp-1",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+}
+sent = []
+
+
+def transport(request):
+    sent.append(request["url"])
+    return {"status": 200, "headers": {}, "body": RESPONSE}
+
+
+store = AxInMemoryRateLimitStore()
+quota = {"rpm": 3, "store": store, "blocking": False, "key": "team-quota"}
+first = ProviderOperationClient("openai", "openai", api_key="example-key", transport=transport, rate_limit=quota)
+second = ProviderOperationClient("openai", "openai", api_key="example-key", transport=transport, rate_limit=quota)
+request = {"chat_prompt": [{"role": "user", "content": "hi"}]}
+
+first.chat(request)
+second.chat(request)
+first.chat(request)
+try:
+    second.chat(request)
+    raise AssertionError("both clients draw from the same three-request bucket")
+except AxAIServiceRateLimitError as error:
+    assert error.retry_after_ms > 0, error
+assert len(sent) == 3, "the throttled call never reached the transport"
+
+print(f"python-rate-limiter-ok (slept={sum(slept):.0f}s, sent={len(sent)})")
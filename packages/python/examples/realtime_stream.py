@@ -0,0 +1,89 @@
+"""Consume a realtime audio turn incrementally with realtime_stream().
+
+Deltas are yielded as frames arrive, so the first audio chunk can play before
+the turn finishes. It carries first_audio_ms, and get_last_realtime_latency()
+reports the same figures per client. A completed turn leaves a caller-supplied
+transport open for the next turn. Closing the generator early closes the
+transport, which unblocks a reader stuck in recv() without waiting for it.
+"""
+
+import threading
+import time
+
+from axllm import OpenAIResponsesClient
+from axllm.ai import ScriptedRealtimeTransport
+
+client = OpenAIResponsesClient(model="gpt-realtime-2", api_key="test-key")
+request = {
+    "model": "gpt-realtime-2",
+    "chat_prompt": [{"role": "user", "content": "Say hello."}],
+    "audio": {"output": {"voice": "alloy"}},
+}
+inbound = [
+    {"type": "session.created"},
+    {"type": "session.updated"},
+    {"type": "response.output_audio_transcript.delta", "response_id": "rt", "delta": "hel"},
+    {"type": "response.output_audio.delta", "response_id": "rt", "delta": "AQI="},
+    {"type": "response.output_audio_transcript.delta", "response_id": "rt", "delta": "lo"},
+    {"type": "response.output_audio.delta", "response_id": "rt", "delta": "AwQ="},
+    {"type": "response.done", "response": {"id": "rt", "usage": {"input_tokens": 3, "output_tokens": 2, "total_tokens": 5}}},
+]
+
+
+class TrackedTransport(ScriptedRealtimeTransport):
+    closed = False
+
+    def close(self):
+        self.closed = True
+
+
+transport = TrackedTransport(inbound)
+chunks = []
+first_audio_ms = None
+text = ""
+for delta in client.realtime_stream(request, transport=transport):
+    result = delta["results"][0]
+    text += result.get("content") or ""
+    audio = result.get("audio")
+    if audio and audio.get("data"):
+        chunks.append(bytes(audio["data"].memoryview()))
+        first_audio_ms = delta.get("first_audio_ms", first_audio_ms)
+
+assert text == "hello", text
+assert chunks == [b"\x01\x02", b"\x03\x04"], chunks
+latency = client.get_last_realtime_latency()
+assert first_audio_ms is not None and latency["first_audio_ms"] == first_audio_ms, latency
+assert latency["turn_ms"] >= latency["first_audio_ms"], latency
+assert not transport.closed, "a completed turn keeps the caller's transport open"
+
+
+class StalledTransport:
+    """Sends one delta, then blocks in recv() until the transport is closed."""
+
+    def __init__(self):
+        self.released = threading.Event()
+        self.frames = [{"type": "session.created"}, {"type": "session.updated"}, inbound[2]]
+
+    def send(self, event):
+        pass
+
+    def recv(self):
+        if self.frames:
+            return self.frames.pop(0)
+        self.released.wait()
+        return None
+
+    def close(self):
+        self.released.set()
+
+
+stalled = StalledTransport()
+stream = client.realtime_stream(request, transport=stalled)
+assert next(stream)["results"][0]["content"] == "hel"
+started = time.perf_counter()
+stream.close()
+close_ms = (time.perf_counter() - started) * 1000
+assert stalled.released.is_set(), "closing early must close the transport"
+assert close_ms < 100, f"early close waited {close_ms:.0f} ms for the reader"
+
+print(f"python-realtime-stream-ok (first audio {first_audio_ms:.2f} ms, early close {close_ms:.2f} ms)")
@@ -0,0 +1,76 @@
+"""Send a large multimodal request through a provider client repeatedly.
+
+The chat path shares messages and media parts with the caller instead of
+deep-copying them, so a 2 MB base64 image and a long history cost about the
+same per call as a short text prompt. The example checks that the caller's
+request is untouched and that get_features hands out editable copies. It
+reports per-call latency and peak traced allocation next to a baseline that
+deep-copies the request and the provider features on every call, as the chat
+path used to.
+"""
+
+import base64
+import copy
+import time
+import tracemalloc
+
+from axllm.ai import ProviderOperationClient
+
+CALLS = 50
+
+RESPONSE = {
+    "id": "resp-1",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+
+def transport(_request):
+    return {"status": 200, "headers": {}, "body": RESPONSE}
+
+
+image = base64.b64encode(bytes(range(256)) * 6000).decode()
+history = []
+for index in range(200):
+    history.append({"role": "user", "content": f"turn {index} " + "x" * 200})
+    history.append({"role": "assistant", "content": f"reply {index}"})
+history.append({
+    "role": "user",
+    "content": [{"type": "text", "text": "describe"}, {"type": "image", "mimeType": "image/png", "image": image}],
+})
+request = {"chat_prompt": history, "model": "gpt-4.1-mini"}
+snapshot = copy.deepcopy(request)
+
+client = ProviderOperationClient("openai", "openai", api_key="example-key", transport=transport)
+assert client.chat(request)["results"][0]["content"] == "ok"
+
+
+def deepcopy_chat(request):
+    copy.deepcopy(client.get_features())
+    return client.chat(copy.deepcopy(request))
+
+
+def measure(chat):
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        chat(request)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / CALLS
+    tracemalloc.start()
+    chat(request)
+    peak_mb = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return elapsed_ms, peak_mb
+
+
+shared_ms, shared_mb = measure(client.chat)
+copied_ms, copied_mb = measure(deepcopy_chat)
+
+assert request == snapshot, "chat must not mutate the caller's request"
+
+features = client.get_features()
+features["functions"] = "edited"
+assert client.get_features()["functions"] != "edited", "get_features must return a private copy"
+
+print(f"python-request-sharing-ok ({len(image) / 1e6:.1f} MB image, {CALLS} calls)")
+print(f"  shared:   {shared_ms:.2f} ms/call, peak {shared_mb:.2f} MB")
+print(f"  deepcopy: {copied_ms:.2f} ms/call, peak {copied_mb:.2f} MB ({copied_ms / shared_ms:.1f}x the shared latency)")
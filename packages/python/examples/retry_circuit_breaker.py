@@ -0,0 +1,107 @@
+"""Retry transient failures with AxRetryPolicy and fail fast with AxCircuitBreaker.
+
+The policy retries only transient errors, with full-jitter backoff charged
+against a shared AxRetryBudget, and gives up at once on client errors. The
+breaker opens after consecutive endpoint failures, rejects calls with a
+non-retryable AxAIServiceCircuitOpenError until the reset timeout passes, then
+lets one probe through and closes again when it succeeds. A scripted clock keeps
+the example instant and deterministic.
+"""
+
+from axllm import (
+    AxAIServiceCircuitOpenError,
+    AxAIServiceStatusError,
+    AxCircuitBreakerRegistry,
+    AxRetryBudget,
+    AxRetryPolicy,
+)
+from axllm.ai import ProviderOperationClient
+
+RESPONSE = {
+    "id": "resp-1",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+# Retry policy: two 503s, then success. Sleeps are recorded instead of taken.
+attempts = []
+sleeps = []
+
+
+def flaky():
+    attempts.append(len(attempts))
+    if len(attempts) < 3:
+        raise AxAIServiceStatusError("upstream overloaded", status=503, retryable=True)
+    return "ok"
+
+
+budget = AxRetryBudget(ratio=0.2, min_retries_per_second=0.0, capacity=2.0)
+policy = AxRetryPolicy(max_retries=5, initial_delay_ms=100, max_delay_ms=1000, budget=budget)
+assert policy.run(flaky, sleep=sleeps.append) == "ok"
+assert len(attempts) == 3 and len(sleeps) == 2, (attempts, sleeps)
+assert all(0.0 <= delay <= 0.2 for delay in sleeps), sleeps
+
+# Client errors are not retried, and an empty budget stops retries early.
+attempts.clear()
+
+
+def rejected():
+    attempts.append(1)
+    raise AxAIServiceStatusError("bad request", status=400, retryable=False)
+
+
+try:
+    policy.run(rejected, sleep=sleeps.append)
+except AxAIServiceStatusError:
+    pass
+assert len(attempts) == 1, attempts
+assert budget.available() < 1.0, "two retries drained the budget"
+attempts.clear()
+try:
+    policy.run(flaky, sleep=sleeps.append)
+except AxAIServiceStatusError:
+    pass
+assert len(attempts) == 1, "no budget left, so the first failure is final"
+
+# Circuit breaker on a provider client: the transport fails until healed.
+now = [0.0]
+healthy = [False]
+sent = []
+
+
+def transport(request):
+    sent.append(request["url"])
+    if not healthy[0]:
+        return {"status": 503, "headers": {}, "body": {"error": {"message": "unavailable"}}}
+    return {"status": 200, "headers": {}, "body": RESPONSE}
+
+
+breakers = AxCircuitBreakerRegistry(failure_threshold=2, reset_timeout_ms=5_000, clock=lambda: now[0])
+client = ProviderOperationClient(
+    "openai", "openai", api_key="example-key", transport=transport, circuit_breakers=breakers
+)
+request = {"chat_prompt": [{"role": "user", "content": "hi"}]}
+
+for _ in range(2):
+    try:
+        client.chat(request)
+    except AxAIServiceStatusError as error:
+        assert error.status == 503
+breaker = breakers.get(sent[0])
+assert breaker.state == "open", breaker.state
+
+try:
+    client.chat(request)
+    raise AssertionError("an open breaker must fail fast")
+except AxAIServiceCircuitOpenError as error:
+    assert not error.retryable, "retrying against an open breaker only burns the budget"
+    assert error.retry_after_ms == 5_000, error.retry_after_ms
+assert len(sent) == 2, "the rejected call never reached the transport"
+
+now[0] += 5.0
+healthy[0] = True
+assert breaker.state == "half_open"
+assert client.chat(request)["results"][0]["content"] == "ok"
+assert breaker.state == "closed", breaker.state
+
+print(f"python-retry-circuit-breaker-ok (retries={len(sleeps)}, requests={len(sent)})")
@@ -0,0 +1,63 @@
+"""Keep a chatty runtime child from blocking on its stderr pipe.
+
+ProcessCodeRuntime drains the child's stderr on a background thread into a
+ring buffer. session.recent_stderr() returns the lines attributed to one
+session. Lines of the form @ax-event {json} are structured runtime events.
+They go to on_event and to recent_events(). Error envelopes carry the
+session's stderr tail under "stderr".
+"""
+
+import sys
+
+from axllm import ProcessCodeRuntime
+
+SERVER = r"""
+import json, sys
+sessions = {}
+for line in sys.stdin:
+    message = json.loads(line)
+    op, payload, sid = message["op"], message.get("payload") or {}, message.get("session_id")
+    response = {"id": message["id"], "ok": True}
+    if op == "create_session":
+        sid = "s%d" % (len(sessions) + 1)
+        sessions[sid] = {}
+        response.update(session_id=sid, result={"session_id": sid})
+    elif op == "execute":
+        try:
+            exec(payload["code"], {"sys": sys, "json": json}, sessions[sid])
+            response.update(session_id=sid, result={"type": "final", "args": [sessions[sid].get("result")]})
+        except Exception as exc:
+            response.update(ok=False, error={"category": "runtime", "message": str(exc)})
+    else:
+        response["result"] = {op: True}
+    print(json.dumps(response), flush=True)
+    if op == "shutdown":
+        break
+"""
+
+CHATTY = """
+for i in range(5000):
+    print("warning: noisy line %d %s" % (i, "x" * 40), file=sys.stderr)
+print("@ax-event " + json.dumps({"type": "metric", "name": "rows", "value": 5000}), file=sys.stderr, flush=True)
+result = "done"
+"""
+
+events = []
+runtime = ProcessCodeRuntime([sys.executable, "-c", SERVER], timeout_ms=10000, stderr_lines=100, on_event=events.append)
+try:
+    noisy = runtime.create_session({})
+    quiet = runtime.create_session({})
+    # ~300 KB of stderr in one step; an undrained 64 KB pipe would hang here.
+    assert noisy.execute(CHATTY)["args"] == ["done"]
+    failed = noisy.execute("print('about to fail', file=sys.stderr, flush=True); import time; time.sleep(0.05); 1 / 0")
+    assert failed["is_error"] and "about to fail" in failed["stderr"], failed
+    assert quiet.execute("result = 1")["args"] == [1]
+
+    assert len(runtime.recent_stderr()) == 100
+    assert quiet.recent_stderr() == []
+    assert events == [{"type": "metric", "name": "rows", "value": 5000}]
+    assert noisy.recent_events() == events
+finally:
+    runtime.shutdown()
+
+print("python-runtime-stderr-drain-ok")
@@ -0,0 +1,67 @@
+"""Bound every runtime request with a deadline and recover from hung children.
+
+ProcessCodeRuntime(..., timeout_ms=...) gives every request a deadline.
+execute(code, {"timeout": ms}) overrides it for one step. When a deadline is
+missed, the watchdog kills the child and spawns a fresh one. The step returns
+a timeout error envelope. Sessions come back on their next call from their
+creation globals and their last exported state. A child that dies on its own
+is respawned the same way.
+"""
+
+import sys
+import time
+
+from axllm import ProcessCodeRuntime
+
+SERVER = r"""
+import json, sys
+sessions = {}
+for line in sys.stdin:
+    message = json.loads(line)
+    op, payload, sid = message["op"], message.get("payload") or {}, message.get("session_id")
+    response = {"id": message["id"], "ok": True}
+    if op == "create_session":
+        sid = "s%d" % (len(sessions) + 1)
+        sessions[sid] = dict(payload.get("globals") or {})
+        response.update(session_id=sid, result={"session_id": sid})
+    elif op == "execute":
+        scope = sessions[sid]
+        exec(payload["code"], {}, scope)
+        response.update(session_id=sid, result={"type": "final", "args": [scope.get("result")]})
+    elif op == "snapshot_globals":
+        response.update(session_id=sid, result={"version": 1, "bindings": dict(sessions[sid])})
+    elif op == "patch_globals":
+        sessions[sid].update((payload.get("globals") or {}).get("bindings") or {})
+        response.update(session_id=sid, result={"patched": True})
+    else:
+        response["result"] = {op: True}
+    print(json.dumps(response), flush=True)
+    if op == "shutdown":
+        break
+"""
+
+runtime = ProcessCodeRuntime([sys.executable, "-c", SERVER], timeout_ms=5000, grace_ms=50)
+try:
+    worker = runtime.create_session({"x": 1})
+    other = runtime.create_session({"z": 5})
+    worker.execute("y = x + 1")
+    worker.export_state()
+
+    started = time.perf_counter()
+    hung = worker.execute("while True: pass", {"timeout": 200})
+    elapsed = time.perf_counter() - started
+    assert hung["error_category"] == "timeout", hung
+    assert elapsed < 2, elapsed
+    assert runtime.restart_count == 1
+
+    assert worker.execute("result = y")["args"] == [2], "worker is rebuilt from its exported state"
+    assert other.execute("result = z")["args"] == [5], "other sessions are rebuilt from their creation globals"
+
+    crashed = worker.execute("import os; os._exit(3)")
+    assert crashed["error_category"] == "runtime", crashed
+    assert worker.execute("result = y * 10")["args"] == [20]
+    assert runtime.restart_count == 2
+finally:
+    runtime.shutdown()
+
+print(f"python-runtime-watchdog-ok (hung step returned after {elapsed * 1000:.0f} ms)")
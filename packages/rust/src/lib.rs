@@ -33467,11 +33467,14 @@ fn provider_resolve_descriptor(args: &[CoreValue]) -> Result<CoreValue, AxError>
     let mut v_candidate = CoreValue::Null;
     let mut v_chat = CoreValue::Null;
     let mut v_chat_path = CoreValue::Null;
+    let mut v_chat_seed = CoreValue::Null;
     let mut v_close_brace = CoreValue::Null;
     let mut v_descriptor = CoreValue::Null;
+    let mut v_descriptor_seed = CoreValue::Null;
     let mut v_embed = CoreValue::Null;
     let mut v_embed_path = CoreValue::Null;
     let mut v_embed_prefix = CoreValue::Null;
+    let mut v_embed_seed = CoreValue::Null;
     let mut v_endpoint = CoreValue::Null;
     let mut v_endpoint_base_url = CoreValue::Null;
     let mut v_endpoint_config = CoreValue::Null;
@@ -33515,6 +33518,7 @@ fn provider_resolve_descriptor(args: &[CoreValue]) -> Result<CoreValue, AxError>
     let mut v_normalizers = CoreValue::Null;
     let mut v_open_brace = CoreValue::Null;
     let mut v_operations = CoreValue::Null;
+    let mut v_operations_seed = CoreValue::Null;
     let mut v_parent = CoreValue::Null;
     let mut v_project = CoreValue::Null;
     let mut v_project_present = CoreValue::Null;
@@ -33528,18 +33532,30 @@ fn provider_resolve_descriptor(args: &[CoreValue]) -> Result<CoreValue, AxError>
     let mut v_resolve_endpoint = CoreValue::Null;
     let mut v_resource_parent = CoreValue::Null;
     let mut v_scheme = CoreValue::Null;
+    let mut v_shared_chat = CoreValue::Null;
+    let mut v_shared_descriptor = CoreValue::Null;
+    let mut v_shared_embed = CoreValue::Null;
+    let mut v_shared_operations = CoreValue::Null;
+    let mut v_shared_speak = CoreValue::Null;
+    let mut v_shared_stream_chat = CoreValue::Null;
+    let mut v_shared_transcribe = CoreValue::Null;
     let mut v_speak = CoreValue::Null;
+    let mut v_speak_seed = CoreValue::Null;
     let mut v_stream_chat = CoreValue::Null;
+    let mut v_stream_chat_seed = CoreValue::Null;
     let mut v_stream_model_path = CoreValue::Null;
     let mut v_stream_model_path_raw = CoreValue::Null;
     let mut v_stream_path = CoreValue::Null;
     let mut v_token = CoreValue::Null;
     let mut v_transcribe = CoreValue::Null;
+    let mut v_transcribe_seed = CoreValue::Null;
     let mut v_transport = CoreValue::Null;
     let mut v_use_beta = CoreValue::Null;
     let mut v_version = CoreValue::Null;
     let mut v_vertex_provider = CoreValue::Null;
-    v_descriptor = provider_descriptor(&[v_profile.clone()])?;
+    v_shared_descriptor = provider_descriptor(&[v_profile.clone()])?;
+    v_descriptor_seed = CoreValue::new_map();
+    v_descriptor = core_map_merge(&[v_shared_descriptor.clone(), v_descriptor_seed.clone()])?;
     v_provider_id = provider_normalize_profile(&[v_profile.clone()])?;
     v_generic_base_snake = core_get(&v_options, &CoreValue::from("base_url"), CoreValue::Null);
     v_generic_base_camel = core_get(
@@ -33769,11 +33785,14 @@ fn provider_resolve_descriptor(args: &[CoreValue]) -> Result<CoreValue, AxError>
                 CoreValue::from("bearer"),
             )?;
             core_map_delete(&[v_descriptor.clone(), CoreValue::from("apiKeyQuery")])?;
-            v_operations = core_get(
+            v_shared_operations = core_get(
                 &v_descriptor,
                 &CoreValue::from("operations"),
                 CoreValue::Null,
             );
+            v_operations_seed = CoreValue::new_map();
+            v_operations =
+                core_map_merge(&[v_shared_operations.clone(), v_operations_seed.clone()])?;
             v_resource_parent = core_string_format(&[
                 CoreValue::from("projects/{}/locations/{}"),
                 v_project.clone(),
@@ -33817,19 +33836,46 @@ fn provider_resolve_descriptor(args: &[CoreValue]) -> Result<CoreValue, AxError>
                 ])?;
                 v_embed_path =
                     core_string_format(&[CoreValue::from("{}:predict"), v_embed_prefix.clone()])?;
-                v_chat = core_get(&v_operations, &CoreValue::from("chat"), CoreValue::Null);
-                v_stream_chat = core_get(
+                v_shared_chat = core_get(&v_operations, &CoreValue::from("chat"), CoreValue::Null);
+                v_chat_seed = CoreValue::new_map();
+                v_chat = core_map_merge(&[v_shared_chat.clone(), v_chat_seed.clone()])?;
+                core_set(&v_operations, CoreValue::from("chat"), v_chat.clone())?;
+                v_shared_stream_chat = core_get(
                     &v_operations,
                     &CoreValue::from("stream_chat"),
                     CoreValue::Null,
                 );
-                v_embed = core_get(&v_operations, &CoreValue::from("embed"), CoreValue::Null);
-                v_transcribe = core_get(
+                v_stream_chat_seed = CoreValue::new_map();
+                v_stream_chat =
+                    core_map_merge(&[v_shared_stream_chat.clone(), v_stream_chat_seed.clone()])?;
+                core_set(
+                    &v_operations,
+                    CoreValue::from("stream_chat"),
+                    v_stream_chat.clone(),
+                )?;
+                v_shared_embed =
+                    core_get(&v_operations, &CoreValue::from("embed"), CoreValue::Null);
+                v_embed_seed = CoreValue::new_map();
+                v_embed = core_map_merge(&[v_shared_embed.clone(), v_embed_seed.clone()])?;
+                core_set(&v_operations, CoreValue::from("embed"), v_embed.clone())?;
+                v_shared_transcribe = core_get(
                     &v_operations,
                     &CoreValue::from("transcribe"),
                     CoreValue::Null,
                 );
-                v_speak = core_get(&v_operations, &CoreValue::from("speak"), CoreValue::Null);
+                v_transcribe_seed = CoreValue::new_map();
+                v_transcribe =
+                    core_map_merge(&[v_shared_transcribe.clone(), v_transcribe_seed.clone()])?;
+                core_set(
+                    &v_operations,
+                    CoreValue::from("transcribe"),
+                    v_transcribe.clone(),
+                )?;
+                v_shared_speak =
+                    core_get(&v_operations, &CoreValue::from("speak"), CoreValue::Null);
+                v_speak_seed = CoreValue::new_map();
+                v_speak = core_map_merge(&[v_shared_speak.clone(), v_speak_seed.clone()])?;
+                core_set(&v_operations, CoreValue::from("speak"), v_speak.clone())?;
                 core_set(&v_chat, CoreValue::from("path"), v_chat_path.clone())?;
                 core_set(
                     &v_stream_chat,
@@ -33882,12 +33928,23 @@ fn provider_resolve_descriptor(args: &[CoreValue]) -> Result<CoreValue, AxError>
                     CoreValue::from("MODEL_TOKEN"),
                     CoreValue::from("{model}"),
                 ])?;
-                v_chat = core_get(&v_operations, &CoreValue::from("chat"), CoreValue::Null);
-                v_stream_chat = core_get(
+                v_shared_chat = core_get(&v_operations, &CoreValue::from("chat"), CoreValue::Null);
+                v_chat_seed = CoreValue::new_map();
+                v_chat = core_map_merge(&[v_shared_chat.clone(), v_chat_seed.clone()])?;
+                core_set(&v_operations, CoreValue::from("chat"), v_chat.clone())?;
+                v_shared_stream_chat = core_get(
                     &v_operations,
                     &CoreValue::from("stream_chat"),
                     CoreValue::Null,
                 );
+                v_stream_chat_seed = CoreValue::new_map();
+                v_stream_chat =
+                    core_map_merge(&[v_shared_stream_chat.clone(), v_stream_chat_seed.clone()])?;
+                core_set(
+                    &v_operations,
+                    CoreValue::from("stream_chat"),
+                    v_stream_chat.clone(),
+                )?;
                 core_set(&v_chat, CoreValue::from("path"), v_model_path.clone())?;
                 core_set(
                     &v_stream_chat,
@@ -47258,6 +47315,32 @@ fn _validate_exact_output_keys(args: &[CoreValue]) -> Result<CoreValue, AxError>
 fn _ace_dedupe_playbook(args: &[CoreValue]) -> Result<CoreValue, AxError> {
     axir_coverage_mark("_ace_dedupe_playbook");
     let mut v_playbook = core_arg(args, 0);
+    let mut v_deduped = CoreValue::Null;
+    let mut v_empty_map = CoreValue::Null;
+    let mut v_section_names = CoreValue::Null;
+    let mut v_sections = CoreValue::Null;
+    v_empty_map = CoreValue::new_map();
+    v_sections = core_get(
+        &v_playbook,
+        &CoreValue::from("sections"),
+        v_empty_map.clone(),
+    );
+    v_section_names = core_map_keys(&[v_sections.clone()])?;
+    v_deduped = _ace_dedupe_playbook_sections(&[v_playbook.clone(), v_section_names.clone()])?;
+    return Ok(v_deduped.clone());
+}
+
+#[allow(
+    unused_variables,
+    unused_assignments,
+    unused_mut,
+    unreachable_code,
+    clippy::all
+)]
+fn _ace_dedupe_playbook_sections(args: &[CoreValue]) -> Result<CoreValue, AxError> {
+    axir_coverage_mark("_ace_dedupe_playbook_sections");
+    let mut v_playbook = core_arg(args, 0);
+    let mut v_section_names = core_arg(args, 1);
     let mut v_bullet = CoreValue::Null;
     let mut v_bullet_harmful = CoreValue::Null;
     let mut v_bullet_helpful = CoreValue::Null;
@@ -47268,13 +47351,13 @@ fn _ace_dedupe_playbook(args: &[CoreValue]) -> Result<CoreValue, AxError> {
     let mut v_existing = CoreValue::Null;
     let mut v_existing_harmful = CoreValue::Null;
     let mut v_existing_helpful = CoreValue::Null;
+    let mut v_has_bullets = CoreValue::Null;
     let mut v_has_existing = CoreValue::Null;
     let mut v_key = CoreValue::Null;
     let mut v_merged_harmful = CoreValue::Null;
     let mut v_merged_helpful = CoreValue::Null;
     let mut v_recomputed = CoreValue::Null;
     let mut v_section_name = CoreValue::Null;
-    let mut v_section_names = CoreValue::Null;
     let mut v_sections = CoreValue::Null;
     let mut v_seen = CoreValue::Null;
     let mut v_trimmed = CoreValue::Null;
@@ -47285,70 +47368,72 @@ fn _ace_dedupe_playbook(args: &[CoreValue]) -> Result<CoreValue, AxError> {
         &CoreValue::from("sections"),
         v_empty_map.clone(),
     );
-    v_section_names = core_map_keys(&[v_sections.clone()])?;
     for v_section_name in core_iter(&v_section_names)? {
         let mut v_section_name = v_section_name;
         v_bullets = core_get(&v_sections, &v_section_name.clone(), CoreValue::Null);
-        v_seen = CoreValue::new_map();
-        v_unique = CoreValue::new_list();
-        for v_bullet in core_iter(&v_bullets)? {
-            let mut v_bullet = v_bullet;
-            v_content = core_get(&v_bullet, &CoreValue::from("content"), CoreValue::from(""));
-            v_trimmed = core_string_trim(&v_content);
-            v_key = core_string_lower(&[v_trimmed.clone()])?;
-            v_has_existing = core_map_contains(&[v_seen.clone(), v_key.clone()])?;
-            if core_truthy(&v_has_existing) {
-                v_existing = core_get(&v_seen, &v_key.clone(), CoreValue::Null);
-                v_existing_helpful = core_get(
-                    &v_existing,
-                    &CoreValue::from("helpfulCount"),
-                    CoreValue::Num(0f64),
-                );
-                v_bullet_helpful = core_get(
-                    &v_bullet,
-                    &CoreValue::from("helpfulCount"),
-                    CoreValue::Num(0f64),
-                );
-                v_merged_helpful =
-                    core_add(&[v_existing_helpful.clone(), v_bullet_helpful.clone()])?;
-                core_set(
-                    &v_existing,
-                    CoreValue::from("helpfulCount"),
-                    v_merged_helpful.clone(),
-                )?;
-                v_existing_harmful = core_get(
-                    &v_existing,
-                    &CoreValue::from("harmfulCount"),
-                    CoreValue::Num(0f64),
-                );
-                v_bullet_harmful = core_get(
-                    &v_bullet,
-                    &CoreValue::from("harmfulCount"),
-                    CoreValue::Num(0f64),
-                );
-                v_merged_harmful =
-                    core_add(&[v_existing_harmful.clone(), v_bullet_harmful.clone()])?;
-                core_set(
-                    &v_existing,
-                    CoreValue::from("harmfulCount"),
-                    v_merged_harmful.clone(),
-                )?;
-                v_bullet_updated_at = core_get(
-                    &v_bullet,
-                    &CoreValue::from("updatedAt"),
-                    CoreValue::from(""),
-                );
-                core_set(
-                    &v_existing,
-                    CoreValue::from("updatedAt"),
-                    v_bullet_updated_at.clone(),
-                )?;
-            } else {
-                core_set(&v_seen, v_key.clone(), v_bullet.clone())?;
-                core_append(&v_unique, v_bullet.clone())?;
+        v_has_bullets = core_truthy_value(&[v_bullets.clone()])?;
+        if core_truthy(&v_has_bullets) {
+            v_seen = CoreValue::new_map();
+            v_unique = CoreValue::new_list();
+            for v_bullet in core_iter(&v_bullets)? {
+                let mut v_bullet = v_bullet;
+                v_content = core_get(&v_bullet, &CoreValue::from("content"), CoreValue::from(""));
+                v_trimmed = core_string_trim(&v_content);
+                v_key = core_string_lower(&[v_trimmed.clone()])?;
+                v_has_existing = core_map_contains(&[v_seen.clone(), v_key.clone()])?;
+                if core_truthy(&v_has_existing) {
+                    v_existing = core_get(&v_seen, &v_key.clone(), CoreValue::Null);
+                    v_existing_helpful = core_get(
+                        &v_existing,
+                        &CoreValue::from("helpfulCount"),
+                        CoreValue::Num(0f64),
+                    );
+                    v_bullet_helpful = core_get(
+                        &v_bullet,
+                        &CoreValue::from("helpfulCount"),
+                        CoreValue::Num(0f64),
+                    );
+                    v_merged_helpful =
+                        core_add(&[v_existing_helpful.clone(), v_bullet_helpful.clone()])?;
+                    core_set(
+                        &v_existing,
+                        CoreValue::from("helpfulCount"),
+                        v_merged_helpful.clone(),
+                    )?;
+                    v_existing_harmful = core_get(
+                        &v_existing,
+                        &CoreValue::from("harmfulCount"),
+                        CoreValue::Num(0f64),
+                    );
+                    v_bullet_harmful = core_get(
+                        &v_bullet,
+                        &CoreValue::from("harmfulCount"),
+                        CoreValue::Num(0f64),
+                    );
+                    v_merged_harmful =
+                        core_add(&[v_existing_harmful.clone(), v_bullet_harmful.clone()])?;
+                    core_set(
+                        &v_existing,
+                        CoreValue::from("harmfulCount"),
+                        v_merged_harmful.clone(),
+                    )?;
+                    v_bullet_updated_at = core_get(
+                        &v_bullet,
+                        &CoreValue::from("updatedAt"),
+                        CoreValue::from(""),
+                    );
+                    core_set(
+                        &v_existing,
+                        CoreValue::from("updatedAt"),
+                        v_bullet_updated_at.clone(),
+                    )?;
+                } else {
+                    core_set(&v_seen, v_key.clone(), v_bullet.clone())?;
+                    core_append(&v_unique, v_bullet.clone())?;
+                }
             }
+            core_set(&v_sections, v_section_name.clone(), v_unique.clone())?;
         }
-        core_set(&v_sections, v_section_name.clone(), v_unique.clone())?;
     }
     core_set(&v_playbook, CoreValue::from("sections"), v_sections.clone())?;
     v_recomputed = _ace_recompute_playbook_stats(&[v_playbook.clone()])?;
@@ -47415,6 +47500,27 @@ fn _function_call_mode_impl(args: &[CoreValue]) -> Result<CoreValue, AxError> {
     return Ok(v_mode.clone());
 }
 
+#[allow(
+    unused_variables,
+    unused_assignments,
+    unused_mut,
+    unreachable_code,
+    clippy::all
+)]
+fn _response_function_calls_impl(args: &[CoreValue]) -> Result<CoreValue, AxError> {
+    axir_coverage_mark("_response_function_calls_impl");
+    let mut v_response = core_arg(args, 0);
+    let mut v_calls = CoreValue::Null;
+    let mut v_empty = CoreValue::Null;
+    v_empty = CoreValue::new_list();
+    v_calls = core_get(
+        &v_response,
+        &CoreValue::from("function_calls"),
+        v_empty.clone(),
+    );
+    return Ok(v_calls.clone());
+}
+
 #[allow(
     unused_variables,
     unused_assignments,
@@ -47553,27 +47659,6 @@ fn _ace_prune_section_for_addition(args: &[CoreValue]) -> Result<CoreValue, AxEr
     return Ok(v_out.clone());
 }
 
-#[allow(
-    unused_variables,
-    unused_assignments,
-    unused_mut,
-    unreachable_code,
-    clippy::all
-)]
-fn _response_function_calls_impl(args: &[CoreValue]) -> Result<CoreValue, AxError> {
-    axir_coverage_mark("_response_function_calls_impl");
-    let mut v_response = core_arg(args, 0);
-    let mut v_calls = CoreValue::Null;
-    let mut v_empty = CoreValue::Null;
-    v_empty = CoreValue::new_list();
-    v_calls = core_get(
-        &v_response,
-        &CoreValue::from("function_calls"),
-        v_empty.clone(),
-    );
-    return Ok(v_calls.clone());
-}
-
 #[allow(
     unused_variables,
     unused_assignments,
@@ -47695,6 +47780,47 @@ fn _tool_result_message_impl(args: &[CoreValue]) -> Result<CoreValue, AxError> {
     return Ok(v_message.clone());
 }
 
+#[allow(
+    unused_variables,
+    unused_assignments,
+    unused_mut,
+    unreachable_code,
+    clippy::all
+)]
+fn _tool_error_message_impl(args: &[CoreValue]) -> Result<CoreValue, AxError> {
+    axir_coverage_mark("_tool_error_message_impl");
+    let mut v_call = core_arg(args, 0);
+    let mut v_error = core_arg(args, 1);
+    let mut v_error_text = CoreValue::Null;
+    let mut v_id = CoreValue::Null;
+    let mut v_message = CoreValue::Null;
+    let mut v_payload = CoreValue::Null;
+    let mut v_payload_json = CoreValue::Null;
+    v_id = core_get(&v_call, &CoreValue::from("id"), CoreValue::Null);
+    v_error_text = core_exception_message(&[v_error.clone()])?;
+    v_payload = CoreValue::new_map();
+    core_set(&v_payload, CoreValue::from("error"), v_error_text.clone())?;
+    v_payload_json = core_json_stringify(&[v_payload.clone()])?;
+    v_message = CoreValue::new_map();
+    core_set(
+        &v_message,
+        CoreValue::from("role"),
+        CoreValue::from("function"),
+    )?;
+    core_set(&v_message, CoreValue::from("function_id"), v_id.clone())?;
+    core_set(
+        &v_message,
+        CoreValue::from("result"),
+        v_payload_json.clone(),
+    )?;
+    core_set(
+        &v_message,
+        CoreValue::from("is_error"),
+        CoreValue::Bool(true),
+    )?;
+    return Ok(v_message.clone());
+}
+
 #[allow(
     unused_variables,
     unused_assignments,
@@ -48082,47 +48208,6 @@ fn _ace_apply_curator_operations(args: &[CoreValue]) -> Result<CoreValue, AxErro
     return Ok(v_out.clone());
 }
 
-#[allow(
-    unused_variables,
-    unused_assignments,
-    unused_mut,
-    unreachable_code,
-    clippy::all
-)]
-fn _tool_error_message_impl(args: &[CoreValue]) -> Result<CoreValue, AxError> {
-    axir_coverage_mark("_tool_error_message_impl");
-    let mut v_call = core_arg(args, 0);
-    let mut v_error = core_arg(args, 1);
-    let mut v_error_text = CoreValue::Null;
-    let mut v_id = CoreValue::Null;
-    let mut v_message = CoreValue::Null;
-    let mut v_payload = CoreValue::Null;
-    let mut v_payload_json = CoreValue::Null;
-    v_id = core_get(&v_call, &CoreValue::from("id"), CoreValue::Null);
-    v_error_text = core_exception_message(&[v_error.clone()])?;
-    v_payload = CoreValue::new_map();
-    core_set(&v_payload, CoreValue::from("error"), v_error_text.clone())?;
-    v_payload_json = core_json_stringify(&[v_payload.clone()])?;
-    v_message = CoreValue::new_map();
-    core_set(
-        &v_message,
-        CoreValue::from("role"),
-        CoreValue::from("function"),
-    )?;
-    core_set(&v_message, CoreValue::from("function_id"), v_id.clone())?;
-    core_set(
-        &v_message,
-        CoreValue::from("result"),
-        v_payload_json.clone(),
-    )?;
-    core_set(
-        &v_message,
-        CoreValue::from("is_error"),
-        CoreValue::Bool(true),
-    )?;
-    return Ok(v_message.clone());
-}
-
 #[allow(
     unused_variables,
     unused_assignments,
@@ -79499,4 +79584,4 @@ fn mcp_oauth_validate_issuer(args: &[CoreValue]) -> Result<CoreValue, AxError> {
     return Ok(v_out.clone());
 }
 
-// END AXIR CORE EMITTED FUNCTIONS (592 of 592 core functions)
+// END AXIR CORE EMITTED FUNCTIONS (593 of 593 core functions)
@@ -3764,7 +3764,7 @@ func TestPythonGeneratedIdioms(t *testing.T) {
 		"def _should_continue_steps(",
 		"def _execute_tool_call(",
 		"def _forward_impl(",
-		"return _forward_impl(self, client, values, options)",
+		"output = _forward_impl(call_gen, client, values, options)",
 		"while True:",
 		"try:",
 		"except Exception as",
@@ -161,10 +161,33 @@ func EmitPython(model AxRuntimeModel, outDir string) error {
 		"examples/mcp_modern_roundtrip.py":                            pyMCPModernRoundtripExample,
 		"examples/mcp_sse_roundtrip.py":                               pyMCPSseRoundtripExample,
 		"examples/context_cache_recovery.py":                          pyContextCacheRecoveryExample,
+		"examples/rate_limiter.py":                                    pyRateLimiterExample,
+		"examples/realtime_stream.py":                                 pyRealtimeStreamExample,
+		"examples/memory_sessions.py":                                 pyMemorySessionsExample,
+		"examples/retry_circuit_breaker.py":                           pyRetryCircuitBreakerExample,
+		"examples/ace_pipelined_compile.py":                           pyACEPipelinedCompileExample,
+		"examples/ace_playbook_snapshots.py":                          pyACEPlaybookSnapshotsExample,
+		"examples/agent_playbook_parallel_evolve.py":                  pyAgentPlaybookParallelEvolveExample,
+		"examples/concurrent_program_sharing.py":                      pyConcurrentProgramSharingExample,
+		"examples/flow_state_sharing.py":                              pyFlowStateSharingExample,
+		"examples/gepa_racing.py":                                     pyGEPARacingExample,
+		"examples/import_startup_budget.py":                           pyImportStartupBudgetExample,
+		"examples/mcp_task_waiting.py":                                pyMCPTaskWaitingExample,
+		"examples/mcp_tool_call_plans.py":                             pyMCPToolCallPlansExample,
+		"examples/runtime_stderr_drain.py":                            pyRuntimeStderrDrainExample,
+		"examples/runtime_watchdog.py":                                pyRuntimeWatchdogExample,
+		"examples/request_sharing.py":                                 pyRequestSharingExample,
 		"API.md":                                                      packageAPIReferenceMarkdown(model, "python"),
 		"README.md":                                                   packageREADME(model, "python"),
 		"LICENSE":                                                     packageLicenseText,
 	}
+	dataFiles, err := BuildPythonDataFiles(model)
+	if err != nil {
+		return err
+	}
+	for path, text := range dataFiles {
+		files[path] = text
+	}
 	addPackageSkills(files, model, "python")
 	return writeFiles(outDir, files)
 }
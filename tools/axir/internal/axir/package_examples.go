@@ -3863,3 +3863,1232 @@ int main() {
   std::cout << "cpp-agent-playbook-ok\n";
 }
 `
+
+const pyACEPipelinedCompileExample = `"""Overlap generation, reflection and curation across examples.
+
+With pipelineWindow set, evolve runs the generator, metric, reflector and
+curator for up to that many examples on worker threads. Curator operations
+are still applied one example at a time, in example order, so the feedback
+history matches a strict run. Each example reflects against the playbook as
+rendered when it was scheduled.
+"""
+
+import json
+import re
+import threading
+import time
+
+from axllm import ax, playbook
+
+EXAMPLES = 16
+LATENCY = 0.02
+
+
+class SlowClient:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = 0
+
+    def complete(self, request):
+        time.sleep(LATENCY)
+        with self.lock:
+            self.calls += 1
+        match = re.search(r"q(\d+)", json.dumps(request))
+        index = int(match.group(1)) if match else 0
+        return {
+            "content": json.dumps(
+                {
+                    "answer": "ok",
+                    "reasoning": "Missed a constraint.",
+                    "errorIdentification": "A constraint was ignored.",
+                    "rootCauseAnalysis": "No rule covered it.",
+                    "correctApproach": "Check every constraint.",
+                    "keyInsight": "List constraints first.",
+                    "bulletTags": [],
+                    "operations": [{"type": "ADD", "section": f"Section {index % 3}", "content": f"Rule {index}: check constraint {index}."}],
+                }
+            )
+        }
+
+
+SEED = {
+    "version": 1,
+    "sections": {"Section 0": [{"id": "seed-1", "section": "Section 0", "content": "Read the question twice.", "helpfulCount": 0, "harmfulCount": 0}]},
+    "stats": {"bulletCount": 1, "helpfulCount": 0, "harmfulCount": 0, "tokenEstimate": 6},
+}
+
+
+def run(options):
+    client = SlowClient()
+    pb = playbook(ax("question:string -> answer:string"), {"studentAI": client, "maxEpochs": 1, "initialPlaybook": SEED})
+    started = time.perf_counter()
+    pb.evolve([{"question": f"q{index}"} for index in range(EXAMPLES)], lambda args: 0.5, options)
+    return pb.get_state(), client.calls, time.perf_counter() - started
+
+
+strict, strict_calls, strict_s = run({})
+piped, piped_calls, piped_s = run({"pipelineWindow": 4})
+
+assert strict_calls == piped_calls
+assert [entry["example"] for entry in piped["artifact"]["feedback"]] == [entry["example"] for entry in strict["artifact"]["feedback"]]
+assert sorted(bullet["content"] for section in piped["playbook"]["sections"].values() for bullet in section) == sorted(
+    bullet["content"] for section in strict["playbook"]["sections"].values() for bullet in section
+)
+assert piped_s < strict_s
+print(f"python-ace-pipelined-compile-ok (strict {strict_s * 1000:.0f} ms, window 4 {piped_s * 1000:.0f} ms)")
+`
+
+const pyACEPlaybookSnapshotsExample = `"""Grow a playbook over many examples, then read and edit its state.
+
+The playbook engine re-renders only after the playbook changes. Dedupe
+rescans only the sections a curator batch touched and then recomputes the
+playbook stats. get_state() returns an editable copy that load() accepts.
+"""
+
+import json
+import time
+
+from axllm import ax, playbook
+
+EXAMPLES = 120
+
+
+class ScriptedClient:
+    def __init__(self):
+        self.calls = 0
+
+    def complete(self, request):
+        self.calls += 1
+        rule = f"Rule {self.calls % 40}: check the {self.calls % 7}th constraint."
+        return {
+            "content": json.dumps(
+                {
+                    "answer": "ok",
+                    "reasoning": "Missed a constraint.",
+                    "errorIdentification": "A constraint was ignored.",
+                    "rootCauseAnalysis": "No rule covered it.",
+                    "correctApproach": "Check every constraint.",
+                    "keyInsight": "List constraints first.",
+                    "bulletTags": [],
+                    "operations": [{"type": "ADD", "section": f"Section {self.calls % 5}", "content": rule}],
+                }
+            )
+        }
+
+
+SEED = {
+    "version": 1,
+    "sections": {"Section 0": [{"id": "seed-1", "section": "Section 0", "content": "Read the question twice.", "helpfulCount": 0, "harmfulCount": 0}]},
+    "stats": {"bulletCount": 1, "helpfulCount": 0, "harmfulCount": 0, "tokenEstimate": 6},
+}
+
+client = ScriptedClient()
+pb = playbook(ax("question:string -> answer:string"), {"studentAI": client, "maxEpochs": 1, "maxSectionSize": 60, "initialPlaybook": SEED})
+started = time.perf_counter()
+pb.evolve([{"question": f"q{index}"} for index in range(EXAMPLES)], lambda args: 0.5)
+elapsed_ms = (time.perf_counter() - started) * 1000
+
+state = pb.get_state()
+bullets = [bullet for section in state["playbook"]["sections"].values() for bullet in section]
+contents = [bullet["content"].strip().lower() for bullet in bullets]
+assert len(contents) == len(set(contents)), "dedupe must leave one bullet per content"
+assert len(state["artifact"]["feedback"]) == EXAMPLES
+assert state["playbook"]["stats"]["bulletCount"] == len(bullets), "stats must follow dedupe"
+assert len(bullets) > 1 and pb.render().count("- [") == len(bullets)
+
+state["playbook"]["sections"]["Section 0"] = [{"id": "edited-1", "section": "Section 0", "content": "Edited rule.", "helpfulCount": 0, "harmfulCount": 0}]
+assert pb.render().count("- [") == len(bullets), "editing a snapshot must not touch the live playbook"
+pb.load(state)
+assert "Edited rule." in pb.render()
+print(f"python-ace-playbook-snapshots-ok ({EXAMPLES} examples, {len(bullets)} bullets, {elapsed_ms:.0f} ms)")
+`
+
+const pyAgentPlaybookParallelEvolveExample = `"""Evaluate agent.playbook().evolve() tasks on a worker pool.
+
+concurrency runs independent task evaluations on threads. Metric calls are
+reserved in task order before each run starts, so maxMetricCalls is spent
+exactly as in a sequential evolve and records come back in task order. Progress
+events carry inFlight. The scripted runtime sleeps to stand in for agent
+latency.
+"""
+
+import json
+import time
+
+from axllm import AxCodeRuntime, AxCodeSession, RuntimeEnvelope, agent
+
+TASKS = 24
+RUNS_PER_TASK = 2
+MAX_METRIC_CALLS = 31
+CONCURRENCY = 8
+
+
+class ScriptedClient:
+    def complete(self, request):
+        return {
+            "content": json.dumps(
+                {
+                    "pythonCode": "final('Answer', {'answer': 'ok'})",
+                    "answer": "ok",
+                    "weaknessDescription": "The agent does not verify its final step.",
+                    "rootCause": "The final step is accepted without a check.",
+                    "proposedGuidance": "Verify the final step before completing the task.",
+                    "evidenceQuotes": ["final"],
+                    "configRecommendations": [],
+                }
+            )
+        }
+
+
+class SlowSession(AxCodeSession):
+    def execute(self, code, options=None):
+        time.sleep(0.01)
+        return RuntimeEnvelope.final({"answer": "ok"})
+
+    def snapshot_globals(self, options=None):
+        return {"version": 1, "bindings": {}, "globals": {}, "closed": False}
+
+    def patch_globals(self, snapshot, options=None):
+        return snapshot
+
+
+class Runtime(AxCodeRuntime):
+    language = "Python"
+
+    def create_session(self, globals, options=None):
+        return SlowSession()
+
+
+def metric(args):
+    return 1.0 if args["task"]["id"].endswith(("0", "5")) else 0.25
+
+
+def evolve(concurrency):
+    client = ScriptedClient()
+    ag = agent("question:string -> answer:string", {"name": "qa", "ai": client, "runtime": Runtime()})
+    pb = ag.playbook({"target": "responder", "studentAI": client})
+    dataset = {"train": [{"id": f"task-{index:02d}", "input": {"question": f"q{index}"}} for index in range(TASKS)]}
+    events = []
+    started = time.perf_counter()
+    result = pb.evolve(dataset, {
+        "metric": metric,
+        "runsPerTask": RUNS_PER_TASK,
+        "maxMetricCalls": MAX_METRIC_CALLS,
+        "maxProposals": 1,
+        "concurrency": concurrency,
+        "onProgress": events.append,
+    })
+    return result, events, time.perf_counter() - started
+
+
+sequential, sequential_events, sequential_s = evolve(1)
+parallel, parallel_events, parallel_s = evolve(CONCURRENCY)
+
+for result in (sequential, parallel):
+    assert result["metricCallsUsed"] == MAX_METRIC_CALLS, result["metricCallsUsed"]
+    # 31 calls cover 15 full tasks plus one run of the 16th.
+    assert [record["task"]["id"] for record in result["records"]] == [f"task-{index:02d}" for index in range(16)]
+assert parallel["baseline"] == sequential["baseline"], (parallel["baseline"], sequential["baseline"])
+assert [record["score"] for record in parallel["records"]] == [record["score"] for record in sequential["records"]]
+assert max(event["inFlight"] for event in sequential_events) == 0
+assert 1 < max(event["inFlight"] for event in parallel_events) <= CONCURRENCY
+print(f"sequential {sequential_s * 1000:.0f} ms, concurrency={CONCURRENCY} {parallel_s * 1000:.0f} ms")
+print("python-agent-playbook-parallel-evolve-ok")
+`
+
+const pyConcurrentProgramSharingExample = `"""Share one AxGen, AxFlow and AxAgent across a thread pool without cross-talk.
+
+Each forward records into its own AxRunContext (pass {"runContext": ctx} to
+keep a handle on it). The scripted client echoes the question it was asked
+after a random delay, so calls interleave. The example checks that every
+context holds only the chat log, traces and output of its own call.
+"""
+
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from axllm import AxRunContext, agent, ax, flow
+
+WORKERS = 16
+CALLS = 400
+
+
+class EchoClient:
+    def complete(self, request):
+        prompt = json.dumps(request.get("chat_prompt"), default=str)
+        tag = prompt[prompt.index("q-") : prompt.index("q-") + 6]
+        time.sleep(random.random() / 1000)
+        # The agent's distiller reads completion; the other stages read answer.
+        content = {"answer": f"a-{tag}", "completion": {"type": "respond", "args": [tag]}}
+        return {"content": json.dumps(content), "usage": {"tag": tag}}
+
+
+client = EchoClient()
+qa = ax("question:string -> answer:string")
+graph = flow({"id": "shared.flow"}).execute("qa", qa).returns({"answer": "answer"})
+helper = agent("question:string -> answer:string", {"contextFields": []})
+
+
+def run_one(index):
+    tag = f"q-{index:04d}"
+    program = (qa, graph, helper)[index % 3]
+    ctx = AxRunContext()
+    out = program.forward(client, {"question": tag}, {"runContext": ctx})
+    assert out["answer"] == f"a-{tag}", (tag, out)
+    assert ctx.status == "ok" and ctx.output == out, (tag, ctx.status)
+    assert ctx.chat_log, tag
+    for entry in ctx.chat_log:
+        assert tag in json.dumps(entry.get("messages"), default=str), (tag, entry)
+    if program is qa:
+        assert [trace["input"] for trace in ctx.traces] == [{"question": tag}], ctx.traces
+    if program is graph:
+        assert [entry["name"] for entry in ctx.chat_log] == ["qa"], ctx.chat_log
+        assert ctx.usage["qa"] == [{"tag": tag}], ctx.usage
+    return tag
+
+
+with ThreadPoolExecutor(WORKERS) as pool:
+    done = list(pool.map(run_one, range(CALLS)))
+assert len(done) == CALLS
+assert qa.last_run_context is not None and graph.get_run_context() is not None
+print(f"python-concurrent-programs-ok ({CALLS} calls on {WORKERS} threads)")
+`
+
+const pyFlowStateSharingExample = `"""Run a wide flow over a large input state.
+
+Each node layers its outputs over the state it read instead of copying the
+whole state, so per-node cost tracks the node's own outputs. The example
+checks parallel fan-out/join results, that the caller's input is untouched,
+and that the un-projected output is a plain dict.
+"""
+
+import json
+import time
+
+from axllm import ax, flow
+
+STATE_KEYS = 20000
+NODES = 40
+
+
+class ScriptedClient:
+    def complete(self, request):
+        prompt = json.dumps(request.get("chat_prompt"), default=str)
+        if "briefText" in prompt:
+            return {"content": json.dumps({"briefText": "facts+angle"})}
+        if "factList" in prompt:
+            return {"content": json.dumps({"factList": "facts"})}
+        if "audienceAngle" in prompt:
+            return {"content": json.dumps({"audienceAngle": "angle"})}
+        return {"content": json.dumps({"noteText": "note"})}
+
+
+def fan_out_flow():
+    return (
+        flow({"id": "example.stateFanOut"})
+        .execute("research", ax("topicText:string -> factList:string"), {"reads": ["topicText"], "writes": ["researchResult", "factList"]})
+        .execute("audience", ax("topicText:string -> audienceAngle:string"), {"reads": ["topicText"], "writes": ["audienceResult", "audienceAngle"]})
+        .execute("join", ax("factList:string, audienceAngle:string -> briefText:string"), {"reads": ["factList", "audienceAngle"], "writes": ["joinResult", "briefText"]})
+    )
+
+
+def wide_flow():
+    graph = flow({"id": "example.stateWide"})
+    for index in range(NODES):
+        graph = graph.execute(f"note{index}", ax("topicText:string -> noteText:string"))
+    return graph.returns({"noteText": "noteText"})
+
+
+client = ScriptedClient()
+values = {f"k{index}": index for index in range(STATE_KEYS)}
+values["topicText"] = "Typed LLM workflows"
+snapshot = dict(values)
+
+out = fan_out_flow().forward(client, values)
+assert type(out) is dict, type(out)
+assert out["briefText"] == "facts+angle", out
+assert out["factList"] == "facts" and out["audienceAngle"] == "angle", out
+assert out["k19999"] == 19999 and len(out) == STATE_KEYS + 7, len(out)
+assert values == snapshot, "flow must not mutate the caller's state"
+
+graph = wide_flow()
+start = time.perf_counter()
+assert graph.forward(client, values) == {"noteText": "note"}
+elapsed_ms = (time.perf_counter() - start) * 1000
+print(f"python-flow-state-sharing-ok ({NODES} nodes over {STATE_KEYS} keys in {elapsed_ms:.1f} ms)")
+`
+
+const pyGEPARacingExample = `"""Race GEPA child candidates against their parent on shuffled minibatch slices.
+
+With racing on, a child proposal is scored on a growing slice of the
+minibatch. It is dropped once a paired sign test against the parent shows it
+can't clear minImprovementThreshold. The default "hoeffding" bound and the
+"bernstein" bound make no assumption about the score distribution, and both
+need more tasks before they drop a candidate. The reflection client
+here proposes mostly worse instructions. The example checks that racing makes
+the same accept/reject decisions while spending fewer metric calls, and it
+reports metricCallsSaved.
+"""
+
+import json
+import zlib
+
+from axllm import AxGEPA, OptimizerEvaluator
+
+PROPOSALS = ["Answer tersely.", "Ramble at length.", "Answer concisely with one fact.", "Ignore the question.", "Guess."]
+
+
+class ReflectionClient:
+    def __init__(self):
+        self.calls = 0
+
+    def chat(self, prompt, options=None):
+        text = PROPOSALS[self.calls % len(PROPOSALS)]
+        self.calls += 1
+        return {"results": [{"content": f"New Value: {text}"}]}
+
+
+def quality(instruction, example):
+    base = 0.85 if "concise" in instruction.lower() else 0.7 if "terse" in instruction.lower() else 0.2
+    jitter = (zlib.crc32(json.dumps([instruction, example]).encode()) % 100) / 1000
+    return min(1.0, base + jitter)
+
+
+class LocalEvaluator(OptimizerEvaluator):
+    def __init__(self):
+        self.calls = 0
+
+    def evaluate(self, candidate_map, options=None):
+        examples = ((options or {}).get("dataset") or {}).get("train") or []
+        instruction = candidate_map.get("qa::instruction", "")
+        rows = [{"input": example, "prediction": {}, "scores": {"quality": quality(instruction, example)}, "scalar": quality(instruction, example)} for example in examples]
+        self.calls += len(rows)
+        total = sum(row["scalar"] for row in rows)
+        return {"rows": rows, "avg": total / max(len(rows), 1), "sum": total, "count": len(rows)}
+
+
+def run(racing):
+    request = {
+        "programKind": "axgen",
+        "components": [{"id": "qa::instruction", "owner": "qa", "kind": "instruction", "current": "Answer clearly."}],
+        "dataset": {"train": [{"question": f"q{index}"} for index in range(40)], "validation": [{"question": f"v{index}"} for index in range(10)]},
+        "options": {"numTrials": 5, "minibatchSize": 40, "maxMetricCalls": 2000, "earlyStoppingTrials": 10, "seed": 7, "racing": racing},
+    }
+    evaluator = LocalEvaluator()
+    artifact = AxGEPA(ReflectionClient(), seed=7).optimize(request, evaluator)
+    return artifact, evaluator.calls
+
+
+exhaustive, exhaustive_calls = run(False)
+raced, raced_calls = run({"bound": "sign", "confidence": 0.95, "minBatch": 4})
+
+assert raced["componentMap"] == exhaustive["componentMap"], (raced["componentMap"], exhaustive["componentMap"])
+assert raced["metadata"]["candidatesExplored"] == exhaustive["metadata"]["candidatesExplored"]
+assert raced_calls == raced["metadata"]["totalMetricCalls"]
+assert raced_calls + raced["metadata"]["metricCallsSaved"] == exhaustive_calls, (raced_calls, raced["metadata"]["metricCallsSaved"], exhaustive_calls)
+assert raced_calls < exhaustive_calls
+print(json.dumps({"componentMap": raced["componentMap"], "metricCalls": {"exhaustive": exhaustive_calls, "raced": raced_calls, "saved": raced["metadata"]["metricCallsSaved"]}}, sort_keys=True))
+print("python-gepa-racing-ok")
+`
+
+const pyImportStartupBudgetExample = `"""Startup check: import axllm; axllm.ai must leave the heavy modules unloaded.
+
+A fresh interpreter runs the import under python -X importtime. Both its
+sys.modules and the import trace must be free of the agent, flow, MCP, and
+generation modules, which load only on first use. For scale it also times an
+eager baseline that imports those modules up front and prints the slowest
+entries of the lazy trace. The timings are printed, not asserted, so a busy
+machine cannot fail the check. The interpreters inherit the caller's
+environment unchanged.
+"""
+
+import json
+import subprocess
+import sys
+import time
+
+HEAVY = ("axllm.agent", "axllm.flow", "axllm.mcp", "axllm.gen")
+LAZY = "import axllm; axllm.ai"
+EAGER = LAZY + "; " + "; ".join(f"import {module}" for module in HEAVY)
+RUNS = 5
+
+PROBE = """
+import json, sys
+{statement}
+print(json.dumps(sorted(m for m in sys.modules if m.startswith("axllm"))))
+"""
+
+
+def run(statement, *flags):
+    return subprocess.run(
+        [sys.executable, *flags, "-c", PROBE.format(statement=statement)], check=True, capture_output=True, text=True
+    )
+
+
+def best_ms(statement):
+    samples = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        run(statement)
+        samples.append((time.perf_counter() - started) * 1000)
+    return min(samples)
+
+
+traced = run(LAZY, "-X", "importtime")
+loaded = json.loads(traced.stdout)
+rows = [line.split("|") for line in traced.stderr.splitlines() if line.startswith("import time:") and "cumulative" not in line]
+imported = {row[2].strip() for row in rows}
+for heavy in HEAVY:
+    assert heavy not in loaded, f"{heavy} loaded eagerly"
+    assert heavy not in imported, f"{heavy} appears in the import trace"
+
+lazy_ms, eager_ms = best_ms(LAZY), best_ms(EAGER)
+print("loaded:", ", ".join(loaded))
+print(f"{LAZY}: best {lazy_ms:.1f} ms of {RUNS} interpreters; eager baseline {eager_ms:.1f} ms")
+for row in sorted(rows, key=lambda row: -int(row[1]))[:8]:
+    print(f"  {int(row[1]) / 1000:7.1f} ms  {row[2].rstrip()}")
+`
+
+const pyMCPTaskWaitingExample = `"""Wait for long-running MCP tasks without flooding the server.
+
+call_tool polls tasks/get for a task with exponential backoff. The first
+delay is taskPollInitialMs and it doubles up to taskPollMaxMs. A server
+pollIntervalMs lengthens the delay, and half of ttlMs caps it. While a
+listener is running, notifications/tasks/status wakes the wait at once.
+wait_for_tasks waits on several task ids together, and taskTimeoutMs bounds
+the whole wait.
+"""
+
+import threading
+import time
+
+from axllm import AxMCPClient, AxMCPScriptedTransport
+from axllm.mcp import AxMCPError
+
+
+class TaskServer(AxMCPScriptedTransport):
+    """A scripted modern server whose tasks finish after a set duration."""
+
+    def __init__(self, notify=False):
+        super().__init__()
+        self.notify = notify
+        self.tasks = {}
+        self.polls = 0
+
+    def task(self, task_id):
+        task = self.tasks[task_id]
+        done = time.monotonic() >= task["doneAt"]
+        out = {"taskId": task_id, "status": "completed" if done else "working", "createdAt": "2026-07-28T00:00:00Z", "lastUpdatedAt": "2026-07-28T00:00:01Z", "ttlMs": 60000}
+        if done:
+            out["result"] = {"resultType": "complete", "structuredContent": {"task": task_id}}
+        return out
+
+    def send(self, message):
+        method, params = message.get("method"), message.get("params") or {}
+        if method == "server/discover":
+            result = {"resultType": "complete", "supportedVersions": ["2026-07-28"], "capabilities": {"tools": {}, "extensions": {"io.modelcontextprotocol/tasks": {}}}, "ttlMs": 60000, "cacheScope": "private"}
+        elif method == "tools/list":
+            result = {"tools": [{"name": "slow", "inputSchema": {"type": "object"}}], "ttlMs": 60000, "cacheScope": "private"}
+        elif method == "tools/call":
+            task_id = f"task-{len(self.tasks) + 1}"
+            seconds = float(params["arguments"]["seconds"])
+            self.tasks[task_id] = {"doneAt": time.monotonic() + seconds}
+            if self.notify:
+                timer = threading.Timer(seconds, lambda: self.emit({"jsonrpc": "2.0", "method": "notifications/tasks/status", "params": self.task(task_id)}))
+                timer.daemon = True
+                timer.start()
+            result = {"resultType": "task", **self.task(task_id)}
+        elif method == "tasks/get":
+            self.polls += 1
+            result = self.task(params["taskId"])
+        else:
+            result = {}
+        return {"jsonrpc": "2.0", "id": message.get("id"), "result": result}
+
+
+polling = TaskServer()
+client = AxMCPClient(polling, {"era": "modern"})
+client.init()
+assert client.call_tool("slow", {"seconds": 0.5})["structuredContent"] == {"task": "task-1"}
+backoff_polls = polling.polls
+assert backoff_polls < 15, backoff_polls
+
+pushed = TaskServer(notify=True)
+listening = AxMCPClient(pushed, {"era": "modern", "taskPollMaxMs": 10000})
+listening.start_listening()
+started = time.perf_counter()
+assert listening.call_tool("slow", {"seconds": 0.5})["structuredContent"] == {"task": "task-1"}
+notified_s = time.perf_counter() - started
+assert notified_s < 1.0 and pushed.polls < 10, (notified_s, pushed.polls)
+
+ids = [client.request("tools/call", {"name": "slow", "arguments": {"seconds": seconds}})["taskId"] for seconds in (0.1, 0.3, 0.2)]
+results = client.wait_for_tasks(ids)
+assert sorted(results) == sorted(ids)
+
+late = client.request("tools/call", {"name": "slow", "arguments": {"seconds": 5}})["taskId"]
+try:
+    client.wait_for_tasks([late], timeout_ms=200)
+    raise AssertionError("expected the task wait to time out")
+except AxMCPError as error:
+    assert "did not finish within 200 ms" in str(error)
+
+print(f"python-mcp-task-waiting-ok ({backoff_polls} polls for a 0.5 s task)")
+`
+
+const pyMCPToolCallPlansExample = `"""Call MCP tools through plans compiled once per catalog load.
+
+Each tools/list load compiles a call plan per tool. A plan holds the
+x-mcp-header bindings, a required/type argument check, and the exposed and
+namespace-qualified names. call_tool looks the plan up by name. When the
+server answers -32020 (header mismatch), only the tools/list page that held
+the tool is fetched again.
+"""
+
+import time
+
+from axllm import AxMCPClient, AxMCPScriptedTransport
+from axllm.mcp import AxMCPError
+
+TOOLS_PER_PAGE = 200
+
+
+def page_tools(page, header):
+    return [
+        {
+            "name": f"tool_{page}_{index}",
+            "inputSchema": {
+                "type": "object",
+                "properties": {"region": {"type": "string", "x-mcp-header": header}, "limit": {"type": "integer"}},
+                "required": ["region"],
+            },
+        }
+        for index in range(TOOLS_PER_PAGE)
+    ]
+
+
+class PagedServer(AxMCPScriptedTransport):
+    def __init__(self):
+        super().__init__()
+        self.headers = {"p0": "Region", "p1": "Region"}
+        self.mismatch = set()
+
+    def send_with_headers(self, message, headers=None):
+        self.request_headers.append(dict(headers or {}))
+        self.requests.append(message)
+        method, params = message.get("method"), message.get("params") or {}
+        if method == "server/discover":
+            result = {"resultType": "complete", "supportedVersions": ["2026-07-28"], "capabilities": {"tools": {}}, "ttlMs": 60000, "cacheScope": "private"}
+        elif method == "tools/list":
+            page = params.get("cursor") or "p0"
+            result = {"tools": page_tools(page, self.headers[page]), "ttlMs": 60000, "cacheScope": "private"}
+            if page == "p0":
+                result["nextCursor"] = "p1"
+        elif method == "tools/call":
+            if params["name"] in self.mismatch:
+                self.mismatch.discard(params["name"])
+                return {"jsonrpc": "2.0", "id": message.get("id"), "error": {"code": -32020, "message": "Header mismatch"}}
+            result = {"resultType": "complete", "structuredContent": {"headers": dict(headers or {})}}
+        else:
+            result = {}
+        return {"jsonrpc": "2.0", "id": message.get("id"), "result": result}
+
+
+server = PagedServer()
+client = AxMCPClient(server, {"era": "modern", "namespace": "warehouse", "validateToolArguments": True})
+client.init()
+assert len(client.tools) == 2 * TOOLS_PER_PAGE
+
+started = time.perf_counter()
+for _ in range(2000):
+    out = client.call_tool(f"tool_p1_{TOOLS_PER_PAGE - 1}", {"region": "west", "limit": 5})
+calls_ms = (time.perf_counter() - started) * 1000
+assert out["structuredContent"]["headers"] == {"Mcp-Param-Region": "west"}, out
+
+try:
+    client.call_tool("tool_p0_0", {"limit": "five"})
+    raise AssertionError("expected argument validation to fail")
+except AxMCPError as error:
+    assert "missing required arguments: region" in str(error)
+client.call_tool("tool_p0_0", {"region": "west", "limit": 5.0})
+
+server.headers["p1"] = "Zone"
+server.mismatch.add("tool_p1_3")
+before = len(server.requests)
+out = client.call_tool("tool_p1_3", {"region": "east"})
+lists = [request.get("params", {}).get("cursor") for request in server.requests[before:] if request["method"] == "tools/list"]
+assert lists == ["p1"], lists
+assert out["structuredContent"]["headers"] == {"Mcp-Param-Zone": "east"}, out
+assert [tool["name"] for tool in client.tools][:2] == ["tool_p0_0", "tool_p0_1"]
+assert len(client.tools) == 2 * TOOLS_PER_PAGE
+assert client.native_tools()[0].name == "tool_p0_0"
+print(f"python-mcp-tool-call-plans-ok (2000 calls in {calls_ms:.0f} ms)")
+`
+
+const pyRuntimeStderrDrainExample = `"""Keep a chatty runtime child from blocking on its stderr pipe.
+
+ProcessCodeRuntime drains the child's stderr on a background thread into a
+ring buffer. session.recent_stderr() returns the lines attributed to one
+session. Lines of the form @ax-event {json} are structured runtime events.
+They go to on_event and to recent_events(). Error envelopes carry the
+session's stderr tail under "stderr".
+"""
+
+import sys
+
+from axllm import ProcessCodeRuntime
+
+SERVER = r"""
+import json, sys
+sessions = {}
+for line in sys.stdin:
+    message = json.loads(line)
+    op, payload, sid = message["op"], message.get("payload") or {}, message.get("session_id")
+    response = {"id": message["id"], "ok": True}
+    if op == "create_session":
+        sid = "s%d" % (len(sessions) + 1)
+        sessions[sid] = {}
+        response.update(session_id=sid, result={"session_id": sid})
+    elif op == "execute":
+        try:
+            exec(payload["code"], {"sys": sys, "json": json}, sessions[sid])
+            response.update(session_id=sid, result={"type": "final", "args": [sessions[sid].get("result")]})
+        except Exception as exc:
+            response.update(ok=False, error={"category": "runtime", "message": str(exc)})
+    else:
+        response["result"] = {op: True}
+    print(json.dumps(response), flush=True)
+    if op == "shutdown":
+        break
+"""
+
+CHATTY = """
+for i in range(5000):
+    print("warning: noisy line %d %s" % (i, "x" * 40), file=sys.stderr)
+print("@ax-event " + json.dumps({"type": "metric", "name": "rows", "value": 5000}), file=sys.stderr, flush=True)
+result = "done"
+"""
+
+events = []
+runtime = ProcessCodeRuntime([sys.executable, "-c", SERVER], timeout_ms=10000, stderr_lines=100, on_event=events.append)
+try:
+    noisy = runtime.create_session({})
+    quiet = runtime.create_session({})
+    # ~300 KB of stderr in one step; an undrained 64 KB pipe would hang here.
+    assert noisy.execute(CHATTY)["args"] == ["done"]
+    failed = noisy.execute("print('about to fail', file=sys.stderr, flush=True); import time; time.sleep(0.05); 1 / 0")
+    assert failed["is_error"] and "about to fail" in failed["stderr"], failed
+    assert quiet.execute("result = 1")["args"] == [1]
+
+    assert len(runtime.recent_stderr()) == 100
+    assert quiet.recent_stderr() == []
+    assert events == [{"type": "metric", "name": "rows", "value": 5000}]
+    assert noisy.recent_events() == events
+finally:
+    runtime.shutdown()
+
+print("python-runtime-stderr-drain-ok")
+`
+
+const pyRuntimeWatchdogExample = `"""Bound every runtime request with a deadline and recover from hung children.
+
+ProcessCodeRuntime(..., timeout_ms=...) gives every request a deadline.
+execute(code, {"timeout": ms}) overrides it for one step. When a deadline is
+missed, the watchdog kills the child and spawns a fresh one. The step returns
+a timeout error envelope. Sessions come back on their next call from their
+creation globals and their last exported state. A child that dies on its own
+is respawned the same way.
+"""
+
+import sys
+import time
+
+from axllm import ProcessCodeRuntime
+
+SERVER = r"""
+import json, sys
+sessions = {}
+for line in sys.stdin:
+    message = json.loads(line)
+    op, payload, sid = message["op"], message.get("payload") or {}, message.get("session_id")
+    response = {"id": message["id"], "ok": True}
+    if op == "create_session":
+        sid = "s%d" % (len(sessions) + 1)
+        sessions[sid] = dict(payload.get("globals") or {})
+        response.update(session_id=sid, result={"session_id": sid})
+    elif op == "execute":
+        scope = sessions[sid]
+        exec(payload["code"], {}, scope)
+        response.update(session_id=sid, result={"type": "final", "args": [scope.get("result")]})
+    elif op == "snapshot_globals":
+        response.update(session_id=sid, result={"version": 1, "bindings": dict(sessions[sid])})
+    elif op == "patch_globals":
+        sessions[sid].update((payload.get("globals") or {}).get("bindings") or {})
+        response.update(session_id=sid, result={"patched": True})
+    else:
+        response["result"] = {op: True}
+    print(json.dumps(response), flush=True)
+    if op == "shutdown":
+        break
+"""
+
+runtime = ProcessCodeRuntime([sys.executable, "-c", SERVER], timeout_ms=5000, grace_ms=50)
+try:
+    worker = runtime.create_session({"x": 1})
+    other = runtime.create_session({"z": 5})
+    worker.execute("y = x + 1")
+    worker.export_state()
+
+    started = time.perf_counter()
+    hung = worker.execute("while True: pass", {"timeout": 200})
+    elapsed = time.perf_counter() - started
+    assert hung["error_category"] == "timeout", hung
+    assert elapsed < 2, elapsed
+    assert runtime.restart_count == 1
+
+    assert worker.execute("result = y")["args"] == [2], "worker is rebuilt from its exported state"
+    assert other.execute("result = z")["args"] == [5], "other sessions are rebuilt from their creation globals"
+
+    crashed = worker.execute("import os; os._exit(3)")
+    assert crashed["error_category"] == "runtime", crashed
+    assert worker.execute("result = y * 10")["args"] == [20]
+    assert runtime.restart_count == 2
+finally:
+    runtime.shutdown()
+
+print(f"python-runtime-watchdog-ok (hung step returned after {elapsed * 1000:.0f} ms)")
+`
+
+const pyRateLimiterExample = `"""Throttle requests client-side with AxRateLimiter.
+
+One limiter holds requests-per-minute and tokens-per-minute buckets per quota
+key. acquire() debits a pre-send token estimate and settle() corrects it with
+the provider-reported usage. A blocking limiter sleeps until the buckets
+refill; a non-blocking one raises AxAIServiceRateLimitError carrying the wait
+as retry_after_ms. Clients that share a store share the same buckets. A scripted
+clock keeps the example instant and deterministic.
+"""
+
+from axllm import AxAIServiceRateLimitError, AxInMemoryRateLimitStore, AxRateLimiter
+from axllm.ai import ProviderOperationClient
+
+now = [0.0]
+slept = []
+
+
+def clock():
+    return now[0]
+
+
+def sleep(seconds):
+    slept.append(seconds)
+    now[0] += seconds
+
+
+# Two requests per minute: the third call waits 30 seconds for a refill.
+limiter = AxRateLimiter(rpm=2, clock=clock, sleep=sleep)
+for _ in range(3):
+    limiter.acquire("openai:gpt-4.1-mini")
+assert slept == [30.0], slept
+
+# Non-blocking callers get the wait back instead of sleeping.
+try:
+    limiter.acquire("openai:gpt-4.1-mini", blocking=False)
+    raise AssertionError("the request bucket is empty")
+except AxAIServiceRateLimitError as error:
+    assert error.status == 429 and error.retryable, error
+    assert error.retry_after_ms == 30_000, error.retry_after_ms
+
+# Other quota keys have their own buckets.
+assert limiter.try_acquire("anthropic:claude") is not None
+
+# Token budget: settle() refunds an overestimate so later calls are admitted.
+tokens = AxRateLimiter(tpm=1_000, clock=clock, sleep=sleep, blocking=False)
+reservation = tokens.acquire("batch", tokens=900)
+assert tokens.try_acquire("batch", tokens=500) is None, "900 of 1000 tokens are reserved"
+tokens.settle(reservation, 300)
+assert tokens.try_acquire("batch", tokens=500) is not None, "settling returned 600 tokens"
+
+# Clients sharing a store share one quota; rate_limit accepts a plain dict.
+RESPONSE = {
+    "id": "resp-1",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+}
+sent = []
+
+
+def transport(request):
+    sent.append(request["url"])
+    return {"status": 200, "headers": {}, "body": RESPONSE}
+
+
+store = AxInMemoryRateLimitStore()
+quota = {"rpm": 3, "store": store, "blocking": False, "key": "team-quota"}
+first = ProviderOperationClient("openai", "openai", api_key="example-key", transport=transport, rate_limit=quota)
+second = ProviderOperationClient("openai", "openai", api_key="example-key", transport=transport, rate_limit=quota)
+request = {"chat_prompt": [{"role": "user", "content": "hi"}]}
+
+first.chat(request)
+second.chat(request)
+first.chat(request)
+try:
+    second.chat(request)
+    raise AssertionError("both clients draw from the same three-request bucket")
+except AxAIServiceRateLimitError as error:
+    assert error.retry_after_ms > 0, error
+assert len(sent) == 3, "the throttled call never reached the transport"
+
+print(f"python-rate-limiter-ok (slept={sum(slept):.0f}s, sent={len(sent)})")
+`
+
+const pyRetryCircuitBreakerExample = `"""Retry transient failures with AxRetryPolicy and fail fast with AxCircuitBreaker.
+
+The policy retries only transient errors, with full-jitter backoff charged
+against a shared AxRetryBudget, and gives up at once on client errors. The
+breaker opens after consecutive endpoint failures, rejects calls with a
+non-retryable AxAIServiceCircuitOpenError until the reset timeout passes, then
+lets one probe through and closes again when it succeeds. A scripted clock keeps
+the example instant and deterministic.
+"""
+
+from axllm import (
+    AxAIServiceCircuitOpenError,
+    AxAIServiceStatusError,
+    AxCircuitBreakerRegistry,
+    AxRetryBudget,
+    AxRetryPolicy,
+)
+from axllm.ai import ProviderOperationClient
+
+RESPONSE = {
+    "id": "resp-1",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+# Retry policy: two 503s, then success. Sleeps are recorded instead of taken.
+attempts = []
+sleeps = []
+
+
+def flaky():
+    attempts.append(len(attempts))
+    if len(attempts) < 3:
+        raise AxAIServiceStatusError("upstream overloaded", status=503, retryable=True)
+    return "ok"
+
+
+budget = AxRetryBudget(ratio=0.2, min_retries_per_second=0.0, capacity=2.0)
+policy = AxRetryPolicy(max_retries=5, initial_delay_ms=100, max_delay_ms=1000, budget=budget)
+assert policy.run(flaky, sleep=sleeps.append) == "ok"
+assert len(attempts) == 3 and len(sleeps) == 2, (attempts, sleeps)
+assert all(0.0 <= delay <= 0.2 for delay in sleeps), sleeps
+
+# Client errors are not retried, and an empty budget stops retries early.
+attempts.clear()
+
+
+def rejected():
+    attempts.append(1)
+    raise AxAIServiceStatusError("bad request", status=400, retryable=False)
+
+
+try:
+    policy.run(rejected, sleep=sleeps.append)
+except AxAIServiceStatusError:
+    pass
+assert len(attempts) == 1, attempts
+assert budget.available() < 1.0, "two retries drained the budget"
+attempts.clear()
+try:
+    policy.run(flaky, sleep=sleeps.append)
+except AxAIServiceStatusError:
+    pass
+assert len(attempts) == 1, "no budget left, so the first failure is final"
+
+# Circuit breaker on a provider client: the transport fails until healed.
+now = [0.0]
+healthy = [False]
+sent = []
+
+
+def transport(request):
+    sent.append(request["url"])
+    if not healthy[0]:
+        return {"status": 503, "headers": {}, "body": {"error": {"message": "unavailable"}}}
+    return {"status": 200, "headers": {}, "body": RESPONSE}
+
+
+breakers = AxCircuitBreakerRegistry(failure_threshold=2, reset_timeout_ms=5_000, clock=lambda: now[0])
+client = ProviderOperationClient(
+    "openai", "openai", api_key="example-key", transport=transport, circuit_breakers=breakers
+)
+request = {"chat_prompt": [{"role": "user", "content": "hi"}]}
+
+for _ in range(2):
+    try:
+        client.chat(request)
+    except AxAIServiceStatusError as error:
+        assert error.status == 503
+breaker = breakers.get(sent[0])
+assert breaker.state == "open", breaker.state
+
+try:
+    client.chat(request)
+    raise AssertionError("an open breaker must fail fast")
+except AxAIServiceCircuitOpenError as error:
+    assert not error.retryable, "retrying against an open breaker only burns the budget"
+    assert error.retry_after_ms == 5_000, error.retry_after_ms
+assert len(sent) == 2, "the rejected call never reached the transport"
+
+now[0] += 5.0
+healthy[0] = True
+assert breaker.state == "half_open"
+assert client.chat(request)["results"][0]["content"] == "ok"
+assert breaker.state == "closed", breaker.state
+
+print(f"python-retry-circuit-breaker-ok (retries={len(sleeps)}, requests={len(sent)})")
+`
+
+const pyMemorySessionsExample = `"""Partition conversation memory by session and compact long sessions.
+
+AxMemory keeps each session_id separate, with per-session tag and index
+lookups. With max_items a session is compacted to compact_to items once it
+grows past the limit; summarize() receives the dropped turns and returns the
+item that replaces them. AxSQLiteMemoryStore keeps one row per item, so a
+fresh AxMemory over the same file picks the sessions up again.
+"""
+
+import os
+import tempfile
+
+from axllm import AxMemory, AxSQLiteMemoryStore
+
+
+def turn(text):
+    return [{"role": "user", "content": text}]
+
+
+def summarize(dropped):
+    return {"role": "summary", "content": f"{len(dropped)} earlier turns", "tags": ["summary"]}
+
+
+with tempfile.TemporaryDirectory() as directory:
+    path = os.path.join(directory, "memory.db")
+    store = AxSQLiteMemoryStore(path)
+    memory = AxMemory(store, max_items=6, compact_to=3, summarize=summarize)
+
+    # Sessions never see each other's turns.
+    memory.add_request(turn("hello from alice"), session_id="alice")
+    memory.add_response({"content": "hi alice"}, session_id="alice")
+    memory.add_request(turn("hello from bob"), session_id="bob")
+    assert [item["session_id"] for item in memory.history(session_id="alice")] == ["alice", "alice"]
+    assert len(memory.history(session_id="bob")) == 1
+    assert sorted(memory.sessions()) == ["alice", "bob"]
+
+    # Tags mark checkpoints that a session can rewind to.
+    memory.add_tag("greeted", session_id="alice")
+    memory.add_request(turn("a detour"), session_id="alice")
+    memory.rewind_to_tag("greeted", session_id="alice")
+    assert memory.get_last(session_id="alice")["response"] == {"content": "hi alice"}
+
+    # The seventh item triggers compaction: four turns fold into one summary.
+    for index in range(5):
+        memory.add_request(turn(f"question {index}"), session_id="alice")
+    history = memory.history(session_id="alice")
+    assert len(history) == 4, history
+    assert history[0] == {"role": "summary", "content": "4 earlier turns", "tags": ["summary"]}
+    assert [item["messages"][0]["content"] for item in history[1:]] == ["question 2", "question 3", "question 4"]
+
+    # summarize() must return items; anything else fails and leaves the session intact.
+    strict = AxMemory(max_items=2, compact_to=1, summarize=lambda dropped: "not an item")
+    strict.add_request(turn("one")).add_request(turn("two"))
+    try:
+        strict.add_request(turn("three"))
+        raise AssertionError("a string summary must be rejected")
+    except TypeError:
+        pass
+    assert len(strict.history()) == 2
+
+    # A new AxMemory over the same SQLite file sees the compacted sessions.
+    store.close()
+    reopened = AxMemory(AxSQLiteMemoryStore(path))
+    assert reopened.history(session_id="alice") == history
+    assert len(reopened.history(session_id="bob")) == 1
+    reopened.clear(session_id="bob")
+    assert reopened.sessions() == ["alice"]
+    reopened.store.close()
+
+print(f"python-memory-sessions-ok (alice={len(history)} items after compaction)")
+`
+
+const pyRequestSharingExample = `"""Send a large multimodal request through a provider client repeatedly.
+
+The chat path shares messages and media parts with the caller instead of
+deep-copying them, so a 2 MB base64 image and a long history cost about the
+same per call as a short text prompt. The example checks that the caller's
+request is untouched and that get_features hands out editable copies. It
+reports per-call latency and peak traced allocation next to a baseline that
+deep-copies the request and the provider features on every call, as the chat
+path used to.
+"""
+
+import base64
+import copy
+import time
+import tracemalloc
+
+from axllm.ai import ProviderOperationClient
+
+CALLS = 50
+
+RESPONSE = {
+    "id": "resp-1",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+
+def transport(_request):
+    return {"status": 200, "headers": {}, "body": RESPONSE}
+
+
+image = base64.b64encode(bytes(range(256)) * 6000).decode()
+history = []
+for index in range(200):
+    history.append({"role": "user", "content": f"turn {index} " + "x" * 200})
+    history.append({"role": "assistant", "content": f"reply {index}"})
+history.append({
+    "role": "user",
+    "content": [{"type": "text", "text": "describe"}, {"type": "image", "mimeType": "image/png", "image": image}],
+})
+request = {"chat_prompt": history, "model": "gpt-4.1-mini"}
+snapshot = copy.deepcopy(request)
+
+client = ProviderOperationClient("openai", "openai", api_key="example-key", transport=transport)
+assert client.chat(request)["results"][0]["content"] == "ok"
+
+
+def deepcopy_chat(request):
+    copy.deepcopy(client.get_features())
+    return client.chat(copy.deepcopy(request))
+
+
+def measure(chat):
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        chat(request)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / CALLS
+    tracemalloc.start()
+    chat(request)
+    peak_mb = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return elapsed_ms, peak_mb
+
+
+shared_ms, shared_mb = measure(client.chat)
+copied_ms, copied_mb = measure(deepcopy_chat)
+
+assert request == snapshot, "chat must not mutate the caller's request"
+
+features = client.get_features()
+features["functions"] = "edited"
+assert client.get_features()["functions"] != "edited", "get_features must return a private copy"
+
+print(f"python-request-sharing-ok ({len(image) / 1e6:.1f} MB image, {CALLS} calls)")
+print(f"  shared:   {shared_ms:.2f} ms/call, peak {shared_mb:.2f} MB")
+print(f"  deepcopy: {copied_ms:.2f} ms/call, peak {copied_mb:.2f} MB ({copied_ms / shared_ms:.1f}x the shared latency)")
+`
+
+const pyRealtimeStreamExample = `"""Consume a realtime audio turn incrementally with realtime_stream().
+
+Deltas are yielded as frames arrive, so the first audio chunk can play before
+the turn finishes. It carries first_audio_ms, and get_last_realtime_latency()
+reports the same figures per client. A completed turn leaves a caller-supplied
+transport open for the next turn. Closing the generator early closes the
+transport, which unblocks a reader stuck in recv() without waiting for it.
+"""
+
+import threading
+import time
+
+from axllm import OpenAIResponsesClient
+from axllm.ai import ScriptedRealtimeTransport
+
+client = OpenAIResponsesClient(model="gpt-realtime-2", api_key="test-key")
+request = {
+    "model": "gpt-realtime-2",
+    "chat_prompt": [{"role": "user", "content": "Say hello."}],
+    "audio": {"output": {"voice": "alloy"}},
+}
+inbound = [
+    {"type": "session.created"},
+    {"type": "session.updated"},
+    {"type": "response.output_audio_transcript.delta", "response_id": "rt", "delta": "hel"},
+    {"type": "response.output_audio.delta", "response_id": "rt", "delta": "AQI="},
+    {"type": "response.output_audio_transcript.delta", "response_id": "rt", "delta": "lo"},
+    {"type": "response.output_audio.delta", "response_id": "rt", "delta": "AwQ="},
+    {"type": "response.done", "response": {"id": "rt", "usage": {"input_tokens": 3, "output_tokens": 2, "total_tokens": 5}}},
+]
+
+
+class TrackedTransport(ScriptedRealtimeTransport):
+    closed = False
+
+    def close(self):
+        self.closed = True
+
+
+transport = TrackedTransport(inbound)
+chunks = []
+first_audio_ms = None
+text = ""
+for delta in client.realtime_stream(request, transport=transport):
+    result = delta["results"][0]
+    text += result.get("content") or ""
+    audio = result.get("audio")
+    if audio and audio.get("data"):
+        chunks.append(bytes(audio["data"].memoryview()))
+        first_audio_ms = delta.get("first_audio_ms", first_audio_ms)
+
+assert text == "hello", text
+assert chunks == [b"\x01\x02", b"\x03\x04"], chunks
+latency = client.get_last_realtime_latency()
+assert first_audio_ms is not None and latency["first_audio_ms"] == first_audio_ms, latency
+assert latency["turn_ms"] >= latency["first_audio_ms"], latency
+assert not transport.closed, "a completed turn keeps the caller's transport open"
+
+
+class StalledTransport:
+    """Sends one delta, then blocks in recv() until the transport is closed."""
+
+    def __init__(self):
+        self.released = threading.Event()
+        self.frames = [{"type": "session.created"}, {"type": "session.updated"}, inbound[2]]
+
+    def send(self, event):
+        pass
+
+    def recv(self):
+        if self.frames:
+            return self.frames.pop(0)
+        self.released.wait()
+        return None
+
+    def close(self):
+        self.released.set()
+
+
+stalled = StalledTransport()
+stream = client.realtime_stream(request, transport=stalled)
+assert next(stream)["results"][0]["content"] == "hel"
+started = time.perf_counter()
+stream.close()
+close_ms = (time.perf_counter() - started) * 1000
+assert stalled.released.is_set(), "closing early must close the transport"
+assert close_ms < 100, f"early close waited {close_ms:.0f} ms for the reader"
+
+print(f"python-realtime-stream-ok (first audio {first_audio_ms:.2f} ms, early close {close_ms:.2f} ms)")
+`
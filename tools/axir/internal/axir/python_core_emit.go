@@ -10,13 +10,58 @@ import (
 
 // pythonEmitState carries the registry context for one python module
 // emission: the global symbol->name map, each symbol's host module, the
-// module being emitted, and the cross-module names referenced so far (which
-// become generated import statements).
+// module being emitted, the cross-module names referenced so far (which
+// become generated import statements), the function being emitted, and the
+// package data files its registry literals were moved to.
 type pythonEmitState struct {
 	names    map[string]string
 	moduleOf map[string]string
 	module   string
 	imports  map[string]map[string]bool
+	function string
+	data     map[string]string
+}
+
+// pythonCoreDataFiles lists the Core functions whose static JSON registry
+// literal is written to axllm/data instead of being inlined in the generated
+// module. The literals run to hundreds of kilobytes, and importing axllm would
+// otherwise compile them all up front. Functions that share a file must parse
+// the same literal.
+var pythonCoreDataFiles = map[string]string{
+	"_provider_model_catalog_registry":  "provider_model_catalog.json",
+	"provider_descriptor":               "provider_descriptors.json",
+	"_render_actor_primitives_list":     "agent_rlm_prompts.json",
+	"_render_rlm_executor_description":  "agent_rlm_prompts.json",
+	"_render_rlm_responder_description": "agent_rlm_prompts.json",
+	"_render_rlm_distiller_description": "agent_rlm_prompts.json",
+}
+
+// dataFileCall rewrites an intrinsic.json.parse of a registry literal into a
+// load of the package data file it was moved to, recording the file contents.
+func (st *pythonEmitState) dataFileCall(stmt CoreStmt) (string, bool, error) {
+	file, ok := pythonCoreDataFiles[st.function]
+	if !ok || CoreIntrinsic(stmt.Callee) != IntrinsicJSONParse || len(stmt.Args) != 1 {
+		return "", false, nil
+	}
+	literal, ok := stmt.Args[0].(string)
+	if !ok || strings.HasPrefix(literal, "%") {
+		return "", false, nil
+	}
+	if previous, seen := st.data[file]; seen && previous != literal {
+		return "", false, fmt.Errorf("%s parses a different literal than the other functions sharing data file %s", st.function, file)
+	}
+	st.data[file] = literal
+	return fmt.Sprintf("_core_json_load_data(%q)", file), true, nil
+}
+
+// isPythonStaticJSONParse reports whether stmt parses a registry literal that
+// is the same on every call, so the host can parse it once and share it.
+func isPythonStaticJSONParse(stmt CoreStmt) bool {
+	if CoreIntrinsic(stmt.Callee) != IntrinsicJSONParse || len(stmt.Args) != 1 {
+		return false
+	}
+	literal, ok := stmt.Args[0].(string)
+	return ok && !strings.HasPrefix(literal, "%")
 }
 
 func (st *pythonEmitState) calleeName(callee string) string {
@@ -42,9 +87,16 @@ func (st *pythonEmitState) calleeName(callee string) string {
 }
 
 func buildPythonCoreModule(model AxRuntimeModel, module, template, marker string) (string, error) {
+	text, _, err := emitPythonCoreModule(model, module, template, marker)
+	return text, err
+}
+
+// emitPythonCoreModule assembles one generated module and returns it together
+// with the package data files its registry literals were moved to.
+func emitPythonCoreModule(model AxRuntimeModel, module, template, marker string) (string, map[string]string, error) {
 	specs, err := BuildCoreFuncRegistry(model)
 	if err != nil {
-		return "", err
+		return "", nil, err
 	}
 	names := CoreFuncNames(specs)
 	moduleOf := make(map[string]string, len(specs))
@@ -56,18 +108,18 @@ func buildPythonCoreModule(model AxRuntimeModel, module, template, marker string
 			moduleSpecs = append(moduleSpecs, spec)
 		}
 	}
-	st := &pythonEmitState{names: names, moduleOf: moduleOf, module: module, imports: map[string]map[string]bool{}}
+	st := &pythonEmitState{names: names, moduleOf: moduleOf, module: module, imports: map[string]map[string]bool{}, data: map[string]string{}}
 	body, err := emitPythonCoreFunctions(st, model, moduleSpecs)
 	if err != nil {
-		return "", err
+		return "", nil, err
 	}
 	out, err := mustInject(template, marker, body, "python "+module)
 	if err != nil {
-		return "", err
+		return "", nil, err
 	}
 	final, err := mustInject(out, "# AXIR_CORE_IMPORTS\n", renderPythonCoreImports(st.imports, template), "python "+module)
 	if err != nil {
-		return "", err
+		return "", nil, err
 	}
 	// Python is the only target without compile-time reference checking, so a
 	// helper an emitted op calls but that the module never defines (or imports)
@@ -75,9 +127,33 @@ func buildPythonCoreModule(model AxRuntimeModel, module, template, marker string
 	// loudly instead. TestPythonModulesSelfContained applies the same audit
 	// across every generated module.
 	if missing := pythonModuleMissingHelpers(final); len(missing) > 0 {
-		return "", fmt.Errorf("python %q module calls undefined helper(s) %s; define them in the module template or import them from a sibling", module, strings.Join(missing, ", "))
+		return "", nil, fmt.Errorf("python %q module calls undefined helper(s) %s; define them in the module template or import them from a sibling", module, strings.Join(missing, ", "))
+	}
+	return final, st.data, nil
+}
+
+// BuildPythonDataFiles returns the axllm/data files that hold the registry
+// literals listed in pythonCoreDataFiles, keyed by package-relative path.
+func BuildPythonDataFiles(model AxRuntimeModel) (map[string]string, error) {
+	files := map[string]string{}
+	for _, module := range []struct{ name, template, marker string }{
+		{"ai", pyAI, "# AXIR_CORE_AI_FUNCTIONS\n"},
+		{"agent", pyAgent, "# AXIR_CORE_AGENT_FUNCTIONS\n"},
+	} {
+		_, data, err := emitPythonCoreModule(model, module.name, module.template, module.marker)
+		if err != nil {
+			return nil, err
+		}
+		for file, literal := range data {
+			files["axllm/data/"+file] = literal
+		}
 	}
-	return final, nil
+	for function, file := range pythonCoreDataFiles {
+		if _, ok := files["axllm/data/"+file]; !ok {
+			return nil, fmt.Errorf("python data file %s: Core function %s no longer parses a registry literal", file, function)
+		}
+	}
+	return files, nil
 }
 
 // renderPythonCoreImports renders the generated cross-module imports,
@@ -255,6 +331,7 @@ func emitPythonCoreFunction(st *pythonEmitState, op Operation, name string) (str
 		}
 	}
 	ret := pythonReturnType(AttrString(op, "signature"))
+	st.function = name
 	var b strings.Builder
 	fmt.Fprintf(&b, "def %s(%s) -> %s:\n", name, strings.Join(args, ", "), ret)
 	fmt.Fprintf(&b, "    _core_coverage_mark(%q)\n", name)
@@ -276,12 +353,21 @@ func emitPythonCoreStmt(st *pythonEmitState, stmt CoreStmt) ([]string, error) {
 	case "break":
 		return []string{"break"}, nil
 	case "call":
-		callee := st.calleeName(stmt.Callee)
-		args := make([]string, 0, len(stmt.Args))
-		for _, arg := range stmt.Args {
-			args = append(args, pythonLiteral(arg))
+		call, moved, err := st.dataFileCall(stmt)
+		if err != nil {
+			return nil, err
+		}
+		if !moved {
+			callee := st.calleeName(stmt.Callee)
+			if isPythonStaticJSONParse(stmt) {
+				callee = "_core_json_parse_shared"
+			}
+			args := make([]string, 0, len(stmt.Args))
+			for _, arg := range stmt.Args {
+				args = append(args, pythonLiteral(arg))
+			}
+			call = fmt.Sprintf("%s(%s)", callee, strings.Join(args, ", "))
 		}
-		call := fmt.Sprintf("%s(%s)", callee, strings.Join(args, ", "))
 		if result := stmt.Result; result != "" {
 			return []string{fmt.Sprintf("%s = %s", pyName(result), call)}, nil
 		}
@@ -980,6 +980,7 @@ class AxMCPClient:
         self.discover_result: dict[str, Any] | None = None
         self.negotiated_extensions: dict[str, Any] = {}
         self.tools: list[dict[str, Any]] = []
+        self._tool_plans: dict[str, dict[str, Any]] = {}
         self.prompts: list[dict[str, Any]] = []
         self.resources: list[dict[str, Any]] = []
         self.resource_templates: list[dict[str, Any]] = []
@@ -993,6 +994,9 @@ class AxMCPClient:
         self._next_id = 1
         self._notification_listeners: list[Callable[[dict[str, Any]], None]] = []
         self._lifecycle_listeners: list[Callable[[str], None]] = []
+        self._task_condition = threading.Condition()
+        self._task_waiters: dict[str, int] = {}
+        self._task_updates: dict[str, dict[str, Any] | None] = {}
         self._initialized = False
         self.transport.set_message_handler(self._handle_inbound_message)
         self.transport.set_request_handler(self._handle_server_request)
@@ -1134,16 +1138,9 @@ class AxMCPClient:
     def refresh(self, *, force: bool = True) -> None:
         changed = False
         if self._capability("tools") and (force or not self._catalog_cache_fresh("tools")):
-            raw_tools = self._collect_catalog("tools/list", "tools")
-            self.tools = []
-            for tool in raw_tools:
-                try:
-                    mcp_param_header_bindings(tool.get("inputSchema") or {})
-                    self.tools.append(tool)
-                except Exception:
-                    logger = self.options.get("logger")
-                    if callable(logger):
-                        logger(f"Warning: excluded MCP tool {tool.get('name', '')}: invalid x-mcp-header annotation")
+            cursors: list[str | None] = []
+            raw_tools = self._collect_catalog("tools/list", "tools", cursors)
+            self.tools, self._tool_plans = self._compile_tool_plans(raw_tools, cursors)
             changed = True
         if self._capability("prompts") and (force or not self._catalog_cache_fresh("prompts")):
             self.prompts = self._collect_catalog("prompts/list", "prompts")
@@ -1158,7 +1155,7 @@ class AxMCPClient:
         if changed:
             self.catalog_revision += 1
 
-    def _collect_catalog(self, method: str, field: str) -> list[dict[str, Any]]:
+    def _collect_catalog(self, method: str, field: str, cursors: list[str | None] | None = None) -> list[dict[str, Any]]:
         values: list[dict[str, Any]] = []
         pages: list[dict[str, Any]] = []
         cursor = None
@@ -1167,7 +1164,10 @@ class AxMCPClient:
         for _page in range(max_pages):
             result = self._request(method, {"cursor": cursor} if cursor else {})
             pages.append(result)
-            values.extend(json.loads(json.dumps(result.get(field) or [])))
+            items = json.loads(json.dumps(result.get(field) or []))
+            values.extend(items)
+            if cursors is not None:
+                cursors.extend([cursor] * len(items))
             cursor = result.get("nextCursor")
             if not cursor:
                 cache_name = {"tools/list": "tools", "prompts/list": "prompts", "resources/list": "resources", "resources/templates/list": "resourceTemplates"}.get(method)
@@ -1178,6 +1178,73 @@ class AxMCPClient:
             seen.add(cursor)
         raise AxMCPError(f"MCP {method} exceeded {max_pages} pagination pages")
 
+    def _compile_tool_plans(self, raw_tools: list[dict[str, Any]], cursors: list[str | None]) -> tuple[list[dict[str, Any]], dict[str, dict[str, Any]]]:
+        """Build one call plan per tool: header bindings, an argument check
+        when ``validateToolArguments`` is set, the exposed and
+        namespace-qualified names, and the list page cursor the tool came
+        from. Tools with invalid header annotations are dropped."""
+        tools: list[dict[str, Any]] = []
+        plans: dict[str, dict[str, Any]] = {}
+        namespace = self.namespace()
+        validate = bool(self.options.get("validateToolArguments", False))
+        for tool, cursor in zip(raw_tools, cursors):
+            name = str(tool.get("name", ""))
+            schema = tool.get("inputSchema") or {}
+            try:
+                bindings = mcp_param_header_bindings(schema)
+            except Exception:
+                logger = self.options.get("logger")
+                if callable(logger):
+                    logger(f"Warning: excluded MCP tool {name}: invalid x-mcp-header annotation")
+                continue
+            function_name = _override_name(name, self.options)
+            tools.append(tool)
+            plans[name] = {
+                "name": name,
+                "functionName": function_name,
+                "qualifiedName": f"{namespace}.{function_name}",
+                "tool": tool,
+                "headerBindings": bindings,
+                "validate": _compile_arguments_validator(name, schema) if validate else None,
+                "cursor": cursor,
+            }
+        return tools, plans
+
+    def _refresh_tool_plan(self, name: str) -> dict[str, Any] | None:
+        """Re-fetch the tools/list page that held ``name`` and recompile its
+        tools. Falls back to a full tools reload when the page can't be
+        re-read or no longer lists the tool."""
+        previous = self._tool_plans.get(name)
+        if previous is not None:
+            cursor = previous.get("cursor")
+            try:
+                page = self._request("tools/list", {"cursor": cursor} if cursor else {})
+            except AxMCPError:
+                page = None
+            page_tools = json.loads(json.dumps((page or {}).get("tools") or []))
+            if any(tool.get("name") == name for tool in page_tools):
+                fresh_tools, fresh_plans = self._compile_tool_plans(page_tools, [cursor] * len(page_tools))
+                tools: list[dict[str, Any]] = []
+                for tool in self.tools:
+                    plan = self._tool_plans.get(str(tool.get("name", "")))
+                    if plan is not None and plan.get("cursor") == cursor:
+                        if fresh_tools:
+                            tools.extend(fresh_tools)
+                            fresh_tools = []
+                        continue
+                    tools.append(tool)
+                tools.extend(fresh_tools)
+                plans = {key: plan for key, plan in self._tool_plans.items() if plan.get("cursor") != cursor}
+                plans.update(fresh_plans)
+                self.tools, self._tool_plans = tools, plans
+                self.catalog_revision += 1
+                return self._tool_plans.get(name)
+        cursors: list[str | None] = []
+        raw_tools = self._collect_catalog("tools/list", "tools", cursors)
+        self.tools, self._tool_plans = self._compile_tool_plans(raw_tools, cursors)
+        self.catalog_revision += 1
+        return self._tool_plans.get(name)
+
     def _catalog_cache_fresh(self, name: str) -> bool:
         return mcp_cache_freshness(self.catalog_cache.get(name), int(time.time() * 1000))
 
@@ -1202,28 +1269,16 @@ class AxMCPClient:
 
     def call_tool(self, name: str, arguments: dict[str, Any] | None = None) -> dict[str, Any]:
         args = arguments or {}
-        headers: dict[str, str] = {}
-        if self.era == "modern":
-            tool = next((item for item in self.tools if item.get("name") == name), None)
-            if tool:
-                bindings = mcp_param_header_bindings(tool.get("inputSchema") or {})
-                headers = {str(key): str(value) for key, value in mcp_param_header_values(bindings, args).items()}
+        plan = self._tool_plans.get(name)
+        if plan is not None and plan["validate"] is not None:
+            plan["validate"](args)
+        headers = self._tool_headers(plan, args)
         try:
             result = self._request_with_input_rounds("tools/call", {"name": name, "arguments": args}, extra_headers=headers)
         except AxMCPError as error:
             if self.era != "modern" or error.code != -32020:
                 raise
-            raw_tools = self._collect_catalog("tools/list", "tools")
-            self.tools = []
-            for tool in raw_tools:
-                try:
-                    mcp_param_header_bindings(tool.get("inputSchema") or {})
-                    self.tools.append(tool)
-                except Exception:
-                    pass
-            tool = next((item for item in self.tools if item.get("name") == name), None)
-            bindings = mcp_param_header_bindings((tool or {}).get("inputSchema") or {})
-            headers = {str(key): str(value) for key, value in mcp_param_header_values(bindings, args).items()}
+            headers = self._tool_headers(self._refresh_tool_plan(name), args)
             result = self._request_with_input_rounds("tools/call", {"name": name, "arguments": args}, extra_headers=headers)
         if result.get("resultType") != "task":
             return result
@@ -1231,40 +1286,129 @@ class AxMCPClient:
             raise AxMCPError("MCP protocol violation: server returned a task without negotiating io.modelcontextprotocol/tasks")
         if not mcp_validate_modern_task(result):
             raise AxMCPError("MCP protocol violation: invalid CreateTaskResult")
-        return self._await_modern_task(str(result["taskId"]))
+        return self._await_modern_tasks({str(result["taskId"]): result})[str(result["taskId"])]
+
+    def wait_for_tasks(self, task_ids: list[str], timeout_ms: float | None = None) -> dict[str, Any]:
+        """Wait for several modern tasks at once and return their results by task id.
 
-    def _await_modern_task(self, task_id: str) -> dict[str, Any]:
+        Waiting wakes on ``notifications/tasks/status`` while a listener is
+        running and otherwise polls ``tasks/get`` with exponential backoff.
+        """
+        if self.era != "modern" or not self._has_tasks_capability():
+            raise AxMCPError("wait_for_tasks is only available for modern MCP Tasks v2")
+        return self._await_modern_tasks({str(task_id): None for task_id in task_ids}, timeout_ms)
+
+    def _tool_headers(self, plan: dict[str, Any] | None, args: dict[str, Any]) -> dict[str, str]:
+        if self.era != "modern" or plan is None or not plan["headerBindings"]:
+            return {}
+        return {str(key): str(value) for key, value in mcp_param_header_values(plan["headerBindings"], args).items()}
+
+    def _await_modern_tasks(self, tasks: dict[str, dict[str, Any] | None], timeout_ms: float | None = None) -> dict[str, Any]:
+        # Each task is polled once right away, then again after a delay that
+        # starts at taskPollInitialMs and grows by taskPollBackoff up to
+        # taskPollMaxMs. The server's pollIntervalMs raises the delay and half
+        # its ttlMs caps it. A tasks/status notification for a waited task
+        # wakes the loop early, and a valid task payload in it saves the poll.
         max_polls = int(self.options.get("maxTaskPolls", 1000))
-        for _ in range(max_polls):
-            task = self.get_task(task_id)
-            outcome = mcp_task_terminal_outcome(task)
-            kind = outcome.get("kind")
-            if kind == "result":
-                return json.loads(json.dumps(outcome.get("result")))
-            if kind == "protocol_error":
-                raise AxMCPError(str(outcome.get("message", "MCP task failed")), code=int(outcome.get("code", 0)), data=outcome.get("data"))
-            if kind in {"violation", "failure", "cancelled"}:
-                raise AxMCPError(str(outcome.get("message", "MCP task failed")))
-            if kind == "input_required":
-                handler = self.options.get("elicitation")
-                fulfillment = mcp_mrtr_plan_fulfillment(
-                    outcome.get("inputRequests"),
-                    self.options.get("roots"),
-                    callable(handler),
-                    False,
+        initial_ms = float(self.options.get("taskPollInitialMs", 50))
+        max_delay_ms = float(self.options.get("taskPollMaxMs", 5000))
+        backoff = float(self.options.get("taskPollBackoff", 2))
+        if timeout_ms is None:
+            timeout_ms = self.options.get("taskTimeoutMs")
+        started = time.monotonic()
+        deadline = None if timeout_ms is None else started + float(timeout_ms) / 1000.0
+        pending = {task_id: {"due": started, "delayMs": initial_ms, "hint": hint} for task_id, hint in tasks.items()}
+        results: dict[str, Any] = {}
+        polls = 0
+        with self._task_condition:
+            for task_id in pending:
+                self._task_waiters[task_id] = self._task_waiters.get(task_id, 0) + 1
+        try:
+            while pending:
+                now = time.monotonic()
+                for task_id in [key for key, state in pending.items() if state["due"] <= now]:
+                    state = pending[task_id]
+                    with self._task_condition:
+                        task = self._task_updates.pop(task_id, None)
+                    if task is None:
+                        if polls >= max_polls:
+                            raise AxMCPError(f"MCP task {task_id} exceeded {max_polls} polls")
+                        polls += 1
+                        task = self.get_task(task_id)
+                    if self._settle_modern_task(task_id, task, results):
+                        del pending[task_id]
+                        continue
+                    if task.get("status") == "input_required":
+                        state["delayMs"] = initial_ms
+                        state["due"] = now
+                        continue
+                    delay_ms = state["delayMs"]
+                    for hint in (state["hint"], task):
+                        poll_interval = hint.get("pollIntervalMs") if isinstance(hint, dict) else None
+                        if isinstance(poll_interval, (int, float)) and poll_interval > 0:
+                            delay_ms = max(delay_ms, float(poll_interval))
+                        ttl = hint.get("ttlMs") if isinstance(hint, dict) else None
+                        if isinstance(ttl, (int, float)) and ttl > 0:
+                            delay_ms = min(delay_ms, float(ttl) / 2)
+                    state["hint"] = None
+                    state["due"] = now + delay_ms / 1000.0
+                    state["delayMs"] = min(state["delayMs"] * backoff, max_delay_ms)
+                if not pending:
+                    break
+                wake_at = min(state["due"] for state in pending.values())
+                if deadline is not None:
+                    if time.monotonic() >= deadline:
+                        raise AxMCPError(f"MCP tasks {', '.join(sorted(pending))} did not finish within {float(timeout_ms):g} ms")
+                    wake_at = min(wake_at, deadline)
+                with self._task_condition:
+                    if not any(task_id in self._task_updates for task_id in pending):
+                        self._task_condition.wait(max(wake_at - time.monotonic(), 0))
+                    for task_id, state in pending.items():
+                        if task_id in self._task_updates:
+                            state["due"] = 0
+        finally:
+            with self._task_condition:
+                for task_id in tasks:
+                    remaining = self._task_waiters.get(task_id, 0) - 1
+                    if remaining > 0:
+                        self._task_waiters[task_id] = remaining
+                    else:
+                        self._task_waiters.pop(task_id, None)
+                        self._task_updates.pop(task_id, None)
+        return results
+
+    def _settle_modern_task(self, task_id: str, task: dict[str, Any], results: dict[str, Any]) -> bool:
+        """Record a finished task's result, raise for a failed one and answer
+        pending input requests. Returns whether the task is finished."""
+        outcome = mcp_task_terminal_outcome(task)
+        kind = outcome.get("kind")
+        if kind == "result":
+            results[task_id] = outcome.get("result")
+            return True
+        if kind == "protocol_error":
+            raise AxMCPError(str(outcome.get("message", "MCP task failed")), code=int(outcome.get("code", 0)), data=outcome.get("data"))
+        if kind in {"violation", "failure", "cancelled"}:
+            raise AxMCPError(str(outcome.get("message", "MCP task failed")))
+        if kind == "input_required":
+            handler = self.options.get("elicitation")
+            fulfillment = mcp_mrtr_plan_fulfillment(
+                outcome.get("inputRequests"),
+                self.options.get("roots"),
+                callable(handler),
+                False,
+            )
+            if not fulfillment.get("ok"):
+                raise AxMCPError(str(fulfillment.get("message", "MCP protocol violation")))
+            responses = dict(fulfillment.get("responses") or {})
+            for key, pending in (fulfillment.get("pending") or {}).items():
+                if pending.get("method") != "elicitation/create" or not callable(handler):
+                    raise AxMCPError(f"MCP protocol violation: unsupported pending task input request method {pending.get('method')}")
+                responses[key] = handler(
+                    pending.get("params") or {},
+                    {"client": self, "namespace": self.namespace()},
                 )
-                if not fulfillment.get("ok"):
-                    raise AxMCPError(str(fulfillment.get("message", "MCP protocol violation")))
-                responses = dict(fulfillment.get("responses") or {})
-                for key, pending in (fulfillment.get("pending") or {}).items():
-                    if pending.get("method") != "elicitation/create" or not callable(handler):
-                        raise AxMCPError(f"MCP protocol violation: unsupported pending task input request method {pending.get('method')}")
-                    responses[key] = handler(
-                        pending.get("params") or {},
-                        {"client": self, "namespace": self.namespace()},
-                    )
-                self.provide_task_input(task_id, responses)
-        raise AxMCPError(f"MCP task {task_id} exceeded {max_polls} polls")
+            self.provide_task_input(task_id, responses)
+        return False
 
     def list_prompts(self, cursor: str | None = None) -> dict[str, Any]:
         return self._request("prompts/list", {"cursor": cursor} if cursor else {})
@@ -1441,7 +1585,8 @@ class AxMCPClient:
         out: list[Tool] = []
         for tool in self.tools:
             original = tool.get("name", "")
-            name = _override_name(original, self.options)
+            plan = self._tool_plans.get(original)
+            name = plan["functionName"] if plan is not None else _override_name(original, self.options)
             out.append(Tool(
                 name,
                 _override_description(tool, self.options),
@@ -1589,6 +1734,16 @@ class AxMCPClient:
             uri = (message.get("params") or {}).get("uri")
             if uri:
                 self._resource_read_cache.pop(str(uri), None)
+        if method == "notifications/tasks/status":
+            params = message.get("params") if isinstance(message.get("params"), dict) else {}
+            task = params.get("task", params)
+            task_id = task.get("taskId") if isinstance(task, dict) else None
+            if task_id is not None:
+                with self._task_condition:
+                    if str(task_id) in self._task_waiters:
+                        # A payload that isn't a full task only wakes the waiter to poll.
+                        self._task_updates[str(task_id)] = task if mcp_validate_modern_task(task) else None
+                        self._task_condition.notify_all()
         callback = self.options.get("onNotification")
         if callable(callback):
             callback(message)
@@ -1618,7 +1773,8 @@ class AxMCPClient:
             }
 
     def _tool_to_function(self, tool: dict[str, Any]) -> Tool:
-        name = _override_name(tool.get("name", ""), self.options)
+        plan = self._tool_plans.get(tool.get("name", ""))
+        name = plan["functionName"] if plan is not None else _override_name(tool.get("name", ""), self.options)
         description = _override_description(tool, self.options)
 
         def handler(args: dict[str, Any]) -> Any:
@@ -2428,6 +2584,44 @@ def _token_to_dict(token: Any) -> dict[str, Any] | None:
     return None
 
 
+_JSON_SCHEMA_TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "string": lambda value: isinstance(value, str),
+    "integer": lambda value: (isinstance(value, int) and not isinstance(value, bool)) or (isinstance(value, float) and value.is_integer()),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "array": lambda value: isinstance(value, list),
+    "object": lambda value: isinstance(value, dict),
+}
+
+
+def _compile_arguments_validator(name: str, schema: Any) -> Callable[[Any], None]:
+    """Check required arguments and the JSON type of each top-level argument
+    whose schema names a single type. Null values, nested values and every
+    other keyword are left to the server, which stays the authority; this
+    only saves a round-trip for calls it would certainly reject."""
+    schema = schema if isinstance(schema, dict) else {}
+    required = tuple(str(key) for key in schema.get("required") or [] if isinstance(key, str))
+    properties = schema.get("properties") if isinstance(schema.get("properties"), dict) else {}
+    checks = tuple(
+        (str(key), prop["type"], _JSON_SCHEMA_TYPE_CHECKS[prop["type"]])
+        for key, prop in properties.items()
+        if isinstance(prop, dict) and isinstance(prop.get("type"), str) and prop["type"] in _JSON_SCHEMA_TYPE_CHECKS
+    )
+
+    def validate(args: Any) -> None:
+        if not isinstance(args, dict):
+            raise AxMCPError(f"MCP tool {name} arguments must be an object")
+        missing = [key for key in required if key not in args]
+        if missing:
+            raise AxMCPError(f"MCP tool {name} is missing required arguments: {', '.join(missing)}")
+        for key, expected, check in checks:
+            value = args.get(key)
+            if value is not None and not check(value):
+                raise AxMCPError(f"MCP tool {name} argument {key} must be {expected}")
+
+    return validate
+
+
 def _override_name(name: str, options: dict[str, Any]) -> str:
     for item in options.get("functionOverrides") or []:
         if item.get("name") == name:
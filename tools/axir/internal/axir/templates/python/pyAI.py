@@ -4,18 +4,17 @@ from abc import ABC, abstractmethod
 import base64
 import copy
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 import hashlib
 import json
 import math
 import os
+import queue
 import random
 import threading
 import time
 import uuid
-import urllib.error
 import urllib.parse
-import urllib.request
 from typing import Any, Callable, Iterable
 # AXIR_CORE_IMPORTS
 
@@ -59,9 +58,11 @@ def _emit_usage_event(
 def _usage_observed_stream(
     values: Iterable[dict[str, Any]],
     options: dict[str, Any],
+    on_usage: Callable[[dict[str, Any] | None, bool], Any] | None = None,
 ):
     last_usage_response = None
     completed = False
+    failed = False
     try:
         for value in values:
             model_usage = value.get("model_usage") or value.get("modelUsage")
@@ -69,7 +70,12 @@ def _usage_observed_stream(
                 last_usage_response = value
             yield value
         completed = True
+    except Exception:
+        failed = True
+        raise
     finally:
+        if on_usage is not None:
+            on_usage(last_usage_response, failed)
         if completed and last_usage_response is not None:
             _emit_usage_event("chat", last_usage_response, options, True)
 
@@ -84,6 +90,8 @@ class AxAIServiceError(Exception):
         response_body: Any = None,
         request: Any = None,
         retryable: bool = False,
+        headers: dict[str, str] | None = None,
+        retry_after_ms: float | None = None,
     ):
         super().__init__(message)
         self.status = status
@@ -91,6 +99,8 @@ class AxAIServiceError(Exception):
         self.response_body = response_body
         self.request = request
         self.retryable = retryable
+        self.headers = headers
+        self.retry_after_ms = retry_after_ms
 
 
 class AxAIServiceStatusError(AxAIServiceError):
@@ -117,6 +127,14 @@ class AxAIServiceAuthenticationError(AxAIServiceError):
     pass
 
 
+class AxAIServiceCircuitOpenError(AxAIServiceNetworkError):
+    """Raised without a network call while an endpoint's circuit breaker is open."""
+
+
+class AxAIServiceRateLimitError(AxAIServiceStatusError):
+    """Raised locally when a client-side rate limit cannot admit a request in time."""
+
+
 class AxAIRefusalError(AxAIServiceError):
     pass
 
@@ -173,46 +191,219 @@ def default_metrics() -> dict[str, Any]:
     }
 
 
-def _encode_multipart(payload: dict[str, Any]) -> tuple[bytes, str]:
-    """Encode a request payload as multipart/form-data.
+_MEDIA_CHUNK_SIZE = 1 << 16
 
-    Multipart operations (e.g. OpenAI /audio/transcriptions) carry the audio as a
-    binary `file` part; every other field is a plain form field. The `file` value is
-    a base64 string (optionally a data: URL) or a dict {data, mimeType?, filename?}.
+
+class AxMediaBuffer:
+    """Binary media handle: in-memory bytes, a file on disk, or base64 text.
+
+    Buffers travel through prompt parts and provider payloads unchanged and
+    are encoded once at the wire boundary. ``str(buffer)`` / ``.base64`` gives
+    the (cached) base64 text and buffers compare equal to it, so they can be
+    used wherever a base64 string is accepted. Raw bytes come from
+    ``memoryview()`` or ``tobytes()``; file-backed buffers stream from disk via
+    ``iter_chunks()`` for multipart uploads.
     """
+
+    __slots__ = ("_bytes", "_path", "_b64", "mime_type", "filename")
+
+    def __init__(self, data: bytes | bytearray | memoryview | None = None, *, mime_type: str | None = None, filename: str | None = None):
+        self._bytes = data
+        self._path: str | None = None
+        self._b64: str | None = None
+        self.mime_type = mime_type
+        self.filename = filename
+
+    @classmethod
+    def from_file(cls, path: str | os.PathLike, *, mime_type: str | None = None, filename: str | None = None) -> "AxMediaBuffer":
+        path = os.fspath(path)
+        if not mime_type:
+            import mimetypes
+
+            mime_type = mimetypes.guess_type(path)[0]
+        buffer = cls(mime_type=mime_type, filename=filename or os.path.basename(path))
+        buffer._path = path
+        return buffer
+
+    @classmethod
+    def from_base64(cls, text: str, *, mime_type: str | None = None, filename: str | None = None) -> "AxMediaBuffer":
+        if text.startswith("data:") and "," in text:
+            header, text = text.split(",", 1)
+            mime_type = mime_type or header[5:].split(";", 1)[0] or None
+        buffer = cls(mime_type=mime_type, filename=filename)
+        buffer._b64 = text
+        return buffer
+
+    def memoryview(self) -> memoryview:
+        if self._bytes is None:
+            if self._path is not None:
+                with open(self._path, "rb") as handle:
+                    self._bytes = handle.read()
+            else:
+                self._bytes = base64.b64decode(self._b64 or "")
+        return memoryview(self._bytes)
+
+    def tobytes(self) -> bytes:
+        view = self.memoryview()
+        return self._bytes if isinstance(self._bytes, bytes) else view.tobytes()
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return self.memoryview()
+
+    @property
+    def base64(self) -> str:
+        if self._b64 is None:
+            self._b64 = base64.b64encode(self.memoryview()).decode("ascii")
+        return self._b64
+
+    def iter_chunks(self, size: int = _MEDIA_CHUNK_SIZE) -> Iterable[bytes | memoryview]:
+        if self._bytes is None and self._path is not None:
+            with open(self._path, "rb") as handle:
+                while chunk := handle.read(size):
+                    yield chunk
+            return
+        view = self.memoryview()
+        for offset in range(0, len(view), size):
+            yield view[offset:offset + size]
+
+    def __len__(self) -> int:
+        if self._bytes is not None:
+            return memoryview(self._bytes).nbytes
+        if self._path is not None:
+            return os.path.getsize(self._path)
+        return self.memoryview().nbytes
+
+    def __bool__(self) -> bool:
+        if self._bytes is None and self._path is None:
+            return bool(self._b64)
+        return len(self) > 0
+
+    def __str__(self) -> str:
+        return self.base64
+
+    def __format__(self, spec: str) -> str:
+        return format(self.base64, spec)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, AxMediaBuffer):
+            return self is other or self.memoryview() == other.memoryview()
+        if isinstance(other, str):
+            return self.base64 == other
+        if isinstance(other, (bytes, bytearray, memoryview)):
+            return self.memoryview() == memoryview(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        source = self._path if self._path is not None else f"{len(self)} bytes"
+        return f"AxMediaBuffer({source!r}, mime_type={self.mime_type!r})"
+
+
+def _media_result(buffer: AxMediaBuffer, options: dict[str, Any]) -> AxMediaBuffer | str:
+    """Binary results stay JSON-serializable base64 text unless the caller opts
+    into raw buffers with the ``media_buffers`` option."""
+    if options.get("media_buffers", options.get("mediaBuffers")):
+        return buffer
+    return buffer.base64
+
+
+def _media_json_default(value):
+    if isinstance(value, AxMediaBuffer):
+        return value.base64
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return base64.b64encode(value).decode("ascii")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _materialize_media(value):
+    """Replace media buffers with base64 text, copying only the containers on the way."""
+    if isinstance(value, AxMediaBuffer):
+        return value.base64
+    if isinstance(value, dict):
+        out = None
+        for key, item in value.items():
+            encoded = _materialize_media(item)
+            if encoded is not item:
+                if out is None:
+                    out = dict(value)
+                out[key] = encoded
+        return value if out is None else out
+    if isinstance(value, list):
+        out = None
+        for index, item in enumerate(value):
+            encoded = _materialize_media(item)
+            if encoded is not item:
+                if out is None:
+                    out = list(value)
+                out[index] = encoded
+        return value if out is None else out
+    return value
+
+
+def _multipart_file(value) -> tuple[str, str, Any]:
+    data = value.get("data", "") if isinstance(value, dict) else value
+    meta = value if isinstance(value, dict) else {}
+    filename = str(meta.get("filename") or getattr(data, "filename", None) or "audio.wav")
+    content_type = str(meta.get("mimeType") or meta.get("mime_type") or getattr(data, "mime_type", None) or "audio/wav")
+    if isinstance(data, (AxMediaBuffer, bytes, bytearray, memoryview)):
+        return filename, content_type, data
+    text = str(data)
+    if text.startswith("data:") and "," in text:
+        text = text.split(",", 1)[1]
+    try:
+        return filename, content_type, base64.b64decode(text)
+    except Exception:
+        return filename, content_type, text.encode()
+
+
+def _multipart_segments(payload: dict[str, Any]) -> tuple[list[Any], str]:
     boundary = "----axllmFormBoundary" + uuid.uuid4().hex
     crlf = b"\r\n"
-    parts: list[bytes] = []
+    segments: list[Any] = []
     for key, value in payload.items():
         if value is None:
             continue
+        segments.append(b"--" + boundary.encode() + crlf)
         if key == "file":
-            if isinstance(value, dict):
-                data = str(value.get("data", ""))
-                filename = str(value.get("filename") or "audio.wav")
-                content_type = str(value.get("mimeType") or value.get("mime_type") or "audio/wav")
-            else:
-                data = str(value)
-                filename = "audio.wav"
-                content_type = "audio/wav"
-            if data.startswith("data:") and "," in data:
-                data = data.split(",", 1)[1]
-            try:
-                file_bytes = base64.b64decode(data)
-            except Exception:
-                file_bytes = data.encode()
-            parts.append(b"--" + boundary.encode() + crlf)
-            parts.append(
-                ('Content-Disposition: form-data; name="file"; filename="' + filename + '"').encode() + crlf
-            )
-            parts.append(("Content-Type: " + content_type).encode() + crlf + crlf)
-            parts.append(file_bytes + crlf)
+            filename, content_type, body = _multipart_file(value)
+            segments.append(('Content-Disposition: form-data; name="file"; filename="' + filename + '"').encode() + crlf)
+            segments.append(("Content-Type: " + content_type).encode() + crlf + crlf)
+            segments.append(body)
+            segments.append(crlf)
         else:
-            parts.append(b"--" + boundary.encode() + crlf)
-            parts.append(('Content-Disposition: form-data; name="' + str(key) + '"').encode() + crlf + crlf)
-            parts.append(str(value).encode() + crlf)
-    parts.append(b"--" + boundary.encode() + b"--" + crlf)
-    return b"".join(parts), "multipart/form-data; boundary=" + boundary
+            segments.append(('Content-Disposition: form-data; name="' + str(key) + '"').encode() + crlf + crlf)
+            segments.append(str(value).encode() + crlf)
+    segments.append(b"--" + boundary.encode() + b"--" + crlf)
+    return segments, "multipart/form-data; boundary=" + boundary
+
+
+def _encode_multipart(payload: dict[str, Any]) -> tuple[bytes, str]:
+    """Encode a request payload as multipart/form-data.
+
+    Multipart operations (e.g. OpenAI /audio/transcriptions) carry the audio as a
+    binary `file` part; every other field is a plain form field. The `file` value is
+    a base64 string (optionally a data: URL), raw bytes, an `AxMediaBuffer`, or a
+    dict {data, mimeType?, filename?} holding one of those.
+    """
+    segments, content_type = _multipart_segments(payload)
+    return b"".join(segment.memoryview() if isinstance(segment, AxMediaBuffer) else segment for segment in segments), content_type
+
+
+def _encode_multipart_stream(payload: dict[str, Any]) -> tuple[Iterable[bytes | memoryview], str, int]:
+    """Like `_encode_multipart`, but yields the body in chunks so file-backed
+    buffers stream from disk; also returns the Content-Length."""
+    segments, content_type = _multipart_segments(payload)
+    length = sum(len(segment) if isinstance(segment, AxMediaBuffer) else memoryview(segment).nbytes for segment in segments)
+
+    def body():
+        for segment in segments:
+            if isinstance(segment, AxMediaBuffer):
+                yield from segment.iter_chunks()
+            else:
+                yield segment
+
+    return body(), content_type, length
 
 
 def _realtime_event_is_ready(event: dict[str, Any]) -> bool:
@@ -233,6 +424,15 @@ def _realtime_event_is_done(event: dict[str, Any]) -> bool:
     return bool(server_content and server_content.get("turnComplete"))
 
 
+_REALTIME_MAX_BUFFERED_EVENTS = 64
+_REALTIME_END = object()
+
+
+class _RealtimeReaderFailure:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
 class ScriptedRealtimeTransport:
     """Deterministic realtime transport for offline tests: returns canned inbound
     frames in order and records every event the driver sends. No network, so the
@@ -270,7 +470,7 @@ class _WebSocketRealtimeTransport:
 
     def send(self, event: dict[str, Any]) -> None:
         self.sent.append(event)
-        self._ws.send(json.dumps(event))
+        self._ws.send(json.dumps(event, default=_media_json_default))
 
     def recv(self) -> dict[str, Any] | None:
         try:
@@ -327,8 +527,8 @@ class AxAIService(ABC):
         ...
 
     def stream(self, request: dict[str, Any], options: dict[str, Any] | None = None):
-        stream_request = copy.deepcopy(_coerce_chat_request(request))
-        stream_request.setdefault("model_config", {})["stream"] = True
+        stream_request = _coerce_chat_request(request)
+        stream_request["model_config"] = {**(stream_request.get("model_config") or {}), "stream": True}
         result = self.chat(stream_request, {**(options or {}), "stream": True})
         if isinstance(result, dict):
             yield result
@@ -390,6 +590,8 @@ class AxBaseAI(AIClient):
         self.last_used_chat_model = None
         self.last_used_embed_model = None
         self.last_used_model_config = None
+        self.rate_limiter: AxRateLimiter | None = None
+        self.rate_limit_key: str | None = None
 
     def get_id(self) -> str:
         return self.id
@@ -450,12 +652,21 @@ class AxBaseAI(AIClient):
                 model_config["stream"] = bool(merged_options["stream"])
             req = {**req, "model": model, "model_config": model_config}
             self.last_used_chat_model = model
-            self.last_used_model_config = copy.deepcopy(model_config)
-            response = self._chat(req, merged_options)
+            self.last_used_model_config = dict(model_config)
+            limiter = self.rate_limiter
+            reservation = limiter.acquire(self._rate_limit_key(str(model)), estimate_chat_request_tokens(req)) if limiter else None
+            try:
+                response = self._chat(req, merged_options)
+            except Exception:
+                if limiter:
+                    limiter.settle(reservation, 0)
+                raise
             if isinstance(response, dict):
+                if limiter:
+                    limiter.settle(reservation, _usage_total_tokens(response))
                 _emit_usage_event("chat", response, merged_options, False)
                 return response
-            return _usage_observed_stream(response, merged_options)
+            return _usage_observed_stream(response, merged_options, _rate_limit_stream_settler(limiter, reservation))
         except Exception:
             is_error = True
             raise
@@ -484,6 +695,9 @@ class AxBaseAI(AIClient):
         finally:
             self._record_metrics("embed", time.perf_counter() - started, is_error)
 
+    def _rate_limit_key(self, model: str) -> str:
+        return self.rate_limit_key or f"{self.name}:{model}"
+
     @abstractmethod
     def _chat(self, request: dict[str, Any], options: dict[str, Any]):
         ...
@@ -507,6 +721,10 @@ class AxBaseAI(AIClient):
         errors["rate"] = errors["count"] / errors["total"] if errors["total"] else 0.0
 
 
+# Transports whose request builders map ``n`` onto native multi-choice sampling.
+_NATIVE_SAMPLING_TRANSPORTS = frozenset(("openai-chat", "gemini-generate-content"))
+
+
 class ProviderOperationClient(AxBaseAI):
     def __init__(
         self,
@@ -525,6 +743,10 @@ class ProviderOperationClient(AxBaseAI):
         credentialProvider: Callable[[dict[str, str]], dict[str, str]] | None = None,
         usage_context: AxUsageContext | None = None,
         usageContext: AxUsageContext | None = None,
+        circuit_breakers: AxCircuitBreakerRegistry | bool | None = None,
+        circuitBreakers: AxCircuitBreakerRegistry | bool | None = None,
+        rate_limit: AxRateLimiter | dict[str, Any] | None = None,
+        rateLimit: AxRateLimiter | dict[str, Any] | None = None,
         **runtime_options,
     ):
         service_options = {**(options or {}), **runtime_options}
@@ -555,7 +777,21 @@ class ProviderOperationClient(AxBaseAI):
         self.api_version = descriptor.get("apiVersion") or api_version
         self.timeout = timeout
         self.transport = transport
+        breakers = circuit_breakers if circuit_breakers is not None else circuitBreakers
+        if breakers is None or breakers is True:
+            # Injected transports manage their own connections; opt in explicitly.
+            breakers = _default_circuit_breakers if transport is None or breakers is True else None
+        self.circuit_breakers = breakers or None
+        self.rate_limiter, rate_limit_key = _resolve_rate_limiter(rate_limit or rateLimit)
+        if rate_limit_key == "api_key" and self.api_key:
+            rate_limit_key = f"{self.profile}:key:" + hashlib.sha256(self.api_key.encode()).hexdigest()[:16]
+        elif rate_limit_key in (None, "model"):
+            rate_limit_key = None
+        self.rate_limit_key = rate_limit_key
         self._context_cache_entries: dict[str, dict[str, Any]] = {}
+        self._features_cache: dict[str, dict[str, Any]] = {}
+        self._features_options: str | None = None
+        self.last_realtime_latency: dict[str, float | None] | None = None
 
     def __enter__(self):
         return self
@@ -563,17 +799,36 @@ class ProviderOperationClient(AxBaseAI):
     def __exit__(self, _exc_type, _exc, _tb):
         return False
 
+    def _rate_limit_key(self, model: str) -> str:
+        return self.rate_limit_key or f"{self.profile}:{model}"
+
     def get_estimated_cost(self, model_usage: dict[str, Any] | None = None) -> float:
         return float(provider_estimate_cost(model_usage or {}))
 
+    def _options_fingerprint(self) -> str | None:
+        try:
+            return json.dumps(self.options, sort_keys=True, default=repr)
+        except (TypeError, ValueError):
+            return None
+
     def get_features(self, model: str | None = None) -> dict[str, Any]:
-        return copy.deepcopy(
-            provider_resolve_features(
-                self.profile,
-                str(model or self.model),
-                self.options,
-            )
-        )
+        """Resolved features for ``model``; every caller receives its own copy.
+
+        Resolution is cached per model and dropped whenever ``options`` changes,
+        including in-place edits, so repeated lookups skip the catalog walk.
+        """
+        fingerprint = self._options_fingerprint()
+        if fingerprint is None or fingerprint != self._features_options:
+            self._features_cache = {}
+            self._features_options = fingerprint
+        key = str(model or self.model)
+        features = self._features_cache.get(key)
+        if features is None:
+            features = copy.deepcopy(provider_resolve_features(self.profile, key, self.options))
+            features.setdefault("multiple_samples", self.descriptor.get("transport") in _NATIVE_SAMPLING_TRANSPORTS)
+            if fingerprint is not None:
+                self._features_cache[key] = features
+        return copy.deepcopy(features)
 
     def _chat(self, request: dict[str, Any], options: dict[str, Any]):
         realtime_model = request.get("model") or self.model
@@ -624,7 +879,7 @@ class ProviderOperationClient(AxBaseAI):
         if not cache_body.get("systemInstruction") and not cache_body.get("contents"):
             return None
         min_tokens = int(cfg.get("minTokens", cfg.get("min_tokens", 2048)))
-        encoded = json.dumps(cache_body, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        encoded = json.dumps(cache_body, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=_media_json_default)
         eligible = math.ceil(len(encoded) / 4) >= min_tokens
         ttl_seconds = int(cfg.get("ttlSeconds", cfg.get("ttl_seconds", 3600)))
         refresh_window_ms = int(float(cfg.get("refreshWindowSeconds", cfg.get("refresh_window_seconds", 300))) * 1000)
@@ -717,7 +972,7 @@ class ProviderOperationClient(AxBaseAI):
 
     def stream(self, request: dict[str, Any], options: dict[str, Any] | None = None):
         req = _coerce_chat_request(request)
-        req.setdefault("model_config", {})["stream"] = True
+        req["model_config"] = {**(req.get("model_config") or {}), "stream": True}
         validate_chat_request(req)
         merged_options = {**self._merged_options(options), "stream": True}
         model = req.get("model") or self.model
@@ -725,11 +980,14 @@ class ProviderOperationClient(AxBaseAI):
         model_config["stream"] = True
         req = {**req, "model": model, "model_config": model_config}
         self.last_used_chat_model = model
-        self.last_used_model_config = copy.deepcopy(model_config)
+        self.last_used_model_config = dict(model_config)
         payload = provider_build_chat_request(self.profile, req, merged_options)
+        limiter = self.rate_limiter
+        reservation = limiter.acquire(self._rate_limit_key(str(model)), estimate_chat_request_tokens(req)) if limiter else None
         yield from _usage_observed_stream(
             self._stream_chat(payload, req, merged_options),
             merged_options,
+            _rate_limit_stream_settler(limiter, reservation),
         )
 
     def _embed(self, request: dict[str, Any], options: dict[str, Any]):
@@ -742,26 +1000,23 @@ class ProviderOperationClient(AxBaseAI):
     def _stream_chat(self, payload: dict[str, Any], request: dict[str, Any], options: dict[str, Any] | None = None):
         model = request.get("model") or payload.get("model") or self.model
         endpoint = self._operation_path("stream_chat", model)
-        cfg = resolve_stream_retry(options or {})
-        max_retries = int(cfg["max_retries"])
-        initial_delay = float(cfg["initial_delay_ms"])
-        max_delay = float(cfg["max_delay_ms"])
-        backoff = float(cfg["backoff_factor"])
+        policy = AxRetryPolicy.from_options(options or {})
+        policy.get_budget().deposit()
         attempt = 0
         sentinel = object()
         while True:
             # Pre-content streaming retry: peek the first raw SSE event before any stateful
             # normalize runs (so peeking has no side effects). If the provider classifies it as
             # a retryable transient status (e.g. Anthropic's HTTP-200 overloaded_error event),
-            # re-issue with the same exponential backoff apiCall uses for a 529 before surfacing.
+            # re-issue with the shared retry policy (full-jitter backoff, retry budget) before surfacing.
             raw = self._request_json(endpoint, payload, stream=True, method=self._operation_method("stream_chat"), operation="stream_chat")
             events = _iter_sse_json(raw)
             first = next(events, sentinel)
             if first is not sentinel:
                 status = provider_classify_stream_error_status(self.profile, first)
-                if status is not None and is_retryable_status(status) and attempt < max_retries:
+                if status is not None and is_retryable_status(status) and attempt < policy.max_retries and policy.get_budget().try_withdraw():
+                    delay = policy.backoff_ms(attempt)
                     attempt += 1
-                    delay = min(initial_delay * (backoff ** (attempt - 1)), max_delay)
                     if delay > 0:
                         time.sleep(delay / 1000.0)
                     continue
@@ -787,6 +1042,8 @@ class ProviderOperationClient(AxBaseAI):
         body_key = "data" if descriptor.get("body") == "multipart" else "json"
         binary_response = descriptor.get("response") == "binary"
         raw = self._request_json(self._operation_path("speak", model), payload, stream=False, body_key=body_key, binary_response=binary_response, method=self._operation_method("speak"), operation="speak")
+        if isinstance(raw, AxMediaBuffer):
+            raw = _media_result(raw, self._merged_options(options))
         return provider_normalize_speak_response(self.profile, raw, request)
 
     def realtime(self, events: Iterable[dict[str, Any]], model: str | None = None):
@@ -805,54 +1062,26 @@ class ProviderOperationClient(AxBaseAI):
         Core-built session setup + input events, fold the inbound event stream
         through the shared realtime codec, and return the final response. Pass a
         ScriptedRealtimeTransport to exercise the loop offline without a socket."""
-        model = request.get("model") or self.model
-        setup = provider_build_realtime_audio_setup(self.profile, request)
-        inputs = provider_build_realtime_audio_input(self.profile, request)
-        own_transport = transport is None
-        if transport is None:
-            url, headers = self._realtime_ws_target(model)
-            transport = _WebSocketRealtimeTransport(url, headers, self.timeout)
-        events: list[dict[str, Any]] = []
-        try:
-            transport.send(setup)
-            input_sent = False
-            while True:
-                event = transport.recv()
-                if event is None:
-                    break
-                if event.get("type") == "error":
-                    detail = event.get("error") or {}
-                    raise AxAIServiceError(detail.get("message") or "realtime error", code=detail.get("code"))
-                if _realtime_event_is_ready(event):
-                    if not input_sent:
-                        input_sent = True
-                        for item in inputs:
-                            transport.send(item)
-                    continue
-                events.append(event)
-                if _realtime_event_is_done(event):
-                    break
-        finally:
-            if own_transport:
-                transport.close()
         # Fold the per-delta normalize results into one turn response: concat the
-        # transcript/text content and base64-concat the audio chunks (mirrors the
-        # TS makeChatResponse; base64 join can't live in Core, so it stays here).
-        state: dict[str, Any] = {}
+        # transcript/text content and join the decoded audio chunks into a single
+        # PCM buffer (mirrors the TS makeChatResponse; binary joins can't live in
+        # Core, so it stays here). The joined audio is base64 text unless the
+        # caller opts into an AxMediaBuffer with the media_buffers option.
         contents: list[str] = []
-        audio_chunks: list[str] = []
+        pcm = bytearray()
+        has_audio = False
         function_calls: list[Any] = []
         response_id = None
         finish_reason = None
         model_usage = None
-        for event in events:
-            out = provider_normalize_realtime_event(self.profile, event, state, self.name, model)
+        for out in self.realtime_stream(request, options, transport=transport):
             result = out["results"][0]
             if result.get("content"):
                 contents.append(result["content"])
             audio = result.get("audio")
             if audio and audio.get("data"):
-                audio_chunks.append(audio["data"])
+                has_audio = True
+                pcm += audio["data"].memoryview()
             if result.get("function_calls"):
                 function_calls.extend(result["function_calls"])
             if result.get("finish_reason"):
@@ -870,11 +1099,121 @@ class ProviderOperationClient(AxBaseAI):
             "function_calls": function_calls,
             "finish_reason": finish_reason or "stop",
         }
-        if audio_chunks:
-            combined = base64.b64encode(b"".join(base64.b64decode(chunk) for chunk in audio_chunks)).decode()
-            merged["audio"] = {"data": combined, "format": "pcm16", "transcript": text}
+        if has_audio:
+            data = _media_result(AxMediaBuffer(pcm, mime_type="audio/pcm"), self._merged_options(options))
+            merged["audio"] = {"data": data, "format": "pcm16", "transcript": text}
         return {"results": [merged], "remote_id": response_id, "model_usage": model_usage}
 
+    def realtime_stream(
+        self,
+        request: dict[str, Any],
+        options: dict[str, Any] | None = None,
+        *,
+        transport: Any = None,
+        max_buffered_events: int = _REALTIME_MAX_BUFFERED_EVENTS,
+    ):
+        """Yield normalized realtime deltas (text, transcript, PCM audio chunks,
+        function calls) as frames arrive instead of after the turn completes.
+
+        A reader thread pulls frames from the transport into a queue of at most
+        ``max_buffered_events``; when the consumer falls behind, the reader stops
+        reading and the socket applies backpressure. Audio deltas carry an
+        ``AxMediaBuffer`` of the PCM chunk, and the first one is tagged with
+        ``first_audio_ms`` (also available from ``get_last_realtime_latency``).
+
+        Closing the generator before the turn completes closes the transport,
+        including a caller-supplied one: the reader thread may be blocked in
+        ``recv()``, and a half-read turn leaves the session unusable anyway. A
+        completed turn leaves a caller's transport open for the next turn."""
+        started = time.perf_counter()
+        model = request.get("model") or self.model
+        setup = provider_build_realtime_audio_setup(self.profile, request)
+        inputs = provider_build_realtime_audio_input(self.profile, request)
+        own_transport = transport is None
+        if transport is None:
+            url, headers = self._realtime_ws_target(model)
+            transport = _WebSocketRealtimeTransport(url, headers, self.timeout)
+        frames: queue.Queue = queue.Queue(maxsize=max(1, int(max_buffered_events)))
+        stop = threading.Event()
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    frames.put(item, timeout=0.05)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def read_frames():
+            try:
+                transport.send(setup)
+                input_sent = False
+                while not stop.is_set():
+                    event = transport.recv()
+                    if event is None:
+                        break
+                    if event.get("type") == "error":
+                        detail = event.get("error") or {}
+                        raise AxAIServiceError(detail.get("message") or "realtime error", code=detail.get("code"))
+                    if _realtime_event_is_ready(event):
+                        if not input_sent:
+                            input_sent = True
+                            for item in inputs:
+                                transport.send(item)
+                        continue
+                    if not put(event) or _realtime_event_is_done(event):
+                        break
+            except BaseException as exc:
+                put(_RealtimeReaderFailure(exc))
+            finally:
+                put(_REALTIME_END)
+
+        reader = threading.Thread(target=read_frames, name="axllm-realtime-reader", daemon=True)
+        latency: dict[str, float | None] = {"first_text_ms": None, "first_audio_ms": None, "turn_ms": None}
+        self.last_realtime_latency = latency
+        reader.start()
+        state: dict[str, Any] = {}
+        completed = False
+        try:
+            while True:
+                frame = frames.get()
+                if frame is _REALTIME_END:
+                    completed = True
+                    break
+                if isinstance(frame, _RealtimeReaderFailure):
+                    raise frame.error
+                out = provider_normalize_realtime_event(self.profile, frame, state, self.name, model)
+                result = out["results"][0]
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                if result.get("content") and latency["first_text_ms"] is None:
+                    latency["first_text_ms"] = elapsed_ms
+                audio = result.get("audio")
+                if audio and audio.get("data"):
+                    if not isinstance(audio["data"], AxMediaBuffer):
+                        audio["data"] = AxMediaBuffer.from_base64(str(audio["data"]), mime_type="audio/pcm")
+                    if latency["first_audio_ms"] is None:
+                        latency["first_audio_ms"] = elapsed_ms
+                        out["first_audio_ms"] = elapsed_ms
+                yield out
+            latency["turn_ms"] = (time.perf_counter() - started) * 1000
+        finally:
+            stop.set()
+            if own_transport or not completed:
+                # Closing unblocks a reader stuck in recv(); it then exits on its
+                # own, so the consumer never waits for it.
+                transport.close()
+            if completed:
+                reader.join()
+
+    def get_last_realtime_latency(self) -> dict[str, float | None] | None:
+        """Latency of the most recent realtime turn started on this client.
+
+        The value is per client, not per turn: concurrent turns on one client
+        overwrite it, so read ``first_audio_ms`` from the stream for those."""
+        latency = self.last_realtime_latency
+        return dict(latency) if latency is not None else None
+
     def _realtime_ws_target(self, model: str | None):
         # Grammar-specific URL + auth construction lives in Core so the client
         # stays provider-agnostic.
@@ -901,6 +1240,28 @@ class ProviderOperationClient(AxBaseAI):
         return str(descriptor.get("method") or "POST").upper()
 
     def _request_json(self, endpoint: str, payload: dict[str, Any], *, stream: bool, body_key: str = "json", binary_response: bool = False, method: str = "POST", base_url: str | None = None, operation: str = "chat"):
+        if self.circuit_breakers is None:
+            return self._send_request(endpoint, payload, stream=stream, body_key=body_key, binary_response=binary_response, method=method, base_url=base_url, operation=operation)
+        breaker = self.circuit_breakers.get(_circuit_breaker_key((base_url or self.base_url).rstrip("/") + endpoint))
+        breaker.before_call()
+        healthy = None
+        try:
+            result = self._send_request(endpoint, payload, stream=stream, body_key=body_key, binary_response=binary_response, method=method, base_url=base_url, operation=operation)
+            healthy = True
+            return result
+        except Exception as exc:
+            healthy = not _counts_as_endpoint_failure(exc)
+            raise
+        finally:
+            # An interrupt says nothing about the endpoint; just hand back a probe slot.
+            if healthy is None:
+                breaker.release_probe()
+            elif healthy:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+
+    def _send_request(self, endpoint: str, payload: dict[str, Any], *, stream: bool, body_key: str = "json", binary_response: bool = False, method: str = "POST", base_url: str | None = None, operation: str = "chat"):
         method = str(method or "POST").upper()
         request_base_url = (base_url or self.base_url).rstrip("/")
         request_url = request_base_url + endpoint
@@ -925,6 +1286,7 @@ class ProviderOperationClient(AxBaseAI):
             "stream": stream,
         }
         if self.transport:
+            call[body_key] = _materialize_media(payload)
             try:
                 return _transport_result(self.transport(call), call)
             except AxAIServiceError:
@@ -937,11 +1299,16 @@ class ProviderOperationClient(AxBaseAI):
             raise AxAIServiceAuthenticationError("OPENAI_API_KEY is required")
         request_headers = call["headers"]
         if body_key == "data":
-            request_body, multipart_content_type = _encode_multipart(payload)
+            request_body, multipart_content_type, content_length = _encode_multipart_stream(payload)
             request_headers = dict(request_headers)
             request_headers["Content-Type"] = multipart_content_type
+            request_headers["Content-Length"] = str(content_length)
         else:
-            request_body = json.dumps(payload).encode()
+            request_body = json.dumps(payload, default=_media_json_default).encode()
+        # urllib.request pulls in http.client/ssl/email; load it with the first real request.
+        import urllib.error
+        import urllib.request
+
         req = urllib.request.Request(
             call["url"],
             data=request_body,
@@ -952,8 +1319,8 @@ class ProviderOperationClient(AxBaseAI):
             with urllib.request.urlopen(req, timeout=self.timeout) as res:
                 if binary_response:
                     # Binary operations (e.g. OpenAI /audio/speech returns raw mp3)
-                    # must not be UTF-8 decoded; return the bytes as base64.
-                    return base64.b64encode(res.read()).decode()
+                    # must not be UTF-8 decoded; base64 is produced only on demand.
+                    return AxMediaBuffer(res.read(), mime_type=(res.headers.get("Content-Type") or "").split(";", 1)[0] or None)
                 body = res.read().decode()
                 return body if stream else json.loads(body)
         except TimeoutError as exc:
@@ -964,7 +1331,9 @@ class ProviderOperationClient(AxBaseAI):
                 parsed = json.loads(body)
             except json.JSONDecodeError:
                 parsed = body
-            raise openai_normalize_error(exc.code, parsed, call) from exc
+            error = openai_normalize_error(exc.code, parsed, call)
+            error.headers = dict(exc.headers.items()) if exc.headers else None
+            raise error from exc
         except OSError as exc:
             raise AxAIServiceNetworkError(str(exc), request=call, retryable=True) from exc
 
@@ -1143,7 +1512,7 @@ class MultiServiceRouter(AxAIService):
 
     def get_features(self, model: str | None = None) -> dict[str, Any]:
         if model is not None and model in self.services:
-            return copy.deepcopy(self.services[model]["service"].get_features(model))
+            return self.services[model]["service"].get_features(model)
         return _router_default_features()
 
     def chat(self, request: dict[str, Any], options: dict[str, Any] | None = None):
@@ -1154,9 +1523,9 @@ class MultiServiceRouter(AxAIService):
         if entry is None:
             raise ValueError(f"No service found for model key: {model_key}")
         self.last_used_service = entry["service"]
-        req = copy.deepcopy(request)
+        req = dict(request)
         if "modelConfig" in req and "model_config" not in req:
-            req["model_config"] = copy.deepcopy(req["modelConfig"])
+            req["model_config"] = req["modelConfig"]
         if "model" not in entry:
             req.pop("model", None)
             return entry["service"].chat(req, options)
@@ -1171,11 +1540,11 @@ class MultiServiceRouter(AxAIService):
             raise ValueError(f"No service found for embed model key: {embed_key}")
         self.last_used_service = entry["service"]
         if "model" not in entry:
-            req = copy.deepcopy(request)
+            req = dict(request)
             req.pop("embedModel", None)
             req.pop("embed_model", None)
             return entry["service"].embed(req, options)
-        return entry["service"].embed(copy.deepcopy(request), options)
+        return entry["service"].embed(dict(request), options)
 
     def transcribe(self, request: dict[str, Any], options: dict[str, Any] | None = None):
         model_key = request.get("model")
@@ -1285,6 +1654,565 @@ def _is_retryable_ai_error(exc: AxAIServiceError) -> bool:
     )
 
 
+def _is_retryable_error(exc: BaseException) -> bool:
+    """Classify any exception raised by a provider call; only transient failures retry.
+
+    An open circuit is not retried: backing off in place would only hold the
+    caller until the breaker's own timeout. Balancers still fail over on it.
+    """
+    if isinstance(exc, AxAIServiceCircuitOpenError):
+        return False
+    if isinstance(exc, AxAIServiceError):
+        return _is_retryable_ai_error(exc)
+    return isinstance(exc, (TimeoutError, ConnectionError))
+
+
+_RATE_LIMIT_RESET_HEADERS = (
+    "x-ratelimit-reset-requests",
+    "x-ratelimit-reset-tokens",
+    "anthropic-ratelimit-requests-reset",
+    "anthropic-ratelimit-tokens-reset",
+    "anthropic-ratelimit-input-tokens-reset",
+    "anthropic-ratelimit-output-tokens-reset",
+)
+_DURATION_UNITS_MS = {"ms": 1.0, "s": 1000.0, "m": 60_000.0, "h": 3_600_000.0}
+
+
+def _parse_duration_ms(value: str) -> float | None:
+    """Parse ``"1.5"`` (seconds) or Go-style durations such as ``"6m0s"`` and ``"250ms"``."""
+    text = str(value).strip()
+    try:
+        return float(text) * 1000.0
+    except ValueError:
+        pass
+    total = 0.0
+    number = ""
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if ch.isdigit() or ch == ".":
+            number += ch
+            i += 1
+            continue
+        unit = "ms" if text.startswith("ms", i) else ch
+        if not number or unit not in _DURATION_UNITS_MS:
+            return None
+        total += float(number) * _DURATION_UNITS_MS[unit]
+        number = ""
+        i += len(unit)
+    return total if not number else None
+
+
+def _parse_reset_time_ms(value: str, now: float) -> float | None:
+    text = str(value).strip()
+    try:
+        moment = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        from email.utils import parsedate_to_datetime
+
+        try:
+            moment = parsedate_to_datetime(text)
+        except (TypeError, ValueError):
+            return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max(0.0, (moment.timestamp() - now) * 1000.0)
+
+
+def retry_after_ms(error: BaseException, now: float | None = None) -> float | None:
+    """Server-requested wait before retrying ``error``, in milliseconds, if any.
+
+    Honours ``retry_after_ms`` set on the error, ``Retry-After-Ms``, ``Retry-After``
+    (seconds or HTTP date) and, for 429 responses, the provider rate-limit reset
+    headers (the longest reset wins).
+    """
+    explicit = getattr(error, "retry_after_ms", None)
+    if explicit is not None:
+        return max(0.0, float(explicit))
+    raw_headers = getattr(error, "headers", None) or {}
+    headers = {str(key).lower(): value for key, value in dict(raw_headers).items()}
+    now = time.time() if now is None else now
+    if headers.get("retry-after-ms") is not None:
+        try:
+            return max(0.0, float(headers["retry-after-ms"]))
+        except ValueError:
+            pass
+    if headers.get("retry-after") is not None:
+        text = str(headers["retry-after"]).strip()
+        try:
+            return max(0.0, float(text) * 1000.0)
+        except ValueError:
+            parsed = _parse_reset_time_ms(text, now)
+            if parsed is not None:
+                return parsed
+    if getattr(error, "status", None) != 429:
+        return None
+    waits = []
+    for name in _RATE_LIMIT_RESET_HEADERS:
+        value = headers.get(name)
+        if value is None:
+            continue
+        wait = _parse_duration_ms(value)
+        if wait is None:
+            wait = _parse_reset_time_ms(value, now)
+        if wait is not None:
+            waits.append(wait)
+    return max(waits) if waits else None
+
+
+class AxRetryBudget:
+    """Process-wide token bucket that caps retries as a share of traffic.
+
+    Every first attempt deposits ``ratio`` tokens and every retry withdraws one,
+    so retries stay near ``ratio`` of requests however many callers are failing.
+    ``min_retries_per_second`` keeps a trickle of retries available for
+    low-traffic processes. Thread-safe.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries_per_second: float = 10.0, capacity: float = 100.0, clock: Callable[[], float] = time.monotonic):
+        self.ratio = float(ratio)
+        self.min_retries_per_second = float(min_retries_per_second)
+        self.capacity = float(capacity)
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.min_retries_per_second)
+        self._updated = now
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        with self._lock:
+            self._refill()
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+    def available(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class AxCircuitBreaker:
+    """Closed/open/half-open breaker for one endpoint.
+
+    After ``failure_threshold`` consecutive transient failures the breaker opens
+    and calls fail fast with ``AxAIServiceCircuitOpenError`` for
+    ``reset_timeout_ms``; then a single probe call is let through and its
+    outcome closes or re-opens the breaker. Thread-safe.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout_ms: float = 30_000.0, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout_ms = float(reset_timeout_ms)
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if (self._clock() - self._opened_at) * 1000.0 >= self.reset_timeout_ms:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> None:
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return
+            if state == "half_open" and not self._probing:
+                self._probing = True
+                return
+            remaining = self.reset_timeout_ms - (self._clock() - self._opened_at) * 1000.0
+        raise AxAIServiceCircuitOpenError(
+            "Circuit open for endpoint; failing fast",
+            retryable=False,
+            retry_after_ms=max(0.0, remaining),
+        )
+
+    def release_probe(self) -> None:
+        """Let another call probe when this one ended without an outcome."""
+        with self._lock:
+            self._probing = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+            self._probing = False
+
+
+def _circuit_breaker_key(url: str) -> str:
+    """Scheme, host and path of ``url``; query strings can carry API keys."""
+    parts = urllib.parse.urlsplit(url)
+    host = parts.hostname or ""
+    if parts.port is not None:
+        host = f"{host}:{parts.port}"
+    return f"{parts.scheme}://{host}{parts.path}"
+
+
+class AxCircuitBreakerRegistry:
+    """Per-endpoint breakers; share one registry between clients to share state."""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout_ms: float = 30_000.0, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_ms = reset_timeout_ms
+        self._clock = clock
+        self._breakers: dict[str, AxCircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str) -> AxCircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = AxCircuitBreaker(self.failure_threshold, self.reset_timeout_ms, self._clock)
+                self._breakers[endpoint] = breaker
+            return breaker
+
+
+def _counts_as_endpoint_failure(exc: BaseException) -> bool:
+    # Rate limiting and client errors mean the endpoint is up.
+    if isinstance(exc, AxAIServiceCircuitOpenError) or getattr(exc, "status", None) == 429:
+        return False
+    return _is_retryable_error(exc)
+
+
+_default_retry_budget = AxRetryBudget()
+_default_circuit_breakers = AxCircuitBreakerRegistry()
+
+
+def default_retry_budget() -> AxRetryBudget:
+    return _default_retry_budget
+
+
+def default_circuit_breakers() -> AxCircuitBreakerRegistry:
+    return _default_circuit_breakers
+
+
+@dataclass
+class AxRetryPolicy:
+    """Exponential backoff with full jitter, bounded by a shared retry budget."""
+
+    max_retries: int = 3
+    initial_delay_ms: float = 1000.0
+    max_delay_ms: float = 60_000.0
+    backoff_factor: float = 2.0
+    budget: AxRetryBudget | None = None
+
+    @classmethod
+    def from_options(cls, options: Any = None, **defaults) -> "AxRetryPolicy":
+        """Read ``options["retry"]`` (camelCase or snake_case) over ``defaults``."""
+        base = {**default_retry_config(), **defaults}
+        retry = _core_get(options, "retry", None) or {}
+        budget = retry.get("budget", base.get("budget")) if isinstance(retry, dict) else base.get("budget")
+        return cls(
+            max_retries=int(retry_opt_value(retry, "maxRetries", "max_retries", base["max_retries"])),
+            initial_delay_ms=float(retry_opt_value(retry, "initialDelayMs", "initial_delay_ms", base["initial_delay_ms"])),
+            max_delay_ms=float(retry_opt_value(retry, "maxDelayMs", "max_delay_ms", base["max_delay_ms"])),
+            backoff_factor=float(retry_opt_value(retry, "backoffFactor", "backoff_factor", base["backoff_factor"])),
+            budget=budget if isinstance(budget, AxRetryBudget) else None,
+        )
+
+    def get_budget(self) -> AxRetryBudget:
+        return self.budget or _default_retry_budget
+
+    def backoff_ms(self, attempt: int) -> float:
+        ceiling = min(self.max_delay_ms, self.initial_delay_ms * (self.backoff_factor ** max(0, attempt)))
+        return random.uniform(0.0, ceiling) if ceiling > 0 else 0.0
+
+    def delay_ms(self, attempt: int, error: BaseException | None = None) -> float | None:
+        """Delay before retry ``attempt`` (0-based), or ``None`` to stop retrying.
+
+        A server-requested wait is used as a floor; if it exceeds ``max_delay_ms``
+        the call gives up instead of sleeping past the policy.
+        """
+        jittered = self.backoff_ms(attempt)
+        requested = retry_after_ms(error) if error is not None else None
+        if requested is None:
+            return jittered
+        if requested > self.max_delay_ms:
+            return None
+        return max(requested, jittered)
+
+    def should_retry(self, attempt: int, error: BaseException) -> float | None:
+        """Classify ``error`` and charge the budget; returns the delay or ``None``."""
+        if attempt >= self.max_retries or not _is_retryable_error(error):
+            return None
+        delay = self.delay_ms(attempt, error)
+        if delay is None or not self.get_budget().try_withdraw():
+            return None
+        return delay
+
+    def run(self, operation: Callable[[], Any], sleep: Callable[[float], Any] = time.sleep) -> Any:
+        """Call ``operation`` until it succeeds or the policy stops retrying."""
+        self.get_budget().deposit()
+        attempt = 0
+        while True:
+            try:
+                return operation()
+            except Exception as error:
+                delay = self.should_retry(attempt, error)
+                if delay is None:
+                    raise
+            if delay > 0:
+                sleep(delay / 1000.0)
+            attempt += 1
+
+
+class AxRateLimitStore(ABC):
+    """Shared rate-limit bucket state. ``update`` must be atomic per key."""
+
+    @abstractmethod
+    def update(self, key: str, fn: Callable[[dict[str, Any] | None], tuple[dict[str, Any], Any]]) -> Any:
+        """Apply ``fn`` to the state for ``key``, store its new state and return its result."""
+        ...
+
+
+class AxInMemoryRateLimitStore(AxRateLimitStore):
+    """Thread-safe in-process store; share one instance between clients."""
+
+    def __init__(self):
+        self._state: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def update(self, key: str, fn: Callable[[dict[str, Any] | None], tuple[dict[str, Any], Any]]) -> Any:
+        with self._lock:
+            state, result = fn(self._state.get(key))
+            self._state[key] = state
+            return result
+
+
+class AxFileRateLimitStore(AxRateLimitStore):
+    """Host-wide store shared by worker processes through one JSON file.
+
+    Every update holds an exclusive advisory ``fcntl`` lock on the file, so
+    processes that point at the same path share the same buckets.
+    """
+
+    def __init__(self, path: str):
+        try:
+            import fcntl
+        except ImportError as exc:
+            raise RuntimeError("AxFileRateLimitStore requires POSIX file locking (fcntl)") from exc
+        self._fcntl = fcntl
+        self.path = str(path)
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+    def update(self, key: str, fn: Callable[[dict[str, Any] | None], tuple[dict[str, Any], Any]]) -> Any:
+        with self._lock, open(self.path, "a+", encoding="utf-8") as handle:
+            self._fcntl.flock(handle.fileno(), self._fcntl.LOCK_EX)
+            try:
+                handle.seek(0)
+                text = handle.read()
+                try:
+                    data = json.loads(text) if text.strip() else {}
+                except json.JSONDecodeError:
+                    data = {}
+                state, result = fn(data.get(key))
+                data[key] = state
+                handle.seek(0)
+                handle.truncate()
+                handle.write(json.dumps(data, separators=(",", ":")))
+                handle.flush()
+                return result
+            finally:
+                self._fcntl.flock(handle.fileno(), self._fcntl.LOCK_UN)
+
+
+def estimate_chat_request_tokens(request: dict[str, Any]) -> int:
+    """Rough pre-send token estimate: about four characters per token of prompt
+    text and function schemas, plus the requested completion budget."""
+    chars = 0
+    for message in request.get("chat_prompt") or request.get("chatPrompt") or []:
+        content = message.get("content") if isinstance(message, dict) else None
+        if isinstance(content, str):
+            chars += len(content)
+        elif isinstance(content, list):
+            for part in content:
+                if isinstance(part, dict) and isinstance(part.get("text"), str):
+                    chars += len(part["text"])
+        for call in (message.get("function_calls") or message.get("functionCalls") or []) if isinstance(message, dict) else []:
+            chars += len(json.dumps(call, default=str))
+    functions = request.get("functions")
+    if functions:
+        chars += len(json.dumps(functions, default=str))
+    config = request.get("model_config") or request.get("modelConfig") or {}
+    completion = config.get("max_tokens", config.get("maxTokens")) or 0
+    return int(math.ceil(chars / 4.0)) + int(completion)
+
+
+def _usage_total_tokens(response: Any) -> int | None:
+    usage = (response.get("model_usage") or response.get("modelUsage")) if isinstance(response, dict) else None
+    tokens = usage.get("tokens") if isinstance(usage, dict) else None
+    if not isinstance(tokens, dict):
+        return None
+    total = tokens.get("total_tokens", tokens.get("totalTokens"))
+    if total is None:
+        total = (tokens.get("prompt_tokens", tokens.get("promptTokens")) or 0) + (tokens.get("completion_tokens", tokens.get("completionTokens")) or 0)
+    return int(total)
+
+
+def _rate_limit_stream_settler(limiter: AxRateLimiter | None, reservation: AxRateLimitReservation | None):
+    """Settle a stream's reservation with its reported usage; refund it when the stream fails first."""
+    if limiter is None:
+        return None
+
+    def settle(usage_response: dict[str, Any] | None, failed: bool) -> None:
+        if failed and usage_response is None:
+            limiter.settle(reservation, 0)
+        else:
+            limiter.settle(reservation, _usage_total_tokens(usage_response))
+
+    return settle
+
+
+@dataclass
+class AxRateLimitReservation:
+    key: str
+    estimated_tokens: int
+
+
+class AxRateLimiter:
+    """Requests-per-minute and tokens-per-minute token buckets for one quota key.
+
+    ``acquire`` blocks until both buckets admit the request (bounded by
+    ``max_wait_ms``); with ``blocking=False`` it raises
+    ``AxAIServiceRateLimitError`` carrying the wait as ``retry_after_ms``.
+    ``settle`` replaces the token estimate with the provider-reported usage.
+    Buckets live in ``store``; share a store to share limits across clients,
+    or use ``AxFileRateLimitStore`` to share them across processes.
+    """
+
+    def __init__(
+        self,
+        rpm: float | None = None,
+        tpm: float | None = None,
+        *,
+        store: AxRateLimitStore | None = None,
+        blocking: bool = True,
+        max_wait_ms: float | None = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Any] = time.sleep,
+    ):
+        self.rpm = float(rpm) if rpm else None
+        self.tpm = float(tpm) if tpm else None
+        self.store = store or _default_rate_limit_store
+        self.blocking = blocking
+        self.max_wait_ms = max_wait_ms
+        self._clock = clock
+        self._sleep = sleep
+
+    def _refilled(self, state: dict[str, Any] | None, now: float) -> dict[str, Any]:
+        if state is None:
+            return {"requests": self.rpm or 0.0, "tokens": self.tpm or 0.0, "updated": now}
+        elapsed_minutes = max(0.0, now - float(state.get("updated", now))) / 60.0
+        return {
+            "requests": min(self.rpm or 0.0, float(state.get("requests", 0.0)) + elapsed_minutes * (self.rpm or 0.0)),
+            "tokens": min(self.tpm or 0.0, float(state.get("tokens", 0.0)) + elapsed_minutes * (self.tpm or 0.0)),
+            "updated": now,
+        }
+
+    def _take(self, key: str, tokens: int) -> float:
+        """Debit one request and ``tokens`` if both buckets allow; else return the wait in ms."""
+        # A single request larger than the whole minute budget waits for a full bucket.
+        cost = min(float(tokens), self.tpm) if self.tpm else 0.0
+
+        def apply(state):
+            state = self._refilled(state, self._clock())
+            waits = []
+            if self.rpm and state["requests"] < 1.0:
+                waits.append((1.0 - state["requests"]) / self.rpm * 60_000.0)
+            if self.tpm and state["tokens"] < cost:
+                waits.append((cost - state["tokens"]) / self.tpm * 60_000.0)
+            if waits:
+                return state, max(waits)
+            if self.rpm:
+                state["requests"] -= 1.0
+            state["tokens"] -= cost
+            return state, 0.0
+
+        return self.store.update(key, apply)
+
+    def try_acquire(self, key: str, tokens: int = 0) -> AxRateLimitReservation | None:
+        return AxRateLimitReservation(key, int(tokens)) if self._take(key, tokens) <= 0 else None
+
+    def acquire(self, key: str, tokens: int = 0, blocking: bool | None = None) -> AxRateLimitReservation:
+        blocking = self.blocking if blocking is None else blocking
+        deadline = None if self.max_wait_ms is None else self._clock() + self.max_wait_ms / 1000.0
+        while True:
+            wait_ms = self._take(key, tokens)
+            if wait_ms <= 0:
+                return AxRateLimitReservation(key, int(tokens))
+            if not blocking or (deadline is not None and self._clock() + wait_ms / 1000.0 > deadline):
+                raise AxAIServiceRateLimitError(
+                    f"Client-side rate limit for {key} needs {wait_ms:.0f}ms",
+                    status=429,
+                    retryable=True,
+                    retry_after_ms=wait_ms,
+                )
+            self._sleep(wait_ms / 1000.0)
+
+    def settle(self, reservation: AxRateLimitReservation | None, actual_tokens: int | None) -> None:
+        """Correct the token bucket once the real usage is known."""
+        if reservation is None or not self.tpm or actual_tokens is None:
+            return None
+        delta = float(actual_tokens) - float(reservation.estimated_tokens)
+        if delta == 0:
+            return None
+
+        def apply(state):
+            state = self._refilled(state, self._clock())
+            state["tokens"] = max(-self.tpm, min(self.tpm, state["tokens"] - delta))
+            return state, None
+
+        self.store.update(reservation.key, apply)
+        return None
+
+
+_default_rate_limit_store = AxInMemoryRateLimitStore()
+
+
+def _resolve_rate_limiter(config: Any) -> tuple[AxRateLimiter | None, str | None]:
+    if not config:
+        return None, None
+    if isinstance(config, AxRateLimiter):
+        return config, None
+    limiter = AxRateLimiter(
+        config.get("rpm", config.get("requestsPerMinute", config.get("requests_per_minute"))),
+        config.get("tpm", config.get("tokensPerMinute", config.get("tokens_per_minute"))),
+        store=config.get("store"),
+        blocking=bool(config.get("blocking", True)),
+        max_wait_ms=config.get("maxWaitMs", config.get("max_wait_ms")),
+    )
+    return limiter, config.get("key")
+
+
 AxBalancerStatsKey = dict[str, Any]
 AxBalancerRouteStats = dict[str, Any]
 AxBalancerStatsObservation = dict[str, Any]
@@ -1849,7 +2777,7 @@ class ProviderRouter:
 
     def _provider_records(self):
         return [
-            {"name": provider.get_name(), "id": provider.get_id(), "features": copy.deepcopy(provider.get_features())}
+            {"name": provider.get_name(), "id": provider.get_id(), "features": provider.get_features()}
             for provider in self.providers
         ]
 
@@ -1990,6 +2918,10 @@ def _core_map_merge(left, right):
     return out
 
 
+def _core_map_clone(value):
+    return copy.deepcopy(value)
+
+
 def _core_map_delete(target, key):
     if isinstance(target, dict):
         target.pop(key, None)
@@ -2012,8 +2944,32 @@ def _core_json_parse(value):
     return json.loads(value)
 
 
+_CORE_SHARED_JSON: dict[str, Any] = {}
+
+
+def _core_json_parse_shared(value):
+    """Parse a static registry literal once and share it read-only."""
+    parsed = _CORE_SHARED_JSON.get(value)
+    if parsed is None:
+        parsed = _CORE_SHARED_JSON.setdefault(value, _core_freeze(json.loads(value)))
+    return parsed
+
+
+_CORE_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+_CORE_DATA: dict[str, Any] = {}
+
+
+def _core_json_load_data(name):
+    """Parse a registry data file from ``axllm/data`` on first use and share it read-only."""
+    parsed = _CORE_DATA.get(name)
+    if parsed is None:
+        with open(os.path.join(_CORE_DATA_DIR, name), encoding="utf-8") as handle:
+            parsed = _CORE_DATA.setdefault(name, _core_freeze(json.load(handle)))
+    return parsed
+
+
 def _core_json_stringify(value):
-    return json.dumps(value or {}, sort_keys=True, separators=(",", ":"))
+    return json.dumps(value or {}, sort_keys=True, separators=(",", ":"), default=_media_json_default)
 
 
 def _core_string_starts_with(value, prefix):
@@ -2117,23 +3073,93 @@ for _axir_provider_public_name in (
 del _axir_provider_public_name
 
 
+class _FrozenDict(dict):
+    """Read-only dict for shared registries and caches; copies come back mutable."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("shared maps are read-only; copy before mutating")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class _FrozenList(list):
+    """Read-only list for shared registries and caches; copies come back mutable."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("shared lists are read-only; copy before mutating")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(value, memo) for value in self]
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def _core_openai_responses_apply_model_config(payload, model_config):
+    """Host replacement for Core's ``_openai_responses_apply_model_config_impl``.
+
+    Chat requests are no longer deep-copied, so ``payload["reasoning"]`` can
+    be the caller's map; copy it before Core sets the effort on it.
+    """
+    if isinstance(payload, dict) and isinstance(payload.get("reasoning"), dict):
+        payload["reasoning"] = dict(payload["reasoning"])
+    return _core_openai_responses_apply_model_config_shared(payload, model_config)
+
+
+def _core_freeze(value):
+    if isinstance(value, dict):
+        return _FrozenDict((key, _core_freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return _FrozenList(_core_freeze(item) for item in value)
+    return value
+
+
+def _shallow_list(value):
+    return list(value) if isinstance(value, (list, tuple)) else value
+
+
 def _coerce_chat_request(request: dict[str, Any]):
+    """Normalize a chat request without copying its contents.
+
+    The result is a new top-level dict with its own ``chat_prompt`` list;
+    messages, media parts and function schemas stay shared with the caller.
+    Provider builders copy the containers they modify, so callers' requests
+    are never mutated.
+    """
     if "chat_prompt" in request:
-        return copy.deepcopy(request)
+        out = dict(request)
+        out["chat_prompt"] = _shallow_list(out["chat_prompt"])
+        return out
     if "chatPrompt" in request:
-        out = copy.deepcopy(request)
-        out["chat_prompt"] = out.pop("chatPrompt")
+        out = dict(request)
+        out["chat_prompt"] = _shallow_list(out.pop("chatPrompt"))
         return out
     if "messages" in request:
         return {
-            "chat_prompt": copy.deepcopy(request["messages"]),
+            "chat_prompt": _shallow_list(request["messages"]),
             "functions": request.get("functions") or _tools_to_functions(request.get("tools") or []),
             "function_call": request.get("function_call") or request.get("tool_choice"),
             "response_format": request.get("response_format"),
             "model": request.get("model"),
             "model_config": request.get("model_config") or {},
         }
-    return copy.deepcopy(request)
+    return dict(request)
 
 
 def _tools_to_functions(tools):
@@ -2152,7 +3178,9 @@ def _transport_result(result: Any, request: dict[str, Any]):
         status = int(result.get("status") or 200)
         body = result.get("json", result.get("body", result.get("data")))
         if status >= 400:
-            raise openai_normalize_error(status, body, request)
+            error = openai_normalize_error(status, body, request)
+            error.headers = result.get("headers")
+            raise error
         return body
     return result
 
@@ -2198,3 +3226,9 @@ def _iter_sse_json(raw: Any):
     event = flush(buffer)
     if event is not None:
         yield event
+
+
+# Python host replacements for Core functions. The portable definitions above
+# stay the reference; rebinding the module globals routes emitted callers here.
+_core_openai_responses_apply_model_config_shared = _openai_responses_apply_model_config_impl
+_openai_responses_apply_model_config_impl = _core_openai_responses_apply_model_config
@@ -3,16 +3,26 @@ import os
 
 from abc import ABC, abstractmethod
 import copy
+import hashlib
+import heapq
 import json
 import math
+import random
 import re
-from typing import Any
+import threading
+import weakref
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable
 
 from .gen import (
     AxGen,
+    AxRunContext,
+    _core_program_begin_run,
+    _core_program_bind_run,
+    _core_program_end_run,
     _core_ai_complete_once,
     _ace_apply_curator_operations,
-    _ace_dedupe_playbook,
+    _ace_dedupe_playbook_sections,
     _ace_empty_playbook,
     _ace_normalize_curator_operations,
     _ace_normalize_reflection_bullet_tags,
@@ -32,6 +42,7 @@ from .gen import (
     _validate_optimization_component_map,
     _validate_optimized_artifact,
 )
+from .ai import _FrozenDict, _FrozenList, _core_freeze, _core_json_load_data, _core_json_parse_shared
 from .mcp import resolve_execution_context
 from .signature import AxSignature, parse_signature
 # AXIR_CORE_IMPORTS
@@ -247,6 +258,102 @@ def _gepa_option(options, *keys, default=None):
     return default
 
 
+def _race_options(options):
+    """Normalize the ``racing`` option; None leaves evaluation exhaustive."""
+    raw = _gepa_option(options or {}, "racing", default=False)
+    if not raw:
+        return None
+    cfg = raw if isinstance(raw, dict) else {}
+    bound = str(cfg.get("bound", "hoeffding"))
+    if bound not in ("hoeffding", "bernstein", "sign"):
+        raise ValueError(f"racing.bound must be 'hoeffding', 'bernstein' or 'sign', got {bound!r}")
+    return {
+        "confidence": min(max(_gepa_num(cfg.get("confidence"), 0.95), 0.5), 0.9999),
+        "minBatch": _gepa_int(_gepa_option(cfg, "minBatch", "min_batch", default=4), 4, 1),
+        "growth": max(1.1, _gepa_num(cfg.get("growth"), 2.0)),
+        "bound": bound,
+        "scoreRange": max(1e-9, _gepa_num(_gepa_option(cfg, "scoreRange", "score_range", default=1), 1)),
+        "seed": cfg.get("seed", 0),
+    }
+
+
+def _race_schedule(total, race):
+    checkpoints = []
+    size = min(total, race["minBatch"])
+    while size < total:
+        checkpoints.append(size)
+        size = max(size + 1, int(math.ceil(size * race["growth"])))
+    checkpoints.append(total)
+    return checkpoints
+
+
+def _race_should_drop(diffs, weights, margin, race, looks):
+    """True when the challenger's mean paired gain provably stays below ``margin``.
+
+    ``diffs`` are challenger-minus-incumbent scores on the tasks seen so far.
+    The error rate is split across the ``looks`` checkpoints (union bound).
+    """
+    if not diffs:
+        return False
+    delta = (1.0 - race["confidence"]) / max(1, looks)
+    if race["bound"] == "sign":
+        wins = sum(1 for diff in diffs if diff > margin)
+        losses = sum(1 for diff in diffs if diff < margin)
+        trials = wins + losses
+        if trials == 0:
+            return False
+        tail = sum(math.comb(trials, k) for k in range(wins + 1)) / (2 ** trials)
+        return tail < delta
+    total_weight = sum(weights)
+    if total_weight <= 0:
+        return False
+    mean = sum(weight * diff for weight, diff in zip(weights, diffs)) / total_weight
+    spread = 2.0 * race["scoreRange"]
+    square_weight = sum(weight * weight for weight in weights)
+    if race["bound"] == "bernstein":
+        n_eff = total_weight * total_weight / square_weight
+        if n_eff < 2:
+            return False
+        variance = sum(weight * (diff - mean) ** 2 for weight, diff in zip(weights, diffs)) / total_weight
+        log_term = math.log(2.0 / delta)
+        radius = math.sqrt(2.0 * variance * log_term / n_eff) + 7.0 * spread * log_term / (3.0 * (n_eff - 1))
+    else:
+        radius = spread * math.sqrt(math.log(1.0 / delta) * square_weight / 2.0) / total_weight
+    return mean + radius < margin
+
+
+def _race_challenger(evaluate_chunk, incumbent, weights, margin, race, seed):
+    """Score a challenger on growing slices of a shuffled task order.
+
+    ``evaluate_chunk(indices)`` returns the challenger's scores for those task
+    indices, or None when the metric budget ran out. Evaluation stops early once
+    the challenger can't beat the incumbent's per-task scores by ``margin``.
+    """
+    total = len(incumbent)
+    order = list(range(total))
+    random.Random(f"{race['seed']}:{seed}").shuffle(order)
+    checkpoints = _race_schedule(total, race)
+    scores = {}
+    done = 0
+    for checkpoint in checkpoints:
+        chunk = order[done:checkpoint]
+        values = evaluate_chunk(chunk)
+        if values is None:
+            return {"scores": scores, "evaluated": done, "dropped": False, "saved": 0, "complete": False}
+        scores.update(zip(chunk, values))
+        done = checkpoint
+        seen = order[:done]
+        if done < total and _race_should_drop(
+            [scores[index] - incumbent[index] for index in seen],
+            [weights[index] for index in seen],
+            margin,
+            race,
+            len(checkpoints),
+        ):
+            return {"scores": scores, "evaluated": done, "dropped": True, "saved": total - done, "complete": True}
+    return {"scores": scores, "evaluated": done, "dropped": False, "saved": 0, "complete": True}
+
+
 class AxBootstrapFewShot(OptimizerEngine):
     name = "BootstrapFewShot"
     version = "axir-bootstrap-fewshot-v1"
@@ -503,6 +610,8 @@ class AxGEPA(OptimizerEngine):
         min_improvement = _gepa_num(_gepa_option(options, "minImprovementThreshold", "min_improvement_threshold", default=0), 0)
         pareto_size = _gepa_int(_gepa_option(options, "paretoSetSize", "pareto_set_size", default=max(10, min(200, minibatch_size * 3))), max(10, min(200, minibatch_size * 3)), 1, 1000)
         tie_eps = _gepa_num(_gepa_option(options, "tieEpsilon", "tie_epsilon", default=0), 0)
+        race = _race_options(options)
+        saved_calls = 0
         base_cfg = _gepa_current_map(components)
         pareto_set = validation[:pareto_size]
         self._selector_init(components, _gepa_option(options, "selectorState", "selector_state"))
@@ -533,10 +642,26 @@ class AxGEPA(OptimizerEngine):
                 current = proposed.get(component["id"], "")
                 trace_dataset = [{"score": row.get("scalar", 0), "trace": row.get("trace"), "output": row.get("prediction")} for row in rows]
                 proposed[component["id"]] = self._reflect(component, current, tuples, trace_dataset, options)
-            child_mini, total_calls = self._evaluate(evaluator, proposed, mini, "child minibatch", max_calls, total_calls)
-            if child_mini is None:
-                break
-            accepted = child_mini["sum"] > parent_eval["sum"] + min_improvement
+            if race is not None and len(mini) > 1 and len(parent_eval["scalars"]) == len(mini):
+                if total_calls + len(mini) > max_calls:
+                    break
+                calls = [total_calls]
+
+                def evaluate_chunk(indices):
+                    chunk_eval, calls[0] = self._evaluate(evaluator, proposed, [mini[index] for index in indices], "child minibatch", max_calls, calls[0])
+                    return None if chunk_eval is None else chunk_eval["scalars"]
+
+                raced = _race_challenger(evaluate_chunk, parent_eval["scalars"], [1.0] * len(mini), min_improvement / len(mini), race, iteration)
+                total_calls = calls[0]
+                saved_calls += raced["saved"]
+                if not raced["complete"]:
+                    break
+                accepted = not raced["dropped"] and sum(raced["scores"].values()) > parent_eval["sum"] + min_improvement
+            else:
+                child_mini, total_calls = self._evaluate(evaluator, proposed, mini, "child minibatch", max_calls, total_calls)
+                if child_mini is None:
+                    break
+                accepted = child_mini["sum"] > parent_eval["sum"] + min_improvement
             for component in group:
                 self._record_result(component["id"], accepted, iteration)
             if not accepted:
@@ -578,6 +703,7 @@ class AxGEPA(OptimizerEngine):
                 "bestScore": 0 if best_score == -1e100 else best_score,
                 "totalMetricCalls": total_calls,
                 "candidatesExplored": len(candidates),
+                **({"metricCallsSaved": saved_calls} if race is not None else {}),
                 "report": {
                     "summary": "GEPA Multi-Objective Optimization Complete",
                     "statistics": {"totalEvaluations": total_calls, "candidatesExplored": len(candidates), "converged": True},
@@ -639,6 +765,10 @@ class AxACE:
         self.base_instruction = None
         self.generator_history = []
         self.delta_history = []
+        self._revision = 0
+        self._rendered = None
+        self._clean_sections = set()
+        self._pipeline_stage = threading.local()
         self.playbook = (
             _ace_clone(self.initial_playbook)
             if self.initial_playbook is not None
@@ -648,6 +778,18 @@ class AxACE:
     def _now(self):
         return self.options.get("now") or "1970-01-01T00:00:00.000Z"
 
+    # The Core `_ace_*` ops mutate the playbook in place and return it, and
+    # every call site assigns the result back, so the setter is where the
+    # revision moves. Renders are memoized per revision.
+    @property
+    def playbook(self):
+        return self._playbook
+
+    @playbook.setter
+    def playbook(self, value):
+        self._playbook = value
+        self._revision += 1
+
     def reset(self):
         self.playbook = (
             _ace_clone(self.initial_playbook)
@@ -657,6 +799,7 @@ class AxACE:
         self.base_instruction = None
         self.generator_history = []
         self.delta_history = []
+        self._clean_sections = set()
 
     def configure_auto(self, level):
         if level == "light":
@@ -688,6 +831,7 @@ class AxACE:
         artifact = state.get("artifact") or {}
         self.generator_history = _ace_clone(artifact.get("feedback") or [])
         self.delta_history = _ace_clone(artifact.get("history") or [])
+        self._clean_sections = set()
 
     def get_playbook(self):
         return _ace_clone(self.playbook)
@@ -709,7 +853,18 @@ class AxACE:
         }
 
     def _render_playbook(self):
-        return _ace_render_playbook(_ace_clone(self.playbook))
+        if self._rendered is None or self._rendered[0] != self._revision:
+            self._rendered = (self._revision, _ace_render_playbook(self.playbook))
+        return self._rendered[1]
+
+    def _dedupe(self, operations):
+        # Sections already deduped and untouched by this batch can't hold new
+        # duplicates; only the rest are rescanned. Stats are always recomputed.
+        sections = _core_get(self.playbook, "sections", {})
+        touched = {op.get("section") for op in operations or [] if isinstance(op, dict)}
+        dirty = [name for name in sections if name in touched or name not in self._clean_sections]
+        self.playbook = _ace_dedupe_playbook_sections(self.playbook, dirty)
+        self._clean_sections = set(sections)
 
     def _generator_output(self, prediction, example):
         reasoning = ""
@@ -734,17 +889,23 @@ class AxACE:
             return program.forward(self.student_ai, example)
         return {}
 
+    def scheduled_render(self):
+        """The playbook render a pipelined worker was scheduled with, or
+        ``None`` outside a pipelined generator call. Generators that inject the
+        playbook into a shared program use it instead of the live playbook."""
+        return getattr(self._pipeline_stage, "rendered", None)
+
     def _run_metric(self, metric_fn, prediction, example):
         fn = metric_fn or self.metric_fn
         if fn is None:
             return 0
         return fn({"prediction": prediction, "example": example})
 
-    def _run_reflection_rounds(self, example, generator_output, feedback):
+    def _run_reflection_rounds(self, example, generator_output, feedback, rendered=None):
         rounds = max(int(self.config.get("maxReflectorRounds", 1) or 1), 1)
         previous = None
         for _ in range(rounds):
-            reflection = self._run_reflector(example, generator_output, feedback, previous)
+            reflection = self._run_reflector(example, generator_output, feedback, previous, rendered)
             if not reflection:
                 break
             reflection = dict(reflection)
@@ -757,26 +918,26 @@ class AxACE:
                 break
         return previous
 
-    def _run_reflector(self, example, generator_output, feedback, previous_reflection):
+    def _run_reflector(self, example, generator_output, feedback, previous_reflection, rendered=None):
         if self.reflector is None:
             return None
         payload = {
             "question": example,
             "generator_answer": generator_output.get("answer"),
             "generator_reasoning": generator_output.get("reasoning"),
-            "playbook": self._render_playbook(),
+            "playbook": self._render_playbook() if rendered is None else rendered,
             "feedback": feedback,
             "previous_reflection": previous_reflection,
         }
         return self.reflector(payload)
 
-    def _run_curator(self, example, reflection):
+    def _run_curator(self, example, reflection, rendered=None):
         if reflection is None:
             return None
         if self.curator is None:
             return None
         payload = {
-            "playbook": self._render_playbook(),
+            "playbook": self._render_playbook() if rendered is None else rendered,
             "reflection": reflection,
             "question_context": example,
             "token_budget": 1024,
@@ -792,9 +953,27 @@ class AxACE:
 
     def _process_example(self, program, example, score, source, epoch, index):
         prediction = self._last_prediction
+        generator_output, reflection, raw_curator = self._reflect_and_curate(example, prediction, score)
+        return self._apply_example(example, prediction, score, generator_output, reflection, raw_curator, source, epoch, index)
+
+    def _reflect_and_curate(self, example, prediction, score, rendered=None):
         generator_output = self._generator_output(prediction, example)
-        reflection = self._run_reflection_rounds(example, generator_output, self._metric_feedback(score))
-        raw_curator = self._run_curator(example, reflection)
+        reflection = self._run_reflection_rounds(example, generator_output, self._metric_feedback(score), rendered)
+        raw_curator = self._run_curator(example, reflection, rendered)
+        return generator_output, reflection, raw_curator
+
+    def _run_example_stages(self, program, example, metric_fn, rendered):
+        # Everything but the playbook apply; pipelined compile runs this on a
+        # worker against the playbook rendered when the example was scheduled.
+        self._pipeline_stage.rendered = rendered
+        try:
+            prediction = self._run_generator(program, example)
+        finally:
+            self._pipeline_stage.rendered = None
+        score = self._run_metric(metric_fn, prediction, example)
+        return (prediction, score) + self._reflect_and_curate(example, prediction, score, rendered)
+
+    def _apply_example(self, example, prediction, score, generator_output, reflection, raw_curator, source, epoch, index):
         operations = _ace_normalize_curator_operations(
             raw_curator.get("operations") if isinstance(raw_curator, dict) else None
         )
@@ -829,7 +1008,7 @@ class AxACE:
                 tag = tag if isinstance(tag, dict) else {}
                 self.playbook = _ace_update_bullet_feedback(self.playbook, tag.get("id"), tag.get("tag"), self._now())
         if resolved and applied_ids:
-            self.playbook = _ace_dedupe_playbook(self.playbook)
+            self._dedupe(resolved)
         feedback_event = {
             "example": example,
             "prediction": prediction,
@@ -873,23 +1052,59 @@ class AxACE:
                 self.base_instruction = None
         examples = list(examples or [])
         epochs = max(int(self.config.get("maxEpochs", 1) or 1), 1)
+        window = _gepa_int(_ace_option(
+            ace_options if isinstance(ace_options, dict) else {},
+            "pipelineWindow",
+            "pipeline_window",
+            default=_ace_option(self.options, "pipelineWindow", "pipeline_window", default=1),
+        ), 1, 1)
         best_score = None
-        for epoch in range(epochs):
-            for index, example in enumerate(examples):
-                prediction = self._run_generator(program, example)
-                self._last_prediction = prediction
-                score = self._run_metric(metric_fn, prediction, example)
-                if isinstance(score, (int, float)):
-                    best_score = score if best_score is None else max(best_score, score)
-                self._process_example(program, example, score, "compile", epoch, index)
+        if window > 1:
+            best_score = self._compile_pipelined(program, examples, metric_fn, epochs, window)
+        else:
+            for epoch in range(epochs):
+                for index, example in enumerate(examples):
+                    prediction = self._run_generator(program, example)
+                    self._last_prediction = prediction
+                    score = self._run_metric(metric_fn, prediction, example)
+                    if isinstance(score, (int, float)):
+                        best_score = score if best_score is None else max(best_score, score)
+                    self._process_example(program, example, score, "compile", epoch, index)
         artifact = self._create_artifact()
         return {
-            "playbook": _ace_clone(self.playbook),
+            "playbook": self.get_playbook(),
             "artifact": artifact,
             "bestScore": best_score if isinstance(best_score, (int, float)) else 0,
             "finalConfiguration": {"strategy": "ace", "epochs": epochs},
         }
 
+    def _compile_pipelined(self, program, examples, metric_fn, epochs, window):
+        """Run up to ``window`` examples' generate/metric/reflect/curate stages
+        concurrently and apply their curator operations one at a time, in
+        example order. Each example sees the playbook as rendered when it was
+        scheduled, which trails the live playbook by at most ``window - 1``
+        applied examples."""
+        slots = [(epoch, index, example) for epoch in range(epochs) for index, example in enumerate(examples)]
+        best_score = None
+        pending = []
+        cursor = 0
+        executor = ThreadPoolExecutor(max_workers=window, thread_name_prefix="axace-pipeline")
+        try:
+            while cursor < len(slots) or pending:
+                while cursor < len(slots) and len(pending) < window:
+                    slot = slots[cursor]
+                    pending.append((slot, executor.submit(self._run_example_stages, program, slot[2], metric_fn, self._render_playbook())))
+                    cursor += 1
+                (epoch, index, example), future = pending.pop(0)
+                prediction, score, generator_output, reflection, raw_curator = future.result()
+                self._last_prediction = prediction
+                if isinstance(score, (int, float)):
+                    best_score = score if best_score is None else max(best_score, score)
+                self._apply_example(example, prediction, score, generator_output, reflection, raw_curator, "compile", epoch, index)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        return best_score
+
     def apply_online_update(self, args):
         args = dict(args or {})
         if self.program is None and self.generator is None:
@@ -933,7 +1148,7 @@ class AxACE:
                 resolved = list(resolved) + list(auto_removed)
                 if curator_result is not None:
                     curator_result["operations"] = resolved
-            self.playbook = _ace_dedupe_playbook(self.playbook)
+            self._dedupe(resolved)
         feedback_event = {
             "example": example,
             "prediction": prediction,
@@ -1056,13 +1271,42 @@ class AxPlaybook:
             self.base_instruction = program.signature.get_description()
         self.started = False
         self._apply_hook = None
+        self._generator_lock = threading.Lock()
 
     # The real LLM generator: run the bound program with the student client.
     def _run_generator(self, example):
         if self.program is None or not hasattr(self.program, "forward"):
             return {}
-        self._inject()
-        return self.program.forward(self.student_ai, example)
+        rendered = self.engine.scheduled_render()
+        if rendered is None:
+            self._inject()
+            return self.program.forward(self.student_ai, example)
+        # Pipelined workers must not write the shared program's instruction.
+        # AxGen-style programs run on a private copy that carries the render
+        # the example was scheduled with; anything else (or a stage apply hook)
+        # injects and runs one example at a time.
+        view = self._program_view(rendered) if self._apply_hook is None else None
+        if view is not None:
+            return view.forward(self.student_ai, example)
+        with self._generator_lock:
+            self._inject(rendered)
+            return self.program.forward(self.student_ai, example)
+
+    def _program_view(self, rendered):
+        program = self.program
+        signature = getattr(program, "signature", None)
+        template = getattr(program, "prompt_template", None)
+        if signature is None or getattr(template, "signature", None) is not signature:
+            return None
+        base = self.base_instruction
+        if base is None and hasattr(signature, "get_description"):
+            base = signature.get_description()
+        view = copy.copy(program)
+        view.signature = copy.copy(signature)
+        view.signature.description = _playbook_compose_instruction(base, rendered)
+        view.prompt_template = copy.copy(template)
+        view.prompt_template.signature = view.signature
+        return view
 
     def _get_reflector_program(self):
         if self._reflector_program is None:
@@ -1125,6 +1369,8 @@ class AxPlaybook:
         ace_options = {}
         if _playbook_option(opts, "maxEpochs", "max_epochs") is not None:
             ace_options["maxEpochs"] = _playbook_option(opts, "maxEpochs", "max_epochs")
+        if _playbook_option(opts, "pipelineWindow", "pipeline_window") is not None:
+            ace_options["pipelineWindow"] = _playbook_option(opts, "pipelineWindow", "pipeline_window")
         result = self.engine.compile(self.program, list(examples or []), metric_fn, {"aceOptions": ace_options})
         self.started = True
         self._inject()
@@ -1153,7 +1399,7 @@ class AxPlaybook:
         self._inject()
 
     def render(self):
-        return _ace_render_playbook(self.engine.get_playbook())
+        return self.engine._render_playbook()
 
     def get_state(self):
         return {"playbook": self.engine.get_playbook(), "artifact": self.engine.get_artifact()}
@@ -1183,8 +1429,8 @@ class AxPlaybook:
     def _set_apply_hook(self, hook):
         self._apply_hook = hook
 
-    def _inject(self):
-        rendered = self.render()
+    def _inject(self, rendered=None):
+        rendered = self.render() if rendered is None else rendered
         if self._apply_hook is not None:
             self._apply_hook(rendered)
             return
@@ -1311,48 +1557,96 @@ class AxAgentPlaybook:
             opts.get("max_metric_calls", max(100, (max_proposals + 1) * dataset_size)),
         )))
         remaining = [max_metric_calls]
-
-        def progress(phase, message):
+        # Runs are reserved in task/repeat order on the calling thread, so the
+        # budget covers exactly the runs a sequential evolve would make.
+        concurrency = max(1, int(_playbook_option(opts, "concurrency", default=1)))
+        budget_lock = threading.Lock()
+        in_flight = [0]
+        race = _race_options(opts)
+        saved = [0]
+
+        def progress(phase, message, **extra):
             callback = opts.get("onProgress") or opts.get("on_progress")
-            event = {"phase": phase, "message": message, "metricCallsUsed": max_metric_calls - remaining[0]}
+            event = {"phase": phase, "message": message, "metricCallsUsed": max_metric_calls - remaining[0], "inFlight": in_flight[0], **extra}
             if callable(callback):
                 callback(event)
             if opts.get("verbose"):
                 print(f"[playbook.evolve] {phase}: {message}")
 
+        def reserve():
+            with budget_lock:
+                if remaining[0] <= 0:
+                    return False
+                remaining[0] -= 1
+                return True
+
+        def evaluate(task):
+            prediction = None
+            try:
+                prediction = self.agent.evaluate_optimization_task(client, task, opts)
+                if callable(metric):
+                    score = float(metric({"example": task, "task": task, "prediction": prediction}))
+                else:
+                    _, score = _score_optimization_prediction(task, prediction, opts)
+            except Exception as exc:
+                return prediction, 0.0, str(exc)
+            return prediction, score if math.isfinite(score) else 0.0, None
+
         def run(tasks):
-            records = []
+            tasks = [task if isinstance(task, dict) else {"input": task} for task in tasks]
+            slots = [(index, repeat) for index in range(len(tasks)) for repeat in range(runs_per_task)]
+            outcomes = [{} for _ in tasks]
             exhausted = False
+            cursor = 0
+            completed = 0
+            pending = {}
+            executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="axagent-evolve") if concurrency > 1 else None
+            try:
+                while True:
+                    while not exhausted and cursor < len(slots) and len(pending) < concurrency:
+                        if not reserve():
+                            exhausted = True
+                            break
+                        index, repeat = slots[cursor]
+                        cursor += 1
+                        if executor is None:
+                            outcomes[index][repeat] = evaluate(tasks[index])
+                            completed += 1
+                            progress("evaluate", f"{completed}/{len(slots)} runs", completed=completed, total=len(slots))
+                        else:
+                            pending[executor.submit(evaluate, tasks[index])] = (index, repeat)
+                            in_flight[0] = len(pending)
+                    if not pending:
+                        break
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index, repeat = pending.pop(future)
+                        outcomes[index][repeat] = future.result()
+                        completed += 1
+                    in_flight[0] = len(pending)
+                    progress("evaluate", f"{completed}/{len(slots)} runs", completed=completed, total=len(slots))
+            finally:
+                in_flight[0] = 0
+                if executor is not None:
+                    executor.shutdown(wait=True, cancel_futures=True)
+            records = []
             for index, task in enumerate(tasks):
-                task = task if isinstance(task, dict) else {"input": task}
-                scores = []
+                runs = [outcomes[index][repeat] for repeat in sorted(outcomes[index])]
+                if not runs:
+                    break
                 prediction = None
                 error = None
-                for _ in range(runs_per_task):
-                    if remaining[0] <= 0:
-                        exhausted = True
-                        break
-                    remaining[0] -= 1
-                    try:
-                        prediction = self.agent.evaluate_optimization_task(client, task, opts)
-                        if callable(metric):
-                            score = float(metric({"example": task, "task": task, "prediction": prediction}))
-                        else:
-                            _, score = _score_optimization_prediction(task, prediction, opts)
-                    except Exception as exc:
-                        score = 0.0
-                        error = str(exc)
-                    scores.append(score if math.isfinite(score) else 0.0)
-                if not scores:
-                    break
-                score = sum(scores) / len(scores)
+                for run_prediction, _, run_error in runs:
+                    prediction = run_prediction if run_prediction is not None else prediction
+                    error = run_error or error
+                score = sum(item[1] for item in runs) / len(runs)
                 record = {"task": task, "score": score, "index": index, "passed": score >= score_threshold and (prediction or {}).get("completionType") == "final"}
                 if prediction is not None:
                     record["prediction"] = prediction
                 elif error:
                     record["error"] = error
                 records.append(record)
-                if len(scores) < runs_per_task:
+                if len(runs) < runs_per_task:
                     exhausted = True
                     break
             weight_sum = sum(float(record["task"].get("weight", 1)) for record in records)
@@ -1463,8 +1757,37 @@ class AxAgentPlaybook:
                 "configRecommendations": [str(value) for value in recommendations],
             }
 
+        def task_scores(records, count):
+            scores = [None] * count
+            for record in records:
+                scores[record["index"]] = record["score"]
+            return None if None in scores else scores
+
+        def race_train(proposal_index):
+            # Score the proposal on growing, shuffled slices of train and stop
+            # once its paired gain over the incumbent provably misses min_gain.
+            tasks = [task if isinstance(task, dict) else {"input": task} for task in train]
+            weights = [float(task.get("weight", 1)) for task in tasks]
+            by_index = {}
+
+            def evaluate_chunk(indices):
+                chunk_records, _, chunk_exhausted = run([tasks[index] for index in indices])
+                for index, record in zip(indices, chunk_records):
+                    by_index[index] = {**record, "index": index}
+                if chunk_exhausted:
+                    return None
+                return [record["score"] for record in chunk_records]
+
+            raced = _race_challenger(evaluate_chunk, incumbent, weights, min_gain, race, proposal_index)
+            saved[0] += raced["saved"] * runs_per_task
+            records = [by_index[index] for index in sorted(by_index)]
+            weight_sum = sum(weights[record["index"]] for record in records)
+            mean = sum(weights[record["index"]] * record["score"] for record in records) / weight_sum if weight_sum else 0.0
+            return records, mean, not raced["complete"], raced
+
         progress("baseline", f"evaluating {len(train)} train tasks")
         baseline_records, held_in, _ = run(train)
+        incumbent = task_scores(baseline_records, len(train))
         if validation:
             progress("baseline", f"evaluating {len(validation)} validation tasks")
             _, held_out, _ = run(validation)
@@ -1531,24 +1854,37 @@ class AxAgentPlaybook:
             if not verify:
                 outcomes.append({"proposal": proposal, "accepted": True, "reason": "applied without verification (verify: false)", "heldIn": {"before": held_in, "after": held_in}})
                 continue
-            _, next_in, train_exhausted = run(train)
-            if validation:
+            raced = None
+            if race is not None and incumbent is not None and len(train) > 1:
+                train_records, next_in, train_exhausted, raced = race_train(proposal_index)
+            else:
+                train_records, next_in, train_exhausted = run(train)
+            dropped = raced is not None and raced["dropped"]
+            if validation and not dropped:
                 _, next_out, validation_exhausted = run(validation)
             else:
                 next_out, validation_exhausted = None, False
             complete = not train_exhausted and not validation_exhausted
-            gain_ok = complete and next_in - held_in >= min_gain
+            gain_ok = complete and not dropped and next_in - held_in >= min_gain
             held_out_ok = next_out is None or held_out is None or next_out - held_out >= -epsilon
             accepted = complete and gain_ok and held_out_ok
+            if dropped:
+                reason = f"dropped by racing after {raced['evaluated']}/{len(train)} train tasks: held-in gain can't reach {min_gain}"
+            elif not complete:
+                reason = "metric_budget exhausted during re-evaluation"
+            else:
+                reason = "held-in improved, held-out non-regressing" if accepted and held_out is not None else ("held-in improved (no held-out set provided — consider one)" if accepted else (f"held-in gain {next_in - held_in:.3f} below {min_gain}" if not gain_ok else f"held-out regressed {(next_out or 0) - (held_out or 0):.3f}"))
             outcomes.append({
                 "proposal": proposal,
                 "accepted": accepted,
-                "reason": "metric_budget exhausted during re-evaluation" if not complete else ("held-in improved, held-out non-regressing" if accepted and held_out is not None else ("held-in improved (no held-out set provided — consider one)" if accepted else (f"held-in gain {next_in - held_in:.3f} below {min_gain}" if not gain_ok else f"held-out regressed {(next_out or 0) - (held_out or 0):.3f}"))),
+                "reason": reason,
                 "heldIn": {"before": held_in, "after": next_in},
                 **({"heldOut": {"before": held_out, "after": next_out}} if next_out is not None and held_out is not None else {}),
+                **({"racing": {"evaluated": raced["evaluated"], "total": len(train), "dropped": dropped}} if raced is not None else {}),
             })
             if accepted:
                 held_in, held_out = next_in, next_out
+                incumbent = task_scores(train_records, len(train))
             else:
                 self.inner.load(before)
         snapshot = self.inner.get_state() if any(item.get("accepted") for item in outcomes) else None
@@ -1568,6 +1904,7 @@ class AxAgentPlaybook:
             ],
             **({"playbookSnapshot": snapshot} if snapshot is not None else {}),
             "metricCallsUsed": max_metric_calls - remaining[0],
+            **({"metricCallsSaved": saved[0]} if race is not None else {}),
             "records": baseline_records,
         }
 
@@ -1583,6 +1920,9 @@ class AxAgent:
         self._playbook_handle = None
         self._agent_playbook = None
         self._playbook_config = self.options.get("playbook")
+        self._run_lock = threading.Lock()
+        self._last_stages = None
+        self.last_run_context: AxRunContext | None = None
         self._rebuild_from_signature(signature)
         if self._playbook_config not in (None, False):
             self._attach_configured_playbook()
@@ -1616,7 +1956,7 @@ class AxAgent:
         return self
 
     def forward(self, client, values: dict[str, Any], options: dict[str, Any] | None = None):
-        options = dict(options or {})
+        run, options = _core_program_begin_run(self, options)
         call_context = resolve_execution_context(options, self.execution_context)
         if call_context:
             options["executionContext"] = call_context
@@ -1629,25 +1969,37 @@ class AxAgent:
         # this wrapper only registers the host callable that closes over this client.
         if runtime is not None and hasattr(runtime, "register_callable"):
             runtime.register_callable("llmQuery", lambda params: _agent_run_llm_query(self.llm_query, client, params))
-        output = _agent_forward(
-            self.state,
-            self.distiller,
-            self.executor,
-            self.responder,
-            client,
-            values or {},
-            options,
-        )
+        # The run works on a private copy of the state and per-run stage views,
+        # so concurrent forwards on one agent don't interleave their logs.
+        state = _core_agent_run_state(self.state)
+        stages = tuple(_core_program_bind_run(stage, AxRunContext()) for stage in (self.distiller, self.executor, self.responder))
+        try:
+            output = _agent_forward(state, *stages, client, values or {}, options)
+        except BaseException as exc:
+            self._publish_run(run, state, stages, error=exc)
+            raise
+        self._publish_run(run, state, stages, output)
         citations = self.options.get("citations")
         citation_callback = citations.get("onCitations") or citations.get("on_citations") if isinstance(citations, dict) else None
         if callable(citation_callback):
             try:
-                citation_callback(list(_core_get(self.state, "last_citations", []) or []))
+                citation_callback(list(_core_get(state, "last_citations", []) or []))
             except Exception:
                 pass
-        self._learn_playbook_failures(output)
+        self._learn_playbook_failures(output, state)
         return output
 
+    def _publish_run(self, run, state, stages, output=None, error=None):
+        _merge_agent_chat_log(state, *stages)
+        _merge_agent_usage(state, *stages)
+        run.chat_log = list(_core_get(state, "chat_log", []) or [])
+        run.usage = dict(_core_get(state, "usage", {}) or {})
+        run.traces = [_agent_export_trace(state)]
+        with self._run_lock:
+            self.state.update(state)
+            self._last_stages = stages
+            _core_program_end_run(self, run, output, error)
+
     def test(self, runtime: AxCodeRuntime, code: str, context_field_values: dict[str, Any] | None = None, options: dict[str, Any] | None = None):
         return _agent_runtime_test(
             self.state,
@@ -1681,8 +2033,12 @@ class AxAgent:
         return _agent_set_state(self.state, state or {})
 
     def _refresh_observability(self):
-        _merge_agent_chat_log(self.state, self.distiller, self.executor, self.responder)
-        _merge_agent_usage(self.state, self.distiller, self.executor, self.responder)
+        stages = self._last_stages or (self.distiller, self.executor, self.responder)
+        _merge_agent_chat_log(self.state, *stages)
+        _merge_agent_usage(self.state, *stages)
+
+    def get_run_context(self):
+        return self.last_run_context
 
     def get_chat_log(self):
         self._refresh_observability()
@@ -1772,32 +2128,47 @@ class AxAgent:
 
     def evaluate_optimization_task(self, client, task: dict[str, Any], options: dict[str, Any] | None = None):
         opts = options or {}
+        # Read the logs back from this call's run context, not the shared
+        # agent state, so concurrent evaluations don't see each other's runs.
+        run = AxRunContext()
+        forward_options = dict(opts.get("forward_options") or {})
+        forward_options["runContext"] = run
         try:
-            output = self.forward(client, task.get("input") or task, opts.get("forward_options") or {})
-            return _build_agent_eval_prediction(output, self.get_action_log(), self.get_usage(), self.export_trace())
+            output = self.forward(client, task.get("input") or task, forward_options)
+            trace, usage = self._run_observability(run)
+            return _build_agent_eval_prediction(output, list(_core_get(trace, "action_log", []) or []), usage, trace)
         except AxAgentClarificationError as exc:
+            trace, usage = self._run_observability(run)
             return {
                 "completionType": "askClarification",
                 "clarification": exc.clarification,
-                "actionLog": self.get_action_log(),
-                "functionCalls": _core_get(self.state, "function_call_traces", []) or [],
+                "actionLog": list(_core_get(trace, "action_log", []) or []),
+                "functionCalls": list(_core_get(trace, "function_call_traces", []) or []),
                 "toolErrors": [],
                 "turnCount": 0,
-                "usage": self.get_usage(),
-                "trace": self.export_trace(),
+                "usage": usage,
+                "trace": trace,
             }
         except Exception as exc:
+            trace, usage = self._run_observability(run)
             return {
                 "completionType": "error",
                 "error": {"message": str(exc)},
-                "actionLog": self.get_action_log(),
-                "functionCalls": _core_get(self.state, "function_call_traces", []) or [],
+                "actionLog": list(_core_get(trace, "action_log", []) or []),
+                "functionCalls": list(_core_get(trace, "function_call_traces", []) or []),
                 "toolErrors": [str(exc)],
                 "turnCount": 0,
-                "usage": self.get_usage(),
-                "trace": self.export_trace(),
+                "usage": usage,
+                "trace": trace,
             }
 
+    def _run_observability(self, run):
+        # A forward that failed before its run was published falls back to
+        # the agent's last trace, as evaluations did before run contexts.
+        if run.traces:
+            return run.traces[-1], run.get_usage()
+        return self.export_trace(), self.get_usage()
+
     def evaluate_optimization(self, client, dataset, candidate_map: dict[str, Any] | None = None, options: dict[str, Any] | None = None):
         opts = options or {}
         normalized = _normalize_optimization_dataset(dataset or [])
@@ -1871,7 +2242,7 @@ class AxAgent:
             elif isinstance(seed, dict):
                 self._playbook_handle.load({"playbook": seed})
 
-    def _learn_playbook_failures(self, output):
+    def _learn_playbook_failures(self, output, state=None):
         if self._playbook_handle is None or self._playbook_config in (None, False):
             return
         config = dict(self._playbook_config) if isinstance(self._playbook_config, dict) else {}
@@ -1880,7 +2251,7 @@ class AxAgent:
             return
         learn_config = dict(learn) if isinstance(learn, dict) else {}
         try:
-            signals = list(_core_get(self.state, "failure_signals", []) or [])
+            signals = list(_core_get(state if state is not None else self.state, "failure_signals", []) or [])
             if len(signals) < int(learn_config.get("minSignals", learn_config.get("min_signals", 1))):
                 return
             covered = set(_agent_collect_covered_failure_signatures(self._playbook_handle.get_state()))
@@ -2061,6 +2432,17 @@ def _core_json_parse(value):
     return json.loads(value)
 
 
+_CORE_FROZEN_CACHE: dict[str, Any] = {}
+
+
+def _core_frozen_cached(key, build):
+    """Build a registry once per process and share it as a read-only structure."""
+    value = _CORE_FROZEN_CACHE.get(key)
+    if value is None:
+        value = _CORE_FROZEN_CACHE.setdefault(key, _core_freeze(build()))
+    return value
+
+
 def _core_string_format(template, *args):
     return str(template).format(*args)
 
@@ -2156,20 +2538,38 @@ def _core_agent_stage_forward(stage, client, values, options):
     return stage.forward(client, values or {}, options or {})
 
 
-def _core_agent_stage_chat_log(stage):
+def _core_agent_stage_run(stage, run=None):
+    """The run context holding this call's entries for ``stage``: its bound run
+    for per-run stage views, or ``run`` once the stage has recorded into it.
+    Programs that ignore run contexts fall back to their getters."""
+    bound = getattr(stage, "_bound_run", None)
+    if isinstance(bound, AxRunContext):
+        return bound
+    if isinstance(run, AxRunContext) and run.status != "pending":
+        return run
+    return None
+
+
+def _core_agent_stage_chat_log(stage, run=None):
+    ctx = _core_agent_stage_run(stage, run)
+    if ctx is not None:
+        return list(ctx.chat_log)
     if hasattr(stage, "get_chat_log"):
         return stage.get_chat_log()
     return []
 
 
-def _core_agent_stage_usage(stage):
-    if hasattr(stage, "get_usage"):
+def _core_agent_stage_usage(stage, run=None):
+    ctx = _core_agent_stage_run(stage, run)
+    if ctx is not None and ctx.usage:
+        return copy.copy(ctx.usage)
+    if ctx is None and hasattr(stage, "get_usage"):
         usage = stage.get_usage()
         if usage:
             return usage
-    if hasattr(stage, "get_chat_log"):
+    if ctx is not None or hasattr(stage, "get_chat_log"):
         items = []
-        for entry in stage.get_chat_log() or []:
+        for entry in _core_agent_stage_chat_log(stage, run) or []:
             usage = _core_get(entry, "usage")
             if usage:
                 items.append(usage)
@@ -2177,12 +2577,21 @@ def _core_agent_stage_usage(stage):
     return []
 
 
-def _core_agent_stage_traces(stage):
+def _core_agent_stage_traces(stage, run=None):
+    ctx = _core_agent_stage_run(stage, run)
+    if ctx is not None:
+        return list(ctx.traces)
     if hasattr(stage, "get_traces"):
         return stage.get_traces()
     return []
 
 
+def _core_agent_run_state(state):
+    """Per-run copy of the agent state: top-level maps and lists are copied one
+    level deep so a forward's in-place updates stay private until published."""
+    return {key: (value.copy() if type(value) in (dict, list) else value) for key, value in state.items()}
+
+
 def _core_agent_clarification_error(payload, state):
     args = _core_get(payload, "args", []) or []
     clarification = args[0] if args else payload
@@ -2336,4 +2745,530 @@ def _core_agent_callable_invoke(state, request, options):
     return {"status": "error", "error": f"unknown callable: {qualified}"}
 
 
+_AGENT_RELEVANCE_STOPWORDS = frozenset((
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have", "how", "i", "in", "into",
+    "is", "it", "of", "on", "or", "our", "please", "show", "that", "the", "their", "this", "to", "use", "with", "you",
+))
+_AGENT_RELEVANCE_PUNCTUATION = re.compile("[-!\"#$%&'()*+,./:;<=>?@\\[\\]^_`{|}~]")
+_AGENT_RELEVANCE_NUMERIC = re.compile("^[0-9]+$")
+_AGENT_RELEVANCE_INDEX_SCHEMA = "axllm-relevance-index-v3"
+_AGENT_RELEVANCE_INDEXES_BY_CATALOG: "weakref.WeakValueDictionary[tuple[int, str], _AgentRelevanceIndex]" = weakref.WeakValueDictionary()
+
+
+class _AgentRelevanceIndex:
+    """Inverted index over one relevance catalog (modules, skills, or memories).
+
+    The agent keeps one index per catalog kind on its state. ``sync`` compares
+    the catalog's item identities with the last sync and applies the difference
+    as deltas: only added items are tokenized and only removed items leave the
+    postings, so an unchanged catalog costs one identity comparison. Items are
+    treated as immutable; replace an entry rather than editing it in place.
+    ``rank`` only touches the postings of the query terms and selects the top
+    entries with a heap. Scores match the portable ``_agent_rank_documents``
+    contract.
+
+    With ``path`` set, term frequencies are also kept in an append-only JSONL
+    file keyed by a digest of each document. A sync appends only the entries it
+    tokenized, and the file is rewritten with the live entries once stale ones
+    dominate, so the next process starts warm.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self.catalog: Any = None
+        self.revision: list[int] = []
+        self._keys: list[tuple[int, int]] = []
+        self._slot_of: dict[tuple[int, int], int] = {}
+        self._ids: list[str | None] = []
+        self._tfs: list[dict[str, Any] | None] = []
+        self._digests: list[str | None] = []
+        self._sources: list[Any] = []
+        self._positions: list[int] = []
+        self._free: list[int] = []
+        self._slots_by_id: dict[str, list[int]] = {}
+        self._postings: dict[str, dict[int, Any]] = {}
+        self._stored: dict[str, dict[str, Any]] = {}
+        self._stored_lines = 0
+        self._file_valid = False
+        self._lock = threading.Lock()
+        if path:
+            self._load()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def sync(self, catalog: Any, build_doc: Callable[[Any], Any]) -> bool:
+        """Apply the catalog changes since the last sync; returns True when any item changed."""
+        items = list(catalog or [])
+        revision = list(map(id, items))
+        with self._lock:
+            self.catalog = catalog
+            if revision == self.revision:
+                return False
+            # Key items by identity and occurrence so a repeated entry still counts once per copy.
+            seen: dict[int, int] = {}
+            keys = []
+            for item_id in revision:
+                occurrence = seen.get(item_id, 0)
+                seen[item_id] = occurrence + 1
+                keys.append((item_id, occurrence))
+            live = set(keys)
+            for key in self._keys:
+                if key not in live:
+                    self._remove(self._slot_of.pop(key))
+            tokenized: list[tuple[str, dict[str, Any]]] = []
+            for position, (key, item) in enumerate(zip(keys, items)):
+                slot = self._slot_of.get(key)
+                if slot is None:
+                    slot = self._slot_of[key] = self._add(build_doc(item), item, tokenized)
+                self._positions[slot] = position
+            self._keys = keys
+            self.revision = revision
+            if tokenized:
+                self._persist(tokenized)
+        return True
+
+    def sources(self, doc_id: Any) -> list[Any]:
+        """Catalog items whose document has ``doc_id``, in catalog order."""
+        slots = sorted(self._slots_by_id.get(str(doc_id), ()), key=self._positions.__getitem__)
+        return [self._sources[slot] for slot in slots]
+
+    def _add(self, doc: Any, source: Any, tokenized: list[tuple[str, dict[str, Any]]]) -> int:
+        doc_id = str(_core_get(doc, "id", ""))
+        fields = _core_get(doc, "fields", []) or []
+        digest = None
+        tf = None
+        if self.path:
+            payload = json.dumps(fields, sort_keys=True, separators=(",", ":"), default=str)
+            digest = hashlib.sha1(f"{doc_id}\n{payload}".encode("utf-8")).hexdigest()
+            tf = self._stored.get(digest)
+        if tf is None:
+            tf = _agent_document_term_frequency(fields)
+            if digest is not None:
+                self._stored[digest] = tf
+                tokenized.append((digest, tf))
+        if self._free:
+            slot = self._free.pop()
+        else:
+            slot = len(self._ids)
+            for values in (self._ids, self._tfs, self._digests, self._sources):
+                values.append(None)
+            self._positions.append(0)
+        self._ids[slot], self._tfs[slot], self._digests[slot], self._sources[slot] = doc_id, tf, digest, source
+        self._slots_by_id.setdefault(doc_id, []).append(slot)
+        for term, frequency in tf.items():
+            self._postings.setdefault(term, {})[slot] = frequency
+        return slot
+
+    def _remove(self, slot: int) -> None:
+        for term in self._tfs[slot] or ():
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(slot, None)
+                if not postings:
+                    del self._postings[term]
+        doc_id = self._ids[slot]
+        slots = self._slots_by_id.get(doc_id)
+        if slots is not None:
+            slots.remove(slot)
+            if not slots:
+                del self._slots_by_id[doc_id]
+        self._ids[slot], self._tfs[slot], self._digests[slot], self._sources[slot] = None, None, None, None
+        self._free.append(slot)
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                lines = handle.read().splitlines()
+        except OSError:
+            return
+        try:
+            header = json.loads(lines[0]) if lines else None
+        except ValueError:
+            header = None
+        if not isinstance(header, dict) or header.get("schema") != _AGENT_RELEVANCE_INDEX_SCHEMA:
+            return
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict) and isinstance(entry.get("tf"), dict):
+                self._stored[str(entry.get("digest", ""))] = entry["tf"]
+        self._stored_lines = len(lines) - 1
+        self._file_valid = True
+
+    def _persist(self, tokenized: list[tuple[str, dict[str, Any]]]) -> None:
+        live = {self._digests[slot] for slot in self._slot_of.values()}
+        try:
+            if self._file_valid and self._stored_lines + len(tokenized) <= 2 * len(live) + 64:
+                with open(self.path, "a", encoding="utf-8") as handle:
+                    for digest, tf in tokenized:
+                        handle.write(json.dumps({"digest": digest, "tf": tf}, separators=(",", ":")) + "\n")
+                self._stored_lines += len(tokenized)
+                return
+            self._stored = {digest: tf for digest, tf in self._stored.items() if digest in live}
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            temp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as handle:
+                handle.write(json.dumps({"schema": _AGENT_RELEVANCE_INDEX_SCHEMA}) + "\n")
+                for digest, tf in self._stored.items():
+                    handle.write(json.dumps({"digest": digest, "tf": tf}, separators=(",", ":")) + "\n")
+            os.replace(temp_path, self.path)
+            self._stored_lines = len(self._stored)
+            self._file_valid = True
+        except OSError:
+            # Persistence only warms the next start; ranking never depends on it.
+            pass
+
+    def rank(self, query: str, options: Any, exclude: Any = None) -> list[dict[str, Any]]:
+        with self._lock:
+            return self._rank(query, options, exclude)
+
+    def _rank(self, query: str, options: Any, exclude: Any) -> list[dict[str, Any]]:
+        top_k = _core_get(options, "topK", 3)
+        min_score = _core_get(options, "minScore", 0.08)
+        margin_ratio = _core_get(options, "marginRatio", 0.15)
+        min_docs = _core_get(options, "minDocs", 2)
+        excluded: set[int] = set()
+        for excluded_id in exclude or ():
+            excluded.update(self._slots_by_id.get(str(excluded_id), ()))
+        doc_count = len(self._keys) - len(excluded)
+        if doc_count < min_docs:
+            return []
+        effective: list[str] = []
+        df: dict[str, int] = {}
+        for term in _agent_relevance_tokens(query):
+            if term in df:
+                continue
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            frequency = len(postings) - sum(1 for slot in excluded if slot in postings)
+            if frequency > 0:
+                df[term] = frequency
+                effective.append(term)
+        if not effective:
+            return []
+        raw: dict[int, float] = {}
+        coverage_weight: dict[int, float] = {}
+        matched: dict[int, list[str]] = {}
+        total_idf = 0
+        for term in effective:
+            weight = math.log(float(1 + float(doc_count) / float(df[term])))
+            total_idf += weight
+            for slot, frequency in self._postings[term].items():
+                if slot in excluded or not frequency > 0:
+                    continue
+                saturated = float(frequency) / float(frequency + 1 or 1)
+                raw[slot] = raw.get(slot, 0) + float(weight) * float(saturated)
+                coverage_weight[slot] = coverage_weight.get(slot, 0) + weight
+                matched.setdefault(slot, []).append(term)
+        best_by_id: dict[str, int] = {}
+        for slot in sorted(raw, key=self._positions.__getitem__):
+            if not raw[slot] > 0:
+                continue
+            doc_id = self._ids[slot]
+            current = best_by_id.get(doc_id)
+            if current is None or raw[slot] > raw[current]:
+                best_by_id[doc_id] = slot
+        if not best_by_id:
+            return []
+        limit = max(1, math.ceil(top_k)) if isinstance(top_k, (int, float)) and top_k > 0 else 1
+        selected = heapq.nsmallest(limit, best_by_id.items(), key=lambda entry: (-raw[entry[1]], entry[0]))
+        top_raw = raw[selected[0][1]]
+        top_coverage = float(coverage_weight[selected[0][1]] or 0) / float(total_idf or 1)
+        if top_coverage < min_score:
+            return []
+        if margin_ratio > 0 and doc_count >= 2:
+            near_top = sum(1 for slot in best_by_id.values() if (top_raw - raw[slot]) / top_raw < margin_ratio)
+            if near_top >= doc_count:
+                return []
+        out = []
+        for doc_id, slot in selected:
+            if not len(out) < top_k:
+                break
+            out.append({"id": doc_id, "score": raw[slot] / top_raw, "matchedTerms": matched[slot]})
+        return out
+
+
+def _agent_relevance_index(state: Any, kind: str, catalog: Any, build_doc: Callable[[Any], Any]) -> _AgentRelevanceIndex:
+    """Return the agent's index for one catalog kind, synced with ``catalog``.
+
+    Indexes live in ``state["relevance_indexes"]``. With
+    ``relevanceRanking.indexDir`` set, each kind persists to
+    ``<indexDir>/<kind>.jsonl``.
+    """
+    indexes = _core_get(state, "relevance_indexes", None)
+    if indexes is None:
+        indexes = state["relevance_indexes"] = {}
+    index = indexes.get(kind)
+    if index is None:
+        options = _core_get(state, "relevance_ranking_options", None)
+        index_dir = _core_get(options, "indexDir", _core_get(options, "index_dir", None))
+        index = indexes[kind] = _AgentRelevanceIndex(os.path.join(str(index_dir), f"{kind}.jsonl") if index_dir else None)
+    index.sync(catalog, build_doc)
+    _AGENT_RELEVANCE_INDEXES_BY_CATALOG[(id(catalog), kind)] = index
+    return index
+
+
+def _agent_catalog_relevance_index(kind: str, catalog: Any, build_doc: Callable[[Any], Any]) -> _AgentRelevanceIndex:
+    """The agent index already built for ``catalog``, or a one-off index when none exists."""
+    index = _AGENT_RELEVANCE_INDEXES_BY_CATALOG.get((id(catalog), kind))
+    if index is None or index.catalog is not catalog:
+        index = _AgentRelevanceIndex()
+    index.sync(catalog, build_doc)
+    return index
+
+
+def _agent_module_relevance_doc(group: Any) -> dict[str, Any]:
+    namespace = _core_get(group, "namespace", "")
+    fields: list[dict[str, Any]] = [{"text": namespace, "identifier": True}]
+    for key, weight in (("title", 1), ("description", 1), ("selection_criteria", 2)):
+        text = _core_get(group, key, "")
+        if _core_ne(text, ""):
+            fields.append({"text": text} if weight == 1 else {"text": text, "weight": weight})
+    for callable_meta in _core_get(group, "callables", []):
+        fields.append({"text": _core_get(callable_meta, "name", ""), "identifier": True})
+        properties = _core_get(_core_get(callable_meta, "parameters", None), "properties", None)
+        if _core_type_is(properties, "object"):
+            fields.extend({"text": prop_key, "identifier": True} for prop_key in _core_map_keys(properties))
+    return {"id": namespace, "fields": fields}
+
+
+def _agent_skill_relevance_doc(skill: Any) -> dict[str, Any]:
+    skill_id = _core_get(skill, "id", "")
+    fields: list[dict[str, Any]] = [
+        {"text": skill_id, "identifier": True},
+        {"text": _core_get(skill, "name", skill_id), "weight": 2},
+    ]
+    description = _core_get(skill, "description", "")
+    if _core_ne(description, ""):
+        fields.append({"text": description, "weight": 2})
+    fields.append({"text": _core_string_slice(_core_get(skill, "content", ""), 0, 600)})
+    return {"id": skill_id, "fields": fields}
+
+
+def _agent_memory_relevance_doc(memory: Any) -> dict[str, Any]:
+    memory_id = _core_get(memory, "id", "")
+    content_head = _core_string_slice(_core_get(memory, "content", ""), 0, 600)
+    return {"id": memory_id, "fields": [{"text": memory_id, "identifier": True}, {"text": content_head}]}
+
+
+def _agent_memory_snippet(memory: Any) -> str:
+    single_line = _core_regex_replace("\\s+", " ", _core_get(memory, "content", ""))
+    return _core_string_slice(str(single_line).strip(), 0, 80)
+
+
+def _core_agent_relevance_tokens(text: str) -> list[Any]:
+    """Host replacement for Core's ``_agent_relevance_tokens``: one precompiled pass per text."""
+    clean = _AGENT_RELEVANCE_PUNCTUATION.sub(" ", str(text).lower())
+    out = []
+    for part in clean.split(" "):
+        part = part.strip()
+        if len(part) > 1 and part not in _AGENT_RELEVANCE_STOPWORDS and _AGENT_RELEVANCE_NUMERIC.sub("", part) != "":
+            out.append(part)
+    return out
+
+
+def _core_agent_rank_relevance_modules(state: Any, task: str) -> Any:
+    """Host replacement for Core's ``_agent_rank_relevance_modules``, ranked on the agent's module index."""
+    split = _core_get(state, "callable_split", None)
+    index = _agent_relevance_index(state, "modules", _core_get(split, "discoverable", []), _agent_module_relevance_doc)
+    ranked = index.rank(task, _core_get(state, "relevance_ranking_options", None))
+    return [{"namespace": entry["id"], "score": entry["score"], "matchedTerms": entry["matchedTerms"]} for entry in ranked]
+
+
+def _core_agent_rank_relevance_skills(state: Any, task: str) -> Any:
+    """Host replacement for Core's ``_agent_rank_relevance_skills``, ranked on the agent's skill index."""
+    index = _agent_relevance_index(state, "skills", _core_get(state, "skills_catalog", []), _agent_skill_relevance_doc)
+    out = []
+    for entry in index.rank(task, _core_get(state, "relevance_ranking_options", None)):
+        skill = index.sources(entry["id"])[-1]
+        out.append({"id": entry["id"], "name": _core_get(skill, "name", entry["id"]), "score": entry["score"]})
+    return out
+
+
+def _core_agent_rank_relevance_memories(state: Any, task: str) -> Any:
+    """Host replacement for Core's ``_agent_rank_relevance_memories``.
+
+    Memories that are already loaded are excluded at rank time instead of being
+    dropped from the index, so loading one does not re-tokenize the catalog.
+    """
+    index = _agent_relevance_index(state, "memories", _core_get(state, "memories_catalog", []), _agent_memory_relevance_doc)
+    loaded = [_core_get(item, "id", "") for item in _core_get(state, "loaded_memories", [])]
+    out = []
+    for entry in index.rank(task, _core_get(state, "relevance_ranking_options", None), loaded):
+        memory = index.sources(entry["id"])[-1]
+        out.append({"id": entry["id"], "snippet": _agent_memory_snippet(memory), "score": entry["score"]})
+    return out
+
+
+def _core_agent_catalog_skill_search(catalog: Any, searches: Any) -> Any:
+    """Host replacement for Core's ``_agent_catalog_skill_search``, ranked on the catalog's skill index."""
+    index = _agent_catalog_relevance_index("skills", catalog, _agent_skill_relevance_doc)
+    options = {"topK": 2, "minScore": 0, "marginRatio": 0, "minDocs": 1}
+    matched_ids: dict[str, None] = {}
+    for search in searches:
+        for entry in index.rank(search, options):
+            matched_ids.setdefault(entry["id"], None)
+    out = []
+    for matched_id in matched_ids:
+        for skill in index.sources(matched_id):
+            skill_id = _core_get(skill, "id", "")
+            out.append({"id": skill_id, "name": _core_get(skill, "name", skill_id), "content": _core_get(skill, "content", "")})
+    return out
+
+
+def _core_agent_catalog_memory_search(catalog: Any, searches: Any, already_loaded: Any) -> Any:
+    """Host replacement for Core's ``_agent_catalog_memory_search``, ranked on the catalog's memory index."""
+    index = _agent_catalog_relevance_index("memories", catalog, _agent_memory_relevance_doc)
+    loaded = [_core_get(item, "id", "") for item in already_loaded]
+    options = {"topK": 3, "minScore": 0, "marginRatio": 0, "minDocs": 1}
+    matched_ids: dict[str, None] = {}
+    for search in searches:
+        for entry in index.rank(search, options, loaded):
+            matched_ids.setdefault(entry["id"], None)
+    return [memory for matched_id in matched_ids for memory in index.sources(matched_id)]
+
+
+def _core_agent_smart_stringify(value: Any, max_chars: Any) -> str:
+    """Host replacement for Core's ``_agent_smart_stringify``.
+
+    Large lists only serialize the head and tail items that are rendered.
+    """
+    context_registry = _agent_context_policy_registry()
+    settings = _core_get(context_registry, "smart_stringify", {})
+    array_threshold = _core_get(settings, "arrayThreshold", 10)
+    array_head_items = _core_get(settings, "arrayHeadItems", 3)
+    array_tail_items = _core_get(settings, "arrayTailItems", 2)
+    if _core_type_is(value, "list"):
+        count = _core_len(value)
+        if _core_gt(count, array_threshold):
+            tail_start = _core_add(count, _core_mul(-1, array_tail_items))
+            head_end = min(count, max(0, math.ceil(array_head_items)))
+            tail_begin = min(count, max(0, math.ceil(tail_start)))
+            head = [_core_json_stringify(item) for item in value[:head_end]]
+            tail = [_core_json_stringify(item) for item in value[tail_begin:]]
+            head_text = _core_string_join(",\n  ", head)
+            tail_text = _core_string_join(",\n  ", tail)
+            hidden = _core_add(count, -5)
+            return _core_string_format("[\n  {},\n  ... [{} hidden items],\n  {}\n]", head_text, hidden, tail_text)
+    return _core_json_pretty(value)
+
+
+def _context_map_rendered_length(item: Any, section_names: Any) -> int:
+    """Characters ``item`` adds to ``_context_map_render_items`` output, newline included."""
+    section = _core_get(item, "section", None)
+    if section not in section_names:
+        return 0
+    id = _core_get(item, "id", None)
+    content = _core_get(item, "content", None)
+    return len(_core_string_format("[{}] {}", id, content)) + 1
+
+
+def _core_context_map_evict_to_budget(items: Any, scores: Any, max_chars: Any) -> Any:
+    """Host replacement for Core's ``_context_map_evict_to_budget``.
+
+    Rendered lengths are tracked per item and candidates come off a min-heap of
+    ``(score, position)``, so the map is never re-rendered while evicting. Ties
+    go to the earliest item, and every item sharing an evicted id is removed.
+    """
+    current = list(items or [])
+    sections = _context_map_sections()
+    section_names = {_core_get(sec, "name", None) for sec in sections}
+    headers = [_core_string_format("## {}", _core_get(sec, "title", None)) for sec in sections]
+    total = sum(len(header) for header in headers) + max(len(headers) - 1, 0)
+    lengths_by_id: dict[Any, int] = {}
+    counts_by_id: dict[Any, int] = {}
+    heap = []
+    for position, item in enumerate(current):
+        iid = _core_get(item, "id", None)
+        item_length = _context_map_rendered_length(item, section_names)
+        total += item_length
+        lengths_by_id[iid] = lengths_by_id.get(iid, 0) + item_length
+        counts_by_id[iid] = counts_by_id.get(iid, 0) + 1
+        heap.append((_core_get(scores, iid, 0), position, iid))
+    heapq.heapify(heap)
+    remaining = len(current)
+    evicted = set()
+    while _core_gt(total, max_chars) and remaining > 0:
+        _, _, iid = heapq.heappop(heap)
+        if iid in evicted:
+            continue
+        evicted.add(iid)
+        total -= lengths_by_id[iid]
+        remaining -= counts_by_id[iid]
+    if not evicted:
+        return current
+    return [item for item in current if _core_get(item, "id", None) not in evicted]
+
+
+def _core_agent_policy_vocabulary_registry() -> Any:
+    """Host replacement for Core's ``_agent_policy_vocabulary_registry``, built once per process."""
+    return _core_frozen_cached("agent_policy_vocabulary", _core_agent_build_policy_vocabulary_registry)
+
+
+def _core_agent_reserved_runtime_names() -> list[Any]:
+    """Host replacement for Core's ``_agent_reserved_runtime_names``.
+
+    The vocabulary registry is shared read-only; callers extend the list they
+    get back, so hand out a copy.
+    """
+    return list(_core_agent_reserved_runtime_names_shared())
+
+
+_RLM_RENDERED_DESCRIPTIONS: dict[tuple[str, str, str], str] = {}
+_RLM_RENDERED_DESCRIPTIONS_MAX = 256
+
+
+def _core_rlm_render_template(template: str, vars: Any, context: str) -> str:
+    """Host replacement for Core's ``_rlm_render_template``, memoized per template and variables.
+
+    The variables already carry the policy flags and the rendered callable
+    inventory, so agents built from the same configuration share one render.
+    """
+    key = (context, template, json.dumps(vars, sort_keys=True, default=str))
+    cached = _RLM_RENDERED_DESCRIPTIONS.get(key)
+    if cached is not None:
+        return cached
+    trimmed = _core_rlm_render_template_uncached(template, vars, context)
+    if len(_RLM_RENDERED_DESCRIPTIONS) >= _RLM_RENDERED_DESCRIPTIONS_MAX:
+        _RLM_RENDERED_DESCRIPTIONS.pop(next(iter(_RLM_RENDERED_DESCRIPTIONS)), None)
+    _RLM_RENDERED_DESCRIPTIONS[key] = trimmed
+    return trimmed
+
+
 # AXIR_CORE_AGENT_FUNCTIONS
+
+
+# Python host replacements for Core functions. The portable definitions above
+# stay the reference; rebinding the module globals routes emitted callers here.
+# _CORE_PORTABLE keeps each replaced definition so conformance can run it.
+_CORE_PORTABLE = {
+    "_agent_policy_vocabulary_registry": _agent_policy_vocabulary_registry,
+    "_agent_reserved_runtime_names": _agent_reserved_runtime_names,
+    "_rlm_render_template": _rlm_render_template,
+    "_agent_relevance_tokens": _agent_relevance_tokens,
+    "_agent_rank_relevance_modules": _agent_rank_relevance_modules,
+    "_agent_rank_relevance_skills": _agent_rank_relevance_skills,
+    "_agent_rank_relevance_memories": _agent_rank_relevance_memories,
+    "_agent_catalog_skill_search": _agent_catalog_skill_search,
+    "_agent_catalog_memory_search": _agent_catalog_memory_search,
+    "_agent_smart_stringify": _agent_smart_stringify,
+    "_context_map_evict_to_budget": _context_map_evict_to_budget,
+}
+_core_agent_build_policy_vocabulary_registry = _agent_policy_vocabulary_registry
+_agent_policy_vocabulary_registry = _core_agent_policy_vocabulary_registry
+_core_agent_reserved_runtime_names_shared = _agent_reserved_runtime_names
+_agent_reserved_runtime_names = _core_agent_reserved_runtime_names
+_core_rlm_render_template_uncached = _rlm_render_template
+_rlm_render_template = _core_rlm_render_template
+_agent_relevance_tokens = _core_agent_relevance_tokens
+_agent_rank_relevance_modules = _core_agent_rank_relevance_modules
+_agent_rank_relevance_skills = _core_agent_rank_relevance_skills
+_agent_rank_relevance_memories = _core_agent_rank_relevance_memories
+_agent_catalog_skill_search = _core_agent_catalog_skill_search
+_agent_catalog_memory_search = _core_agent_catalog_memory_search
+_agent_smart_stringify = _core_agent_smart_stringify
+_context_map_evict_to_budget = _core_context_map_evict_to_budget
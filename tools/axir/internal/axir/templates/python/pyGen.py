@@ -3,19 +3,37 @@ import os
 
 import copy
 import inspect
+import itertools
 import json
 import re
+import threading
 import time
-from typing import Any
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from collections.abc import MutableSequence
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable
 
-from .ai import AIClient, chat_response_to_completion
+from .ai import AIClient, AxRetryPolicy, chat_response_to_completion
 from .prompt import AxPromptTemplate
 from .schema import AxValidationError, strip_internal, validate_fields, validate_output
 from .signature import AxSignature
-from .mcp import resolve_execution_context
 # AXIR_CORE_IMPORTS
 
 
+def resolve_execution_context(options: dict[str, Any] | None, parent=None):
+    """Resolve the MCP/UCP execution context, importing the MCP runtime only
+    when a program actually configures one (keeps `ax()` off the mcp import)."""
+    opts = options or {}
+    if parent is None and not (
+        opts.get("executionContext") or opts.get("mcpExecutionContext") or opts.get("mcp") is not None or opts.get("ucp") is not None
+    ):
+        return None
+    from .mcp import resolve_execution_context as resolve
+
+    return resolve(options, parent)
+
+
 def _call_optimizer_engine(engine, request: dict[str, Any], evaluator):
     try:
         return engine.optimize(request, evaluator)
@@ -86,62 +104,412 @@ def _score_optimization_prediction_local(task, prediction, options):
     return scores, scalar
 
 
-class AxMemory:
+class AxMemoryStore(ABC):
+    """Persistent session partitions for ``AxMemory``.
+
+    ``save`` replaces a session. ``append`` and ``update`` change single items
+    on the hot path; their defaults rewrite the session through ``save``, so
+    stores only override them when they can do better.
+    """
+
+    @abstractmethod
+    def load(self, session_id: str | None) -> list[dict[str, Any]] | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, session_id: str | None, items: list[dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, session_id: str | None) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def sessions(self) -> list[str | None]:
+        raise NotImplementedError
+
+    def append(self, session_id: str | None, items: list[dict[str, Any]]) -> None:
+        self.save(session_id, list(self.load(session_id) or []) + list(items))
+
+    def update(self, session_id: str | None, index: int, item: dict[str, Any]) -> None:
+        items = list(self.load(session_id) or [])
+        items[index] = item
+        self.save(session_id, items)
+
+
+class AxInMemoryMemoryStore(AxMemoryStore):
+    """Thread-safe in-process memory store."""
+
     def __init__(self):
-        self.items: list[dict[str, Any]] = []
+        self._sessions: dict[str | None, list[dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, session_id):
+        with self._lock:
+            return self._sessions.get(session_id)
+
+    def save(self, session_id, items):
+        with self._lock:
+            self._sessions[session_id] = list(items)
+
+    def append(self, session_id, items):
+        with self._lock:
+            self._sessions.setdefault(session_id, []).extend(items)
+
+    def update(self, session_id, index, item):
+        with self._lock:
+            self._sessions[session_id][index] = item
+
+    def delete(self, session_id):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def sessions(self):
+        with self._lock:
+            return list(self._sessions)
+
+
+class AxSQLiteMemoryStore(AxMemoryStore):
+    """SQLite memory store with one row per item.
+
+    Sessions are loaded only when used. Appends and single-item updates touch
+    one row; only compaction, rewinds and tag removal rewrite a session.
+    """
+
+    def __init__(self, path: str):
+        import sqlite3
+
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS ax_memory_items (session_key TEXT NOT NULL, position INTEGER NOT NULL, "
+            "session_id TEXT, item TEXT NOT NULL, PRIMARY KEY (session_key, position))"
+        )
+
+    @staticmethod
+    def _key(session_id) -> str:
+        return "" if session_id is None else "s:" + str(session_id)
+
+    def _insert(self, session_id, start: int, items) -> None:
+        key = self._key(session_id)
+        self._db.executemany(
+            "INSERT INTO ax_memory_items (session_key, position, session_id, item) VALUES (?, ?, ?, ?)",
+            [(key, start + offset, session_id, json.dumps(item, default=str)) for offset, item in enumerate(items)],
+        )
+
+    def load(self, session_id):
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT item FROM ax_memory_items WHERE session_key = ? ORDER BY position", (self._key(session_id),)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows] if rows else None
+
+    def save(self, session_id, items):
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.execute("DELETE FROM ax_memory_items WHERE session_key = ?", (self._key(session_id),))
+                self._insert(session_id, 0, items)
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def append(self, session_id, items):
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._db.execute(
+                    "SELECT COALESCE(MAX(position) + 1, 0) FROM ax_memory_items WHERE session_key = ?", (self._key(session_id),)
+                ).fetchone()
+                self._insert(session_id, row[0], items)
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def update(self, session_id, index, item):
+        with self._lock:
+            self._db.execute(
+                "UPDATE ax_memory_items SET item = ? WHERE session_key = ? AND position = ?",
+                (json.dumps(item, default=str), self._key(session_id), int(index)),
+            )
+
+    def delete(self, session_id):
+        with self._lock:
+            self._db.execute("DELETE FROM ax_memory_items WHERE session_key = ?", (self._key(session_id),))
+
+    def sessions(self):
+        with self._lock:
+            return [row[0] for row in self._db.execute("SELECT DISTINCT session_id FROM ax_memory_items")]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class _AxMemorySession:
+    def __init__(self, items: list[dict[str, Any]]):
+        self.items = items
+        self.by_tag: dict[str, list[dict[str, Any]]] = {}
+        self.by_index: dict[Any, list[dict[str, Any]]] = {}
+        self.last_assistant: dict[str, Any] | None = None
+        for item in items:
+            self.index(item)
+
+    def index(self, item: dict[str, Any]) -> None:
+        for tag in item.get("tags") or []:
+            self.by_tag.setdefault(tag, []).append(item)
+        if "index" in item:
+            self.by_index.setdefault(item["index"], []).append(item)
+        if item.get("role") == "assistant":
+            self.last_assistant = item
+
+    def reindex(self) -> None:
+        self.by_tag = {}
+        self.by_index = {}
+        self.last_assistant = None
+        for item in self.items:
+            self.index(item)
+
+
+class _AxMemoryItems(MutableSequence):
+    """Live list view of one ``AxMemory`` session, kept for code that used the
+    old ``memory.items`` list. Writes go through the memory, so the session's
+    indexes and store stay in sync."""
+
+    def __init__(self, memory: "AxMemory", session_id: str | None = None):
+        self._memory = memory
+        self._session_id = session_id
+
+    def _rewrite(self, change: Callable[[list[dict[str, Any]]], None]) -> None:
+        with self._memory._lock:
+            session = self._memory._session(self._session_id)
+            change(session.items)
+            session.reindex()
+            self._memory._commit(self._session_id, session)
+
+    def __len__(self) -> int:
+        with self._memory._lock:
+            return len(self._memory._session(self._session_id).items)
+
+    def __getitem__(self, index):
+        with self._memory._lock:
+            return self._memory._session(self._session_id).items[index]
+
+    def __setitem__(self, index, value) -> None:
+        def change(items):
+            items[index] = value
+        self._rewrite(change)
+
+    def __delitem__(self, index) -> None:
+        def change(items):
+            del items[index]
+        self._rewrite(change)
+
+    def insert(self, index: int, value) -> None:
+        self._rewrite(lambda items: items.insert(index, value))
+
+    def append(self, value) -> None:
+        self._memory._append(value, self._session_id)
+
+    def __eq__(self, other) -> bool:
+        return list(self) == (list(other) if isinstance(other, (list, tuple, _AxMemoryItems)) else other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+_MEMORY_MAX_CACHED_SESSIONS = 1024
+
+
+class AxMemory:
+    """Conversation memory partitioned by ``session_id``.
+
+    Each session keeps tag and sample-index indexes, so lookups touch only
+    that session. ``session_id=None`` names the default session rather than
+    the whole memory: ``history``, ``get_last``, ``add_tag``, ``rewind_to_tag``
+    and ``remove_by_tag`` without a session no longer see items written under
+    another ``session_id``. Use ``sessions()`` to visit every session.
+    Sessions live in ``store`` (in-memory by default) and the
+    most recently used ones stay cached. With ``max_items`` a session is
+    compacted down to ``compact_to`` items once it grows past the limit;
+    ``summarize(dropped_items)`` may return a summary item (or list of
+    items) that replaces the dropped turns, otherwise they are truncated.
+    """
+
+    def __init__(
+        self,
+        store: AxMemoryStore | None = None,
+        *,
+        max_items: int | None = None,
+        compact_to: int | None = None,
+        summarize: Callable[[list[dict[str, Any]]], Any] | None = None,
+        max_cached_sessions: int = _MEMORY_MAX_CACHED_SESSIONS,
+    ):
+        self.store = store if store is not None else AxInMemoryMemoryStore()
+        self.max_items = int(max_items) if max_items else None
+        self.compact_to = int(compact_to) if compact_to is not None else (max(1, self.max_items // 2) if self.max_items else None)
+        self.summarize = summarize
+        self.max_cached_sessions = max(1, int(max_cached_sessions))
+        self._sessions: OrderedDict[str | None, _AxMemorySession] = OrderedDict()
+        self._lock = threading.RLock()
+
+    @property
+    def items(self) -> MutableSequence:
+        """The default session as a live, writable list view."""
+        return _AxMemoryItems(self)
+
+    @items.setter
+    def items(self, value) -> None:
+        with self._lock:
+            session = self._session(None)
+            session.items[:] = list(value)
+            session.reindex()
+            self._commit(None, session)
+
+    def _session(self, session_id) -> _AxMemorySession:
+        session = self._sessions.get(session_id)
+        if session is not None:
+            self._sessions.move_to_end(session_id)
+            return session
+        session = _AxMemorySession(list(self.store.load(session_id) or []))
+        self._sessions[session_id] = session
+        if len(self._sessions) > self.max_cached_sessions:
+            self._sessions.popitem(last=False)
+        return session
+
+    def _commit(self, session_id, session: _AxMemorySession) -> None:
+        self.store.save(session_id, session.items)
+
+    def _append(self, item: dict[str, Any], session_id) -> None:
+        with self._lock:
+            session = self._session(session_id)
+            session.items.append(item)
+            session.index(item)
+            if self.max_items is not None and len(session.items) > self.max_items:
+                try:
+                    self._compact(session)
+                except BaseException:
+                    session.items.pop()
+                    session.reindex()
+                    raise
+                self._commit(session_id, session)
+            else:
+                self.store.append(session_id, [item])
+
+    def _update(self, session_id, session: _AxMemorySession, item: dict[str, Any]) -> None:
+        for index in range(len(session.items) - 1, -1, -1):
+            if session.items[index] is item:
+                self.store.update(session_id, index, item)
+                return
+        self._commit(session_id, session)
+
+    def _compact(self, session: _AxMemorySession) -> None:
+        keep = min(self.compact_to or 0, len(session.items))
+        dropped = session.items[: len(session.items) - keep]
+        retained = session.items[len(session.items) - keep:]
+        summary = self.summarize(dropped) if self.summarize is not None else None
+        if isinstance(summary, dict):
+            summary = [summary]
+        if summary is not None and (not isinstance(summary, list) or not all(isinstance(entry, dict) for entry in summary)):
+            raise TypeError(f"AxMemory summarize must return a dict, a list of dicts, or None, got {type(summary).__name__}")
+        session.items[:] = list(summary or []) + retained
+        session.reindex()
+
+    def add_item(self, item: dict[str, Any], session_id: str | None = None):
+        entry = dict(item)
+        entry.setdefault("session_id", session_id)
+        entry.setdefault("tags", [])
+        self._append(entry, session_id)
+        return self
 
     def add_request(self, messages, session_id: str | None = None):
-        self.items.append({"role": "request", "messages": messages, "session_id": session_id, "tags": []})
+        self._append({"role": "request", "messages": messages, "session_id": session_id, "tags": []}, session_id)
         return self
 
     def add_response(self, response, session_id: str | None = None):
         if not _ax_memory_response_meaningful(response):
             return self
-        self.items.append({"role": "assistant", "response": response, "session_id": session_id, "tags": []})
+        self._append({"role": "assistant", "response": response, "session_id": session_id, "tags": []}, session_id)
         return self
 
     def update_result(self, result, session_id: str | None = None):
         item = {"role": "assistant", "response": result, "session_id": session_id, "tags": []}
-        for existing in reversed(self.items):
-            if existing.get("role") == "assistant" and existing.get("session_id") == session_id:
-                existing.update(item)
+        with self._lock:
+            session = self._session(session_id)
+            existing = session.last_assistant
+            if existing is None:
+                self._append(item, session_id)
                 return self
-        self.items.append(item)
+            existing.update(item)
+            session.reindex()
+            self._update(session_id, session, existing)
         return self
 
     def add_function_results(self, results, session_id: str | None = None):
         if not isinstance(results, list):
             results = [results]
-        self.items.append({"role": "function", "results": results, "session_id": session_id, "tags": []})
+        self._append({"role": "function", "results": results, "session_id": session_id, "tags": []}, session_id)
         return self
 
-    def history(self, index: int | None = None):
-        if index is None:
-            return list(self.items)
-        return [item for item in self.items if item.get("index") == index]
+    def history(self, index: int | None = None, session_id: str | None = None):
+        with self._lock:
+            session = self._session(session_id)
+            if index is None:
+                return list(session.items)
+            return list(session.by_index.get(index, []))
 
     def get_last(self, session_id: str | None = None):
-        for item in reversed(self.items):
-            if session_id is None or item.get("session_id") == session_id:
-                return item
-        return None
+        with self._lock:
+            items = self._session(session_id).items
+            return items[-1] if items else None
+
+    def add_tag(self, tag: str, session_id: str | None = None):
+        with self._lock:
+            session = self._session(session_id)
+            if session.items:
+                tags = session.items[-1].setdefault("tags", [])
+                if tag not in tags:
+                    tags.append(tag)
+                    session.by_tag.setdefault(tag, []).append(session.items[-1])
+                    self.store.update(session_id, len(session.items) - 1, session.items[-1])
+        return self
 
-    def add_tag(self, tag: str):
-        if self.items:
-            tags = self.items[-1].setdefault("tags", [])
-            if tag not in tags:
-                tags.append(tag)
+    def rewind_to_tag(self, tag: str, session_id: str | None = None):
+        with self._lock:
+            session = self._session(session_id)
+            tagged = session.by_tag.get(tag)
+            if not tagged:
+                return self
+            target = tagged[-1]
+            for idx in range(len(session.items) - 1, -1, -1):
+                if session.items[idx] is target:
+                    del session.items[idx + 1:]
+                    session.reindex()
+                    self._commit(session_id, session)
+                    break
         return self
 
-    def rewind_to_tag(self, tag: str):
-        for idx in range(len(self.items) - 1, -1, -1):
-            if tag in (self.items[idx].get("tags") or []):
-                self.items = self.items[: idx + 1]
+    def remove_by_tag(self, tag: str, session_id: str | None = None):
+        with self._lock:
+            session = self._session(session_id)
+            if not session.by_tag.get(tag):
                 return self
+            session.items[:] = [item for item in session.items if tag not in (item.get("tags") or [])]
+            session.reindex()
+            self._commit(session_id, session)
         return self
 
-    def remove_by_tag(self, tag: str):
-        self.items = [item for item in self.items if tag not in (item.get("tags") or [])]
+    def sessions(self) -> list[str | None]:
+        return self.store.sessions()
+
+    def clear(self, session_id: str | None = None):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+            self.store.delete(session_id)
         return self
 
 
@@ -160,6 +528,261 @@ def _ax_memory_response_meaningful(response) -> bool:
     return response.get("audio") is not None
 
 
+class AxTraceSink(ABC):
+    @abstractmethod
+    def write(self, kind: str, entries: list[dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+
+class AxJsonlTraceSink(AxTraceSink):
+    """Appends entries evicted from a trace buffer to a JSON Lines file."""
+
+    def __init__(self, path: str):
+        self.path = str(path)
+        self._lock = threading.Lock()
+
+    def write(self, kind: str, entries: list[dict[str, Any]]) -> None:
+        if not entries:
+            return
+        lines = "".join(json.dumps({"kind": kind, "entry": entry}, default=str) + "\n" for entry in entries)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as handle:
+                handle.write(lines)
+
+
+class AxTraceBuffer(MutableSequence):
+    """Sequence with optional ring-buffer retention for long-lived observability stores.
+
+    Retention is opt-in: with neither ``max_entries`` nor ``max_bytes`` set the
+    buffer keeps every entry, like a plain list. Otherwise entries past
+    ``max_entries`` (or ``max_bytes`` of JSON) are evicted oldest first and
+    handed to ``sink`` when one is configured. Positions are absolute:
+    ``offset`` counts evicted entries, so ``total`` and ``since(mark)`` stay
+    valid across evictions. Every mutator, including ``insert``, item
+    assignment, ``del`` and ``pop``, goes through the same size accounting.
+    """
+
+    def __init__(self, kind: str = "trace", max_entries: int | None = None, max_bytes: int | None = None, sink: AxTraceSink | None = None):
+        self.kind = kind
+        self.max_entries = int(max_entries) if max_entries else None
+        self.max_bytes = int(max_bytes) if max_bytes else None
+        self.sink = sink
+        self.offset = 0
+        self._entries: deque[dict[str, Any]] = deque()
+        self._sizes: deque[int] = deque()
+        self._bytes = 0
+        self._lock = threading.RLock()
+
+    @property
+    def total(self) -> int:
+        return self.offset + len(self._entries)
+
+    def _size(self, entry) -> int:
+        return len(json.dumps(entry, default=str)) if self.max_bytes is not None else 0
+
+    def _reset(self, entries: list[dict[str, Any]]) -> None:
+        self._entries = deque(entries)
+        self._sizes = deque(self._size(entry) for entry in entries)
+        self._bytes = sum(self._sizes)
+        self._trim()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self.snapshot())
+
+    def __getitem__(self, index):
+        with self._lock:
+            if isinstance(index, slice):
+                return list(self._entries)[index]
+            return self._entries[index]
+
+    def __setitem__(self, index, value) -> None:
+        with self._lock:
+            if isinstance(index, slice):
+                entries = list(self._entries)
+                entries[index] = value
+                self._reset(entries)
+                return
+            size = self._size(value)
+            self._bytes += size - self._sizes[index]
+            self._entries[index] = value
+            self._sizes[index] = size
+            self._trim()
+
+    def __delitem__(self, index) -> None:
+        with self._lock:
+            if isinstance(index, slice):
+                entries = list(self._entries)
+                del entries[index]
+                self._reset(entries)
+                return
+            self._bytes -= self._sizes[index]
+            del self._entries[index]
+            del self._sizes[index]
+
+    def insert(self, index: int, value) -> None:
+        size = self._size(value)
+        with self._lock:
+            self._entries.insert(index, value)
+            self._sizes.insert(index, size)
+            self._bytes += size
+            self._trim()
+
+    def append(self, entry) -> None:
+        size = self._size(entry)
+        with self._lock:
+            self._entries.append(entry)
+            self._sizes.append(size)
+            self._bytes += size
+            self._trim()
+
+    def extend(self, entries) -> None:
+        for entry in list(entries):
+            self.append(entry)
+
+    def __iadd__(self, entries):
+        self.extend(entries)
+        return self
+
+    def __eq__(self, other) -> bool:
+        return self.snapshot() == (list(other) if isinstance(other, (list, tuple, AxTraceBuffer)) else other)
+
+    def __repr__(self) -> str:
+        return repr(self.snapshot())
+
+    def __copy__(self):
+        clone = AxTraceBuffer(self.kind, self.max_entries, self.max_bytes, self.sink)
+        with self._lock:
+            clone.offset = self.offset
+            clone._entries = deque(self._entries)
+            clone._sizes = deque(self._sizes)
+            clone._bytes = self._bytes
+        return clone
+
+    def __deepcopy__(self, memo):
+        clone = self.__copy__()
+        clone._entries = deque(copy.deepcopy(list(clone._entries), memo))
+        return clone
+
+    def since(self, mark: int) -> list[dict[str, Any]]:
+        with self._lock:
+            return list(itertools.islice(self._entries, max(0, int(mark) - self.offset), None))
+
+    def range(self, start: int, end: int) -> list[dict[str, Any]]:
+        with self._lock:
+            stop = max(0, int(end) - self.offset)
+            return list(itertools.islice(self._entries, min(max(0, int(start) - self.offset), stop), stop))
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._evict(len(self._entries))
+
+    def _trim(self) -> None:
+        excess = len(self._entries) - self.max_entries if self.max_entries is not None else 0
+        if self.max_bytes is not None:
+            budget = self._bytes
+            index = 0
+            for size in itertools.islice(self._sizes, len(self._sizes) - 1):
+                if budget <= self.max_bytes:
+                    break
+                budget -= size
+                index += 1
+            excess = max(excess, index)
+        if excess > 0:
+            self._evict(excess)
+
+    def _evict(self, count: int) -> None:
+        if count <= 0:
+            return
+        evicted = [self._entries.popleft() for _ in range(count)]
+        self._bytes -= sum(self._sizes.popleft() for _ in range(count))
+        self.offset += count
+        if self.sink is not None:
+            self.sink.write(self.kind, evicted)
+
+
+def _core_trace_buffers(options) -> tuple[AxTraceBuffer, AxTraceBuffer, AxTraceBuffer]:
+    retention = _core_get(options, "traceRetention", _core_get(options, "trace_retention", {})) or {}
+    max_entries = _core_get(retention, "maxEntries", _core_get(retention, "max_entries"))
+    max_bytes = _core_get(retention, "maxBytes", _core_get(retention, "max_bytes"))
+    sink = _core_get(retention, "sink")
+    if isinstance(sink, (str, os.PathLike)):
+        sink = AxJsonlTraceSink(os.fspath(sink))
+    return tuple(AxTraceBuffer(kind, max_entries, max_bytes, sink) for kind in ("chat_log", "function_call", "trace"))
+
+
+class AxRunContext:
+    """Mutable state of a forward() call: its chat log, function calls, traces,
+    usage, status and output.
+
+    Every forward records into its own context, so one program instance can
+    serve concurrent calls without cross-talk. Pass ``{"runContext": ctx}`` to
+    read a specific call's observability; otherwise ``last_run_context`` on the
+    program holds the most recently finished one. Reusing a context across calls
+    accumulates their entries.
+    """
+
+    def __init__(self, session_id: str | None = None):
+        self.session_id = session_id
+        self.chat_log: list[dict[str, Any]] = []
+        self.function_call_traces: list[dict[str, Any]] = []
+        self.traces: list[dict[str, Any]] = []
+        self.usage: Any = []
+        self.status = "pending"
+        self.output: Any = None
+        self.error: BaseException | None = None
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+
+    def get_chat_log(self):
+        return list(self.chat_log)
+
+    def get_function_call_traces(self):
+        return list(self.function_call_traces)
+
+    def get_traces(self):
+        return list(self.traces)
+
+    def get_usage(self):
+        return copy.copy(self.usage)
+
+
+def _core_program_begin_run(program, options):
+    """Split the caller's run context (or the one bound to a stage view) out of
+    the forward options and mark it running."""
+    opts = dict(options or {})
+    run = opts.pop("runContext", None) or opts.pop("run_context", None) or getattr(program, "_bound_run", None)
+    if not isinstance(run, AxRunContext):
+        run = AxRunContext()
+    run.session_id = _core_get(opts, "sessionId", _core_get(opts, "session_id", run.session_id))
+    run.status = "running"
+    run.started_at = time.time()
+    run.finished_at = None
+    return run, opts
+
+
+def _core_program_end_run(program, run, output=None, error=None):
+    run.status = "error" if error is not None else "ok"
+    run.output = output
+    run.error = error
+    run.finished_at = time.time()
+    program.last_run_context = run
+    return run
+
+
+def _core_program_bind_run(program, run):
+    """Shallow per-run view of ``program`` whose forward() records into ``run``."""
+    view = copy.copy(program)
+    view._bound_run = run
+    return view
+
+
 class AxGen:
     def __init__(self, signature, options: dict[str, Any] | None = None):
         self.signature = signature if isinstance(signature, AxSignature) else AxSignature(signature)
@@ -174,9 +797,10 @@ class AxGen:
         self.field_processors = list(self.options.get("field_processors") or self.options.get("fieldProcessors") or [])
         self.stop_functions = list(self.options.get("stop_functions") or self.options.get("stopFunctions") or [])
         self.memory = self.options.get("memory") or self.options.get("mem") or AxMemory()
-        self.chat_log: list[dict[str, Any]] = []
-        self.function_call_traces: list[dict[str, Any]] = []
-        self.traces: list[dict[str, Any]] = []
+        self.chat_log, self.function_call_traces, self.traces = _core_trace_buffers(self.options)
+        self._trace_marks = (0, 0)
+        self._run: AxRunContext | None = None
+        self.last_run_context: AxRunContext | None = None
         self.program_id = self.options.get("id") or self.options.get("program_id") or self.options.get("programId") or "root"
         self.instruction = str(self.options.get("instruction") or "")
         self.prompt_template = AxPromptTemplate(
@@ -391,34 +1015,59 @@ class AxGen:
             raise ValueError("options.engine must implement OptimizerEngine for optimize()")
         return self.optimize_with(engine, dataset or [], opts)
 
+    # Unlike AxFlow and AxAgent, AxGen's getters read the program-wide retained
+    # buffers rather than ``last_run_context``: they accumulate across calls,
+    # are bounded by ``traceRetention``, and back ``get_chat_log_range`` and
+    # the absolute ranges recorded in traces. Use ``get_run_context()`` for
+    # one call's entries.
     def get_traces(self):
-        return list(self.traces)
+        return _core_trace_snapshot(self.traces)
 
     def get_chat_log(self):
-        return list(self.chat_log)
+        return _core_trace_snapshot(self.chat_log)
+
+    def get_chat_log_range(self, start: int, end: int):
+        if isinstance(self.chat_log, AxTraceBuffer):
+            return self.chat_log.range(start, end)
+        return list(self.chat_log[start:end])
 
     def get_memory(self):
         return self.memory
 
     def get_function_call_traces(self):
-        return list(self.function_call_traces)
+        return _core_trace_snapshot(self.function_call_traces)
+
+    def get_run_context(self):
+        return self.last_run_context
 
     def forward(self, client: AIClient, values: dict[str, Any], options: dict[str, Any] | None = None):
-        call_context = resolve_execution_context(options, self.execution_context)
-        if call_context is self.execution_context:
-            return _forward_impl(self, client, values, options)
+        # Per-call state lives on a shallow copy bound to its run context, so
+        # concurrent forwards on one instance never share trace marks or sessions.
+        run, options = _core_program_begin_run(self, options)
         call_gen = copy.copy(self)
-        call_gen.execution_context = call_context
-        call_gen.functions = self._base_functions + (call_context.native_tools() if call_context else [])
-        call_gen.prompt_template = AxPromptTemplate(
-            self.signature,
-            functions=call_gen.functions,
-            structured_output_function_name=self.options.get("structured_output_function_name", self.options.get("structuredOutputFunctionName")),
-            custom_template=self.options.get("custom_template", self.options.get("customTemplate")),
-        )
-        if self.instruction:
-            call_gen.prompt_template.set_instruction(self.instruction)
-        return _forward_impl(call_gen, client, values, options)
+        call_gen._run = run
+        call_context = resolve_execution_context(options, self.execution_context)
+        if call_context is not self.execution_context:
+            call_gen.execution_context = call_context
+            call_gen.functions = self._base_functions + (call_context.native_tools() if call_context else [])
+            call_gen.prompt_template = AxPromptTemplate(
+                self.signature,
+                functions=call_gen.functions,
+                structured_output_function_name=self.options.get("structured_output_function_name", self.options.get("structuredOutputFunctionName")),
+                custom_template=self.options.get("custom_template", self.options.get("customTemplate")),
+            )
+            if self.instruction:
+                call_gen.prompt_template.set_instruction(self.instruction)
+        try:
+            runtime_options = _core_map_merge(self.options, options)
+            _core_axgen_begin_trace(call_gen, runtime_options)
+            _core_axgen_begin_memory(call_gen, runtime_options)
+            output = _forward_impl(call_gen, client, values, options)
+        except BaseException as exc:
+            _core_program_end_run(self, run, error=exc)
+            raise
+        _core_program_end_run(self, run, output)
+        return output
 
     def streaming_forward(self, client: AIClient, values: dict[str, Any], options: dict[str, Any] | None = None):
         call_context = resolve_execution_context(options, self.execution_context)
@@ -429,7 +1078,7 @@ class AxGen:
             call_gen.prompt_template = AxPromptTemplate(self.signature, functions=call_gen.functions)
             yield from call_gen.streaming_forward(client, values, {**(options or {}), "executionContext": call_context})
             return
-        validate_fields(self.signature.get_input_fields(), values, "input")
+        self.signature.validator("inputs")(values, "input")
         stream_options = {**self.options, **(options or {}), "stream": True}
         req = self._request(self.prompt_template.render(values), stream_options, client)
         chunks = []
@@ -459,12 +1108,18 @@ def ax(
     *,
     sample_count: int | None = None,
     result_picker=None,
+    sample_accept=None,
+    sample_concurrency: int | None = None,
 ) -> AxGen:
     normalized = dict(options or {})
     if sample_count is not None:
         normalized["sample_count"] = int(sample_count)
     if result_picker is not None:
         normalized["result_picker"] = result_picker
+    if sample_accept is not None:
+        normalized["sample_accept"] = sample_accept
+    if sample_concurrency is not None:
+        normalized["sample_concurrency"] = int(sample_concurrency)
     return AxGen(signature, normalized)
 
 
@@ -672,6 +1327,90 @@ def _core_ai_complete_once(client, request, options):
     raise TypeError("AI client must implement chat() or complete()")
 
 
+def _core_sum_usage_tokens(left, right):
+    out = dict(left or {})
+    for key, value in (right or {}).items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            out[key] = (out.get(key) or 0) + value
+        elif key not in out:
+            out[key] = value
+    return out
+
+
+def _core_merge_sample_responses(responses):
+    """Merge single-sample completions into one multi-result completion with summed usage."""
+    merged = dict(responses[0])
+    results = []
+    usage = None
+    for response in responses:
+        for result in response.get("results") or []:
+            results.append({**result, "index": len(results)})
+        if response.get("usage"):
+            usage = _core_sum_usage_tokens(usage, response["usage"])
+    merged["results"] = results
+    merged["usage"] = usage
+    return merged
+
+
+def _core_sample_accept(options):
+    accept = (options or {}).get("sampleAccept", (options or {}).get("sample_accept"))
+    if accept is None:
+        picker = (options or {}).get("resultPicker", (options or {}).get("result_picker"))
+        accept = getattr(picker, "accept", None)
+    return accept if callable(accept) else None
+
+
+def _core_sample_concurrency(options, count):
+    limit = (options or {}).get("sampleConcurrency", (options or {}).get("sample_concurrency"))
+    return int(count) if limit is None else max(1, min(int(limit), int(count)))
+
+
+def _core_fan_out_samples(client, request, options, retries, count):
+    """Issue ``count`` single-sample requests for providers without native ``n``.
+
+    At most ``sampleConcurrency`` requests (default: all ``count``) are in flight
+    at once; the next one is submitted only when a slot frees up. An optional
+    ``sampleAccept`` callback (or a result picker's ``accept`` method) receives
+    each raw result as it arrives; the first accepted result ends the fan-out and
+    no further requests are submitted. Requests already in flight at that point
+    cannot be recalled and are still billed by the provider, so pair
+    ``sampleAccept`` with a low ``sampleConcurrency`` when cost matters more than
+    latency. Failed samples are dropped unless every sample fails.
+    """
+    config = {key: value for key, value in (request.get("model_config") or {}).items() if key != "n"}
+    single = {**request, "model_config": config}
+    accept = _core_sample_accept(options)
+    count = int(count)
+    responses = [None] * count
+    errors = []
+    workers = _core_sample_concurrency(options, count)
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="axgen-sample")
+    try:
+        pending = {}
+        submitted = 0
+        accepted = False
+        while not accepted and (pending or submitted < count):
+            while submitted < count and len(pending) < workers:
+                pending[executor.submit(_core_complete_attempts, client, single, options, retries)] = submitted
+                submitted += 1
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    responses[index] = future.result()
+                except Exception as error:
+                    errors.append(error)
+                    continue
+                if accept is not None and any(accept(result) for result in responses[index].get("results") or []):
+                    accepted = True
+    finally:
+        executor.shutdown(wait=False)
+    completed = [response for response in responses if response is not None]
+    if not completed:
+        raise errors[0]
+    return _core_merge_sample_responses(completed)
+
+
 def _core_ai_client_features(client, model):
     get_features = getattr(client, "get_features", None)
     if callable(get_features):
@@ -683,6 +1422,44 @@ def _core_retry_sleep(attempt):
     time.sleep(min(0.25 * (int(attempt) + 1), 1.0))
 
 
+def _core_sample_count(request):
+    count = _core_get(_core_get(request, "model_config", {}), "n", 1)
+    return 1 if count is None else int(count)
+
+
+def _core_complete_attempts(client, request, options, retries):
+    """Complete one request, retrying transient failures under ``AxRetryPolicy``."""
+    policy = AxRetryPolicy.from_options(options, initial_delay_ms=250)
+    policy.max_retries = int(retries)
+    policy.get_budget().deposit()
+    attempt = 0
+    while True:
+        try:
+            return _core_ai_complete_once(client, request, options)
+        except Exception as error:
+            delay_ms = policy.should_retry(attempt, error)
+            if delay_ms is None:
+                raise
+            if delay_ms > 0:
+                time.sleep(delay_ms / 1000.0)
+            attempt += 1
+
+
+def _core_complete_with_retries(client, request, options, retries):
+    """Host replacement for Core's ``_complete_with_retries_impl``.
+
+    Retries follow the shared ``AxRetryPolicy`` (transient errors only, jittered
+    backoff, retry budget) instead of Core's fixed schedule, and multi-sample
+    requests fan out when the provider has no native ``n``.
+    """
+    count = _core_sample_count(request)
+    if count > 1:
+        features = _core_ai_client_features(client, _core_get(options, "model"))
+        if not _core_get(features, "multiple_samples", True):
+            return _core_fan_out_samples(client, request, options, retries, count)
+    return _core_complete_attempts(client, request, options, retries)
+
+
 def _core_exception_message(error):
     return str(error)
 
@@ -860,9 +1637,7 @@ def _core_axgen_apply_field_processors(gen, output):
             result[field] = str(value) + op.removeprefix("suffix:")
             changed = True
     if changed:
-        memory = _core_get(gen, "memory")
-        if memory is not None and hasattr(memory, "items"):
-            memory.items.append({"role": "processor", "output": dict(result), "tags": ["processor"]})
+        _core_axgen_memory_add_item(gen, {"role": "processor", "output": dict(result), "tags": ["processor"]})
     return result
 
 
@@ -916,15 +1691,51 @@ def _core_axgen_run_streaming_assertions(gen, content):
     return None
 
 
+def _core_axgen_begin_trace(gen, options):
+    chat_log = _core_get(gen, "chat_log", [])
+    function_calls = _core_get(gen, "function_call_traces", [])
+    scope = _core_get(options, "traceScope", _core_get(options, "trace_scope"))
+    if scope == "request":
+        for store in (chat_log, function_calls, _core_get(gen, "traces", [])):
+            store.clear()
+    gen._trace_marks = (_core_trace_total(chat_log), _core_trace_total(function_calls))
+    return None
+
+
+def _core_trace_total(store):
+    return store.total if isinstance(store, AxTraceBuffer) else len(store)
+
+
+def _core_trace_since(store, mark):
+    if isinstance(store, AxTraceBuffer):
+        return store.since(mark)
+    return list(store[mark:])
+
+
+def _core_trace_snapshot(store):
+    return store.snapshot() if isinstance(store, AxTraceBuffer) else list(store)
+
+
 def _core_axgen_record_trace(gen, values, output, status):
     traces = _core_get(gen, "traces", [])
-    traces.append({
+    chat_log = _core_get(gen, "chat_log", []) or []
+    function_calls = _core_get(gen, "function_call_traces", []) or []
+    chat_start, call_start = _core_get(gen, "_trace_marks", (0, 0)) or (0, 0)
+    run = _core_get(gen, "_run")
+    # The call's own entries come from its run context; the ranges locate them
+    # in the shared stores (exact unless other threads appended in between).
+    trace = {
         "status": status,
         "input": values,
         "output": output,
-        "chat_log": list(_core_get(gen, "chat_log", []) or []),
-        "function_calls": list(_core_get(gen, "function_call_traces", []) or []),
-    })
+        "chat_log": list(run.chat_log) if run is not None else _core_trace_since(chat_log, chat_start),
+        "chat_log_range": {"start": chat_start, "end": _core_trace_total(chat_log)},
+        "function_calls": list(run.function_call_traces) if run is not None else _core_trace_since(function_calls, call_start),
+        "function_calls_range": {"start": call_start, "end": _core_trace_total(function_calls)},
+    }
+    traces.append(trace)
+    if run is not None:
+        run.traces.append(trace)
     return None
 
 
@@ -939,38 +1750,66 @@ def _core_axgen_should_continue_steps(gen, calls):
     return True
 
 
-def _core_axgen_memory_add_request(gen, messages):
+def _core_axgen_begin_memory(gen, options):
+    gen._memory_session_id = _core_get(options, "sessionId", _core_get(options, "session_id"))
+    return None
+
+
+def _core_axgen_memory_accepts_session(fn) -> bool:
+    try:
+        parameters = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return False
+    return "session_id" in parameters or any(
+        parameter.kind is inspect.Parameter.VAR_KEYWORD for parameter in parameters.values()
+    )
+
+
+def _core_axgen_memory_call(gen, method, *args):
     memory = _core_get(gen, "memory")
-    if memory is not None and hasattr(memory, "add_request"):
-        memory.add_request(messages)
+    if memory is None or not hasattr(memory, method):
+        return False
+    fn = getattr(memory, method)
+    session_id = _core_get(gen, "_memory_session_id")
+    # Custom memories written for the flat API take no session_id; they keep
+    # receiving every item as before.
+    if session_id is None or not _core_axgen_memory_accepts_session(fn):
+        fn(*args)
+    else:
+        fn(*args, session_id=session_id)
+    return True
+
+
+def _core_axgen_memory_add_item(gen, item):
+    if not _core_axgen_memory_call(gen, "add_item", item):
+        memory = _core_get(gen, "memory")
+        if memory is not None and hasattr(memory, "items"):
+            memory.items.append(item)
+    return None
+
+
+def _core_axgen_memory_add_request(gen, messages):
+    _core_axgen_memory_call(gen, "add_request", messages)
     return None
 
 
 def _core_axgen_memory_add_response(gen, request, response):
-    memory = _core_get(gen, "memory")
-    if memory is not None and hasattr(memory, "add_response"):
-        memory.add_response(response)
+    _core_axgen_memory_call(gen, "add_response", response)
     return None
 
 
 def _core_axgen_memory_add_function_result(gen, call, result, ok):
-    memory = _core_get(gen, "memory")
-    if memory is not None and hasattr(memory, "add_function_results"):
-        memory.add_function_results({"call": call, "result": result, "ok": bool(ok)})
+    _core_axgen_memory_call(gen, "add_function_results", {"call": call, "result": result, "ok": bool(ok)})
     return None
 
 
 def _core_axgen_memory_add_correction(gen, response, error):
-    memory = _core_get(gen, "memory")
-    if memory is not None and hasattr(memory, "items"):
-        memory.items.append({"role": "user", "content": f"Correction: {_core_exception_message(error)}", "response": response, "tags": ["correction"]})
+    _core_axgen_memory_add_item(gen, {"role": "user", "content": f"Correction: {_core_exception_message(error)}", "response": response, "tags": ["correction"]})
     return None
 
 
 def _core_axgen_memory_cleanup_corrections(gen):
-    memory = _core_get(gen, "memory")
-    if memory is not None and hasattr(memory, "remove_by_tag"):
-        memory.remove_by_tag("correction")
+    _core_axgen_memory_call(gen, "remove_by_tag", "correction")
     return None
 
 
@@ -987,6 +1826,11 @@ def _core_axgen_record_chat_log(gen, request, response):
         "providerMetadata": _core_get(request, "provider_metadata", {}),
     }
     chat_log.append(entry)
+    run = _core_get(gen, "_run")
+    if run is not None:
+        run.chat_log.append(entry)
+        if entry["usage"]:
+            run.usage.append(entry["usage"])
     return None
 
 
@@ -1000,6 +1844,9 @@ def _core_axgen_record_function_call(gen, call, result, status):
         "result": result,
     }
     traces.append(record)
+    run = _core_get(gen, "_run")
+    if run is not None:
+        run.function_call_traces.append(record)
     hook = _core_get(_core_get(gen, "options", {}), "on_function_call", _core_get(_core_get(gen, "options", {}), "onFunctionCall"))
     if callable(hook):
         try:
@@ -1010,3 +1857,10 @@ def _core_axgen_record_function_call(gen, call, result, status):
 
 
 # AXIR_CORE_GEN_FUNCTIONS
+
+
+# Python host replacements for Core functions. The portable definitions above
+# stay the reference; rebinding the module globals routes emitted callers here.
+# _CORE_PORTABLE keeps each replaced definition so conformance can run it.
+_CORE_PORTABLE = {"_complete_with_retries_impl": _complete_with_retries_impl}
+_complete_with_retries_impl = _core_complete_with_retries
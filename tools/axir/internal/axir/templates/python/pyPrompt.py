@@ -207,10 +207,26 @@ def _core_template_parse_range(tokens, source: str, context: str, start_index: i
     return {"nodes": nodes, "index": i, "terminator": None}
 
 
+_TEMPLATE_TREES: dict[tuple[str, str], list[dict[str, Any]]] = {}
+_TEMPLATE_TREES_MAX = 256
+
+
 def _core_template_parse(template: str, context: str):
+    """Parse ``template`` into a node tree, compiled once per (template, context).
+
+    Trees are shared and read-only: rendering and variable collection never
+    mutate them. Templates that fail to parse are not cached.
+    """
+    key = (template, context)
+    cached = _TEMPLATE_TREES.get(key)
+    if cached is not None:
+        return cached
     result = _core_template_parse_range(_core_template_tokenize(template), template, context)
     if result["terminator"]:
         raise TemplateError(f"Unexpected template terminator '{result['terminator']}' in {context}")
+    if len(_TEMPLATE_TREES) >= _TEMPLATE_TREES_MAX:
+        _TEMPLATE_TREES.pop(next(iter(_TEMPLATE_TREES)), None)
+    _TEMPLATE_TREES[key] = result["nodes"]
     return result["nodes"]
 
 
@@ -492,7 +508,60 @@ def _core_prompt_output_type_placeholder(field_type):
     return [value] if getattr(field_type, "is_array", False) else value
 
 
+_SYSTEM_PROMPTS: dict[tuple[Any, ...], str] = {}
+_SYSTEM_PROMPTS_MAX = 512
+
+
+def _core_prompt_system_key(signature, values, functions, options):
+    """Everything the system prompt depends on; ``None`` when it cannot be keyed.
+
+    Fields are keyed by content, so a field edited in place gets a new
+    prompt, and only the set of optional inputs that are actually provided is
+    taken from values.
+    """
+    options = options or {}
+    values = values or {}
+    try:
+        input_fields = tuple(_core_prompt_get_input_fields(signature))
+        output_fields = tuple(getattr(signature, "output_fields", None) or signature.get_output_fields())
+        provided = tuple(
+            field.name
+            for field in input_fields
+            if field.is_optional and _core_prompt_is_provided_value(values.get(field.name))
+        ) if isinstance(values, dict) else None
+        key = (
+            repr(input_fields),
+            repr(output_fields),
+            str(_core_prompt_get_description(signature) or ""),
+            _core_prompt_has_complex_fields(signature),
+            provided,
+            tuple((item["name"], item.get("description") or "") for item in _core_prompt_function_descriptors(functions)),
+            str(options.get("instruction") or ""),
+            bool(options.get("has_example_demonstrations", options.get("hasExampleDemonstrations", False))),
+            options.get("structured_output_function_name") or "",
+            options.get("custom_template"),
+        )
+        hash(key)
+    except (AttributeError, TypeError):
+        return None
+    return key
+
+
 def _core_prompt_structured(signature, values, functions, options) -> str:
+    key = _core_prompt_system_key(signature, values, functions, options)
+    if key is None:
+        return _core_prompt_structured_uncached(signature, values, functions, options)
+    cached = _SYSTEM_PROMPTS.get(key)
+    if cached is not None:
+        return cached
+    content = _core_prompt_structured_uncached(signature, values, functions, options)
+    if len(_SYSTEM_PROMPTS) >= _SYSTEM_PROMPTS_MAX:
+        _SYSTEM_PROMPTS.pop(next(iter(_SYSTEM_PROMPTS)), None)
+    _SYSTEM_PROMPTS[key] = content
+    return content
+
+
+def _core_prompt_structured_uncached(signature, values, functions, options) -> str:
     values = values or {}
     options = options or {}
     has_complex_fields = _core_prompt_has_complex_fields(signature)
@@ -2,8 +2,11 @@ from __future__ import annotations
 import os
 
 import copy
+import json
 import re
-from typing import Any
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
 # AXIR_CORE_IMPORTS
 
 
@@ -248,4 +251,327 @@ def _valid_url_shape(value):
     return isinstance(value, str) or (isinstance(value, dict) and "url" in value)
 
 
+_EMAIL_PATTERN = re.compile("^[^\\s@]+@[^\\s@]+\\.[^\\s@]+$")
+_STRING_TYPE_NAMES = frozenset(("string", "code", "date", "datetime", "dateRange", "datetimeRange"))
+_URL_FORMATS = frozenset(("uri", "url"))
+_COMPILED_CACHE_MAX = 512
+_COMPILED_FIELDS: dict[str, Callable[[Any, str], None]] = {}
+_COMPILED_VALUES: dict[str, Callable[[Any, str], None]] = {}
+
+FieldsValidator = Callable[[Any, str], None]
+ValueValidator = Callable[[Any, str], None]
+
+
+def _compile_pattern(pattern):
+    try:
+        return re.compile(pattern)
+    except (re.error, TypeError):
+        # Keep invalid patterns failing at validation time, as re.search did.
+        return None
+
+
+def _compile_string_constraints(field) -> list[Callable[[str], None]]:
+    typ = _core_get(field, "type", None)
+    title = _core_get(field, "title", None)
+    checks = []
+    min_length = _core_get(typ, "min_length", None)
+    if min_length is not None:
+        def check_min(value):
+            if len(value) < min_length:
+                raise AxValidationError(f"Field '{title}' failed validation: String must be at least {min_length} characters long.")
+        checks.append(check_min)
+    max_length = _core_get(typ, "max_length", None)
+    if max_length is not None:
+        def check_max(value):
+            if len(value) > max_length:
+                raise AxValidationError(f"Field '{title}' failed validation: String must be at most {max_length} characters long.")
+        checks.append(check_max)
+    pattern = _core_get(typ, "pattern", None)
+    if pattern is not None:
+        compiled = _compile_pattern(pattern)
+        search = compiled.search if compiled is not None else (lambda value: re.search(pattern, value))
+
+        def check_pattern(value):
+            if search(value) is None:
+                raise AxValidationError(f"Field '{title}' failed validation: String must match pattern /{pattern}/.")
+        checks.append(check_pattern)
+    format = _core_get(typ, "format", None)
+    if format == "email":
+        def check_email(value):
+            if _EMAIL_PATTERN.search(value) is None:
+                raise AxValidationError(f"Field '{title}' failed validation: String must be a valid email address.")
+        checks.append(check_email)
+    if format in _URL_FORMATS:
+        def check_url(value):
+            if not _core_url_valid(value):
+                raise AxValidationError(f"Invalid URL for '{title}': Invalid URL format.")
+        checks.append(check_url)
+    return checks
+
+
+def _compile_number_constraints(field) -> list[Callable[[Any], None]]:
+    typ = _core_get(field, "type", None)
+    title = _core_get(field, "title", None)
+    checks = []
+    minimum = _core_get(typ, "minimum", None)
+    if minimum is not None:
+        def check_minimum(value):
+            if value < minimum:
+                raise AxValidationError(f"Field '{title}' failed validation: Number must be at least {minimum}.")
+        checks.append(check_minimum)
+    maximum = _core_get(typ, "maximum", None)
+    if maximum is not None:
+        def check_maximum(value):
+            if value > maximum:
+                raise AxValidationError(f"Field '{title}' failed validation: Number must be at most {maximum}.")
+        checks.append(check_maximum)
+    return checks
+
+
+def _run_checks(checks, value):
+    for check in checks:
+        check(value)
+
+
+def compile_value_validator(field) -> ValueValidator:
+    """Compile one field's type and constraints into a ``(value, path)`` closure.
+
+    Type dispatch, regex compilation and nested-field expansion happen once;
+    the returned closure raises the same ``AxValidationError`` messages as
+    ``validate_value``.
+    """
+    field_name = _core_get(field, "name", None)
+    typ = _core_get(field, "type", None)
+    type_name = _core_get(typ, "name", None)
+    if _core_get(typ, "is_array", False):
+        check_item = compile_value_validator(_core_field_item(field))
+
+        def check_array(value, path):
+            if not isinstance(value, list):
+                raise AxValidationError(f"{path} must be an array")
+            for item in value:
+                check_item(item, path)
+        return check_array
+    if type_name == "image":
+        def check_image(value, path):
+            if not _valid_image(value):
+                raise AxValidationError(f"Validation failed: Expected '{field_name}' to be type 'object ({{ mimeType: string; data: string }})'")
+        return check_image
+    if type_name == "audio":
+        def check_audio(value, path):
+            if not _valid_audio(value):
+                raise AxValidationError(f"Validation failed: Expected '{field_name}' to be type 'string or object ({{ data: string; format?: string }})'")
+        return check_audio
+    if type_name == "file":
+        def check_file(value, path):
+            if not _valid_file(value):
+                raise AxValidationError(f"Validation failed: Expected '{field_name}' to be type 'object ({{ mimeType: string; data: string }} | {{ mimeType: string; fileUri: string }})'")
+        return check_file
+    if type_name == "url":
+        field_title = _core_get(field, "title", None)
+
+        def check_url(value, path):
+            if not _valid_url_shape(value):
+                raise AxValidationError(f"Validation failed: Expected '{field_name}' to be type 'string or object ({{ url: string; title?: string; description?: string }})'")
+            if isinstance(value, str) and not _core_url_valid(value):
+                raise AxValidationError(f"Invalid URL for '{field_title}': Invalid URL format. Expected a valid URL like https://example.com. Use a valid URL format (e.g., https://example.com). You provided: {value}.")
+        return check_url
+    if type_name in _STRING_TYPE_NAMES:
+        string_checks = _compile_string_constraints(field)
+
+        def check_string(value, path):
+            if not isinstance(value, str):
+                raise AxValidationError(f"Validation failed: Expected '{field_name}' to be a {type_name}")
+            _run_checks(string_checks, value)
+        return check_string
+    if type_name == "number":
+        number_checks = _compile_number_constraints(field)
+
+        def check_number(value, path):
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                raise AxValidationError(f"Validation failed: Expected '{field_name}' to be a number")
+            _run_checks(number_checks, value)
+        return check_number
+    if type_name == "boolean":
+        def check_boolean(value, path):
+            if not isinstance(value, bool):
+                raise AxValidationError(f"Validation failed: Expected '{field_name}' to be a boolean")
+        return check_boolean
+    if type_name == "class":
+        options = _core_get(typ, "options", None)
+        known = frozenset(options) if isinstance(options, (list, tuple)) and all(isinstance(option, str) for option in options) else options
+
+        def check_class(value, path):
+            if not isinstance(value, str):
+                raise AxValidationError(f"Validation failed: Expected '{field_name}' to be a class")
+            if options and value not in known:
+                raise AxValidationError(f"{path} must be one of {options}")
+        return check_class
+    if type_name == "json":
+        def check_json(value, path):
+            if not _core_type_is(value, "json"):
+                raise AxValidationError(f"Validation failed: Expected '{field_name}' to be JSON")
+        return check_json
+    if type_name == "object":
+        nested_map = _core_get(typ, "fields", None)
+        check_nested = compile_fields_validator(_core_fields_from_map(nested_map)) if nested_map else None
+
+        def check_object(value, path):
+            if not isinstance(value, dict):
+                raise AxValidationError(f"{path} must be an object")
+            if check_nested is not None:
+                check_nested(value, path)
+        return check_object
+
+    def check_any(value, path):
+        return None
+    return check_any
+
+
+def compile_fields_validator(fields: list[Any]) -> FieldsValidator:
+    """Compile a field list into a ``(values, context)`` closure.
+
+    Field order is kept so the first failing field matches ``validate_fields``.
+    """
+    entries = []
+    for field in fields or []:
+        entries.append((
+            _core_get(field, "name", None),
+            _core_get(field, "title", None),
+            bool(_core_get(field, "is_optional", False)),
+            compile_value_validator(field),
+        ))
+    entries = tuple(entries)
+
+    def check_fields(values, context):
+        if not isinstance(values, dict):
+            raise AxValidationError(f"{context} must be an object")
+        get = values.get
+        for name, title, is_optional, check_value in entries:
+            value = get(name)
+            if value is None:
+                if not is_optional:
+                    raise AxValidationError(f"Required field is missing: '{title}'")
+            else:
+                check_value(value, f"{context}.{name}")
+        return None
+    return check_fields
+
+
+def _cache_put(cache, key, entry):
+    if len(cache) >= _COMPILED_CACHE_MAX:
+        cache.pop(next(iter(cache)), None)
+    cache[key] = entry
+
+
+def _fields_key(fields) -> str:
+    # Keyed by content rather than identity, so a field edited in place (or a
+    # new object at a reused id) never hits a validator or schema built for
+    # the old definition. Field and FieldType reprs cover every attribute.
+    return repr(fields)
+
+
+def _compiled_fields(fields: list[Any]) -> FieldsValidator:
+    """Process-wide compiled validator for ``fields``, keyed by their content."""
+    fields = list(fields or ())
+    key = _fields_key(fields)
+    validator = _COMPILED_FIELDS.get(key)
+    if validator is None:
+        validator = compile_fields_validator(fields)
+        _cache_put(_COMPILED_FIELDS, key, validator)
+    return validator
+
+
+def _compiled_value(field) -> ValueValidator:
+    key = _fields_key(field)
+    validator = _COMPILED_VALUES.get(key)
+    if validator is None:
+        validator = compile_value_validator(field)
+        _cache_put(_COMPILED_VALUES, key, validator)
+    return validator
+
+
+_JSON_SCHEMA_CACHE_MAX = 256
+_JSON_SCHEMAS: OrderedDict[tuple[Any, ...], dict[str, Any]] = OrderedDict()
+_JSON_SCHEMAS_LOCK = threading.Lock()
+
+
+def _copy_json(value):
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+def _json_schema_cache_key(fields, schema_title, options):
+    try:
+        options_key = json.dumps(options, sort_keys=True) if options else ""
+    except (TypeError, ValueError):
+        return None
+    return (_fields_key(list(fields or ())), schema_title, options_key)
+
+
+def _json_schema_cache_get(fields, schema_title, options):
+    """Return a private copy of the cached schema for fields with this content, or None."""
+    key = _json_schema_cache_key(fields, schema_title, options)
+    if key is None:
+        return None
+    with _JSON_SCHEMAS_LOCK:
+        schema = _JSON_SCHEMAS.get(key)
+        if schema is None:
+            return None
+        _JSON_SCHEMAS.move_to_end(key)
+    return _copy_json(schema)
+
+
+def _json_schema_cache_put(fields, schema_title, options, schema):
+    key = _json_schema_cache_key(fields, schema_title, options)
+    if key is None:
+        return None
+    schema = _copy_json(schema)
+    with _JSON_SCHEMAS_LOCK:
+        _JSON_SCHEMAS[key] = schema
+        _JSON_SCHEMAS.move_to_end(key)
+        while len(_JSON_SCHEMAS) > _JSON_SCHEMA_CACHE_MAX:
+            _JSON_SCHEMAS.popitem(last=False)
+    return None
+
+
 # AXIR_CORE_SCHEMA_FUNCTIONS
+
+
+def _core_validate_fields(fields: list[Any], values: Any, context: str) -> None:
+    """Host replacement for Core's ``_validate_fields_impl`` using compiled validators."""
+    _compiled_fields(fields)(values, context)
+    return None
+
+
+def _core_validate_value(field: Any, value: Any, path: str) -> None:
+    """Host replacement for Core's ``_validate_value_impl`` using compiled validators."""
+    _compiled_value(field)(value, path)
+    return None
+
+
+def _core_schema_to_json_schema(fields: list[Any], schema_title: str, options: Any) -> dict[str, Any]:
+    """Core's ``_schema_to_json_schema_impl`` behind the per-(fields, title, options) cache."""
+    cached = _json_schema_cache_get(fields, schema_title, options)
+    if cached is not None:
+        return cached
+    schema = _core_schema_to_json_schema_uncached(fields, schema_title, options)
+    _json_schema_cache_put(fields, schema_title, options, schema)
+    return schema
+
+
+# Python host replacements for Core functions. The portable definitions above
+# stay the reference; rebinding the module globals routes emitted callers here.
+# _CORE_PORTABLE keeps each replaced definition so conformance can run it.
+_CORE_PORTABLE = {
+    "_validate_fields_impl": _validate_fields_impl,
+    "_validate_value_impl": _validate_value_impl,
+    "_schema_to_json_schema_impl": _schema_to_json_schema_impl,
+}
+_core_schema_to_json_schema_uncached = _schema_to_json_schema_impl
+_schema_to_json_schema_impl = _core_schema_to_json_schema
+_validate_fields_impl = _core_validate_fields
+_validate_value_impl = _core_validate_value
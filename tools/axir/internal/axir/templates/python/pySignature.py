@@ -5,6 +5,8 @@ from dataclasses import dataclass, field as dataclass_field
 import copy
 import json
 import re
+import threading
+from collections import OrderedDict
 from typing import Any
 # AXIR_CORE_IMPORTS
 
@@ -242,7 +244,9 @@ class AxSignature:
             self.description = parsed.description
             self.input_fields = parsed.input_fields
             self.output_fields = parsed.output_fields
-        self.validate()
+        else:
+            # Parsed signatures were validated when they entered the parse cache.
+            self.validate()
 
     @classmethod
     def create(cls, signature: str):
@@ -263,6 +267,22 @@ class AxSignature:
     def toJSONSchema(self, target: str = "outputs", options: dict[str, Any] | None = None):
         return self.to_json_schema(target, options)
 
+    def validator(self, target: str = "outputs"):
+        """Return the compiled ``(values, context)`` validator for ``target``.
+
+        Compiled once per field list and rebuilt when the fields' content changes,
+        including fields edited in place.
+        """
+        from .schema import compile_fields_validator
+        fields = self.input_fields if target == "inputs" else self.output_fields
+        key = repr(fields)
+        cache = self.__dict__.setdefault("_validators", {})
+        entry = cache.get(target)
+        if entry is None or entry[0] != key:
+            entry = (key, compile_fields_validator(fields))
+            cache[target] = entry
+        return entry[1]
+
     def validate(self):
         validate_signature(self)
         return True
@@ -632,4 +652,63 @@ def _title(name: str) -> str:
     return text[:1].upper() + text[1:]
 
 
+_PARSED_SIGNATURE_CACHE_MAX = 256
+_PARSED_SIGNATURES: OrderedDict[str, AxSignature] = OrderedDict()
+_PARSED_SIGNATURES_LOCK = threading.Lock()
+
+
+def _copy_field(field: Field) -> Field:
+    typ = copy.copy(field.type)
+    if typ.options is not None:
+        typ.options = list(typ.options)
+    if typ.fields:
+        typ.fields = {key: _copy_field(item) if isinstance(item, Field) else copy.deepcopy(item) for key, item in typ.fields.items()}
+    out = copy.copy(field)
+    out.type = typ
+    return out
+
+
+def _signature_from_template(template: AxSignature) -> AxSignature:
+    sig = AxSignature.__new__(AxSignature)
+    sig.description = template.description
+    sig.input_fields = [_copy_field(item) for item in template.input_fields]
+    sig.output_fields = [_copy_field(item) for item in template.output_fields]
+    sig.force_structured = False
+    return sig
+
+
+def _signature_parse_cached(signature: str, parse: Any) -> AxSignature:
+    """Parse ``signature`` through a process-wide LRU keyed by source text.
+
+    Each call returns a fresh ``AxSignature`` with its own copies of the
+    cached ``Field`` objects, so callers may edit them in place; copying is
+    several times cheaper than parsing again.
+    """
+    if not isinstance(signature, str):
+        return parse(signature)
+    with _PARSED_SIGNATURES_LOCK:
+        template = _PARSED_SIGNATURES.get(signature)
+        if template is not None:
+            _PARSED_SIGNATURES.move_to_end(signature)
+    if template is None:
+        template = parse(signature)
+        with _PARSED_SIGNATURES_LOCK:
+            _PARSED_SIGNATURES[signature] = template
+            while len(_PARSED_SIGNATURES) > _PARSED_SIGNATURE_CACHE_MAX:
+                _PARSED_SIGNATURES.popitem(last=False)
+    return _signature_from_template(template)
+
+
 # AXIR_CORE_SIGNATURE_FUNCTIONS
+
+
+def _core_parse_signature(signature: str) -> AxSignature:
+    """Host replacement for Core's ``parse_signature`` backed by the parse LRU."""
+    return _signature_parse_cached(signature, _signature_parse_impl)
+
+
+# Python host replacements for Core functions. The portable definitions above
+# stay the reference; rebinding the module globals routes emitted callers here.
+# _CORE_PORTABLE keeps each replaced definition so conformance can run it.
+_CORE_PORTABLE = {"parse_signature": parse_signature}
+parse_signature = _core_parse_signature
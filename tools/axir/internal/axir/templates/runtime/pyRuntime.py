@@ -5,8 +5,9 @@ import os
 import shlex
 import subprocess
 import threading
+from collections import deque
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
 
 
 @dataclass
@@ -101,7 +102,26 @@ class RuntimeProtocolError(RuntimeError):
 
 
 class ProcessCodeRuntime:
+    """Drive a code runtime child process over the line-delimited JSON protocol.
+
+    ``timeout_ms`` is the default deadline for every request. An ``execute``
+    call may override it with ``options["timeout"]`` (milliseconds), which is
+    also forwarded to the child. The host waits ``grace_ms`` beyond the
+    deadline so a child that enforces its own timeout can still answer. When a
+    deadline is missed, the watchdog kills the child and a fresh one is
+    spawned. A child that died on its own is respawned on the next request.
+    Sessions from the old process are re-created on their next use from their
+    creation globals and their last exported or restored state.
+
+    A background thread drains the child's stderr into a ring buffer of the
+    last ``stderr_lines`` lines, each tagged with the session that last sent
+    a request. Lines starting with ``event_prefix`` followed by a JSON
+    object are runtime events (logs, metrics); they are kept in their own ring
+    buffer and passed to ``on_event``.
+    """
+
     language = "JavaScript"
+    event_prefix = "@ax-event "
 
     def __init__(
         self,
@@ -109,6 +129,10 @@ class ProcessCodeRuntime:
         *,
         cwd: str | None = None,
         env: dict[str, str] | None = None,
+        timeout_ms: float | None = None,
+        grace_ms: float = 500,
+        stderr_lines: int = 200,
+        on_event: Callable[[dict[str, Any]], Any] | None = None,
     ):
         argv = shlex.split(command) if isinstance(command, str) else list(command)
         if not argv:
@@ -116,18 +140,23 @@ class ProcessCodeRuntime:
         merged_env = os.environ.copy()
         if env:
             merged_env.update(env)
-        self._process = subprocess.Popen(
-            argv,
-            cwd=cwd,
-            env=merged_env,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,
-        )
-        self._lock = threading.Lock()
+        self._argv = argv
+        self._cwd = cwd
+        self._env = merged_env
+        self.timeout_ms = timeout_ms
+        self.grace_ms = grace_ms
+        self.restart_count = 0
+        self._generation = 0
+        self._closed = False
+        self.on_event = on_event
+        self._lock = threading.RLock()
         self._next_id = 0
+        self._active_session: ProcessCodeSession | None = None
+        self._stderr_lock = threading.Lock()
+        self._stderr: deque[tuple[int, ProcessCodeSession | None, str]] = deque(maxlen=max(int(stderr_lines), 1))
+        self._events: deque[tuple[ProcessCodeSession | None, dict[str, Any]]] = deque(maxlen=max(int(stderr_lines), 1))
+        self._drainer: threading.Thread | None = None
+        self._process = self._spawn()
 
     def get_usage_instructions(self) -> str:
         try:
@@ -140,36 +169,182 @@ class ProcessCodeRuntime:
         return ""
 
     def create_session(self, globals: dict[str, Any], options: dict[str, Any] | None = None):
-        response = self._request("create_session", None, {"globals": globals or {}, "options": options or {}})
+        with self._lock:
+            self._active_session = None
+            response = self._request("create_session", None, {"globals": globals or {}, "options": options or {}})
+            return ProcessCodeSession(self, self._session_id_from(response), globals=globals, options=options, generation=self._generation)
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+            if self._process.poll() is None:
+                try:
+                    self._request("shutdown", None, {})
+                finally:
+                    try:
+                        self._process.terminate()
+                    except ProcessLookupError:
+                        pass
+
+    def recent_stderr(self, limit: int | None = None, *, session: ProcessCodeSession | None = None) -> list[str]:
+        """Return the newest buffered stderr lines, oldest first, optionally
+        only those attributed to ``session``."""
+        with self._stderr_lock:
+            lines = [line for _, owner, line in self._stderr if session is None or owner is session]
+        return lines[-limit:] if limit else lines
+
+    def recent_events(self, limit: int | None = None, *, session: ProcessCodeSession | None = None) -> list[dict[str, Any]]:
+        with self._stderr_lock:
+            events = [event for owner, event in self._events if session is None or owner is session]
+        return events[-limit:] if limit else events
+
+    def _spawn(self) -> subprocess.Popen:
+        process = subprocess.Popen(
+            self._argv,
+            cwd=self._cwd,
+            env=self._env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        self._drainer = threading.Thread(
+            target=self._drain_stderr,
+            args=(process, self._generation),
+            name="axllm-runtime-stderr",
+            daemon=True,
+        )
+        self._drainer.start()
+        return process
+
+    def _drain_stderr(self, process: subprocess.Popen, generation: int):
+        # Keep the pipe empty so a chatty child never blocks on a full buffer.
+        stream = process.stderr
+        if stream is None:
+            return
+        try:
+            for raw in stream:
+                line = raw.rstrip("\r\n")
+                owner = self._active_session
+                if line.startswith(self.event_prefix):
+                    try:
+                        event = json.loads(line[len(self.event_prefix):])
+                    except json.JSONDecodeError:
+                        event = None
+                    if isinstance(event, dict):
+                        with self._stderr_lock:
+                            self._events.append((owner, event))
+                        if self.on_event is not None:
+                            try:
+                                self.on_event(event)
+                            except Exception:
+                                pass
+                        continue
+                with self._stderr_lock:
+                    self._stderr.append((generation, owner, line))
+        except (OSError, ValueError):
+            pass
+        finally:
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+    def _restart(self):
+        process = self._process
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
+        for stream in (process.stdin, process.stdout):
+            try:
+                if stream is not None:
+                    stream.close()
+            except Exception:
+                pass
+        if self._drainer is not None:
+            self._drainer.join(timeout=0.5)
+        self._generation += 1
+        self.restart_count += 1
+        self._process = self._spawn()
+
+    def _ensure_process(self):
+        if self._closed:
+            raise RuntimeError("runtime protocol process is closed")
+        if self._process.poll() is not None:
+            self._restart()
+
+    def _session_id_from(self, response: dict[str, Any]) -> str:
         session_id = response.get("session_id")
         result = response.get("result")
         if not session_id and isinstance(result, dict):
             session_id = result.get("session_id")
         if not session_id:
             raise RuntimeError("runtime protocol did not return a session_id")
-        return ProcessCodeSession(self, str(session_id))
+        return str(session_id)
 
-    def shutdown(self):
-        if self._process.poll() is None:
-            try:
-                self._request("shutdown", None, {})
-            finally:
-                try:
-                    self._process.terminate()
-                except ProcessLookupError:
-                    pass
+    def _rebuild_session(self, session: ProcessCodeSession):
+        response = self._request("create_session", None, {"globals": session._globals, "options": session._options})
+        session_id = self._session_id_from(response)
+        if session._state is not None:
+            self._request("patch_globals", session_id, {"globals": session._state, "options": {}})
+        session._session_id = session_id
+        session._generation = self._generation
 
-    def _request(self, op: str, session_id: str | None, payload: dict[str, Any] | None) -> dict[str, Any]:
+    def _request(
+        self,
+        op: str,
+        session_id: str | None,
+        payload: dict[str, Any] | None,
+        timeout_ms: float | None = None,
+    ) -> dict[str, Any]:
         with self._lock:
+            if op != "shutdown":
+                self._ensure_process()
             self._next_id += 1
             message: dict[str, Any] = {"id": str(self._next_id), "op": op, "payload": payload or {}}
             if session_id is not None:
                 message["session_id"] = session_id
             if self._process.stdin is None or self._process.stdout is None:
                 raise RuntimeError("runtime protocol process is closed")
-            self._process.stdin.write(json.dumps(message, separators=(",", ":")) + "\n")
-            self._process.stdin.flush()
-            line = self._process.stdout.readline()
+            deadline_ms = self.timeout_ms if timeout_ms is None else timeout_ms
+            watchdog = None
+            expired = threading.Event()
+            if deadline_ms is not None and op != "shutdown":
+                process = self._process
+
+                def expire():
+                    expired.set()
+                    try:
+                        process.kill()
+                    except ProcessLookupError:
+                        pass
+
+                watchdog = threading.Timer((float(deadline_ms) + float(self.grace_ms)) / 1000.0, expire)
+                watchdog.daemon = True
+                watchdog.start()
+            try:
+                self._process.stdin.write(json.dumps(message, separators=(",", ":")) + "\n")
+                self._process.stdin.flush()
+                line = self._process.stdout.readline()
+            except (BrokenPipeError, OSError, ValueError):
+                if not expired.is_set():
+                    raise RuntimeError(self._closed_without_response_message())
+                line = ""
+            finally:
+                if watchdog is not None:
+                    watchdog.cancel()
+            if expired.is_set():
+                self._restart()
+                raise RuntimeProtocolError(
+                    f"runtime {op} exceeded its {float(deadline_ms):g} ms deadline; the runtime process was restarted",
+                    "timeout",
+                )
             if not line:
                 raise RuntimeError(self._closed_without_response_message())
             try:
@@ -200,46 +375,82 @@ class ProcessCodeRuntime:
         message = "runtime protocol process closed without a response"
         if code is not None:
             message += f" (exit code {code})"
-            stderr_text = ""
-            if self._process.stderr is not None:
-                try:
-                    stderr_text = self._process.stderr.read().strip()
-                except Exception:
-                    stderr_text = ""
+            if self._drainer is not None:
+                self._drainer.join(timeout=0.5)
+            with self._stderr_lock:
+                lines = [line for generation, _, line in self._stderr if generation == self._generation]
+            stderr_text = "\n".join(lines[-20:]).strip()
             if stderr_text:
                 message += f": {stderr_text}"
         return message
 
 
 class ProcessCodeSession:
-    def __init__(self, runtime: ProcessCodeRuntime, session_id: str):
+    def __init__(
+        self,
+        runtime: ProcessCodeRuntime,
+        session_id: str,
+        *,
+        globals: dict[str, Any] | None = None,
+        options: dict[str, Any] | None = None,
+        generation: int = 0,
+    ):
         self._runtime = runtime
         self._session_id = session_id
+        self._globals = globals or {}
+        self._options = options or {}
+        self._generation = generation
+        self._state: Any = None
+
+    def _call(self, op: str, payload: dict[str, Any], timeout_ms: float | None = None) -> Any:
+        runtime = self._runtime
+        with runtime._lock:
+            runtime._ensure_process()
+            if self._generation != runtime._generation:
+                runtime._rebuild_session(self)
+            # Left set after the call: stderr written just before the response,
+            # or after it, still belongs to this session.
+            runtime._active_session = self
+            return runtime._request(op, self._session_id, payload, timeout_ms).get("result")
+
+    def recent_stderr(self, limit: int | None = None) -> list[str]:
+        return self._runtime.recent_stderr(limit, session=self)
+
+    def recent_events(self, limit: int | None = None) -> list[dict[str, Any]]:
+        return self._runtime.recent_events(limit, session=self)
 
     def execute(self, code: str, options: dict[str, Any] | None = None) -> Any:
+        options = options or {}
+        timeout_ms = options.get("timeout")
         try:
-            return self._runtime._request(
+            return self._call(
                 "execute",
-                self._session_id,
-                {"code": str(code), "options": options or {}},
-            ).get("result")
+                {"code": str(code), "options": options},
+                float(timeout_ms) if isinstance(timeout_ms, (int, float)) and not isinstance(timeout_ms, bool) else None,
+            )
         except RuntimeProtocolError as exc:
-            return RuntimeEnvelope.error(str(exc), exc.category)
+            envelope = RuntimeEnvelope.error(str(exc), exc.category)
         except RuntimeError as exc:
-            return RuntimeEnvelope.error(str(exc), "runtime")
+            envelope = RuntimeEnvelope.error(str(exc), "runtime")
+        stderr_tail = self.recent_stderr(20)
+        if stderr_tail:
+            envelope["stderr"] = stderr_tail
+        return envelope
 
     def inspect_globals(self, options: dict[str, Any] | None = None) -> Any:
-        return self._runtime._request("inspect_globals", self._session_id, options or {}).get("result")
+        return self._call("inspect_globals", options or {})
 
     def snapshot_globals(self, options: dict[str, Any] | None = None) -> Any:
-        return self._runtime._request("snapshot_globals", self._session_id, options or {}).get("result")
+        state = self._call("snapshot_globals", options or {})
+        self._state = state
+        return state
 
     def patch_globals(self, globals: dict[str, Any], options: dict[str, Any] | None = None) -> Any:
-        return self._runtime._request(
-            "patch_globals",
-            self._session_id,
-            {"globals": globals or {}, "options": options or {}},
-        ).get("result")
+        result = self._call("patch_globals", {"globals": globals or {}, "options": options or {}})
+        if isinstance(globals, dict) and "bindings" in globals:
+            # A whole snapshot was restored; it is what a rebuilt session replays.
+            self._state = globals
+        return result
 
     def export_state(self, options: dict[str, Any] | None = None) -> Any:
         return self.snapshot_globals(options or {})
@@ -248,4 +459,9 @@ class ProcessCodeSession:
         return self.patch_globals(snapshot or {}, options or {})
 
     def close(self) -> Any:
-        return self._runtime._request("close", self._session_id, {}).get("result")
+        runtime = self._runtime
+        with runtime._lock:
+            if self._generation != runtime._generation or runtime._process.poll() is not None:
+                # The process that owned this session is gone; there is nothing to close.
+                return {"closed": True}
+            return runtime._request("close", self._session_id, {}).get("result")
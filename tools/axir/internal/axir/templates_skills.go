@@ -303,9 +303,8 @@ func renderSkill(spec packageSkillSpec, model AxRuntimeModel, target string) str
 			"- Set `sampleCount` / `sample_count` to request N provider candidates. Core parses and validates every candidate, preserving each provider result index.",
 			"- Without a result picker, AxGen returns candidate 0. A result picker receives all `{ index, sample }` structured candidates and returns the winning list index; Core rejects an index outside `0..N-1`.",
 			"- Native callback surface: "+skillResultPickerSurface(target)+".",
-			"- OpenAI-compatible Chat and Gemini map multi-sampling to `n` and `candidateCount`. Anthropic rejects `n > 1` explicitly.",
-			"",
-		) + "\n"
+		)
+		genForwardGuide = readmeLines(append(append([]string{genForwardGuide}, skillMultiSampleProviderText(target)...), "")...) + "\n"
 	}
 	agentMemoryGuide := ""
 	if spec.ID == "agent-memory-skills" {
@@ -319,6 +318,12 @@ func renderSkill(spec packageSkillSpec, model AxRuntimeModel, target string) str
 			"- `onSkillsSearch` / `onMemoriesSearch` take precedence over static catalogs. Without a host callback, `skillsCatalog` / `memoriesCatalog` use the built-in deterministic lexical ranker.",
 			"- `onLoadedMemories` / `onLoadedSkills` observe runtime recall and discovery, not constructor presets. `onUsedMemories` / `onUsedSkills` emit one consolidated notification per forward. Forward observers override constructor observers, and observer errors are ignored.",
 			"- `relevanceRanking` produces advisory skill and memory hints using the same tokenization, weighting, tie suppression, limits, snippets, and already-loaded exclusion as TypeScript.",
+		)
+		for _, line := range skillRelevanceIndexText(target) {
+			agentMemoryGuide = readmeLines(agentMemoryGuide, line)
+		}
+		agentMemoryGuide = readmeLines(
+			agentMemoryGuide,
 			"- `"+legacyGet+"` and `"+legacySet+"` preserve the legacy bare-runtime snapshot shape. Use `"+exportState+"` and `"+restoreState+"` for the complete portable agent snapshot, including loaded skills and constructor-preset reapplication. Do not interchange the two shapes.",
 			"",
 			"## Runnable Examples",
@@ -352,6 +357,25 @@ func renderSkill(spec packageSkillSpec, model AxRuntimeModel, target string) str
 			"",
 		) + "\n"
 	}
+	packageFacts := []string{
+		"Language: " + cfg.Language + ".",
+		"Package: `" + manifest.PackageName + "`.",
+		"Package API docs: `API.md` and `axir-api.json`.",
+		"Capability manifest: `axir-capabilities.json`.",
+		"Runnable examples: `examples/`.",
+		"Real network support: " + skillBoolText(manifest.RealNetworkSupport) + ".",
+		"Scripted no-key transport support: " + skillBoolText(manifest.ScriptedTransportSupport) + ".",
+		"Runtime profiles: " + skillRuntimeProfileText(manifest.RuntimeProfiles) + ".",
+	}
+	hostGuide := ""
+	apiSurface := skillAPISurface(apiRef, spec.Sections)
+	if target == "python" {
+		packageFacts = append(packageFacts, skillPythonPackageFacts(spec.ID)...)
+		hostGuide = skillPythonHostGuide(spec.ID)
+		for _, line := range skillPythonAPIExtras(spec.ID) {
+			apiSurface = readmeLines(apiSurface, line)
+		}
+	}
 	guardrails := []string{
 		"Start from package examples for exact native syntax before inventing a new call shape.",
 		"Use `provider-api` examples only when the user explicitly has provider credentials available.",
@@ -375,16 +399,7 @@ func renderSkill(spec packageSkillSpec, model AxRuntimeModel, target string) str
 		"",
 		"## Package Facts",
 		"",
-		skillBulletList([]string{
-			"Language: " + cfg.Language + ".",
-			"Package: `" + manifest.PackageName + "`.",
-			"Package API docs: `API.md` and `axir-api.json`.",
-			"Capability manifest: `axir-capabilities.json`.",
-			"Runnable examples: `examples/`.",
-			"Real network support: " + skillBoolText(manifest.RealNetworkSupport) + ".",
-			"Scripted no-key transport support: " + skillBoolText(manifest.ScriptedTransportSupport) + ".",
-			"Runtime profiles: " + skillRuntimeProfileText(manifest.RuntimeProfiles) + ".",
-		}),
+		skillBulletList(packageFacts),
 		"",
 		"## Core Pattern",
 		"",
@@ -392,9 +407,9 @@ func renderSkill(spec packageSkillSpec, model AxRuntimeModel, target string) str
 		skillSnippet(target, spec.ID),
 		"```",
 		"",
-		expandedExamples+profileGuide+routingGuide+genForwardGuide+agentMemoryGuide+usageObserverGuide+"## Relevant API Surface",
+		expandedExamples+profileGuide+routingGuide+genForwardGuide+agentMemoryGuide+usageObserverGuide+hostGuide+"## Relevant API Surface",
 		"",
-		skillAPISurface(apiRef, spec.Sections),
+		apiSurface,
 		"",
 		"## Guardrails",
 		"",
@@ -0,0 +1,227 @@
+package axir
+
+// Python-only skill guidance for behavior implemented by host replacements in the
+// Python templates. Other targets do not carry these runtime layers, so their
+// skills stay unchanged.
+
+func skillPythonPackageFacts(specID string) []string {
+	if specID != "ai" {
+		return nil
+	}
+	return []string{
+		"Imports are lazy: `import axllm` loads no submodule, and `axllm.ai` pulls in only the provider layer. `AxAgent`, flows, the MCP/event runtime, and optimizers load on first access. Provider registries are read from `axllm/data/*.json` on first use. `examples/import_startup_budget.py` checks that `import axllm; axllm.ai` leaves the agent, flow, MCP, and generation modules unloaded.",
+	}
+}
+
+func skillMultiSampleProviderText(target string) []string {
+	if target != "python" {
+		return []string{"- OpenAI-compatible Chat and Gemini map multi-sampling to `n` and `candidateCount`. Anthropic rejects `n > 1` explicitly."}
+	}
+	return []string{
+		"- OpenAI-compatible Chat and Gemini map multi-sampling to `n` and `candidateCount`. For profiles whose features report `multiple_samples: False` (Anthropic, OpenAI Responses), AxGen sends N concurrent single-sample requests and merges them into one multi-result response with summed usage. The wall-clock cost stays close to one call.",
+		"- With fan-out, `sampleAccept` / `sample_accept` (or a picker object's `accept` method) sees each raw result as it arrives. The first accepted result ends the fan-out: no further requests are submitted and only completed samples reach the picker.",
+		"- Fan-out keeps at most `sampleConcurrency` / `sample_concurrency` requests in flight (default: all N) and submits the next one only when a slot frees up. Requests already in flight when a sample is accepted cannot be recalled and are still billed, so set a low concurrency (for example 1) with `sampleAccept` when cost matters more than latency.",
+	}
+}
+
+func skillRelevanceIndexText(target string) []string {
+	if target != "python" {
+		return nil
+	}
+	return []string{
+		"- Each agent keeps one relevance index per module, skill, and memory catalog. Catalog entries are tracked by identity, so only added entries are tokenized and removed entries leave the index; replace an entry instead of editing it in place. Set `relevanceRanking={\"indexDir\": path}` to persist term frequencies to `<indexDir>/<kind>.jsonl`; each sync appends only the entries it tokenized, so large tool catalogs skip tokenization on the next start.",
+	}
+}
+
+func skillPythonAPIExtras(specID string) []string {
+	switch specID {
+	case "ai":
+		return []string{"- Resilience and rate limits: `AxRetryPolicy`, `AxRetryBudget`, `AxRateLimiter`, `AxInMemoryRateLimitStore`, `AxFileRateLimitStore`, `AxCircuitBreaker`, `AxCircuitBreakerRegistry`"}
+	case "audio":
+		return []string{"- Binary media: `AxMediaBuffer`"}
+	case "gen":
+		return []string{
+			"- Trace retention: `AxTraceBuffer`, `AxTraceSink`, `AxJsonlTraceSink`",
+			"- Run contexts: `AxRunContext`",
+			"- Memory: `AxMemory`, `AxMemoryStore`, `AxInMemoryMemoryStore`, `AxSQLiteMemoryStore`",
+		}
+	default:
+		return nil
+	}
+}
+
+func skillPythonHostGuide(specID string) string {
+	var lines []string
+	switch specID {
+	case "ai":
+		lines = []string{
+			"## Retries And Circuit Breakers",
+			"",
+			"- Generation and pre-content stream retries share `AxRetryPolicy`: only transient failures retry (408/429/5xx/529, network, timeout). Validation and 401/403 errors surface immediately.",
+			"- Backoff is exponential with full jitter. `Retry-After`, `retry-after-ms` and, on 429, provider rate-limit reset headers set the minimum wait; a requested wait longer than `maxDelayMs` ends the retries.",
+			"- A process-wide `AxRetryBudget` caps retries at a share of traffic so an outage does not multiply load. Pass `retry={\"budget\": AxRetryBudget(...)}` to isolate a workload.",
+			"- Provider clients keep a circuit breaker per endpoint (scheme, host and path; query strings are ignored). After consecutive transient failures, calls fail fast with `AxAIServiceCircuitOpenError` until a probe succeeds. Retry policies do not retry an open circuit; balancers fail over on it. Share breakers with `circuit_breakers=AxCircuitBreakerRegistry(...)`, or disable them with `circuit_breakers=False`. Clients with an injected `transport` opt in with `circuit_breakers=True`.",
+			"- `examples/retry_circuit_breaker.py` drains a retry budget and walks a breaker through open, half-open and closed.",
+			"",
+			"## Client-Side Rate Limits",
+			"",
+			"- Pass `rate_limit={\"rpm\": ..., \"tpm\": ...}` (or an `AxRateLimiter`) to a provider client to queue requests locally instead of paying for 429 round-trips. Buckets are keyed by profile and model by default; use `\"key\": \"api_key\"` to share one quota across models, or any string for a custom quota.",
+			"- Prompt tokens are estimated before sending (about four characters per token plus `max_tokens`), then corrected with the reported `model_usage` when the response or stream completes.",
+			"- Limiters share the process-wide `AxInMemoryRateLimitStore` by default. Use `AxFileRateLimitStore(path)` to share buckets between worker processes on one host.",
+			"- `acquire` blocks by default, bounded by `maxWaitMs`. With `\"blocking\": False`, a full bucket raises the retryable `AxAIServiceRateLimitError` with `retry_after_ms`, so retry policies wait and balancers fail over.",
+			"- `examples/rate_limiter.py` covers blocking and non-blocking waits, token settlement, and two clients sharing one quota.",
+			"",
+			"## Request Sharing",
+			"",
+			"- The chat path does not copy requests. Messages, media parts, and function schemas are shared with the caller, and provider builders copy only the containers they change, so the caller's request is never mutated. Base64 images and long histories therefore cost nothing extra per call. `examples/request_sharing.py` measures a 2 MB image request against a per-call `copy.deepcopy` baseline.",
+			"- `get_features` on provider clients caches the resolved map per model and returns a fresh copy on every call, so callers may edit it. The cache is dropped whenever `options` changes, including in-place edits. Usage-observer events are also private copies.",
+		}
+	case "audio":
+		lines = []string{
+			"## Binary Media",
+			"",
+			"- Wrap images, audio, and files in `AxMediaBuffer` to avoid holding base64 copies. Use `AxMediaBuffer(data_bytes, mime_type=...)`, `AxMediaBuffer.from_file(path)`, or `AxMediaBuffer.from_base64(text)`. Pass it wherever a base64 string is accepted, for example `{\"mimeType\": \"image/png\", \"data\": buffer}` as a media field or prompt part.",
+			"- Buffers pass through prompt rendering and provider builders unchanged. They are base64-encoded once, when the JSON body is written. Multipart uploads such as transcription stream file-backed buffers from disk with a known Content-Length.",
+			"- `speak` over HTTP and the joined `realtime_chat` audio return base64 text by default, so results stay JSON-serializable. Pass the `media_buffers` option (`{\"media_buffers\": True}` per call or on the client) to get an `AxMediaBuffer` instead. Use `tobytes()` / `memoryview()` for the raw audio. `str(buffer)` / `.base64` encodes lazily and caches the result, and the buffer compares equal to its base64 text.",
+			"- Injected test transports still receive base64 strings in place of buffers.",
+			"",
+			"## Realtime Streaming",
+			"",
+			"- `client.realtime_stream(request, transport=None, max_buffered_events=64)` yields each normalized realtime delta as it arrives. A delta can carry text, a transcript, function calls, or one PCM chunk as an `AxMediaBuffer`. Play audio without waiting for the turn to finish.",
+			"- A reader thread reads frames into a queue capped at `max_buffered_events`. When the consumer falls behind, the reader stops reading and the socket applies backpressure.",
+			"- The first audio delta includes `first_audio_ms`. After the turn, `client.get_last_realtime_latency()` returns `first_audio_ms`, `first_text_ms`, and `turn_ms`. It is per client, so concurrent turns on one client overwrite it; read `first_audio_ms` from the stream instead.",
+			"- Closing the generator before the turn completes stops the reader and closes the transport, even one you passed in, because the reader may be blocked in `recv()`. A completed turn leaves your transport open. `realtime_chat` folds the same stream into one response.",
+			"- `examples/realtime_stream.py` streams a scripted turn and closes a stalled one early.",
+		}
+	case "gen":
+		lines = []string{
+			"## Trace Retention",
+			"",
+			"- `chat_log`, `function_call_traces`, and `traces` are `AxTraceBuffer` sequences. Retention is opt-in: by default they keep every entry, so a long-lived program grows until you bound it.",
+			"- Set `traceRetention` / `trace_retention` to `{\"maxEntries\": N, \"maxBytes\": B, \"sink\": ...}`. `maxBytes` measures JSON size. `sink` is an `AxTraceSink` or a file path for `AxJsonlTraceSink`, and it receives evicted entries instead of dropping them. Eviction costs O(evicted entries), and size accounting covers every mutator, including `insert`, item assignment, `del`, and `pop`.",
+			"- Each trace holds only its own forward call's chat-log and function-call entries. It also records absolute `chat_log_range` / `function_calls_range` positions; resolve them with `get_chat_log_range(start, end)` while the entries are still retained.",
+			"- `forward(..., {\"traceScope\": \"request\"})` clears the stores (spilling them to the sink) before the call, so the program keeps only the latest request.",
+			"- AxFlow records only the chat-log entries, usage, and traces that a child program produced during the current node call.",
+			"",
+			"## Run Contexts",
+			"",
+			"- Every `forward` records its chat log, function calls, traces, usage, status, and output into its own `AxRunContext`. One `AxGen`, `AxFlow`, or `AxAgent` can therefore serve concurrent calls from a thread pool.",
+			"- Pass `{\"runContext\": AxRunContext()}` (or `run_context`) to keep a handle on a specific call. `program.last_run_context` / `get_run_context()` returns the most recently finished call.",
+			"- AxFlow and AxAgent getters (`get_traces`, `get_chat_log`, `get_usage`, `get_trace`) read the latest finished run. AxGen getters keep reading its retained trace buffers.",
+			"- `examples/concurrent_program_sharing.py` runs shared programs on 16 threads and checks that no call sees another call's entries.",
+			"",
+			"## Memory",
+			"",
+			"- `AxMemory` partitions items by `session_id`. AxGen writes to the session named by the `sessionId` / `session_id` forward option, or to the default `None` session. `history`, `get_last`, `update_result`, `add_tag`, `rewind_to_tag`, and `remove_by_tag` only touch that session and use its tag and index lookups.",
+			"- Breaking change: without `session_id` those methods act on the default session, not on the whole memory. Items written under another `session_id` are no longer visible to `history()` or `get_last()`, and `add_tag`, `rewind_to_tag`, and `remove_by_tag` leave them alone. Pass the `session_id` explicitly, or walk `sessions()`. Custom memories whose methods take no `session_id` argument are still called without one.",
+			"- Pass `store=AxSQLiteMemoryStore(path)` to keep sessions on disk, one row per item. Only recently used sessions (`max_cached_sessions`, default 1024) stay loaded; the default is `AxInMemoryMemoryStore`. Implement `AxMemoryStore` (`load`, `save`, `delete`, `sessions`) for other backends. Override `append` and `update` to avoid rewriting a session on every turn.",
+			"- `max_items` bounds each session. Past the limit, the oldest items compact down to `compact_to` (default half of `max_items`). `summarize(dropped_items)` may return a replacement summary item or a list of items; without it the old items are truncated. Any other return value raises `TypeError`.",
+			"- `memory.items` is a live, writable list view of the default session. Assigning a list replaces that session.",
+			"- `examples/memory_sessions.py` separates two sessions, rewinds to a tag, compacts with a summary, and reopens a SQLite store.",
+		}
+	case "agent":
+		lines = []string{
+			"## MCP Tool Calls",
+			"",
+			"Each `tools/list` load compiles one call plan per tool. A plan holds the `x-mcp-header` bindings, the exposed function name and the namespace-qualified name.",
+			"",
+			"- `call_tool` looks the plan up by name.",
+			"- With `validateToolArguments: True`, plans also check arguments locally. Missing `required` arguments, or a top-level argument of the wrong JSON type, raise `AxMCPError` before any request is sent. Integral floats such as `5.0` pass as `integer`. Nested values and other schema keywords are left to the server. Validation is off by default.",
+			"- On a `-32020` header mismatch, only the `tools/list` page that listed the tool is fetched again. The client reloads the whole tool catalog only if that page no longer lists the tool.",
+			"- `examples/mcp_tool_call_plans.py` makes 2000 calls against a two-page catalog and runs a targeted refresh.",
+			"",
+			"## MCP Tasks",
+			"",
+			"When a modern MCP tool returns a task, `call_tool` waits for it to finish.",
+			"",
+			"- It polls `tasks/get` right away and then backs off. The first delay is `taskPollInitialMs` (50), growing by `taskPollBackoff` (2) up to `taskPollMaxMs` (5000).",
+			"- A server `pollIntervalMs` lengthens the delay, and half of `ttlMs` caps it.",
+			"- After `start_listening()`, a `notifications/tasks/status` for the task wakes the wait at once. A full task payload in the notification saves the poll.",
+			"- `taskTimeoutMs` bounds the whole wait, and `maxTaskPolls` (1000) caps the polls.",
+			"- `client.wait_for_tasks(task_ids, timeout_ms=None)` waits for several tasks together and returns their results by id.",
+			"- `examples/mcp_task_waiting.py` covers polling, notifications, multi-task waits and the deadline.",
+		}
+	case "agent-rlm":
+		lines = []string{
+			"## Process Runtime Deadlines",
+			"",
+			"`ProcessCodeRuntime(command, timeout_ms=..., grace_ms=500)` gives every protocol request a deadline. An `execute` step can override it with `options[\"timeout\"]` in milliseconds, and the agent passes its `timeout` option through there. The host waits `grace_ms` longer so the child can report its own timeout first.",
+			"",
+			"- When a deadline is missed, a watchdog kills the child and spawns a new one. The step returns a `timeout` error envelope, and `restart_count` goes up.",
+			"- A child that exits on its own is respawned on the next request.",
+			"- Sessions from the old child are re-created on their next call from their creation globals. The last snapshot taken with `snapshot_globals()`/`export_state()`, or restored with `patch_globals()`/`restore_state()`, is then replayed.",
+			"- `examples/runtime_watchdog.py` recovers from a hung step and a crashed child.",
+			"",
+			"The child's stderr is drained on a background thread, so heavy `console.error` output can't fill the pipe and stall the child.",
+			"",
+			"- The last `stderr_lines` lines (default 200) are kept in a ring buffer. Each line is tagged with the session that last sent a request.",
+			"- `runtime.recent_stderr(limit)` returns all buffered lines, and `session.recent_stderr(limit)` returns one session's lines.",
+			"- Error envelopes from `execute` carry the session's recent lines under `\"stderr\"`, so they show up in step traces.",
+			"- A line `@ax-event {json}` is a structured runtime event, such as a log record or a metric. It is passed to `on_event` and kept for `recent_events()` instead of the stderr buffer.",
+			"- `examples/runtime_stderr_drain.py` runs a step that writes about 300 KB to stderr.",
+		}
+	case "flow":
+		lines = []string{
+			"## Flow State",
+			"",
+			"Flow state is copy-on-write. Each node writes its outputs into a new layer over the state it read, so a node costs its own outputs, not a copy of every field. Parallel group results are merged by replaying each node's layer. Nodes see an ordinary `dict`. Copying, pickling or calling `dict(...)` on the state gives a flat snapshot. A flow with no `returns` hands back a plain `dict`. `examples/flow_state_sharing.py` runs a wide flow over a 20,000-key state.",
+		}
+	case "gepa":
+		lines = []string{
+			"## Racing Candidates",
+			"",
+			"Set `\"racing\": True` (or a dict) in the GEPA options to stop scoring a child once it clearly loses to its parent. The child is scored on growing slices of a shuffled minibatch. The first slice has `minBatch` tasks (default 4), and each slice is `growth` times the previous (default 2). It is dropped once a confidence bound on its paired gain over the parent's per-task scores falls below `minImprovementThreshold`.",
+			"",
+			"```python",
+			"options = {\"maxMetricCalls\": 2000, \"racing\": {\"bound\": \"sign\", \"confidence\": 0.95, \"minBatch\": 4}}",
+			"```",
+			"",
+			"- `bound` is `\"hoeffding\"` (default), `\"bernstein\"` or `\"sign\"` (a paired sign test).",
+			"- `scoreRange` (default 1) is the width of the scalar score range for the Hoeffding and Bernstein bounds.",
+			"- The error rate is split across a race's checkpoints.",
+			"- Racing only shortens child-minibatch evaluations. Parent and Pareto evaluations still see every task.",
+			"- A child that finishes its race is judged exactly as without racing.",
+			"- With racing on, the artifact metadata includes `metricCallsSaved`.",
+			"- `examples/gepa_racing.py` compares the calls spent with and without racing.",
+		}
+	case "playbook":
+		lines = []string{
+			"## Snapshots And Rendering",
+			"",
+			"- `get_state()` and the engine's `get_playbook()` / `get_artifact()` return editable copies. Changing one does not touch the live playbook; pass it to `load()` to apply it.",
+			"- The rendered playbook is cached per revision, and reflector rounds and the curator reuse it.",
+			"- After each curator batch, dedupe rescans only the sections the batch touched, using the Core section dedupe op, and then recomputes the playbook stats.",
+			"- `examples/ace_playbook_snapshots.py` grows a playbook over 120 examples.",
+			"",
+			"## Pipelined Evolve",
+			"",
+			"`evolve(examples, metric_fn, {\"pipelineWindow\": n})` runs the generator, metric, reflector and curator for up to `n` examples on worker threads. The engine option `pipelineWindow` sets the default. The default of 1 keeps the strict one-example-at-a-time loop.",
+			"",
+			"- Curator operations are applied on the calling thread, one example at a time and in example order. Feedback history order matches a strict run.",
+			"- Each example reflects and curates against the playbook as rendered when it was scheduled. That render lags the live playbook by at most `n - 1` applied examples.",
+			"- Workers never rewrite the bound program's instruction. An `AxGen` runs on a private copy that carries the example's render. Other programs run the generator step one example at a time.",
+			"- The program, metric and clients are shared across workers, so they must be thread-safe.",
+			"- `examples/ace_pipelined_compile.py` times a strict and a pipelined evolve.",
+			"",
+			"## Parallel Agent Evolve",
+			"",
+			"Agent-bound `evolve(dataset, options)` evaluates tasks one run at a time by default. Set `\"concurrency\": n` to run up to `n` task evaluations on worker threads.",
+			"",
+			"```python",
+			"result = ag.playbook().evolve(dataset, {\"metric\": metric, \"runsPerTask\": 3, \"maxMetricCalls\": 600, \"concurrency\": 8})",
+			"```",
+			"",
+			"- Metric calls are reserved in task/repeat order before each run starts. `maxMetricCalls` buys exactly the runs a sequential evolve would make.",
+			"- Records come back in task order.",
+			"- Each evaluation reads its logs from its own run context.",
+			"- `onProgress` receives an `\"evaluate\"` event per finished run with `completed`, `total` and `inFlight`.",
+			"- The agent, its runtime and the metric are shared across workers, so they must be thread-safe.",
+			"- `examples/agent_playbook_parallel_evolve.py` compares a sequential and a concurrent evolve.",
+			"",
+			"`\"racing\"` takes the same settings as in GEPA. With it set, a verified proposal is scored on growing, shuffled slices of `train` against the incumbent's per-task scores. It is dropped once its held-in gain can't reach `minHeldInGain`, and validation is skipped for dropped proposals. Racing needs a complete baseline. Each raced outcome gets `racing: {evaluated, total, dropped}`, and the result reports `metricCallsSaved`.",
+		}
+	default:
+		return ""
+	}
+	return readmeLines(append(lines, "", "")...)
+}